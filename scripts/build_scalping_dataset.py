@@ -5,9 +5,14 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
 from pathlib import Path
 
-import duckdb
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pyarrow.compute as pc
+
+from services.event_store.game_prices import get_game_prices_cache
 
 
 def parse_args() -> argparse.Namespace:
@@ -15,9 +20,9 @@ def parse_args() -> argparse.Namespace:
         description="Export deduplicated game recordings for scalping explorer."
     )
     parser.add_argument(
-        "--input-glob",
-        default="/home/devops/rugs_data/events_parquet/doc_type=complete_game/**/*.parquet",
-        help="Parquet glob for complete_game data.",
+        "--data-dir",
+        default="/home/devops/rugs_data",
+        help="RUGS_DATA_DIR root (complete_game data is read via the game prices dataset).",
     )
     parser.add_argument(
         "--output-dir",
@@ -45,35 +50,14 @@ def main() -> None:
     out_dir = Path(args.output_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    con = duckdb.connect()
-
-    ranked_query = f"""
-    WITH rows AS (
-      SELECT
-        game_id,
-        date,
-        ts,
-        raw_json,
-        json_array_length(json_extract(raw_json, '$.prices')) AS price_len
-      FROM read_parquet('{args.input_glob}', hive_partitioning=1)
-    ),
-    ranked AS (
-      SELECT *,
-             ROW_NUMBER() OVER (
-               PARTITION BY game_id
-               ORDER BY COALESCE(price_len, -1) DESC, date DESC, ts DESC
-             ) AS rn
-      FROM rows
-    )
-    SELECT game_id, date, ts, raw_json, price_len
-    FROM ranked
-    WHERE rn = 1
-      AND price_len IS NOT NULL
-      AND price_len >= {args.min_len}
-    ORDER BY date DESC, game_id;
-    """
-
-    rows = con.execute(ranked_query).fetchall()
+    # Deduplicated per game_id (longest price array wins) and incrementally
+    # maintained, so only games recorded since the last run are parsed.
+    table = get_game_prices_cache(Path(args.data_dir)).table()
+    table = table.filter(pc.greater_equal(table["duration_ticks"], args.min_len))
+    table = table.sort_by([("date", "descending"), ("game_id", "ascending")])
+    rows = table.select(
+        ["game_id", "date", "ts", "prices", "peak_multiplier", "rugged"]
+    ).to_pylist()
 
     full_path = out_dir / f"scalping_unique_games_min{args.min_len}.jsonl"
     quick_path = out_dir / f"scalping_unique_games_min{args.min_len}_quick{args.quick_size}.jsonl"
@@ -82,25 +66,20 @@ def main() -> None:
     lengths: list[int] = []
     records: list[dict] = []
 
-    for game_id, date, ts, raw_json, price_len in rows:
-        raw = json.loads(raw_json)
-        prices = raw.get("prices")
-        if not isinstance(prices, list):
-            continue
-
-        cleaned_prices = [float(v) for v in prices if isinstance(v, (int, float)) and float(v) > 0]
+    for row in rows:
+        cleaned_prices = [v for v in row["prices"] if v > 0]
         if len(cleaned_prices) < args.min_len:
             continue
 
         record = {
-            "game_id": game_id,
-            "id": game_id,
-            "date": str(date),
-            "source_ts": ts,
+            "game_id": row["game_id"],
+            "id": row["game_id"],
+            "date": str(row["date"]),
+            "source_ts": row["ts"],
             "source": "rugs_data.complete_game.best_row",
             "price_len": len(cleaned_prices),
-            "peakMultiplier": raw.get("peakMultiplier"),
-            "rugged": raw.get("rugged"),
+            "peakMultiplier": row["peak_multiplier"],
+            "rugged": row["rugged"],
             "prices": cleaned_prices,
         }
         records.append(record)
@@ -124,7 +103,7 @@ def main() -> None:
         return lengths_sorted[idx]
 
     summary = {
-        "input_glob": args.input_glob,
+        "data_dir": args.data_dir,
         "output_full": str(full_path),
         "output_quick": str(quick_path),
         "min_len": args.min_len,
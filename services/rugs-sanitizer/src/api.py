@@ -5,6 +5,8 @@ Endpoints:
 - /health         Health check
 - /stats          Pipeline and broadcaster statistics
 - /channels       List available channels
+- /trades         Recent trade/sidebet rows (filter by game, player, coin, ...)
+- /trades/summary Flow aggregates per game/player and top players (whales)
 - /feed/game      WebSocket: GameTick events
 - /feed/stats     WebSocket: SessionStats events
 - /feed/trades    WebSocket: Trade events
@@ -20,7 +22,7 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.responses import RedirectResponse
 from fastapi.staticfiles import StaticFiles
 
@@ -112,6 +114,51 @@ def create_app(
             )
         return {"channels": channel_info}
 
+    # --- Trade store queries ---
+
+    @app.get("/trades")
+    async def trades(
+        game_id: str | None = None,
+        player_id: str | None = None,
+        coin: str | None = None,
+        token_type: str | None = None,
+        kind: str | None = None,
+        limit: int = 100,
+    ):
+        """Most recent trade/sidebet rows matching the filters, newest first."""
+        if pipeline is None:
+            raise HTTPException(status_code=503, detail="Pipeline not available")
+        rows = pipeline.trade_store.query(
+            limit=max(1, min(limit, 1000)),
+            game_id=game_id,
+            player_id=player_id,
+            coin=coin,
+            token_type=token_type,
+            kind=kind,
+        )
+        return {"count": len(rows), "rows": rows}
+
+    @app.get("/trades/summary")
+    async def trades_summary(
+        game_id: str | None = None,
+        player_id: str | None = None,
+        by: str = "volume",
+        limit: int = 10,
+    ):
+        """Flow aggregates for a game and/or player, plus the top players."""
+        if pipeline is None:
+            raise HTTPException(status_code=503, detail="Pipeline not available")
+        store = pipeline.trade_store
+        try:
+            whales = store.whales(limit=max(1, min(limit, 100)), by=by, game_id=game_id)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+        return {
+            "game": store.game_summary(game_id) if game_id else None,
+            "player": store.player_summary(player_id) if player_id else None,
+            "whales": whales,
+        }
+
     # --- WebSocket endpoints ---
 
     @app.websocket("/feed/{channel_name}")
@@ -93,6 +93,14 @@ class ChannelBroadcaster:
                     all_clients.add(id(ws))
         return len(all_clients)
 
+    def has_subscribers(self, channel: Channel) -> bool:
+        """Whether an event on `channel` would reach anyone (its own or /feed/all).
+
+        Cheap enough for per-event checks: dead references count until the
+        next cleanup, which only errs toward building the event.
+        """
+        return bool(self._channels[channel]) or bool(self._channels[Channel.ALL])
+
     async def subscribe(self, websocket, channel: Channel) -> None:
         """Subscribe a WebSocket client to a channel."""
         ref = weakref.ref(websocket)
@@ -27,6 +27,7 @@ from .broadcaster import ChannelBroadcaster
 from .history_collector import HistoryCollector
 from .models import Channel, Phase, SanitizedEvent
 from .sanitizer import SanitizationPipeline
+from .trade_store import TradeStore
 from .upstream import UpstreamClient
 
 logging.basicConfig(
@@ -49,6 +50,7 @@ def load_config() -> dict:
         "host": "0.0.0.0",
         "log_level": "INFO",
         "history_collection_interval": 10,
+        "trade_store_dir": "",
     }
 
     if config_path.exists():
@@ -65,6 +67,7 @@ def load_config() -> dict:
         "HOST": "host",
         "LOG_LEVEL": "log_level",
         "HISTORY_COLLECTION_INTERVAL": "history_collection_interval",
+        "TRADE_STORE_DIR": "trade_store_dir",
     }
 
     for env_key, config_key in env_mappings.items():
@@ -90,9 +93,11 @@ async def run_service():
     logger.info(f"API Port: {config['port']}")
     logger.info(f"History collection interval: every {config['history_collection_interval']} rugs")
     logger.info("Channels: /feed/game, /feed/stats, /feed/trades, /feed/history, /feed/all")
+    logger.info(f"Trade store Parquet dir: {config['trade_store_dir'] or '(memory only)'}")
 
     # Initialize components
-    pipeline = SanitizationPipeline()
+    trade_store = TradeStore(flush_dir=config["trade_store_dir"] or None)
+    pipeline = SanitizationPipeline(trade_store=trade_store)
     broadcaster = ChannelBroadcaster()
     history_collector = HistoryCollector(collection_interval=config["history_collection_interval"])
 
@@ -125,6 +130,15 @@ async def run_service():
 
     pipeline.on_event(Channel.GAME, on_game_event)
 
+    # Skip building events nobody receives. RUGGED game ticks always feed
+    # the history collector.
+    def channel_demand(channel: Channel, phase: Phase) -> bool:
+        if channel == Channel.GAME and phase == Phase.RUGGED:
+            return True
+        return broadcaster.has_subscribers(channel)
+
+    pipeline.set_demand(channel_demand)
+
     # Upstream message handler
     def on_upstream_message(raw: dict) -> None:
         pipeline.process_raw(raw)
@@ -207,6 +221,7 @@ async def run_service():
     finally:
         logger.info("Cleaning up...")
         broadcaster.stop()
+        trade_store.flush()
         await upstream.disconnect()
         logger.info("Rugs Sanitizer Service stopped")
 
@@ -84,6 +84,17 @@ class PartialPrices(BaseModel):
             values=raw.get("values", {}),
         )
 
+    @staticmethod
+    def dump_raw(raw: dict | None) -> dict | None:
+        """from_raw(raw).model_dump(mode="json") without building the model."""
+        if raw is None:
+            return None
+        return {
+            "start_tick": raw.get("startTick", 0),
+            "end_tick": raw.get("endTick", 0),
+            "values": {k: float(v) for k, v in raw.get("values", {}).items()},
+        }
+
 
 class ProvablyFair(BaseModel):
     """Provably fair triplet data.
@@ -109,6 +120,17 @@ class ProvablyFair(BaseModel):
             server_seed=raw.get("serverSeed"),
         )
 
+    @staticmethod
+    def dump_raw(raw: dict | None) -> dict | None:
+        """from_raw(raw).model_dump(mode="json") without building the model."""
+        if raw is None:
+            return None
+        return {
+            "server_seed_hash": raw.get("serverSeedHash", ""),
+            "version": raw.get("version", "v3"),
+            "server_seed": raw.get("serverSeed"),
+        }
+
 
 class Rugpool(BaseModel):
     """Rugpool consolation prize state.
@@ -131,6 +153,17 @@ class Rugpool(BaseModel):
             rugpool_amount=raw.get("rugpoolAmount", 0.0),
         )
 
+    @staticmethod
+    def dump_raw(raw: dict | None) -> dict | None:
+        """from_raw(raw).model_dump(mode="json") without building the model."""
+        if raw is None:
+            return None
+        return {
+            "instarug_count": raw.get("instarugCount", 0),
+            "threshold": raw.get("threshold", 10),
+            "rugpool_amount": float(raw.get("rugpoolAmount", 0.0)),
+        }
+
 
 class SideBet(BaseModel):
     """Active sidebet details.
@@ -163,6 +196,22 @@ class SideBet(BaseModel):
             real_portion=raw.get("realPortion", 0.0),
         )
 
+    @staticmethod
+    def dump_raw(raw: dict | None) -> dict | None:
+        """from_raw(raw).model_dump(mode="json") without building the model."""
+        if raw is None:
+            return None
+        return {
+            "started_at_tick": raw.get("startedAtTick", 0),
+            "game_id": raw.get("gameId", ""),
+            "end": raw.get("end", 0),
+            "bet_amount": float(raw.get("betAmount", 0.0)),
+            "x_payout": raw.get("xPayout", 5),
+            "coin_address": raw.get("coinAddress", ""),
+            "bonus_portion": float(raw.get("bonusPortion", 0.0)),
+            "real_portion": float(raw.get("realPortion", 0.0)),
+        }
+
 
 class ShortPosition(BaseModel):
     """Active short position details.
@@ -195,6 +244,22 @@ class ShortPosition(BaseModel):
             real_portion=raw.get("realPortion", 0.0),
         )
 
+    @staticmethod
+    def dump_raw(raw: dict | None) -> dict | None:
+        """from_raw(raw).model_dump(mode="json") without building the model."""
+        if raw is None:
+            return None
+        return {
+            "amount": float(raw.get("amount", 0.0)),
+            "entry_price": float(raw.get("entryPrice", 0.0)),
+            "entry_tick": raw.get("entryTick", 0),
+            "current_value": float(raw.get("currentValue", 0.0)),
+            "pnl": float(raw.get("pnl", 0.0)),
+            "coin_address": raw.get("coinAddress", ""),
+            "bonus_portion": float(raw.get("bonusPortion", 0.0)),
+            "real_portion": float(raw.get("realPortion", 0.0)),
+        }
+
 
 class LeaderboardEntry(BaseModel):
     """Single leaderboard entry (top 10 by PnL).
@@ -260,6 +325,29 @@ class LeaderboardEntry(BaseModel):
             short_position=ShortPosition.from_raw(raw.get("shortPosition")),
         )
 
+    @staticmethod
+    def dump_raw(raw: dict) -> dict:
+        """from_raw(raw).model_dump(mode="json") without building the model."""
+        return {
+            "id": raw.get("id") or "",
+            "username": raw.get("username") or "",
+            "level": raw.get("level") or 0,
+            "pnl": float(raw.get("pnl") or 0.0),
+            "regular_pnl": float(raw.get("regularPnl") or 0.0),
+            "sidebet_pnl": float(raw.get("sidebetPnl") or 0.0),
+            "short_pnl": float(raw.get("shortPnl") or 0.0),
+            "pnl_percent": float(raw.get("pnlPercent") or 0.0),
+            "has_active_trades": raw.get("hasActiveTrades") or False,
+            "position_qty": float(raw.get("positionQty") or 0.0),
+            "avg_cost": float(raw.get("avgCost") or 0.0),
+            "total_invested": float(raw.get("totalInvested") or 0.0),
+            "position": raw.get("position") or 0,
+            "selected_coin": raw.get("selectedCoin"),
+            "sidebet_active": raw.get("sidebetActive"),
+            "side_bet": SideBet.dump_raw(raw.get("sideBet")),
+            "short_position": ShortPosition.dump_raw(raw.get("shortPosition")),
+        }
+
 
 # ---------------------------------------------------------------------------
 # God Candle tier (Section 1.11)
@@ -403,6 +491,33 @@ class GameTick(BaseModel):
             has_god_candle=has_gc,
         )
 
+    @staticmethod
+    def dump_raw(data: dict, phase: Phase) -> dict:
+        """from_raw(data, phase).model_dump(mode="json") without building models.
+
+        Only for ticks without daily records (no highestToday); transition
+        ticks go through from_raw so GodCandleDetector sees a DailyRecords.
+        """
+        return {
+            "game_id": data.get("gameId", ""),
+            "phase": phase.value,
+            "active": data.get("active", False),
+            "price": float(data.get("price", 1.0)),
+            "rugged": data.get("rugged", False),
+            "tick_count": data.get("tickCount", 0),
+            "trade_count": data.get("tradeCount"),
+            "cooldown_timer": data.get("cooldownTimer", 0),
+            "cooldown_paused": data.get("cooldownPaused", False),
+            "allow_pre_round_buys": data.get("allowPreRoundBuys", False),
+            "partial_prices": PartialPrices.dump_raw(data.get("partialPrices")),
+            "provably_fair": ProvablyFair.dump_raw(data.get("provablyFair")),
+            "rugpool": Rugpool.dump_raw(data.get("rugpool")),
+            "leaderboard": [LeaderboardEntry.dump_raw(e) for e in data.get("leaderboard", [])],
+            "game_version": data.get("gameVersion"),
+            "daily_records": None,
+            "has_god_candle": False,
+        }
+
 
 class SessionStats(BaseModel):
     """Server-computed aggregate statistics.
@@ -430,6 +545,19 @@ class SessionStats(BaseModel):
             count_100x=data.get("count100x"),
         )
 
+    @staticmethod
+    def dump_raw(data: dict) -> dict:
+        """from_raw(data).model_dump(mode="json") without building the model."""
+        average = data.get("averageMultiplier")
+        return {
+            "connected_players": data.get("connectedPlayers", 0),
+            "average_multiplier": None if average is None else float(average),
+            "count_2x": data.get("count2x"),
+            "count_10x": data.get("count10x"),
+            "count_50x": data.get("count50x"),
+            "count_100x": data.get("count100x"),
+        }
+
 
 class Trade(BaseModel):
     """Annotated trade from standard/newTrade.
@@ -637,3 +765,27 @@ class SanitizedEvent(BaseModel):
             game_id=game_id,
             phase=phase,
         )
+
+    @classmethod
+    def from_dump(
+        cls,
+        channel: Channel,
+        event_type: str,
+        data: dict[str, Any],
+        game_id: str = "",
+        phase: Phase = Phase.UNKNOWN,
+        timestamp: datetime | None = None,
+    ) -> SanitizedEvent:
+        """Like create(), for data already in model_dump(mode="json") form.
+
+        Skips validation (model_construct); the caller vouches for `data`.
+        """
+        ts = timestamp or datetime.now(UTC)
+        return cls.model_construct(
+            channel=channel,
+            event_type=event_type,
+            data=data,
+            timestamp=ts.isoformat(),
+            game_id=game_id,
+            phase=phase,
+        )
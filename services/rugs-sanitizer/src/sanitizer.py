@@ -19,18 +19,26 @@ from .models import (
     Channel,
     GameHistoryRecord,
     GameTick,
+    Phase,
     SanitizedEvent,
     SessionStats,
     Trade,
 )
 from .phase_detector import PhaseDetector
 from .trade_annotator import TradeAnnotator
+from .trade_store import TradeStore
 
 logger = logging.getLogger(__name__)
 
 # Type alias for event callbacks
 EventCallback = Callable[[SanitizedEvent], None]
 
+# Whether anyone consumes a channel's events right now (see set_demand)
+DemandPredicate = Callable[[Channel, Phase], bool]
+
+# Full-validation sampling interval for the gameStateUpdate fast path
+VALIDATE_EVERY = 100
+
 
 class SanitizationPipeline:
     """Core event processing pipeline.
@@ -40,12 +48,19 @@ class SanitizationPipeline:
     to registered callbacks.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self, trade_store: TradeStore | None = None, validate_every: int = VALIDATE_EVERY
+    ) -> None:
         self._phase_detector = PhaseDetector()
         self._trade_annotator = TradeAnnotator()
         self._god_candle_detector = GodCandleDetector()
+        self._trade_store = trade_store if trade_store is not None else TradeStore()
         self._callbacks: dict[Channel, list[EventCallback]] = {ch: [] for ch in Channel}
         self._stats = PipelineStats()
+        self._demand: DemandPredicate | None = None
+        self._validate_every = validate_every
+        self._since_validation = 0
+        self._shape: tuple | None = None
 
     @property
     def phase_detector(self) -> PhaseDetector:
@@ -59,10 +74,22 @@ class SanitizationPipeline:
     def god_candle_detector(self) -> GodCandleDetector:
         return self._god_candle_detector
 
+    @property
+    def trade_store(self) -> TradeStore:
+        return self._trade_store
+
     def on_event(self, channel: Channel, callback: EventCallback) -> None:
         """Register a callback for events on a specific channel."""
         self._callbacks[channel].append(callback)
 
+    def set_demand(self, demand: DemandPredicate | None) -> None:
+        """Only build events for channels `demand(channel, phase)` accepts.
+
+        Skipped channels cost nothing beyond the state they feed (phase
+        detection, god candle tracking, trade store). None builds everything.
+        """
+        self._demand = demand
+
     def process_raw(self, raw_message: str | dict) -> list[SanitizedEvent]:
         """Process a raw message from rugs-feed WebSocket.
 
@@ -127,48 +154,58 @@ class SanitizationPipeline:
         if data.get("availableShitcoins"):
             self._trade_annotator.update_practice_tokens(data["availableShitcoins"])
 
-        # --- Channel: GAME ---
-        game_tick = GameTick.from_raw(data, phase)
-
-        # God candle change-detection: override the stateless has_god_candle
-        # flag with the detector's result. The wire re-reports stale god candle
-        # data on every transition tick for the rest of the UTC day; the detector
-        # tracks previously seen game IDs and only flags genuinely new ones.
-        if game_tick.daily_records is not None:
-            is_new = self._god_candle_detector.check(game_tick.daily_records)
-            game_tick.has_god_candle = is_new
-
-        game_event = SanitizedEvent.create(
-            channel=Channel.GAME,
-            event_type="gameStateUpdate",
-            model=game_tick,
-            game_id=game_id,
-            phase=phase,
-            timestamp=timestamp,
-        )
-        events.append(game_event)
-        self._emit(Channel.GAME, game_event)
-        self._stats.game_events += 1
-
-        # --- Channel: STATS ---
-        stats = SessionStats.from_raw(data)
-        stats_event = SanitizedEvent.create(
-            channel=Channel.STATS,
-            event_type="gameStateUpdate",
-            model=stats,
-            game_id=game_id,
-            phase=phase,
-            timestamp=timestamp,
-        )
-        events.append(stats_event)
-        self._emit(Channel.STATS, stats_event)
-        self._stats.stats_events += 1
+        # --- Channels: GAME + STATS ---
+        want_game = self._wants(Channel.GAME, phase)
+        want_stats = self._wants(Channel.STATS, phase)
+        if data.get("highestToday") is not None:
+            # Transition tick: full models so GodCandleDetector sees DailyRecords
+            # (always run, so its seen-game state holds without subscribers)
+            game_data, stats_data = self._dump_validated(data, phase)
+            self._stats.validated_events += 1
+        elif want_game or want_stats:
+            game_data, stats_data = self._dump_game_state(data, phase)
+        else:
+            game_data = stats_data = None
+
+        if want_game:
+            game_event = SanitizedEvent.from_dump(
+                channel=Channel.GAME,
+                event_type="gameStateUpdate",
+                data=game_data,
+                game_id=game_id,
+                phase=phase,
+                timestamp=timestamp,
+            )
+            events.append(game_event)
+            self._emit(Channel.GAME, game_event)
+            self._stats.game_events += 1
+        else:
+            self._stats.skipped_events += 1
+
+        if want_stats:
+            stats_event = SanitizedEvent.from_dump(
+                channel=Channel.STATS,
+                event_type="gameStateUpdate",
+                data=stats_data,
+                game_id=game_id,
+                phase=phase,
+                timestamp=timestamp,
+            )
+            events.append(stats_event)
+            self._emit(Channel.STATS, stats_event)
+            self._stats.stats_events += 1
+        else:
+            self._stats.skipped_events += 1
 
         # --- Channel: HISTORY (if gameHistory present) ---
         game_history = data.get("gameHistory")
         if game_history:
             for entry_raw in game_history:
                 record = GameHistoryRecord.from_raw(entry_raw)
+                self._trade_store.add_game_history(record)
+                if not self._wants(Channel.HISTORY, phase):
+                    self._stats.skipped_events += 1
+                    continue
                 history_event = SanitizedEvent.create(
                     channel=Channel.HISTORY,
                     event_type="gameHistory",
@@ -187,6 +224,63 @@ class SanitizationPipeline:
 
         return events
 
+    def _dump_game_state(self, data: dict, phase: Phase) -> tuple[dict, dict]:
+        """GAME and STATS payloads, skipping pydantic construction when trusted.
+
+        Upstream payloads are trusted between samples: every
+        `validate_every`-th tick, and any tick whose top-level or
+        leaderboard key layout differs from the last one, goes through the
+        full models instead. A fast dump that disagrees with its validated
+        counterpart is logged, the validated payload wins, and validation
+        continues on every tick until the two agree again.
+        """
+        leaderboard = data.get("leaderboard")
+        shape = (tuple(data), tuple(leaderboard[0]) if leaderboard else ())
+        self._since_validation += 1
+        if shape != self._shape or self._since_validation >= self._validate_every:
+            self._shape = shape
+            self._since_validation = 0
+            game_data, stats_data = self._dump_validated(data, phase)
+            self._stats.validated_events += 1
+            try:
+                fast = (GameTick.dump_raw(data, phase), SessionStats.dump_raw(data))
+            except (TypeError, ValueError, AttributeError):
+                fast = None
+            if fast != (game_data, stats_data):
+                # Keep validating every tick until a sample agrees again
+                self._shape = None
+                self._stats.fast_path_mismatches += 1
+                logger.warning("Fast-path gameStateUpdate dump disagrees with validated models")
+            return game_data, stats_data
+
+        try:
+            game_data = GameTick.dump_raw(data, phase)
+            stats_data = SessionStats.dump_raw(data)
+        except (TypeError, ValueError, AttributeError):
+            # Malformed values: the validating path raises the proper error
+            self._shape = None
+            return self._dump_validated(data, phase)
+        self._stats.fast_path_events += 1
+        return game_data, stats_data
+
+    def _dump_validated(self, data: dict, phase: Phase) -> tuple[dict, dict]:
+        """GAME and STATS payloads via the full pydantic models."""
+        game_tick = GameTick.from_raw(data, phase)
+
+        # God candle change-detection: override the stateless has_god_candle
+        # flag with the detector's result. The wire re-reports stale god candle
+        # data on every transition tick for the rest of the UTC day; the detector
+        # tracks previously seen game IDs and only flags genuinely new ones.
+        if game_tick.daily_records is not None:
+            is_new = self._god_candle_detector.check(game_tick.daily_records)
+            game_tick.has_god_candle = is_new
+
+        stats = SessionStats.from_raw(data)
+        return game_tick.model_dump(mode="json"), stats.model_dump(mode="json")
+
+    def _wants(self, channel: Channel, phase: Phase) -> bool:
+        return self._demand is None or self._demand(channel, phase)
+
     def _process_trade(self, data: dict, timestamp: datetime) -> list[SanitizedEvent]:
         """Process standard/newTrade into trades channel."""
         game_id = data.get("gameId", "")
@@ -195,6 +289,10 @@ class SanitizationPipeline:
         # Parse and annotate
         trade = Trade.from_raw(data)
         self._trade_annotator.annotate(trade, phase)
+        self._trade_store.add_trade(trade, timestamp)
+        if not self._wants(Channel.TRADES, phase):
+            self._stats.skipped_events += 1
+            return []
 
         # Create event
         trade_event = SanitizedEvent.create(
@@ -230,7 +328,12 @@ class SanitizationPipeline:
             "other_events": self._stats.other_events,
             "parse_errors": self._stats.parse_errors,
             "empty_events": self._stats.empty_events,
+            "skipped_events": self._stats.skipped_events,
+            "fast_path_events": self._stats.fast_path_events,
+            "validated_events": self._stats.validated_events,
+            "fast_path_mismatches": self._stats.fast_path_mismatches,
             "phase": self._phase_detector.get_stats(),
+            "trade_store": self._trade_store.get_stats(),
         }
 
 
@@ -246,3 +349,7 @@ class PipelineStats:
         self.other_events: int = 0
         self.parse_errors: int = 0
         self.empty_events: int = 0
+        self.skipped_events: int = 0
+        self.fast_path_events: int = 0
+        self.validated_events: int = 0
+        self.fast_path_mismatches: int = 0
@@ -0,0 +1,398 @@
+"""
+Columnar in-memory index of trades and sidebets.
+
+Every annotated standard/newTrade and every gameHistory sidebet is appended
+as one row to a column buffer (constant time). Full buffers are sealed into
+Arrow record batches kept in a ring of segments; with a flush directory each
+sealed segment is also written to Parquet, so disk keeps the full history
+while memory stays bounded.
+
+Per-game, per-player and per-game-player flow aggregates (volume, net flow,
+sidebet exposure) are maintained incrementally on append, so whale-flow
+signals never re-scan raw events. Row queries filter the in-memory segments
+with pyarrow.compute.
+
+Single-threaded: called from the pipeline and API handlers on the service's
+asyncio loop.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import os
+from collections import OrderedDict, deque
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from .models import GameHistoryRecord, Trade, TradeType
+
+logger = logging.getLogger(__name__)
+
+TRADE_STORE_SCHEMA = pa.schema(
+    [
+        ("kind", pa.string()),  # "trade" | "sidebet"
+        ("event_id", pa.string()),
+        ("game_id", pa.string()),
+        ("player_id", pa.string()),
+        ("username", pa.string()),
+        ("action", pa.string()),  # TradeType value, or "placed" | "payout"
+        ("tick", pa.int64()),
+        ("price", pa.float64()),
+        ("amount", pa.float64()),  # SOL traded, or sidebet stake
+        ("qty", pa.float64()),
+        ("payout", pa.float64()),  # Sidebet payout (0.0 otherwise)
+        ("coin", pa.string()),
+        ("token_type", pa.string()),
+        ("is_forced_sell", pa.bool_()),
+        ("timestamp_ms", pa.int64()),
+    ]
+)
+
+_COLUMNS = TRADE_STORE_SCHEMA.names
+
+# SOL committed to the game (inflow) vs taken out (outflow)
+_INFLOW = frozenset({TradeType.BUY, TradeType.SHORT_OPEN})
+_OUTFLOW = frozenset({TradeType.SELL, TradeType.SHORT_CLOSE})
+
+# Aggregate fields that whales() can rank by
+RANK_FIELDS = ("volume", "net_flow", "inflow", "outflow", "sidebet_stake")
+
+QUERY_FILTERS = ("kind", "game_id", "player_id", "coin", "token_type")
+
+
+class FlowAggregate:
+    """Running trade and sidebet totals for a game, player or both."""
+
+    __slots__ = (
+        "forced_sells",
+        "inflow",
+        "last_ms",
+        "outflow",
+        "sidebet_payout",
+        "sidebet_stake",
+        "sidebets",
+        "trades",
+    )
+
+    def __init__(self) -> None:
+        self.trades = 0
+        self.inflow = 0.0
+        self.outflow = 0.0
+        self.forced_sells = 0
+        self.sidebets = 0
+        self.sidebet_stake = 0.0
+        self.sidebet_payout = 0.0
+        self.last_ms = 0
+
+    @property
+    def volume(self) -> float:
+        return self.inflow + self.outflow
+
+    @property
+    def net_flow(self) -> float:
+        """SOL committed minus SOL taken out (positive = buying pressure)."""
+        return self.inflow - self.outflow
+
+    def add_trade(self, action: TradeType, amount: float, forced: bool, ts_ms: int) -> None:
+        self.trades += 1
+        if action in _INFLOW:
+            self.inflow += amount
+        elif action in _OUTFLOW:
+            self.outflow += amount
+        self.forced_sells += forced
+        self.last_ms = max(self.last_ms, ts_ms)
+
+    def add_sidebet(self, stake: float, payout: float, ts_ms: int) -> None:
+        self.sidebets += 1
+        self.sidebet_stake += stake
+        self.sidebet_payout += payout
+        self.last_ms = max(self.last_ms, ts_ms)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "trades": self.trades,
+            "volume": self.volume,
+            "inflow": self.inflow,
+            "outflow": self.outflow,
+            "net_flow": self.net_flow,
+            "forced_sells": self.forced_sells,
+            "sidebets": self.sidebets,
+            "sidebet_stake": self.sidebet_stake,
+            "sidebet_payout": self.sidebet_payout,
+            "last_ms": self.last_ms,
+        }
+
+
+class TradeStore:
+    """Columnar trade/sidebet index with incremental flow aggregates.
+
+    Rows land in a column buffer; every `segment_rows` rows it is sealed
+    into an Arrow record batch. The newest `max_segments` batches stay in
+    memory; sealed batches are written to `flush_dir` (if set) as Parquet.
+    """
+
+    def __init__(
+        self,
+        segment_rows: int = 4096,
+        max_segments: int = 64,
+        flush_dir: str | Path | None = None,
+        max_games: int = 500,
+        max_players: int = 10_000,
+    ) -> None:
+        self._segment_rows = segment_rows
+        self._segments: deque[pa.RecordBatch] = deque(maxlen=max_segments)
+        self._buffer: dict[str, list] = {name: [] for name in _COLUMNS}
+        self._buffered = 0
+        self._flush_dir = Path(flush_dir) if flush_dir else None
+
+        self._max_games = max_games
+        self._max_players = max_players
+        self._games: OrderedDict[str, FlowAggregate] = OrderedDict()
+        self._game_players: dict[str, dict[str, FlowAggregate]] = {}
+        self._players: OrderedDict[str, FlowAggregate] = OrderedDict()
+        self._usernames: dict[str, str] = {}
+        # Games whose gameHistory sidebets were already indexed (rolling window)
+        self._sidebet_games: OrderedDict[str, None] = OrderedDict()
+
+        self._rows_total = 0
+        self._segments_sealed = 0
+        self._files_written = 0
+        self._flush_errors = 0
+
+    # ------------------------------------------------------------------
+    # Ingest
+    # ------------------------------------------------------------------
+
+    def add_trade(self, trade: Trade, timestamp: datetime | None = None) -> None:
+        """Index an annotated trade."""
+        ts_ms = _to_ms(timestamp)
+        self._append(
+            "trade",
+            trade.id,
+            trade.game_id,
+            trade.player_id,
+            trade.username,
+            trade.type.value,
+            trade.tick_index,
+            trade.price,
+            trade.amount,
+            trade.qty,
+            0.0,
+            trade.coin,
+            trade.token_type,
+            trade.is_forced_sell,
+            ts_ms,
+        )
+        for agg in self._aggregates(trade.game_id, trade.player_id, trade.username):
+            agg.add_trade(trade.type, trade.amount, trade.is_forced_sell, ts_ms)
+
+    def add_game_history(self, record: GameHistoryRecord) -> int:
+        """Index a completed game's sidebets (once per game).
+
+        gameHistory is a rolling window, so the same game is seen ~10 times;
+        repeats are skipped.
+
+        Returns:
+            Number of sidebet rows added.
+        """
+        if not record.id or record.id in self._sidebet_games:
+            return 0
+        self._sidebet_games[record.id] = None
+        if len(self._sidebet_games) > self._max_games:
+            self._sidebet_games.popitem(last=False)
+
+        for entry in record.global_sidebets:
+            game_id = entry.game_id or record.id
+            payout = entry.payout or 0.0
+            # Placed rows carry the stake; payout rows carry the winnings
+            stake = entry.bet_amount if entry.type == "placed" else 0.0
+            tick = entry.started_at_tick if entry.type == "placed" else entry.end_tick
+            ts_ms = entry.timestamp or record.timestamp
+            self._append(
+                "sidebet",
+                entry.id,
+                game_id,
+                entry.player_id,
+                entry.username,
+                entry.type,
+                tick or 0,
+                0.0,
+                entry.bet_amount,
+                0.0,
+                payout,
+                entry.coin_address,
+                "unknown",
+                False,
+                ts_ms,
+            )
+            for agg in self._aggregates(game_id, entry.player_id, entry.username):
+                agg.add_sidebet(stake, payout, ts_ms)
+        return len(record.global_sidebets)
+
+    def _append(self, *row: Any) -> None:
+        buffer = self._buffer
+        for name, value in zip(_COLUMNS, row, strict=True):
+            buffer[name].append(value)
+        self._buffered += 1
+        self._rows_total += 1
+        if self._buffered >= self._segment_rows:
+            self.seal()
+
+    def _aggregates(self, game_id: str, player_id: str, username: str) -> list[FlowAggregate]:
+        """Aggregates touched by one row: game, player, player-within-game."""
+        game = self._games.get(game_id)
+        if game is None:
+            game = self._games[game_id] = FlowAggregate()
+            self._game_players[game_id] = {}
+            if len(self._games) > self._max_games:
+                evicted, _ = self._games.popitem(last=False)
+                self._game_players.pop(evicted, None)
+
+        player = self._players.get(player_id)
+        if player is None:
+            player = self._players[player_id] = FlowAggregate()
+            if len(self._players) > self._max_players:
+                evicted, _ = self._players.popitem(last=False)
+                self._usernames.pop(evicted, None)
+        else:
+            self._players.move_to_end(player_id)
+        if username:
+            self._usernames[player_id] = username
+
+        in_game = self._game_players[game_id].get(player_id)
+        if in_game is None:
+            in_game = self._game_players[game_id][player_id] = FlowAggregate()
+        return [game, player, in_game]
+
+    # ------------------------------------------------------------------
+    # Segments
+    # ------------------------------------------------------------------
+
+    def seal(self) -> pa.RecordBatch | None:
+        """Seal buffered rows into an Arrow segment (and Parquet, if configured)."""
+        if not self._buffered:
+            return None
+        batch = pa.RecordBatch.from_pydict(self._buffer, schema=TRADE_STORE_SCHEMA)
+        self._buffer = {name: [] for name in _COLUMNS}
+        self._buffered = 0
+        self._segments.append(batch)
+        self._segments_sealed += 1
+        if self._flush_dir is not None:
+            self._write_segment(batch)
+        return batch
+
+    def flush(self) -> None:
+        """Seal the partial segment (call on shutdown)."""
+        self.seal()
+
+    def _write_segment(self, batch: pa.RecordBatch) -> None:
+        name = f"trades-{datetime.now(UTC):%Y%m%dT%H%M%S}-{self._segments_sealed:06d}.parquet"
+        target = self._flush_dir / name
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_suffix(".tmp")
+            pq.write_table(pa.Table.from_batches([batch]), tmp, compression="zstd")
+            os.replace(tmp, target)
+            self._files_written += 1
+        except OSError as e:
+            self._flush_errors += 1
+            logger.error(f"Failed to flush trade segment {name}: {e}")
+
+    def table(self) -> pa.Table:
+        """All in-memory rows (sealed segments plus the open buffer), oldest first."""
+        batches = list(self._segments)
+        if self._buffered:
+            batches.append(pa.RecordBatch.from_pydict(self._buffer, schema=TRADE_STORE_SCHEMA))
+        return pa.Table.from_batches(batches, schema=TRADE_STORE_SCHEMA)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def query(self, limit: int = 100, **filters: str | None) -> list[dict[str, Any]]:
+        """Most recent rows matching all given filters, newest first.
+
+        Args:
+            limit: Maximum rows returned
+            **filters: Equality filters on QUERY_FILTERS columns (None = any)
+        """
+        unknown = set(filters) - set(QUERY_FILTERS)
+        if unknown:
+            raise ValueError(f"Unknown filters {sorted(unknown)}. Valid: {QUERY_FILTERS}")
+
+        table = self.table()
+        mask = None
+        for column, value in filters.items():
+            if value is None:
+                continue
+            match = pc.equal(table[column], value)
+            mask = match if mask is None else pc.and_(mask, match)
+        if mask is not None:
+            table = table.filter(mask)
+
+        start = max(0, table.num_rows - limit)
+        rows = table.slice(start).to_pylist()
+        rows.reverse()
+        return rows
+
+    def game_summary(self, game_id: str) -> dict[str, Any] | None:
+        agg = self._games.get(game_id)
+        if agg is None:
+            return None
+        return {"game_id": game_id, "players": len(self._game_players[game_id]), **agg.to_dict()}
+
+    def player_summary(self, player_id: str) -> dict[str, Any] | None:
+        agg = self._players.get(player_id)
+        if agg is None:
+            return None
+        return {
+            "player_id": player_id,
+            "username": self._usernames.get(player_id, ""),
+            **agg.to_dict(),
+        }
+
+    def whales(
+        self, limit: int = 10, by: str = "volume", game_id: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Top players by an aggregate field, session-wide or within one game.
+
+        net_flow ranks by magnitude (largest buyers and sellers both surface).
+        """
+        if by not in RANK_FIELDS:
+            raise ValueError(f"Unknown ranking '{by}'. Valid: {RANK_FIELDS}")
+        players = self._players if game_id is None else self._game_players.get(game_id, {})
+
+        def key(item: tuple[str, FlowAggregate]) -> float:
+            value = getattr(item[1], by)
+            return abs(value) if by == "net_flow" else value
+
+        top = heapq.nlargest(limit, players.items(), key=key)
+        return [
+            {"player_id": pid, "username": self._usernames.get(pid, ""), **agg.to_dict()}
+            for pid, agg in top
+        ]
+
+    def get_stats(self) -> dict:
+        """Return store statistics."""
+        return {
+            "rows_total": self._rows_total,
+            "rows_in_memory": sum(b.num_rows for b in self._segments) + self._buffered,
+            "segments": len(self._segments),
+            "segments_sealed": self._segments_sealed,
+            "files_written": self._files_written,
+            "flush_errors": self._flush_errors,
+            "flush_dir": str(self._flush_dir) if self._flush_dir else None,
+            "games": len(self._games),
+            "players": len(self._players),
+        }
+
+
+def _to_ms(timestamp: datetime | None) -> int:
+    ts = timestamp or datetime.now(UTC)
+    return int(ts.timestamp() * 1000)
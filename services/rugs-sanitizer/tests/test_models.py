@@ -1,5 +1,8 @@
 """Tests for Pydantic models derived from Rosetta Stone v0.2.0."""
 
+import random
+from datetime import UTC, datetime
+
 import pytest
 from src.models import (
     Channel,
@@ -590,3 +593,68 @@ class TestSanitizedEvent:
         assert evt.phase == Phase.ACTIVE
         assert evt.data["connected_players"] == 150
         assert "T" in evt.timestamp  # ISO format
+
+
+class TestDumpRaw:
+    """dump_raw must produce exactly what from_raw(...).model_dump(mode="json") does."""
+
+    @pytest.mark.parametrize("tick", [ACTIVE_TICK, RUGGED_TICK, COOLDOWN_TICK, PRESALE_TICK])
+    def test_game_tick_parity(self, tick):
+        for phase in (Phase.ACTIVE, Phase.COOLDOWN):
+            expected = GameTick.from_raw(tick, phase).model_dump(mode="json")
+            assert GameTick.dump_raw(tick, phase) == expected
+
+    def test_session_stats_parity(self):
+        for tick in (ACTIVE_TICK, COOLDOWN_TICK, {}):
+            assert SessionStats.dump_raw(tick) == SessionStats.from_raw(tick).model_dump(
+                mode="json"
+            )
+
+    def test_randomized_parity_and_wire_json(self):
+        """Ints for floats, nulls and missing sub-objects serialize identically"""
+        rng = random.Random(11)
+
+        def number():
+            return rng.choice([0, 1, 3, None, 0.5, rng.uniform(-2, 2)])
+
+        for _ in range(200):
+            entry = {
+                "id": rng.choice(["did:privy:x", None]),
+                "username": rng.choice(["u", None]),
+                "level": rng.choice([0, 7, None]),
+                "pnl": number(),
+                "regularPnl": number(),
+                "sidebetPnl": number(),
+                "shortPnl": number(),
+                "positionQty": number(),
+                "avgCost": number(),
+                "position": rng.choice([1, None]),
+                "selectedCoin": rng.choice([None, {"address": "0xPractice"}]),
+                "sidebetActive": rng.choice([None, True]),
+                "sideBet": rng.choice(
+                    [None, {"startedAtTick": 3, "end": 43, "betAmount": 1, "gameId": "g"}]
+                ),
+                "shortPosition": rng.choice(
+                    [None, {"amount": 1, "entryPrice": 2, "entryTick": 5, "pnl": 0}]
+                ),
+            }
+            tick = {
+                **ACTIVE_TICK,
+                "price": rng.choice([1, 2.5, rng.random()]),
+                "averageMultiplier": rng.choice([None, 15, 15.5]),
+                "rugpool": rng.choice([None, {"rugpoolAmount": 4}]),
+                "partialPrices": {"startTick": 0, "endTick": 1, "values": {"0": 1, "1": 1.5}},
+                "leaderboard": [entry],
+            }
+            model = GameTick.from_raw(tick, Phase.ACTIVE)
+            fast = GameTick.dump_raw(tick, Phase.ACTIVE)
+            assert fast == model.model_dump(mode="json")
+
+            ts = datetime(2026, 2, 6, 3, 4, 19, tzinfo=UTC)
+            validated = SanitizedEvent.create(
+                Channel.GAME, "gameStateUpdate", model, "g", timestamp=ts
+            )
+            constructed = SanitizedEvent.from_dump(
+                Channel.GAME, "gameStateUpdate", fast, "g", timestamp=ts
+            )
+            assert constructed.model_dump_json() == validated.model_dump_json()
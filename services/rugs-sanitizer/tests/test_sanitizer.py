@@ -3,6 +3,7 @@
 import json
 
 import pytest
+from pydantic import ValidationError
 from src.models import Channel, Phase, SanitizedEvent
 from src.sanitizer import SanitizationPipeline
 
@@ -323,3 +324,65 @@ class TestEdgeCases:
         assert stats["stats_events"] == 1
         assert stats["trade_events"] == 1
         assert stats["parse_errors"] == 1
+
+
+class TestFastPath:
+    def test_fast_path_matches_validated_output(self):
+        fast = SanitizationPipeline(validate_every=1000)
+        validated = SanitizationPipeline(validate_every=1)
+        for tick in range(50, 60):
+            raw = make_raw_event("gameStateUpdate", {**ACTIVE_DATA, "tickCount": tick})
+            fast_json = [e.model_dump_json() for e in fast.process_raw(raw)]
+            validated_json = [e.model_dump_json() for e in validated.process_raw(raw)]
+            assert fast_json == validated_json
+
+        assert fast.get_stats()["fast_path_events"] == 9
+        assert fast.get_stats()["fast_path_mismatches"] == 0
+        assert validated.get_stats()["fast_path_events"] == 0
+
+    def test_validation_sampled(self):
+        pipeline = SanitizationPipeline(validate_every=4)
+        for _ in range(9):
+            pipeline.process_raw(make_raw_event("gameStateUpdate", ACTIVE_DATA))
+
+        stats = pipeline.get_stats()
+        assert stats["validated_events"] == 3  # First tick, then every 4th
+        assert stats["fast_path_events"] == 6
+
+    def test_shape_change_revalidates(self):
+        pipeline = SanitizationPipeline(validate_every=1000)
+        pipeline.process_raw(make_raw_event("gameStateUpdate", ACTIVE_DATA))
+        pipeline.process_raw(make_raw_event("gameStateUpdate", ACTIVE_DATA))
+        pipeline.process_raw(make_raw_event("gameStateUpdate", {**ACTIVE_DATA, "newField": 1}))
+
+        assert pipeline.get_stats()["validated_events"] == 2
+
+    def test_malformed_values_still_rejected(self):
+        pipeline = SanitizationPipeline(validate_every=1000)
+        pipeline.process_raw(make_raw_event("gameStateUpdate", ACTIVE_DATA))
+
+        with pytest.raises(ValidationError):
+            pipeline.process_raw(make_raw_event("gameStateUpdate", {**ACTIVE_DATA, "price": "x"}))
+
+
+class TestChannelDemand:
+    def test_undemanded_channels_skipped(self):
+        pipeline = SanitizationPipeline()
+        pipeline.set_demand(lambda channel, phase: channel == Channel.STATS)
+
+        events = pipeline.process_raw(make_raw_event("gameStateUpdate", HISTORY_DATA))
+        assert [e.channel for e in events] == [Channel.STATS]
+        assert pipeline.process_raw(make_raw_event("standard/newTrade", TRADE_DATA)) == []
+
+        stats = pipeline.get_stats()
+        assert stats["skipped_events"] == 4  # game + 2 history + trade
+        assert stats["trade_store"]["rows_total"] == 1
+
+    def test_nothing_built_without_demand(self):
+        pipeline = SanitizationPipeline()
+        pipeline.set_demand(lambda channel, phase: False)
+
+        assert pipeline.process_raw(make_raw_event("gameStateUpdate", ACTIVE_DATA)) == []
+        stats = pipeline.get_stats()
+        assert stats["fast_path_events"] == stats["validated_events"] == 0
+        assert pipeline.phase_detector.current_phase == Phase.ACTIVE
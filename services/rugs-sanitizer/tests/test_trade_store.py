@@ -0,0 +1,228 @@
+"""Tests for the columnar trade/sidebet store."""
+
+import random
+
+import pyarrow.parquet as pq
+import pytest
+from src.models import GameHistoryRecord, Trade, TradeType
+from src.sanitizer import SanitizationPipeline
+from src.trade_store import TRADE_STORE_SCHEMA, TradeStore
+
+
+def make_trade(n: int, player: str = "p1", game: str = "g1", **kwargs) -> Trade:
+    fields = {
+        "id": f"t{n}",
+        "game_id": game,
+        "player_id": player,
+        "username": player.upper(),
+        "type": TradeType.BUY,
+        "price": 1.2,
+        "amount": 0.1,
+        "qty": 0.08,
+        "tick_index": n,
+    }
+    fields.update(kwargs)
+    return Trade(**fields)
+
+
+def make_history(game_id: str, sidebets: list[dict]) -> GameHistoryRecord:
+    return GameHistoryRecord.from_raw(
+        {"id": game_id, "timestamp": 1770000000000, "globalSidebets": sidebets}
+    )
+
+
+PLACED = {
+    "id": "sb1",
+    "playerId": "p1",
+    "username": "P1",
+    "gameId": "g1",
+    "type": "placed",
+    "betAmount": 0.01,
+    "startedAtTick": 40,
+    "timestamp": 1770000000100,
+}
+PAYOUT = {
+    "id": "sb2",
+    "playerId": "p1",
+    "username": "P1",
+    "gameId": "g1",
+    "type": "payout",
+    "betAmount": 0.01,
+    "payout": 0.05,
+    "profit": 0.04,
+    "endTick": 80,
+    "timestamp": 1770000000200,
+}
+
+
+class TestAggregates:
+    def test_flow_per_game_and_player(self):
+        store = TradeStore()
+        store.add_trade(make_trade(1, amount=0.5))
+        store.add_trade(make_trade(2, type=TradeType.SELL, amount=0.2))
+        store.add_trade(make_trade(3, player="p2", type=TradeType.SHORT_OPEN, amount=0.3))
+
+        game = store.game_summary("g1")
+        assert game["trades"] == 3
+        assert game["players"] == 2
+        assert game["inflow"] == pytest.approx(0.8)
+        assert game["net_flow"] == pytest.approx(0.6)
+
+        p1 = store.player_summary("p1")
+        assert p1["username"] == "P1"
+        assert p1["volume"] == pytest.approx(0.7)
+        assert p1["net_flow"] == pytest.approx(0.3)
+        assert store.player_summary("nobody") is None
+
+    def test_forced_sells_counted(self):
+        store = TradeStore()
+        store.add_trade(make_trade(1, type=TradeType.SELL, is_forced_sell=True))
+
+        assert store.game_summary("g1")["forced_sells"] == 1
+
+    def test_sidebet_exposure(self):
+        store = TradeStore()
+        added = store.add_game_history(make_history("g1", [PLACED, PAYOUT]))
+
+        assert added == 2
+        p1 = store.player_summary("p1")
+        assert p1["sidebets"] == 2
+        assert p1["sidebet_stake"] == pytest.approx(0.01)
+        assert p1["sidebet_payout"] == pytest.approx(0.05)
+        assert p1["trades"] == 0
+
+    def test_rolling_history_indexed_once(self):
+        store = TradeStore()
+        record = make_history("g1", [PLACED])
+        store.add_game_history(record)
+
+        assert store.add_game_history(record) == 0
+        assert store.player_summary("p1")["sidebets"] == 1
+
+    def test_matches_full_recomputation(self):
+        """Incremental aggregates equal a scan over the stored rows"""
+        rng = random.Random(7)
+        store = TradeStore(segment_rows=64)
+        kinds = list(TradeType)
+        for n in range(1000):
+            trade = make_trade(
+                n,
+                player=f"p{rng.randint(0, 9)}",
+                game=f"g{n // 250}",
+                type=rng.choice(kinds),
+                amount=round(rng.uniform(0.001, 2.0), 6),
+            )
+            store.add_trade(trade)
+
+        for player in (f"p{i}" for i in range(10)):
+            rows = store.query(limit=10_000, player_id=player)
+            inflow = sum(r["amount"] for r in rows if r["action"] in ("buy", "short_open"))
+            outflow = sum(r["amount"] for r in rows if r["action"] in ("sell", "short_close"))
+            summary = store.player_summary(player)
+            assert summary["trades"] == len(rows)
+            assert summary["net_flow"] == pytest.approx(inflow - outflow)
+
+    def test_aggregates_bounded(self):
+        store = TradeStore(max_games=2, max_players=3)
+        for n in range(5):
+            store.add_trade(make_trade(n, player=f"p{n}", game=f"g{n}"))
+
+        assert store.game_summary("g0") is None
+        assert store.game_summary("g4") is not None
+        assert store.get_stats()["players"] == 3
+
+
+class TestWhales:
+    def test_rank_by_volume_within_game(self):
+        store = TradeStore()
+        store.add_trade(make_trade(1, player="small", amount=0.01))
+        store.add_trade(make_trade(2, player="whale", amount=5.0))
+        store.add_trade(make_trade(3, player="elsewhere", game="g2", amount=9.0))
+
+        top = store.whales(limit=2, game_id="g1")
+        assert [w["player_id"] for w in top] == ["whale", "small"]
+
+    def test_net_flow_ranks_by_magnitude(self):
+        store = TradeStore()
+        store.add_trade(make_trade(1, player="buyer", amount=1.0))
+        store.add_trade(make_trade(2, player="dumper", type=TradeType.SELL, amount=3.0))
+
+        assert store.whales(limit=1, by="net_flow")[0]["player_id"] == "dumper"
+
+    def test_unknown_ranking(self):
+        with pytest.raises(ValueError, match="Unknown ranking"):
+            TradeStore().whales(by="luck")
+
+
+class TestSegments:
+    def test_seal_and_ring_bound(self):
+        store = TradeStore(segment_rows=10, max_segments=3)
+        for n in range(45):
+            store.add_trade(make_trade(n))
+
+        stats = store.get_stats()
+        assert stats["segments_sealed"] == 4
+        assert stats["rows_in_memory"] == 35  # 3 segments + 5 buffered
+        assert stats["rows_total"] == 45
+        assert store.table().schema == TRADE_STORE_SCHEMA
+        # Aggregates cover rows that left memory
+        assert store.game_summary("g1")["trades"] == 45
+
+    def test_query_filters_newest_first(self):
+        store = TradeStore(segment_rows=4)
+        for n in range(10):
+            store.add_trade(make_trade(n, player="p1" if n % 2 else "p2"))
+        store.add_game_history(make_history("g1", [PLACED]))
+
+        rows = store.query(limit=3, player_id="p1", kind="trade")
+        assert [r["event_id"] for r in rows] == ["t9", "t7", "t5"]
+        assert store.query(kind="sidebet")[0]["tick"] == 40
+
+    def test_unknown_filter(self):
+        with pytest.raises(ValueError, match="Unknown filters"):
+            TradeStore().query(price="1.0")
+
+    def test_flush_writes_parquet(self, tmp_path):
+        store = TradeStore(segment_rows=5, flush_dir=tmp_path)
+        for n in range(7):
+            store.add_trade(make_trade(n))
+        store.flush()
+
+        files = sorted(tmp_path.glob("*.parquet"))
+        assert len(files) == 2
+        assert not list(tmp_path.glob("*.tmp"))
+        table = pq.read_table(files[0])
+        assert table.schema == TRADE_STORE_SCHEMA
+        assert table.num_rows + pq.read_table(files[1]).num_rows == 7
+        assert store.get_stats()["files_written"] == 2
+
+
+class TestPipelineIntegration:
+    def test_trades_and_history_indexed(self):
+        pipeline = SanitizationPipeline()
+        trade = {
+            "id": "trade-1",
+            "gameId": "g1",
+            "playerId": "p1",
+            "username": "P1",
+            "type": "buy",
+            "price": 1.5,
+            "tickIndex": 10,
+            "amount": 0.25,
+        }
+        pipeline.process_raw({"event_type": "standard/newTrade", "data": trade})
+        pipeline.process_raw(
+            {
+                "event_type": "gameStateUpdate",
+                "data": {
+                    "gameId": "g2",
+                    "active": False,
+                    "gameHistory": [{"id": "g1", "timestamp": 1, "globalSidebets": [PLACED]}],
+                },
+            }
+        )
+
+        summary = pipeline.trade_store.player_summary("p1")
+        assert summary["trades"] == 1
+        assert summary["sidebets"] == 1
+        assert pipeline.get_stats()["trade_store"]["rows_total"] == 2
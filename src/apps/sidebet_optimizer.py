@@ -86,20 +86,18 @@ def load_games():
     return df[df["rug_tick"] >= 10]
 
 
-@st.cache_data
+# Widest window offered by the sidebar slider; surfaces cover 0..MAX_WINDOW
+MAX_WINDOW = 100
+
+
 def build_survival_model(rug_ticks):
     """Build survival model from rug tick data."""
-    max_tick = int(max(rug_ticks)) + 1
+    rug_ticks = np.asarray(rug_ticks, dtype=np.int64)
+    max_tick = int(rug_ticks.max()) + 1
 
-    # Compute hazard rate
-    rug_counts = np.zeros(max_tick)
-    at_risk = np.zeros(max_tick)
-
-    for rt in rug_ticks:
-        rt = int(rt)
-        at_risk[: rt + 1] += 1
-        if rt < max_tick:
-            rug_counts[rt] += 1
+    # Compute hazard rate (games at risk at t = games rugging at or after t)
+    rug_counts = np.bincount(rug_ticks, minlength=max_tick).astype(float)
+    at_risk = np.cumsum(rug_counts[::-1])[::-1]
 
     hazard = np.divide(rug_counts, at_risk, out=np.zeros(max_tick), where=at_risk > 0)
     hazard_smooth = np.convolve(hazard, np.ones(10) / 10, mode="same")
@@ -108,13 +106,50 @@ def build_survival_model(rug_ticks):
     return hazard_smooth, survival, at_risk
 
 
-def p_win(tick, window, survival):
-    """P(rug in next window ticks | at tick) = sidebet win probability."""
-    if tick >= len(survival) - 1:
-        return 1.0
-    s_now = survival[tick]
-    s_future = survival[min(tick + window, len(survival) - 1)]
-    return 1 - (s_future / s_now) if s_now > 0 else 0.5
+def p_win_surface(survival, max_window=MAX_WINDOW):
+    """
+    P(rug in next window ticks | at tick) for every (tick, window).
+
+    Row t, column w is the sidebet win probability entering at tick t with a
+    w-tick window. Ticks at or past the end of the model win with certainty.
+    """
+    last = len(survival) - 1
+    ticks = np.arange(len(survival))[:, None]
+    windows = np.arange(max_window + 1)[None, :]
+
+    s_now = survival[:, None]
+    s_future = survival[np.minimum(ticks + windows, last)]
+    ratio = np.divide(s_future, s_now, out=np.ones_like(s_future), where=s_now > 0)
+    surface = np.where(s_now > 0, 1 - ratio, 0.5)
+    surface[last:] = 1.0
+    return surface
+
+
+@st.cache_resource
+def load_model():
+    """Load games and build the survival model and P(win) surface once per dataset."""
+    df = load_games()
+    hazard, survival, at_risk = build_survival_model(df["rug_tick"].values)
+    p_surface = p_win_surface(survival)
+    for arr in (hazard, survival, at_risk, p_surface):
+        arr.flags.writeable = False
+    return df, hazard, survival, at_risk, p_surface
+
+
+@st.cache_resource
+def payout_surfaces(payout):
+    """EV (%/SOL) and Kelly fraction surfaces for one payout, memoized."""
+    p_surface = load_model()[4]
+    ev = expected_value(p_surface, payout) * 1000
+    kelly_f = kelly(p_surface, payout)
+    ev.flags.writeable = False
+    kelly_f.flags.writeable = False
+    return ev, kelly_f
+
+
+def surface_rows(ticks, p_surface):
+    """Surface row index per tick (ticks past the model share its last row)."""
+    return np.minimum(ticks, len(p_surface) - 1)
 
 
 def expected_value(p, payout, bet=0.001):
@@ -130,7 +165,7 @@ def breakeven(payout):
 def kelly(p, payout):
     """Kelly criterion: f* = (p*b - q) / b"""
     b = payout - 1
-    return max(0, (p * b - (1 - p)) / b)
+    return np.maximum(0, (p * b - (1 - p)) / b)
 
 
 # =============================================================================
@@ -192,11 +227,11 @@ def chart_survival(hazard, survival):
     return fig
 
 
-def chart_ev_by_tick(survival, window, payout):
+def chart_ev_by_tick(p_surface, ev_surface, window, payout):
     """Win probability and EV by entry tick."""
-    ticks = np.arange(10, min(600, len(survival) - window), 2)
-    p_wins = [p_win(t, window, survival) for t in ticks]
-    evs = [expected_value(p, payout) * 1000 for p in p_wins]  # % per SOL
+    ticks = np.arange(10, min(600, len(p_surface) - window), 2)
+    p_wins = p_surface[ticks, window]
+    evs = ev_surface[ticks, window]  # % per SOL
     be = breakeven(payout)
 
     fig = make_subplots(
@@ -214,7 +249,7 @@ def chart_ev_by_tick(survival, window, payout):
     fig.add_trace(
         go.Scatter(
             x=ticks,
-            y=np.array(p_wins) * 100,
+            y=p_wins * 100,
             mode="lines",
             line=dict(color=THEME["mauve"], width=2),
             name="P(win)",
@@ -227,12 +262,12 @@ def chart_ev_by_tick(survival, window, payout):
     fig.add_hline(y=be * 100, line=dict(color=THEME["yellow"], dash="dash"), row=1, col=1)
 
     # EV with color fill
-    pos_mask = np.array(evs) > 0
+    pos_mask = evs > 0
 
     fig.add_trace(
         go.Scatter(
             x=ticks[pos_mask],
-            y=np.array(evs)[pos_mask],
+            y=evs[pos_mask],
             mode="lines",
             line=dict(color=THEME["green"], width=2),
             fill="tozeroy",
@@ -247,7 +282,7 @@ def chart_ev_by_tick(survival, window, payout):
     fig.add_trace(
         go.Scatter(
             x=ticks[~pos_mask],
-            y=np.array(evs)[~pos_mask],
+            y=evs[~pos_mask],
             mode="lines",
             line=dict(color=THEME["red"], width=2),
             fill="tozeroy",
@@ -274,16 +309,12 @@ def chart_ev_by_tick(survival, window, payout):
     return fig, ticks, p_wins, evs
 
 
-def chart_heatmap(survival, payout, current_window):
+def chart_heatmap(ev_surface, current_window):
     """EV heatmap: tick × window."""
     tick_vals = np.arange(20, 500, 8)
     window_vals = np.arange(20, 80, 4)
 
-    ev_matrix = np.zeros((len(window_vals), len(tick_vals)))
-    for i, w in enumerate(window_vals):
-        for j, t in enumerate(tick_vals):
-            p = p_win(int(t), int(w), survival)
-            ev_matrix[i, j] = expected_value(p, payout) * 1000
+    ev_matrix = ev_surface[np.ix_(surface_rows(tick_vals, ev_surface), window_vals)].T
 
     fig = go.Figure(
         data=go.Heatmap(
@@ -346,13 +377,14 @@ def chart_distribution(df):
 # =============================================================================
 def main():
     # Load data
-    df = load_games()
-    hazard, survival, at_risk = build_survival_model(df["rug_tick"].values)
+    df, hazard, survival, at_risk, p_surface = load_model()
 
     # Sidebar controls
     st.sidebar.title("⚙️ Parameters")
 
-    window = st.sidebar.slider("Sidebet Window", 10, 100, 40, 5, help="Ticks for sidebet to win")
+    window = st.sidebar.slider(
+        "Sidebet Window", 10, MAX_WINDOW, 40, 5, help="Ticks for sidebet to win"
+    )
     payout = st.sidebar.radio("Payout Multiplier", [5, 10, 20], horizontal=True)
 
     st.sidebar.divider()
@@ -371,15 +403,16 @@ def main():
 
     # Key metrics
     be = breakeven(payout)
+    ev_surface, kelly_surface = payout_surfaces(payout)
     ticks = np.arange(50, min(550, len(survival) - window), 2)
-    p_wins = [p_win(t, window, survival) for t in ticks]
-    evs = [expected_value(p, payout) for p in p_wins]
+    p_wins = p_surface[ticks, window]
+    evs = ev_surface[ticks, window] / 1000
 
     best_idx = np.argmax(evs)
     best_tick = ticks[best_idx]
     best_p = p_wins[best_idx]
     best_ev = evs[best_idx]
-    kelly_bet = kelly(best_p, payout) * kelly_frac
+    kelly_bet = kelly_surface[best_tick, window] * kelly_frac
     bet_size = bankroll * kelly_bet
 
     col1, col2, col3, col4 = st.columns(4)
@@ -414,11 +447,11 @@ def main():
     )
 
     with tab1:
-        fig, _, _, _ = chart_ev_by_tick(survival, window, payout)
+        fig, _, _, _ = chart_ev_by_tick(p_surface, ev_surface, window, payout)
         st.plotly_chart(fig, use_container_width=True)
 
         # Strategy rules
-        pos_ev_ticks = ticks[np.array(evs) > 0]
+        pos_ev_ticks = ticks[evs > 0]
 
         c1, c2 = st.columns(2)
         with c1:
@@ -437,7 +470,7 @@ def main():
             """)
 
     with tab2:
-        fig = chart_heatmap(survival, payout, window)
+        fig = chart_heatmap(ev_surface, window)
         st.plotly_chart(fig, use_container_width=True)
         st.caption("Green = +EV zones, Red = -EV zones. Dashed line = your selected window.")
 
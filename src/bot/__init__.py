@@ -1,6 +1,7 @@
 """Bot module - Trading strategies and bot controller"""
 
 from .bet_amount_sequencer import calculate_optimal_sequence, estimate_clicks
+from .click_planner import ClickPlanner, plan_clicks
 from .controller import BotController
 from .execution_bridge import BotExecutionBridge
 from .interface import BotInterface
@@ -18,6 +19,7 @@ __all__ = [
     "BotController",
     "BotExecutionBridge",
     "BotInterface",
+    "ClickPlanner",
     "ConservativeStrategy",
     "SidebetStrategy",
     "TradingStrategy",
@@ -25,4 +27,5 @@ __all__ = [
     "estimate_clicks",
     "get_strategy",
     "list_strategies",
+    "plan_clicks",
 ]
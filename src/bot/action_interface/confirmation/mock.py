@@ -95,4 +95,9 @@ class MockConfirmationMonitor:
             "min_ms": self._simulated_latency_ms,
             "max_ms": self._simulated_latency_ms,
             "count": 0,  # No actual samples in mock
+            "p50_ms": self._simulated_latency_ms,
+            "p90_ms": self._simulated_latency_ms,
+            "p99_ms": self._simulated_latency_ms,
+            "pending": 0,
+            "timeouts": 0,
         }
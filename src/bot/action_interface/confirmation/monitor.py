@@ -3,6 +3,22 @@ ConfirmationMonitor - Tracks action confirmations and measures latency.
 
 Subscribes to EventBus PLAYER_UPDATE events and correlates them with
 pending actions to measure round-trip latency.
+
+Matching: each pending action is indexed by the state change it should
+cause (its signature: cash and position direction, e.g. BUY = cash down,
+position up). A playerUpdate's direction against the previous update picks
+the bucket, and the oldest action in it is confirmed - O(1) per update, no
+scan. When the direction is unknown (first update seen) or matches no
+bucket, the oldest pending action is confirmed, as before. Actions without
+a signature (bet-size clicks) are confirmed only by updates that match no
+other bucket.
+
+Timeouts: pending actions sit in a timing wheel of WHEEL_RESOLUTION_MS
+slots and are failed with a timeout result once their slot passes.
+
+Latency: a rolling window of samples in log-linear histogram buckets
+(services.latency_trace), so percentile queries cost a fixed bucket walk
+regardless of sample count.
 """
 
 from __future__ import annotations
@@ -10,12 +26,14 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from collections import deque
+from collections import OrderedDict, deque
 from collections.abc import Callable
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
+from services.latency_trace import BUCKET_COUNT, bucket_index, percentiles
+
 if TYPE_CHECKING:
     from bot.action_interface.types import ActionResult, ActionType
     from models.events.player_action import PlayerState
@@ -23,6 +41,26 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# (cash direction, position direction), each -1 / 0 / +1
+Signature = tuple[int, int]
+
+# Expected state change per action type; others have no server-side effect
+# that a playerUpdate could be matched against
+EXPECTED_SIGNATURES: dict[str, Signature] = {
+    "BUY": (-1, 1),
+    "SELL": (1, -1),
+    "SIDEBET": (-1, 0),
+}
+
+DEFAULT_TIMEOUT_MS = 10_000
+WHEEL_RESOLUTION_MS = 100
+
+LATENCY_PERCENTILES = (50.0, 90.0, 99.0)
+
+
+def _sign(value: float) -> int:
+    return (value > 0) - (value < 0)
+
 
 @dataclass
 class PendingAction:
@@ -33,14 +71,84 @@ class PendingAction:
     client_ts: int
     state_before: PlayerState | None
     callback: Callable[[ActionResult], None] | None = None
+    signature: Signature | None = None
+    deadline_ms: int = 0
+
+
+class LatencyHistogram:
+    """
+    Rolling-window latency histogram (ms).
+
+    add() is O(1): the sample lands in a log-linear bucket and the sample
+    it pushes out of the window is subtracted. min/max are kept with
+    monotonic deques; percentiles walk the fixed bucket array.
+    """
+
+    def __init__(self, window: int):
+        self.samples: deque[int] = deque()
+        self._window = window
+        self._counts = [0] * BUCKET_COUNT
+        self._sum = 0
+        self._mins: deque[int] = deque()
+        self._maxes: deque[int] = deque()
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def add(self, latency_ms: int):
+        latency_ms = max(0, latency_ms)
+        if len(self.samples) == self._window:
+            oldest = self.samples.popleft()
+            self._counts[bucket_index(oldest)] -= 1
+            self._sum -= oldest
+            if self._mins[0] == oldest:
+                self._mins.popleft()
+            if self._maxes[0] == oldest:
+                self._maxes.popleft()
+
+        self.samples.append(latency_ms)
+        self._counts[bucket_index(latency_ms)] += 1
+        self._sum += latency_ms
+        while self._mins and self._mins[-1] > latency_ms:
+            self._mins.pop()
+        self._mins.append(latency_ms)
+        while self._maxes and self._maxes[-1] < latency_ms:
+            self._maxes.pop()
+        self._maxes.append(latency_ms)
+
+    def clear(self):
+        self.samples.clear()
+        self._counts = [0] * BUCKET_COUNT
+        self._sum = 0
+        self._mins.clear()
+        self._maxes.clear()
+
+    def stats(self) -> dict[str, float | int]:
+        if not self.samples:
+            return {
+                "avg_ms": 0.0,
+                "min_ms": 0,
+                "max_ms": 0,
+                "count": 0,
+                **{f"p{q:g}_ms": 0 for q in LATENCY_PERCENTILES},
+            }
+        values = percentiles(self._counts, LATENCY_PERCENTILES)
+        return {
+            "avg_ms": self._sum / len(self.samples),
+            "min_ms": self._mins[0],
+            "max_ms": self._maxes[0],
+            "count": len(self.samples),
+            **{f"p{q:g}_ms": values[q] for q in LATENCY_PERCENTILES},
+        }
 
 
 class ConfirmationMonitor:
     """
     Monitors PLAYER_UPDATE events to confirm actions and measure latency.
 
-    Uses FIFO matching: assumes server confirms actions in the order they
-    were sent. Maintains rolling latency statistics.
+    Matches each update to the oldest pending action whose expected state
+    change it shows (FIFO within a signature), times out unconfirmed
+    actions, and maintains rolling latency statistics.
     """
 
     def __init__(
@@ -48,6 +156,7 @@ class ConfirmationMonitor:
         event_bus: EventBus,
         max_pending: int = 100,
         latency_window: int = 100,
+        timeout_ms: int = DEFAULT_TIMEOUT_MS,
     ):
         """
         Initialize the confirmation monitor.
@@ -56,15 +165,29 @@ class ConfirmationMonitor:
             event_bus: EventBus instance to subscribe to
             max_pending: Maximum pending actions to track
             latency_window: Number of latency samples to keep for stats
+            timeout_ms: Time after which an unconfirmed action fails
         """
         self._event_bus = event_bus
         self._max_pending = max_pending
         self._latency_window = latency_window
+        self._timeout_ms = timeout_ms
 
         # Thread-safe data structures
         self._lock = threading.RLock()
-        self._pending: deque[PendingAction] = deque(maxlen=max_pending)
-        self._latency_samples: deque[int] = deque(maxlen=latency_window)
+        # All pending actions in registration order, and the same actions
+        # bucketed by signature (None = no expected state change)
+        self._pending: OrderedDict[str, PendingAction] = OrderedDict()
+        self._by_signature: dict[Signature | None, OrderedDict[str, PendingAction]] = {}
+        self._latency = LatencyHistogram(latency_window)
+
+        # Last cash / position seen, for the direction of the next update
+        self._last_cash: float | None = None
+        self._last_qty: float | None = None
+
+        # Timing wheel: slot = deadline // WHEEL_RESOLUTION_MS (mod slot count)
+        self._wheel: list[list[str]] = [[] for _ in range(timeout_ms // WHEEL_RESOLUTION_MS + 2)]
+        self._wheel_position: int | None = None
+        self._timeouts = 0
 
         # Subscription tracking
         self._subscribed = False
@@ -99,6 +222,10 @@ class ConfirmationMonitor:
             # Clear pending actions
             pending_count = len(self._pending)
             self._pending.clear()
+            self._by_signature.clear()
+            for slot in self._wheel:
+                slot.clear()
+            self._wheel_position = None
 
             if pending_count > 0:
                 logger.warning(
@@ -125,6 +252,7 @@ class ConfirmationMonitor:
         """
         with self._lock:
             client_ts = int(time.time() * 1000)
+            self._advance_wheel(client_ts)
 
             pending = PendingAction(
                 action_id=action_id,
@@ -132,9 +260,19 @@ class ConfirmationMonitor:
                 client_ts=client_ts,
                 state_before=state_before,
                 callback=callback,
+                signature=EXPECTED_SIGNATURES.get(getattr(action_type, "value", action_type)),
+                deadline_ms=client_ts + self._timeout_ms,
             )
 
-            self._pending.append(pending)
+            if len(self._pending) >= self._max_pending:
+                oldest = next(iter(self._pending.values()))
+                self._remove(oldest)
+                logger.debug(f"Pending limit reached, dropped {oldest.action_id}")
+
+            self._pending[action_id] = pending
+            self._by_signature.setdefault(pending.signature, OrderedDict())[action_id] = pending
+            slot = -(-pending.deadline_ms // WHEEL_RESOLUTION_MS) % len(self._wheel)
+            self._wheel[slot].append(action_id)
 
             logger.debug(
                 f"Registered pending action {action_id} ({action_type}), "
@@ -146,25 +284,31 @@ class ConfirmationMonitor:
         Get latency statistics from recent confirmations.
 
         Returns:
-            dict with avg, min, max latency (ms) and sample count
+            dict with avg, min, max, p50/p90/p99 latency (ms), sample count,
+            pending actions and timeouts so far
         """
         with self._lock:
-            if not self._latency_samples:
-                return {
-                    "avg_ms": 0.0,
-                    "min_ms": 0,
-                    "max_ms": 0,
-                    "count": 0,
-                }
-
-            samples = list(self._latency_samples)
             return {
-                "avg_ms": sum(samples) / len(samples),
-                "min_ms": min(samples),
-                "max_ms": max(samples),
-                "count": len(samples),
+                **self._latency.stats(),
+                "pending": len(self._pending),
+                "timeouts": self._timeouts,
             }
 
+    def expire_timeouts(self) -> int:
+        """
+        Fail pending actions whose confirmation deadline has passed.
+
+        Also runs on every register and update; call it to expire actions
+        while no events arrive.
+
+        Returns:
+            Number of actions timed out
+        """
+        with self._lock:
+            before = self._timeouts
+            self._advance_wheel(int(time.time() * 1000))
+            return self._timeouts - before
+
     def _on_player_update(self, event: dict):
         """
         Handle PLAYER_UPDATE event from EventBus.
@@ -173,23 +317,19 @@ class ConfirmationMonitor:
             event: Event dict with 'name' and 'data' keys
         """
         with self._lock:
-            if not self._pending:
-                # No pending actions to confirm
-                return
-
             # Extract event data
             data = event.get("data", event)
             confirmed_ts = int(time.time() * 1000)
+            self._advance_wheel(confirmed_ts)
 
-            # Extract player state from event data
-            state_after = self._extract_player_state(data)
-
-            # FIFO matching: confirm oldest pending action
-            pending = self._pending.popleft()
+            signature = self._observe(data)
+            pending = self._match(signature)
+            if pending is None:
+                return
 
             # Calculate latency
             latency = confirmed_ts - pending.client_ts
-            self._latency_samples.append(latency)
+            self._latency.add(latency)
 
             logger.debug(
                 f"Confirmed action {pending.action_id} ({pending.action_type}), "
@@ -200,18 +340,95 @@ class ConfirmationMonitor:
             result = self._build_action_result(
                 pending=pending,
                 confirmed_ts=confirmed_ts,
-                state_after=state_after,
+                state_after=self._extract_player_state(data),
             )
+            self._notify(pending, result)
 
-            # Invoke callback if provided
-            if pending.callback:
-                try:
-                    pending.callback(result)
-                except Exception as e:
-                    logger.error(
-                        f"Error in confirmation callback for {pending.action_id}: {e}",
-                        exc_info=True,
-                    )
+    def _observe(self, data: dict) -> Signature | None:
+        """
+        Record cash / position from an update; direction since the last one.
+
+        Reads the server's flat cash / positionQty fields, falling back to
+        the nested currentBalance / position.qty shape.
+        """
+        try:
+            cash = data.get("cash")
+            if cash is None:
+                cash = data.get("currentBalance")
+            qty = data.get("positionQty")
+            if qty is None:
+                qty = (data.get("position") or {}).get("qty")
+            cash, qty = float(cash or 0), float(qty or 0)
+        except (TypeError, ValueError, AttributeError):
+            return None
+
+        signature = None
+        if self._last_cash is not None:
+            signature = (_sign(cash - self._last_cash), _sign(qty - self._last_qty))
+        self._last_cash, self._last_qty = cash, qty
+        return signature
+
+    def _match(self, signature: Signature | None) -> PendingAction | None:
+        """Pop the pending action an update with this signature confirms."""
+        if not self._pending:
+            return None
+
+        bucket = None
+        if signature is not None:
+            bucket = self._by_signature.get(signature) or self._by_signature.get(None)
+        # Direction unknown or unexpected: oldest pending action
+        pending = next(iter((bucket or self._pending).values()))
+
+        self._remove(pending)
+        return pending
+
+    def _remove(self, pending: PendingAction):
+        del self._pending[pending.action_id]
+        bucket = self._by_signature[pending.signature]
+        del bucket[pending.action_id]
+        if not bucket:
+            del self._by_signature[pending.signature]
+
+    def _advance_wheel(self, now_ms: int):
+        """Expire actions in every wheel slot passed since the last call."""
+        position = now_ms // WHEEL_RESOLUTION_MS
+        if self._wheel_position is None:
+            self._wheel_position = position
+            return
+
+        # A full turn visits every slot; no need to go round twice
+        start = max(self._wheel_position + 1, position - len(self._wheel) + 1)
+        for tick in range(start, position + 1):
+            slot = self._wheel[tick % len(self._wheel)]
+            if not slot:
+                continue
+            due, slot[:] = slot[:], []
+            for action_id in due:
+                pending = self._pending.get(action_id)
+                if pending is None:
+                    continue  # Already confirmed
+                if pending.deadline_ms > now_ms:
+                    slot.append(action_id)
+                    continue
+                self._remove(pending)
+                self._timeouts += 1
+                logger.warning(
+                    f"Action {pending.action_id} ({pending.action_type}) not confirmed "
+                    f"within {self._timeout_ms}ms"
+                )
+                self._notify(pending, self._build_timeout_result(pending, now_ms))
+        self._wheel_position = position
+
+    def _notify(self, pending: PendingAction, result: ActionResult):
+        """Invoke the pending action's callback, if any."""
+        if pending.callback:
+            try:
+                pending.callback(result)
+            except Exception as e:
+                logger.error(
+                    f"Error in confirmation callback for {pending.action_id}: {e}",
+                    exc_info=True,
+                )
 
     def _extract_player_state(self, data: dict) -> PlayerState | None:
         """
@@ -284,3 +501,17 @@ class ConfirmationMonitor:
             state_before=pending.state_before,
             state_after=state_after,
         )
+
+    def _build_timeout_result(self, pending: PendingAction, now_ms: int) -> ActionResult:
+        """ActionResult for an action never confirmed by the server."""
+        from bot.action_interface.types import ActionResult
+
+        return ActionResult(
+            success=False,
+            action_id=pending.action_id,
+            action_type=pending.action_type,
+            client_ts=pending.client_ts,
+            confirmed_ts=None,
+            error=f"Not confirmed within {now_ms - pending.client_ts}ms",
+            state_before=pending.state_before,
+        )
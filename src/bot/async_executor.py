@@ -31,6 +31,11 @@ class AsyncBotExecutor:
     - Non-blocking execution: Tick updates return immediately
     - Queue-based: Prevents direct thread blocking
     - Graceful degradation: Drops ticks if bot can't keep up
+    - Mailbox mode: Single slot, newest tick wins, so the bot always
+      decides on the freshest state (overwritten ticks are counted as skipped)
+    - Staleness tracking: Tick age when the decision starts
+    - Optional deadline: Decisions made too long after their tick arrived
+      are discarded instead of executed
     - Clean shutdown: Proper thread cleanup
 
     Thread Safety:
@@ -40,14 +45,19 @@ class AsyncBotExecutor:
     - AUDIT FIX: Added Condition for proper shutdown synchronization
     """
 
-    def __init__(self, bot_controller):
+    def __init__(self, bot_controller, mailbox: bool = False, deadline: float | None = None):
         """
         Initialize async bot executor
 
         Args:
             bot_controller: BotController instance to execute
+            mailbox: Keep only the newest unprocessed tick instead of a FIFO queue
+            deadline: Seconds after a tick is queued beyond which its decision
+                is discarded instead of executed (None = no deadline)
         """
         self.bot_controller = bot_controller
+        self.mailbox = mailbox
+        self.deadline = deadline
 
         # AUDIT FIX: Thread-safe state with lock
         self._state_lock = threading.Lock()
@@ -58,6 +68,10 @@ class AsyncBotExecutor:
         self.execution_queue = queue.Queue(maxsize=10)
         self.result_queue = queue.Queue()
 
+        # Mailbox mode: one (tick, queued_at) slot, overwritten by newer ticks
+        self._mailbox_condition = threading.Condition()
+        self._mailbox_slot: tuple[GameTick, float] | None = None
+
         # Worker thread
         self.worker_thread = None
         self.stop_event = threading.Event()
@@ -70,8 +84,17 @@ class AsyncBotExecutor:
         self._executions = 0
         self._failures = 0
         self._queue_drops = 0
+        self._skipped_ticks = 0
+        self._deadline_discards = 0
+        self._staleness_count = 0
+        self._staleness_total = 0.0
+        self._staleness_max = 0.0
+        self._staleness_last = 0.0
 
-        logger.info("AsyncBotExecutor initialized")
+        logger.info(
+            f"AsyncBotExecutor initialized (mode={'mailbox' if mailbox else 'queue'}, "
+            f"deadline={deadline})"
+        )
 
     @property
     def enabled(self) -> bool:
@@ -103,6 +126,18 @@ class AsyncBotExecutor:
         with self._state_lock:
             return self._queue_drops
 
+    @property
+    def skipped_ticks(self) -> int:
+        """Thread-safe counter of ticks overwritten in the mailbox before processing."""
+        with self._state_lock:
+            return self._skipped_ticks
+
+    @property
+    def deadline_discards(self) -> int:
+        """Thread-safe counter of decisions discarded for missing the deadline."""
+        with self._state_lock:
+            return self._deadline_discards
+
     def start(self):
         """Start the bot executor worker thread"""
         if self.worker_thread and self.worker_thread.is_alive():
@@ -134,6 +169,11 @@ class AsyncBotExecutor:
         self.enabled = False
         self.stop_event.set()
 
+        # Clear the mailbox and wake the worker
+        with self._mailbox_condition:
+            self._mailbox_slot = None
+            self._mailbox_condition.notify_all()
+
         # Clear the execution queue
         while not self.execution_queue.empty():
             try:
@@ -161,13 +201,17 @@ class AsyncBotExecutor:
 
         logger.info(
             f"Bot executor stopped. Stats: {self.executions} executions, "
-            f"{self.failures} failures, {self.queue_drops} drops"
+            f"{self.failures} failures, {self.queue_drops} drops, "
+            f"{self.skipped_ticks} skipped, {self.deadline_discards} discarded"
         )
 
     def queue_execution(self, tick: GameTick) -> bool:
         """
         Queue a bot execution request (non-blocking)
 
+        In mailbox mode the tick replaces any tick still waiting, so this
+        always succeeds while enabled.
+
         Args:
             tick: GameTick to process
 
@@ -177,9 +221,20 @@ class AsyncBotExecutor:
         if not self.enabled:
             return False
 
+        queued_at = time.perf_counter()
+
+        if self.mailbox:
+            with self._mailbox_condition:
+                if self._mailbox_slot is not None:
+                    with self._state_lock:
+                        self._skipped_ticks += 1
+                self._mailbox_slot = (tick, queued_at)
+                self._mailbox_condition.notify()
+            return True
+
         try:
             # Try to add to queue (non-blocking)
-            self.execution_queue.put_nowait(tick)
+            self.execution_queue.put_nowait((tick, queued_at))
             return True
         except queue.Full:
             # Queue is full - drop this tick
@@ -189,6 +244,38 @@ class AsyncBotExecutor:
             logger.debug(f"Bot execution queue full, dropped tick {tick.tick}")
             return False
 
+    def _next_request(self, timeout: float) -> tuple[GameTick, float] | None:
+        """
+        Wait for the next (tick, queued_at) to process
+
+        Returns:
+            The request, or None on stop signal
+
+        Raises:
+            queue.Empty: Nothing arrived within timeout
+        """
+        if not self.mailbox:
+            return self.execution_queue.get(timeout=timeout)
+
+        with self._mailbox_condition:
+            if self._mailbox_slot is None and not self.stop_event.is_set():
+                self._mailbox_condition.wait(timeout=timeout)
+            if self.stop_event.is_set():
+                return None
+            request, self._mailbox_slot = self._mailbox_slot, None
+        if request is None:
+            raise queue.Empty
+        return request
+
+    def _record_staleness(self, staleness: float):
+        """Record tick age at decision time (seconds)"""
+        with self._state_lock:
+            self._staleness_count += 1
+            self._staleness_total += staleness
+            self._staleness_last = staleness
+            if staleness > self._staleness_max:
+                self._staleness_max = staleness
+
     def _worker_loop(self):
         """
         Worker thread that processes bot execution requests
@@ -201,18 +288,35 @@ class AsyncBotExecutor:
             while not self.stop_event.is_set():
                 try:
                     # Wait for execution request (with timeout for responsiveness)
-                    tick = self.execution_queue.get(timeout=0.5)
+                    request = self._next_request(timeout=0.5)
 
-                    if tick is None:  # Stop signal
+                    if request is None:  # Stop signal
                         break
 
+                    tick, queued_at = request
+
                     # Execute bot decision
                     start_time = time.perf_counter()
+                    self._record_staleness(start_time - queued_at)
+
+                    deadline = None
+                    if self.deadline is not None:
+                        deadline = queued_at + self.deadline
+                        if start_time > deadline:
+                            self._discard(tick, start_time - queued_at)
+                            continue
 
                     try:
-                        result = self.bot_controller.execute_step()
+                        if deadline is None:
+                            result = self.bot_controller.execute_step()
+                        else:
+                            result = self.bot_controller.execute_step(deadline=deadline)
                         elapsed = time.perf_counter() - start_time
 
+                        if result.get("discarded"):
+                            self._discard(tick, time.perf_counter() - queued_at)
+                            continue
+
                         # AUDIT FIX: Thread-safe counter increment
                         with self._state_lock:
                             self._executions += 1
@@ -258,6 +362,15 @@ class AsyncBotExecutor:
 
         logger.info("Bot executor worker stopped")
 
+    def _discard(self, tick: GameTick, age: float):
+        """Count a decision dropped for missing the deadline"""
+        with self._state_lock:
+            self._deadline_discards += 1
+        logger.debug(
+            f"Bot decision for tick {tick.tick} discarded: {age * 1000:.1f}ms old "
+            f"(deadline {self.deadline * 1000:.0f}ms)"
+        )
+
     def get_latest_result(self) -> dict | None:
         """
         Get latest bot execution result (non-blocking)
@@ -275,12 +388,24 @@ class AsyncBotExecutor:
         Get executor statistics
 
         Returns:
-            dict: Statistics including executions, failures, drops, queue size
+            dict: Statistics including executions, failures, drops, queue size,
+                skipped ticks, deadline discards and staleness (ms)
         """
-        return {
-            "enabled": self.enabled,
-            "executions": self.executions,
-            "failures": self.failures,
-            "queue_drops": self.queue_drops,
-            "queue_size": self.execution_queue.qsize(),
-        }
+        with self._mailbox_condition:
+            pending = 1 if self._mailbox_slot is not None else 0
+        with self._state_lock:
+            count = self._staleness_count
+            return {
+                "enabled": self._enabled,
+                "mode": "mailbox" if self.mailbox else "queue",
+                "executions": self._executions,
+                "failures": self._failures,
+                "queue_drops": self._queue_drops,
+                "queue_size": pending if self.mailbox else self.execution_queue.qsize(),
+                "skipped_ticks": self._skipped_ticks,
+                "deadline_ms": self.deadline * 1000 if self.deadline is not None else None,
+                "deadline_discards": self._deadline_discards,
+                "staleness_last_ms": self._staleness_last * 1000,
+                "staleness_avg_ms": (self._staleness_total / count * 1000) if count else 0.0,
+                "staleness_max_ms": self._staleness_max * 1000,
+            }
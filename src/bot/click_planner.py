@@ -0,0 +1,188 @@
+"""
+ClickPlanner - Shortest-path bet amount planner with precomputed tables.
+
+Models the bet amount as an integer number of 0.001 SOL units and every
+amount button as an edge:
+
+    +0.001 / +0.01 / +0.1 / +1   add 1 / 10 / 100 / 1000 units
+    1/2                           halve (odd amounts round half-even, like
+                                  the quantize() in bet_amount_sequencer)
+    X2                            double
+    X                             clear to zero
+
+Edge weights are the expected latency of each button (e.g. measured by
+TimingMetrics.get_button_latency_ms()); with no weights every click costs
+the same and plans have the fewest clicks. Dijkstra runs once per starting
+amount over [0, 2 * max_units] and the shortest-path tree is kept as two
+compact arrays, so later plans from that amount are a table walk.
+
+Unlike calculate_optimal_sequence() this is exact: no plan is ever slower
+than the heuristic's (see tests/test_bot/test_click_planner.py).
+"""
+
+import heapq
+import threading
+from array import array
+from collections.abc import Iterable, Mapping
+from decimal import Decimal
+
+from bot.bet_amount_sequencer import calculate_optimal_sequence
+
+UNIT = Decimal("0.001")
+
+# Tables store each edge as an index into BUTTONS
+BUTTONS = ("+1", "+0.1", "+0.01", "+0.001", "X2", "1/2", "X")
+INCREMENT_UNITS = {"+1": 1000, "+0.1": 100, "+0.01": 10, "+0.001": 1}
+
+# Covers config.FINANCIAL["max_bet"] (1 SOL)
+DEFAULT_MAX_UNITS = 1000
+
+_NO_PARENT = 0xFFFF
+
+
+def to_units(amount: Decimal) -> int:
+    """Amount in SOL -> integer 0.001 units (quantized like the sequencer)."""
+    return int(Decimal(str(amount)).quantize(UNIT) / UNIT)
+
+
+def apply_button(units: int, button: str) -> int:
+    """Amount (in units) after pressing a button."""
+    if button in INCREMENT_UNITS:
+        return units + INCREMENT_UNITS[button]
+    if button == "X2":
+        return units * 2
+    if button == "1/2":
+        half, odd = divmod(units, 2)
+        # Decimal quantize() default rounding: half-even
+        return half + 1 if odd and half % 2 else half
+    if button == "X":
+        return 0
+    raise ValueError(f"Unknown button: {button}")
+
+
+class ClickPlanner:
+    """
+    Fastest button sequence between two bet amounts.
+
+    Thread-safe: tables are built under a lock and read without one.
+
+    Args:
+        button_costs: Expected latency per button (any unit, must be > 0);
+            buttons not listed cost the mean of the listed ones.
+            None = one per click (fewest clicks).
+        max_units: Largest amount (in 0.001 units) the tables cover;
+            intermediate amounts may go up to twice this.
+    """
+
+    def __init__(
+        self,
+        button_costs: Mapping[str, float] | None = None,
+        max_units: int = DEFAULT_MAX_UNITS,
+    ):
+        if not 0 < max_units <= (_NO_PARENT - 1) // 2:
+            raise ValueError(f"max_units out of range: {max_units}")
+        self.max_units = max_units
+        self.limit = 2 * max_units
+        self.costs = self._resolve_costs(button_costs)
+
+        # Source amount -> (parent amount, button index) per reachable amount
+        self._tables: dict[int, tuple[array, bytes]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _resolve_costs(button_costs: Mapping[str, float] | None) -> dict[str, float]:
+        if not button_costs:
+            return dict.fromkeys(BUTTONS, 1.0)
+        known = {b: float(c) for b, c in button_costs.items() if b in BUTTONS}
+        if any(cost <= 0 for cost in known.values()):
+            raise ValueError(f"Button costs must be positive: {known}")
+        default = sum(known.values()) / len(known) if known else 1.0
+        return {button: known.get(button, default) for button in BUTTONS}
+
+    # ========== Planning ==========
+
+    def plan(self, current: Decimal, target: Decimal) -> list[str]:
+        """
+        Fastest button sequence from current to target.
+
+        Amounts outside the table range fall back to
+        calculate_optimal_sequence().
+        """
+        start, goal = to_units(current), to_units(target)
+        if start == goal:
+            return []
+        if not (0 <= start <= self.max_units and 0 <= goal <= self.max_units):
+            return calculate_optimal_sequence(current, target)
+
+        parents, buttons = self._table(start)
+        sequence = []
+        node = goal
+        while node != start:
+            sequence.append(BUTTONS[buttons[node]])
+            node = parents[node]
+        sequence.reverse()
+        return sequence
+
+    def cost(self, sequence: Iterable[str]) -> float:
+        """Expected latency of a button sequence under this planner's costs."""
+        return sum(self.costs[button] for button in sequence)
+
+    def precompute(self, amounts: Iterable[Decimal]) -> None:
+        """Build tables for starting amounts ahead of time (e.g. the bets we place)."""
+        for amount in amounts:
+            units = to_units(amount)
+            if 0 <= units <= self.max_units:
+                self._table(units)
+
+    # ========== Tables ==========
+
+    def _table(self, start: int) -> tuple[array, bytes]:
+        table = self._tables.get(start)
+        if table is None:
+            with self._lock:
+                table = self._tables.get(start)
+                if table is None:
+                    table = self._tables[start] = self._search(start)
+        return table
+
+    def _search(self, start: int) -> tuple[array, bytes]:
+        """Dijkstra from start; equally fast paths are broken by fewer clicks."""
+        limit = self.limit
+        edges = [(index, self.costs[button], button) for index, button in enumerate(BUTTONS)]
+        best: list[tuple[float, int] | None] = [None] * (limit + 1)
+        parents = array("H", [_NO_PARENT]) * (limit + 1)
+        buttons = bytearray(limit + 1)
+
+        best[start] = (0.0, 0)
+        heap = [(0.0, 0, start)]
+        while heap:
+            cost, clicks, node = heapq.heappop(heap)
+            if best[node] != (cost, clicks):
+                continue  # Stale entry
+            for index, weight, button in edges:
+                nxt = apply_button(node, button)
+                if nxt > limit or nxt == node:
+                    continue
+                key = (cost + weight, clicks + 1)
+                if best[nxt] is None or key < best[nxt]:
+                    best[nxt] = key
+                    parents[nxt] = node
+                    buttons[nxt] = index
+                    heapq.heappush(heap, (*key, nxt))
+        return parents, bytes(buttons)
+
+
+_default_planner: ClickPlanner | None = None
+
+
+def plan_clicks(current: Decimal, target: Decimal) -> list[str]:
+    """
+    Fewest-clicks button sequence from current to target.
+
+    Uses a shared unweighted ClickPlanner; build your own ClickPlanner to
+    weight buttons by measured latency.
+    """
+    global _default_planner
+    if _default_planner is None:
+        _default_planner = ClickPlanner()
+    return _default_planner.plan(current, target)
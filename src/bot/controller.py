@@ -4,9 +4,12 @@ Phase 8.3: Now supports dual-mode execution (BACKEND vs UI_LAYER)
 """
 
 import logging
+import time
 from decimal import Decimal
 from typing import Any, Optional
 
+from services.latency_trace import STAGE_DECISION, latency_tracer
+
 from .execution_mode import ExecutionMode
 from .interface import BotInterface
 from .strategies import TradingStrategy, get_strategy
@@ -72,7 +75,7 @@ class BotController:
             f"execution_mode={execution_mode.value}"
         )
 
-    def execute_step(self) -> dict[str, Any]:
+    def execute_step(self, deadline: float | None = None) -> dict[str, Any]:
         """
         Execute one decision cycle
 
@@ -85,8 +88,13 @@ class BotController:
 
         Phase 8.3: Routes execution based on execution_mode
 
+        Args:
+            deadline: time.perf_counter() value after which the decision is
+                discarded instead of executed (None = no deadline)
+
         Returns:
-            Result dictionary from action execution
+            Result dictionary from action execution (discarded decisions
+            have "discarded": True and are not counted as actions)
         """
         try:
             # Step 1: Observe
@@ -99,11 +107,22 @@ class BotController:
 
             # Step 3: Decide
             action_type, amount, reasoning = self.strategy.decide(observation, info)
+            latency_tracer.stamp(STAGE_DECISION)
 
             # Store reasoning
             self.last_action = action_type
             self.last_reasoning = reasoning
 
+            # Too late to act on the state this decision was based on
+            if deadline is not None and time.perf_counter() > deadline:
+                logger.debug(f"Bot decision {action_type} discarded: deadline exceeded")
+                return {
+                    "success": False,
+                    "action": action_type,
+                    "reason": "Decision deadline exceeded",
+                    "discarded": True,
+                }
+
             # Step 4: Execute (Phase 8.3: Route based on execution mode)
             if self.execution_mode == ExecutionMode.BACKEND:
                 result = self._execute_action_backend(action_type, amount)
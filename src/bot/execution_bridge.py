@@ -5,8 +5,12 @@ Bridges LiveBacktestService bot decisions to real browser button clicks
 using delta-based sequencing and front-running optimization.
 
 Features:
-- Delta-based sequencing: calculates current → target, not always from zero
+- Delta-based sequencing: calculates current → target, not always from zero,
+  with the fastest button sequence from bot.click_planner
 - Front-running: prepares next bet amount immediately after placing current
+- Speculative staging: predicts the next amount for both outcomes of the
+  pending sidebet and clicks it in as soon as the outcome is known, so the
+  entry tick only needs the SIDEBET click (mispredictions are corrected)
 - Tracks current browser amount to minimize clicks
 - Safety gate: explicit enable() required before any execution
 
@@ -19,14 +23,24 @@ Usage:
 
     # Execute current bet (will also prepare next bet)
     await bridge.execute_sidebet(Decimal("0.004"))
+
+    # Or, when the next amount depends on how this bet resolves:
+    bridge.stage_outcomes(on_win=Decimal("0.001"), on_loss=Decimal("0.002"))
+    await bridge.execute_sidebet(Decimal("0.001"))
+    ...
+    bridge.resolve_outcome(won=False)
+    await bridge.prestage()  # During cooldown / before the entry tick
 """
 
 import asyncio
 import logging
+import threading
+import time
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from bot.bet_amount_sequencer import calculate_optimal_sequence
+from bot.click_planner import ClickPlanner
+from browser.dom.timing import TimingMetrics
 
 if TYPE_CHECKING:
     from browser.bridge import BrowserBridge
@@ -49,6 +63,9 @@ class BotExecutionBridge:
     # Delay between button clicks (ms) - allows browser to register each click
     INTER_CLICK_DELAY_MS = 100
 
+    # Re-weight the click planner after this many measured clicks
+    RECALIBRATE_EVERY_CLICKS = 50
+
     def __init__(
         self,
         trading_controller: "TradingController",
@@ -73,6 +90,23 @@ class BotExecutionBridge:
         # Pre-staged amount for front-running
         self._next_amount: Decimal | None = None
 
+        # Speculative staging: predicted next amount per outcome of the pending bet
+        self._predicted: dict[bool, Decimal | None] | None = None
+        self._prestaged_amount: Decimal | None = None
+        self._prestage_cancel = threading.Event()
+        # Held by whoever is clicking amount buttons (prestage runs on its own loop)
+        self._click_lock = threading.Lock()
+
+        # Staging statistics
+        self._staging_hits = 0
+        self._staging_misses = 0
+        self._staging_cancelled = 0
+
+        # Shortest-path click planner, weighted by measured button latency
+        self.timing_metrics = TimingMetrics()
+        self.planner = ClickPlanner()
+        self._clicks_since_calibration = 0
+
         # Execution lock to prevent concurrent operations
         self._lock = asyncio.Lock()
 
@@ -89,12 +123,16 @@ class BotExecutionBridge:
         WARNING: This enables real money trading!
         """
         self._enabled = True
+        self._prestage_cancel.clear()
         logger.warning("BotExecutionBridge ENABLED - Real money trading active!")
 
     def disable(self) -> None:
         """Disable real execution."""
         self._enabled = False
         self._next_amount = None  # Clear any staged amounts
+        self._predicted = None
+        self._prestaged_amount = None
+        self._prestage_cancel.set()
         logger.info("BotExecutionBridge disabled")
 
     @property
@@ -125,6 +163,120 @@ class BotExecutionBridge:
     def clear_staged_amount(self) -> None:
         """Clear any staged front-running amount."""
         self._next_amount = None
+        self._predicted = None
+
+    # ========================================================================
+    # SPECULATIVE STAGING
+    # ========================================================================
+
+    def stage_outcomes(self, on_win: Decimal | None, on_loss: Decimal | None) -> None:
+        """
+        Stage the next bet amount for each outcome of the pending sidebet.
+
+        Call this before execute_sidebet() with the strategy's sizing for
+        both outcomes (None = no next bet after that outcome). If both
+        predict the same amount it is front-run straight after SIDEBET,
+        otherwise resolve_outcome() + prestage() click it in once the
+        outcome is known.
+
+        Args:
+            on_win: Next bet amount if the pending sidebet wins
+            on_loss: Next bet amount if it loses
+        """
+        predicted = {
+            True: None if on_win is None else Decimal(str(on_win)).quantize(Decimal("0.001")),
+            False: None if on_loss is None else Decimal(str(on_loss)).quantize(Decimal("0.001")),
+        }
+        if predicted[True] == predicted[False]:
+            self._predicted = None
+            self._next_amount = predicted[True]
+        else:
+            self._predicted = predicted
+            self._next_amount = None
+        logger.info(f"Staged next bet amounts: win={predicted[True]}, loss={predicted[False]}")
+
+    def resolve_outcome(self, won: bool) -> Decimal | None:
+        """
+        Pick the staged amount for a now-known outcome.
+
+        Args:
+            won: Whether the pending sidebet won
+
+        Returns:
+            Amount to pre-stage (None if nothing was staged for that outcome)
+        """
+        if self._predicted is None:
+            return self._next_amount
+        self._next_amount = self._predicted[won]
+        self._predicted = None
+        logger.debug(f"Outcome {'WIN' if won else 'LOSS'}: next bet {self._next_amount}")
+        return self._next_amount
+
+    async def prestage(self) -> bool:
+        """
+        Click in the staged next amount ahead of the entry tick.
+
+        Safe to run on a different event loop than execute_sidebet(): an
+        incoming execution cancels it between clicks, then corrects from
+        whatever amount was reached.
+
+        Returns:
+            True if the browser now holds the staged amount
+        """
+        if not self._enabled or self._next_amount is None:
+            return False
+        if not self.browser_bridge.is_connected():
+            return False
+        if not self._click_lock.acquire(blocking=False):
+            return False  # An execution is clicking
+        try:
+            if self._prestage_cancel.is_set():
+                # An execution is waiting for the lock; it clears the flag
+                self._staging_cancelled += 1
+                logger.info("Pre-staging cancelled before the first click")
+                return False
+            target, self._next_amount = self._next_amount, None
+            if target is None:
+                return False
+            sequence = self.planner.plan(self._current_amount, target)
+            logger.info(
+                f"Pre-staging: {self._current_amount} → {target} "
+                f"via {len(sequence)} clicks: {sequence}"
+            )
+            for button in sequence:
+                if self._prestage_cancel.is_set():
+                    self._staging_cancelled += 1
+                    logger.info(f"Pre-staging cancelled at {self._current_amount}")
+                    return False
+                if not await self._click_button(button):
+                    logger.warning(f"Pre-staging failed at button: {button}")
+                    return False
+                await asyncio.sleep(self.INTER_CLICK_DELAY_MS / 1000)
+
+            self._prestaged_amount = target
+            return True
+        finally:
+            self._click_lock.release()
+
+    async def _acquire_clicks(self) -> None:
+        """Cancel any running prestage and wait until its current click is done."""
+        self._prestage_cancel.set()
+        while not self._click_lock.acquire(blocking=False):
+            await asyncio.sleep(0.005)
+        # Prestages that got the lock meanwhile saw the flag and backed off
+        self._prestage_cancel.clear()
+
+    def get_staging_stats(self) -> dict:
+        """Get speculative staging statistics"""
+        total = self._staging_hits + self._staging_misses
+        return {
+            "hits": self._staging_hits,
+            "misses": self._staging_misses,
+            "cancelled": self._staging_cancelled,
+            "hit_rate": (self._staging_hits / total * 100) if total > 0 else 0.0,
+            "prestaged_amount": self._prestaged_amount,
+            "pending_outcomes": self._predicted is not None,
+        }
 
     # ========================================================================
     # EXECUTION
@@ -155,15 +307,28 @@ class BotExecutionBridge:
             return False
 
         async with self._lock:
-            return await self._execute_sidebet_internal(amount)
+            await self._acquire_clicks()
+            try:
+                return await self._execute_sidebet_internal(amount)
+            finally:
+                self._click_lock.release()
 
     async def _execute_sidebet_internal(self, amount: Decimal) -> bool:
         """Internal execution logic (assumes lock is held)."""
         # Normalize amount
         target = Decimal(str(amount)).quantize(Decimal("0.001"))
 
+        # Score the speculative pre-stage; a wrong one is corrected below
+        if self._prestaged_amount is not None:
+            if self._prestaged_amount == target:
+                self._staging_hits += 1
+            else:
+                self._staging_misses += 1
+                logger.info(f"Pre-staged {self._prestaged_amount} mispredicted, correcting")
+            self._prestaged_amount = None
+
         # Calculate delta sequence from current → target
-        sequence = calculate_optimal_sequence(self._current_amount, target)
+        sequence = self.planner.plan(self._current_amount, target)
 
         logger.info(
             f"Executing sidebet {target} SOL: {self._current_amount} → {target} "
@@ -193,6 +358,10 @@ class BotExecutionBridge:
         if self._next_amount is not None:
             await self._prepare_next_bet()
 
+        # Off the critical path: the bet is placed and the next one staged
+        if self._clicks_since_calibration >= self.RECALIBRATE_EVERY_CLICKS:
+            self.recalibrate_planner()
+
         return True
 
     async def _prepare_next_bet(self) -> None:
@@ -206,7 +375,7 @@ class BotExecutionBridge:
         if self._next_amount is None:
             return
 
-        next_seq = calculate_optimal_sequence(self._current_amount, self._next_amount)
+        next_seq = self.planner.plan(self._current_amount, self._next_amount)
 
         if next_seq:
             logger.info(
@@ -229,6 +398,17 @@ class BotExecutionBridge:
         # Clear staged amount
         self._next_amount = None
 
+    def recalibrate_planner(self) -> None:
+        """Rebuild the click planner from measured per-button latency."""
+        latencies = self.timing_metrics.get_button_latency_ms()
+        self._clicks_since_calibration = 0
+        if not latencies:
+            return
+        costs = {button: ms + self.INTER_CLICK_DELAY_MS for button, ms in latencies.items()}
+        self.planner = ClickPlanner(costs)
+        self.planner.precompute([self._current_amount])
+        logger.debug(f"Click planner recalibrated: {costs}")
+
     async def _click_button(self, button: str) -> bool:
         """
         Click a single button, updating tracked state only on success.
@@ -241,6 +421,7 @@ class BotExecutionBridge:
         """
         # Calculate what the new amount would be (before attempting click)
         new_amount = self._current_amount
+        click_start = time.perf_counter()
         try:
             if button == "X":
                 self.trading_controller.clear_bet_amount()
@@ -262,6 +443,8 @@ class BotExecutionBridge:
 
             # Only update tracked amount after successful click
             self._current_amount = new_amount.quantize(Decimal("0.001"))
+            self.timing_metrics.add_button_click(button, (time.perf_counter() - click_start) * 1000)
+            self._clicks_since_calibration += 1
             return True
 
         except Exception as e:
@@ -13,7 +13,16 @@ Do NOT invest time refactoring these - they're being replaced.
 """
 
 from .aggressive import AggressiveStrategy
-from .base import TradingStrategy
+from .base import TradingStrategy, VectorizedStrategy
+from .batch import (
+    ACTION_NAMES,
+    BatchEvaluation,
+    BatchState,
+    GameArrays,
+    evaluate_strategy,
+    load_games,
+    parity_mismatches,
+)
 from .conservative import ConservativeStrategy
 from .foundational import FoundationalStrategy
 from .sidebet import SidebetStrategy
@@ -54,11 +63,19 @@ def list_strategies() -> list:
 
 
 __all__ = [
+    "ACTION_NAMES",
     "AggressiveStrategy",
+    "BatchEvaluation",
+    "BatchState",
     "ConservativeStrategy",
     "FoundationalStrategy",
+    "GameArrays",
     "SidebetStrategy",
     "TradingStrategy",
+    "VectorizedStrategy",
+    "evaluate_strategy",
     "get_strategy",
     "list_strategies",
+    "load_games",
+    "parity_mismatches",
 ]
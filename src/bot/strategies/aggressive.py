@@ -5,10 +5,17 @@ Aggressive trading strategy
 from decimal import Decimal
 from typing import Any
 
-from .base import TradingStrategy
+from .base import TradingStrategy, VectorizedStrategy
+from .batch import (
+    ACTION_BUY,
+    ACTION_SELL,
+    ACTION_SIDE,
+    Rule,
+    Segment,
+)
 
 
-class AggressiveStrategy(TradingStrategy):
+class AggressiveStrategy(VectorizedStrategy, TradingStrategy):
     """
     Aggressive trading strategy
 
@@ -79,3 +86,18 @@ class AggressiveStrategy(TradingStrategy):
             return decide_action("WAIT", None, f"Holding for bigger gains (P&L: {pnl_pct:.1f}%)")
         else:
             return decide_action("WAIT", None, "Waiting for entry")
+
+    def batch_rules(self, segment: Segment) -> list[Rule]:
+        """decide() rules as masks (buy, sell, sidebet priority)"""
+        balance = segment.balance
+        rules = []
+        if segment.has_position:
+            pnl_pct = segment.pnl_pct
+            exit_mask = (pnl_pct > float(self.TAKE_PROFIT)) | (pnl_pct < float(self.STOP_LOSS))
+            rules.append((ACTION_SELL, None, exit_mask))
+        elif balance >= float(self.BUY_AMOUNT):
+            buy_mask = segment.can_buy & (segment.price < float(self.BUY_THRESHOLD))
+            rules.append((ACTION_BUY, float(self.BUY_AMOUNT), buy_mask))
+        if balance >= float(self.SIDEBET_AMOUNT):
+            rules.append((ACTION_SIDE, float(self.SIDEBET_AMOUNT), segment.can_sidebet))
+        return rules
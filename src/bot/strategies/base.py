@@ -7,6 +7,10 @@ from abc import ABC, abstractmethod
 from decimal import Decimal
 from typing import Any
 
+import numpy as np
+
+from .batch import BatchState, GameArrays, Rule, Segment, run_scalar, run_vectorized
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,6 +22,10 @@ class TradingStrategy(ABC):
     - action_type: "BUY", "SELL", "SIDE", or "WAIT"
     - amount: Decimal amount (for BUY/SIDE) or None
     - reasoning: String explaining the decision
+
+    decide_batch() evaluates a whole game at once (see batch.py) by calling
+    decide() per tick; strategies whose rules are simple thresholds mix in
+    VectorizedStrategy to run vectorized.
     """
 
     def __init__(self):
@@ -45,6 +53,19 @@ class TradingStrategy(ABC):
         """
         pass
 
+    def decide_batch(self, game: GameArrays, state: BatchState) -> np.ndarray:
+        """
+        Decide every tick of a game at once
+
+        Args:
+            game: Game columns (price, tick, tradeable, rugged)
+            state: Balance carried across games (updated in place)
+
+        Returns:
+            Action code per tick (ACTION_WAIT/BUY/SELL/SIDE)
+        """
+        return run_scalar(self, game, state)
+
     def reset(self):
         """Reset strategy state (called on new game)"""
         self.last_action = None
@@ -70,3 +91,26 @@ class TradingStrategy(ABC):
             return ("WAIT", None, "Action not permitted; waiting")
 
         return (normalized, amount, reasoning)
+
+
+class VectorizedStrategy(ABC):
+    """
+    Mixin for strategies whose decide() is expressible as threshold masks
+
+    Implement batch_rules(); decide_batch() then jumps between events with
+    run_vectorized() instead of calling decide() per tick. List it before
+    TradingStrategy in the bases so its decide_batch() wins.
+    """
+
+    @abstractmethod
+    def batch_rules(self, segment: Segment) -> list[Rule]:
+        """
+        decide() as masks over a segment of constant state
+
+        Returns:
+            (action code, amount, mask) tuples in decide()'s priority order
+        """
+
+    def decide_batch(self, game: GameArrays, state: BatchState) -> np.ndarray:
+        """Vectorized decide() over a whole game"""
+        return run_vectorized(self, game, state)
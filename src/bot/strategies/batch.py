@@ -0,0 +1,537 @@
+"""
+Batch strategy evaluation - whole games at a time with NumPy
+
+TradingStrategy.decide() makes one decision per tick from observation
+dicts. For offline evaluation (backtests, the replay archive) that is
+Python-speed per tick. decide_batch() evaluates a whole game from price /
+tick / phase arrays plus a small carried state (BatchState) and returns
+one action code per tick.
+
+Game model (mirrors ReplayEngine.run_headless with a TradeManager):
+
+    Each tick, in order:
+    1. On a rugged tick an active sidebet wins if placed within the
+       window (5x payout), otherwise it loses
+    2. A sidebet past its window (tick > placed + 40) expires as a loss
+    3. The strategy decides; BUY / SELL / SIDE apply at this tick's price
+       (BUY costs amount * price and is refused if unaffordable, SELL
+       returns amount * price, SIDE costs amount)
+    At game end an open position is closed at the last price and an
+    unresolved sidebet is lost. Only the balance carries over to the
+    next game.
+
+Vectorization: state only changes on actions and sidebet resolutions, so
+between those events every strategy rule is a mask over the remaining
+ticks. run_vectorized() jumps from event to event (a handful per game)
+instead of stepping through every tick.
+
+run_scalar() drives the same model through decide() tick by tick. It is
+the default decide_batch() for strategies without a vectorized version,
+and the reference parity_mismatches() checks the vectorized paths against.
+"""
+
+import logging
+import time
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from config import config
+
+if TYPE_CHECKING:
+    from models import GameTick
+
+    from .base import TradingStrategy
+
+logger = logging.getLogger(__name__)
+
+# Action codes (decide_batch output)
+ACTION_WAIT = 0
+ACTION_BUY = 1
+ACTION_SELL = 2
+ACTION_SIDE = 3
+ACTION_NAMES = ("WAIT", "BUY", "SELL", "SIDE")
+ACTION_CODES = {name: code for code, name in enumerate(ACTION_NAMES)}
+
+PRESALE_PHASE = "PRESALE"
+
+MIN_BET = float(config.FINANCIAL["min_bet"])
+SIDEBET_WINDOW = config.GAME_RULES["sidebet_window_ticks"]
+SIDEBET_COOLDOWN = config.GAME_RULES["sidebet_cooldown_ticks"]
+SIDEBET_MULTIPLIER = float(config.GAME_RULES["sidebet_multiplier"])
+
+
+@dataclass
+class GameArrays:
+    """
+    One game as columns.
+
+    Attributes:
+        price: Price multiplier per tick (float64)
+        tick: Tick number per tick (int64)
+        tradeable: Trading allowed (PRESALE, or active and not a blocked phase)
+        rugged: Rug flag per tick
+        game_id: Game identifier
+    """
+
+    price: np.ndarray
+    tick: np.ndarray
+    tradeable: np.ndarray
+    rugged: np.ndarray
+    game_id: str = ""
+
+    def __len__(self) -> int:
+        return len(self.price)
+
+    @classmethod
+    def from_columns(
+        cls,
+        price: Sequence[float],
+        tick: Sequence[int],
+        phase: Sequence[str],
+        active: Sequence[bool],
+        rugged: Sequence[bool] | None = None,
+        game_id: str = "",
+    ) -> "GameArrays":
+        """Build from raw columns (tradeable derived like BotInterface.bot_get_info)."""
+        phase = np.asarray(phase, dtype=object)
+        blocked = np.isin(phase, list(config.GAME_RULES["blocked_phases"]))
+        tradeable = (phase == PRESALE_PHASE) | (np.asarray(active, dtype=bool) & ~blocked)
+        return cls(
+            price=np.asarray(price, dtype=np.float64),
+            tick=np.asarray(tick, dtype=np.int64),
+            tradeable=tradeable.astype(bool),
+            rugged=np.zeros(len(phase), dtype=bool)
+            if rugged is None
+            else np.asarray(rugged, dtype=bool),
+            game_id=game_id,
+        )
+
+    @classmethod
+    def from_ticks(cls, ticks: Sequence["GameTick"]) -> "GameArrays":
+        """Build from GameTicks (a list or a TickIndex)."""
+        return cls.from_columns(
+            price=[float(t.price) for t in ticks],
+            tick=[t.tick for t in ticks],
+            phase=[t.phase for t in ticks],
+            active=[t.active for t in ticks],
+            rugged=[t.rugged for t in ticks],
+            game_id=ticks[0].game_id if len(ticks) else "",
+        )
+
+
+@dataclass
+class BatchState:
+    """
+    State carried through decide_batch().
+
+    The balance carries across games; position and sidebet live within one.
+    """
+
+    balance: float = float(config.FINANCIAL["initial_balance"])
+
+    # Open position
+    position_price: float | None = None
+    position_amount: float = 0.0
+    position_tick: int | None = None
+
+    # Active sidebet
+    sidebet_tick: int | None = None
+    sidebet_amount: float = 0.0
+    last_sidebet_resolved: int | None = None
+
+    # Totals
+    trades: int = 0
+    rejected: int = 0
+    sidebets_won: int = 0
+    sidebets_lost: int = 0
+    games: int = 0
+
+    def start_game(self) -> None:
+        self.position_price = None
+        self.position_amount = 0.0
+        self.position_tick = None
+        self.sidebet_tick = None
+        self.sidebet_amount = 0.0
+        self.last_sidebet_resolved = None
+
+    def end_game(self, price: float) -> None:
+        if self.position_price is not None:
+            self.balance += self.position_amount * price
+        if self.sidebet_tick is not None:
+            self.sidebets_lost += 1
+        self.start_game()
+        self.games += 1
+
+    def settle(self, tick: int, rugged: bool) -> None:
+        """Rug and expiry checks before the decision on this tick."""
+        if self.sidebet_tick is None:
+            return
+        if rugged:
+            self._resolve_sidebet(tick - self.sidebet_tick <= SIDEBET_WINDOW, tick)
+        elif tick > self.sidebet_tick + SIDEBET_WINDOW:
+            self._resolve_sidebet(False, tick)
+
+    def _resolve_sidebet(self, won: bool, tick: int) -> None:
+        if won:
+            self.balance += self.sidebet_amount * SIDEBET_MULTIPLIER
+            self.sidebets_won += 1
+        else:
+            self.sidebets_lost += 1
+        self.sidebet_tick = None
+        self.sidebet_amount = 0.0
+        self.last_sidebet_resolved = tick
+
+    def apply(self, action: int, amount: float, price: float, tick: int) -> bool:
+        """Apply an action; False if the environment refused it (state unchanged)."""
+        if action == ACTION_BUY:
+            cost = amount * price
+            if cost > self.balance:
+                self.rejected += 1
+                return False
+            self.balance -= cost
+            self.position_price = price
+            self.position_amount = amount
+            self.position_tick = tick
+        elif action == ACTION_SELL:
+            self.balance += self.position_amount * price
+            self.position_price = None
+            self.position_amount = 0.0
+            self.position_tick = None
+        elif action == ACTION_SIDE:
+            if amount > self.balance:
+                self.rejected += 1
+                return False
+            self.balance -= amount
+            self.sidebet_tick = tick
+            self.sidebet_amount = amount
+        else:
+            return False
+        self.trades += 1
+        return True
+
+    def can_sidebet(self, tick):
+        """Sidebet cooldown check (scalar or array of ticks)."""
+        if self.last_sidebet_resolved is None:
+            return np.ones_like(tick, dtype=bool) if isinstance(tick, np.ndarray) else True
+        return tick - self.last_sidebet_resolved > SIDEBET_COOLDOWN
+
+
+@dataclass
+class Segment:
+    """
+    Ticks [start, stop) of a game over which BatchState is constant.
+
+    Passed to TradingStrategy.batch_rules(); every array covers the segment.
+    """
+
+    price: np.ndarray
+    tick: np.ndarray
+    can_buy: np.ndarray
+    can_sidebet: np.ndarray
+    balance: float
+    position_price: float | None
+    position_tick: int | None
+
+    @property
+    def has_position(self) -> bool:
+        return self.position_price is not None
+
+    @property
+    def pnl_pct(self) -> np.ndarray:
+        """Unrealized P&L % of the open position (same float ops as the scalar path)."""
+        return (self.price / self.position_price - 1) * 100
+
+
+# (action code, amount, bool mask over the segment) in priority order
+Rule = tuple[int, float | None, np.ndarray]
+
+
+# ========== Scalar reference ==========
+
+
+def run_scalar(strategy: "TradingStrategy", game: GameArrays, state: BatchState) -> np.ndarray:
+    """
+    Evaluate a game by calling strategy.decide() once per tick.
+
+    Args:
+        strategy: Any TradingStrategy
+        game: Game columns
+        state: Carried state (updated in place)
+
+    Returns:
+        Action code per tick
+    """
+    actions = np.zeros(len(game), dtype=np.int8)
+    strategy.reset()
+    state.start_game()
+    for i in range(len(game)):
+        price, tick = float(game.price[i]), int(game.tick[i])
+        state.settle(tick, bool(game.rugged[i]))
+        observation, info = _observation(game, i, state)
+        action, amount, _reasoning = strategy.decide(observation, info)
+        code = ACTION_CODES.get(action, ACTION_WAIT)
+        actions[i] = code
+        if code != ACTION_WAIT:
+            state.apply(code, float(amount) if amount is not None else 0.0, price, tick)
+    if len(game):
+        state.end_game(float(game.price[-1]))
+    return actions
+
+
+def _observation(
+    game: GameArrays, i: int, state: BatchState
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """bot_get_observation() / bot_get_info() equivalents for tick i."""
+    price, tick = float(game.price[i]), int(game.tick[i])
+    tradeable = bool(game.tradeable[i])
+
+    position = None
+    if state.position_price is not None:
+        position = {
+            "entry_price": state.position_price,
+            "amount": state.position_amount,
+            "entry_tick": state.position_tick,
+            "current_pnl_sol": state.position_amount * (price - state.position_price),
+            "current_pnl_percent": (price / state.position_price - 1) * 100,
+        }
+    sidebet = None
+    if state.sidebet_tick is not None:
+        sidebet = {
+            "amount": state.sidebet_amount,
+            "placed_tick": state.sidebet_tick,
+            "ticks_remaining": state.sidebet_tick + SIDEBET_WINDOW - tick,
+        }
+
+    can_buy = tradeable and state.balance >= MIN_BET
+    can_sell = position is not None
+    can_sidebet = (
+        tradeable and sidebet is None and state.balance >= MIN_BET and state.can_sidebet(tick)
+    )
+    valid_actions = ["WAIT"]
+    valid_actions += ["BUY"] if can_buy else []
+    valid_actions += ["SELL"] if can_sell else []
+    valid_actions += ["SIDE"] if can_sidebet else []
+
+    observation = {
+        "current_state": {
+            "price": price,
+            "tick": tick,
+            "active": tradeable,
+            "rugged": bool(game.rugged[i]),
+        },
+        "wallet": {"balance": state.balance},
+        "position": position,
+        "sidebet": sidebet,
+        "game_info": {"game_id": game.game_id, "current_tick_index": i},
+    }
+    info = {
+        "valid_actions": valid_actions,
+        "can_buy": can_buy,
+        "can_sell": can_sell,
+        "can_sidebet": can_sidebet,
+    }
+    return observation, info
+
+
+# ========== Vectorized engine ==========
+
+
+def run_vectorized(strategy: "TradingStrategy", game: GameArrays, state: BatchState) -> np.ndarray:
+    """
+    Evaluate a game with strategy.batch_rules(), jumping between events.
+
+    Args:
+        strategy: TradingStrategy implementing batch_rules()
+        game: Game columns
+        state: Carried state (updated in place)
+
+    Returns:
+        Action code per tick (identical to run_scalar())
+    """
+    n = len(game)
+    actions = np.zeros(n, dtype=np.int8)
+    strategy.reset()
+    state.start_game()
+    price, tick, rugged = game.price, game.tick, game.rugged
+
+    i = 0
+    while i < n:
+        state.settle(int(tick[i]), bool(rugged[i]))
+
+        # State is constant until the next action or sidebet resolution
+        stop = n
+        if state.sidebet_tick is not None:
+            expiry = tick[i + 1 :] > state.sidebet_tick + SIDEBET_WINDOW
+            later = np.flatnonzero(expiry | rugged[i + 1 :])
+            if len(later):
+                stop = i + 1 + int(later[0])
+
+        seg_tick = tick[i:stop]
+        balance_ok = state.balance >= MIN_BET
+        tradeable = game.tradeable[i:stop] & balance_ok
+        segment = Segment(
+            price=price[i:stop],
+            tick=seg_tick,
+            can_buy=tradeable,
+            can_sidebet=tradeable & state.can_sidebet(seg_tick)
+            if state.sidebet_tick is None
+            else np.zeros(stop - i, dtype=bool),
+            balance=state.balance,
+            position_price=state.position_price,
+            position_tick=state.position_tick,
+        )
+        rules = strategy.batch_rules(segment)
+        if not rules:
+            i = stop
+            continue
+        hit = rules[0][2]
+        for _, _, mask in rules[1:]:
+            hit = hit | mask
+
+        next_i = stop
+        for offset in np.flatnonzero(hit):
+            # First rule in priority order that fires here
+            code, amount, _ = next(rule for rule in rules if rule[2][offset])
+            j = i + int(offset)
+            actions[j] = code
+            if state.apply(code, amount or 0.0, float(price[j]), int(tick[j])):
+                next_i = j + 1
+                break
+            # Refused: state unchanged, so the remaining decisions still hold
+        i = next_i
+
+    if n:
+        state.end_game(float(price[-1]))
+    return actions
+
+
+# ========== Parity and offline evaluation ==========
+
+
+def parity_mismatches(
+    strategy_factory: Callable[[], "TradingStrategy"],
+    games: Iterable[GameArrays],
+    initial_balance: float = float(config.FINANCIAL["initial_balance"]),
+) -> list[dict[str, Any]]:
+    """
+    Compare decide_batch() with the scalar decide() path over games.
+
+    Args:
+        strategy_factory: Builds a fresh strategy (one per path)
+        games: Games to replay through both paths (balance carries over)
+        initial_balance: Starting balance
+
+    Returns:
+        One entry per game whose actions or resulting state differ
+        (empty list = parity)
+    """
+    batch, scalar = strategy_factory(), strategy_factory()
+    batch_state = BatchState(balance=initial_balance)
+    scalar_state = BatchState(balance=initial_balance)
+
+    mismatches = []
+    for index, game in enumerate(games):
+        got = batch.decide_batch(game, batch_state)
+        expected = run_scalar(scalar, game, scalar_state)
+        differs = np.flatnonzero(got != expected)
+        if len(differs) or batch_state != scalar_state:
+            first = int(differs[0]) if len(differs) else None
+            mismatches.append(
+                {
+                    "game": index,
+                    "game_id": game.game_id,
+                    "first_index": first,
+                    "batch": ACTION_NAMES[got[first]] if first is not None else None,
+                    "scalar": ACTION_NAMES[expected[first]] if first is not None else None,
+                    "batch_balance": batch_state.balance,
+                    "scalar_balance": scalar_state.balance,
+                }
+            )
+            # Resync so one divergence doesn't cascade into every later game
+            batch_state = BatchState(**vars(scalar_state))
+    return mismatches
+
+
+@dataclass
+class BatchEvaluation:
+    """Result of evaluating one strategy over a game set."""
+
+    strategy_name: str
+    initial_balance: float
+    state: BatchState
+    action_counts: dict[str, int] = field(default_factory=dict)
+    ticks: int = 0
+    elapsed_s: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "strategy_name": self.strategy_name,
+            "initial_balance": self.initial_balance,
+            "final_balance": self.state.balance,
+            "pnl": self.state.balance - self.initial_balance,
+            "games": self.state.games,
+            "ticks": self.ticks,
+            "trades": self.state.trades,
+            "rejected": self.state.rejected,
+            "sidebets_won": self.state.sidebets_won,
+            "sidebets_lost": self.state.sidebets_lost,
+            "action_counts": self.action_counts,
+            "elapsed_s": self.elapsed_s,
+            "ticks_per_sec": self.ticks / self.elapsed_s if self.elapsed_s > 0 else 0.0,
+        }
+
+
+def evaluate_strategy(
+    strategy: "TradingStrategy",
+    games: Iterable[GameArrays],
+    initial_balance: float = float(config.FINANCIAL["initial_balance"]),
+) -> BatchEvaluation:
+    """
+    Run a strategy over many games with decide_batch().
+
+    Args:
+        strategy: Strategy instance
+        games: Game columns, e.g. from load_games()
+        initial_balance: Starting balance (carried across games)
+
+    Returns:
+        BatchEvaluation with final state, action counts and timing
+    """
+    state = BatchState(balance=initial_balance)
+    counts = np.zeros(len(ACTION_NAMES), dtype=np.int64)
+    ticks = 0
+    start = time.perf_counter()
+    for game in games:
+        actions = strategy.decide_batch(game, state)
+        counts += np.bincount(actions, minlength=len(ACTION_NAMES))
+        ticks += len(game)
+    elapsed = time.perf_counter() - start
+    return BatchEvaluation(
+        strategy_name=str(strategy),
+        initial_balance=initial_balance,
+        state=state,
+        action_counts={name: int(counts[code]) for code, name in enumerate(ACTION_NAMES)},
+        ticks=ticks,
+        elapsed_s=elapsed,
+    )
+
+
+def load_games(directory: Path) -> list[GameArrays]:
+    """Load every recording in a directory as GameArrays (one pass, up front)."""
+    from core.replay_source import FileDirectorySource
+
+    source = FileDirectorySource(Path(directory))
+    games = []
+    for identifier in source.list_available():
+        try:
+            ticks, _game_id = source.load(identifier)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping {identifier}: {e}")
+            continue
+        if len(ticks):
+            games.append(GameArrays.from_ticks(ticks))
+    return games
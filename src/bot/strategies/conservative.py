@@ -5,10 +5,17 @@ Conservative trading strategy
 from decimal import Decimal
 from typing import Any
 
-from .base import TradingStrategy
+from .base import TradingStrategy, VectorizedStrategy
+from .batch import (
+    ACTION_BUY,
+    ACTION_SELL,
+    ACTION_SIDE,
+    Rule,
+    Segment,
+)
 
 
-class ConservativeStrategy(TradingStrategy):
+class ConservativeStrategy(VectorizedStrategy, TradingStrategy):
     """
     Conservative trading strategy
 
@@ -97,3 +104,23 @@ class ConservativeStrategy(TradingStrategy):
             )
         else:
             return decide_action("WAIT", None, f"Waiting for entry (Price: {price:.2f}x too high)")
+
+    def batch_rules(self, segment: Segment) -> list[Rule]:
+        """decide() rules as masks (buy, sell, sidebet priority)"""
+        price, balance = segment.price, segment.balance
+        rules = []
+        if segment.has_position:
+            pnl_pct = segment.pnl_pct
+            exit_mask = (
+                (pnl_pct > float(self.TAKE_PROFIT))
+                | (pnl_pct < float(self.STOP_LOSS))
+                | (price > float(self.BUBBLE_EXIT))
+            )
+            rules.append((ACTION_SELL, None, exit_mask))
+        elif balance >= float(self.BUY_AMOUNT):
+            buy_mask = segment.can_buy & (price < float(self.BUY_THRESHOLD))
+            rules.append((ACTION_BUY, float(self.BUY_AMOUNT), buy_mask))
+        if balance >= float(self.SIDEBET_AMOUNT):
+            side_mask = segment.can_sidebet & (segment.tick > self.SIDEBET_TICK)
+            rules.append((ACTION_SIDE, float(self.SIDEBET_AMOUNT), side_mask))
+        return rules
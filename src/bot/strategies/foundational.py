@@ -18,10 +18,19 @@ Design Philosophy:
 from decimal import Decimal
 from typing import Any
 
-from .base import TradingStrategy
+import numpy as np
 
+from .base import TradingStrategy, VectorizedStrategy
+from .batch import (
+    ACTION_BUY,
+    ACTION_SELL,
+    ACTION_SIDE,
+    Rule,
+    Segment,
+)
 
-class FoundationalStrategy(TradingStrategy):
+
+class FoundationalStrategy(VectorizedStrategy, TradingStrategy):
     """
     Foundational trading strategy based on empirical analysis
 
@@ -200,6 +209,39 @@ class FoundationalStrategy(TradingStrategy):
                     "WAIT", None, f"⏳ Waiting for sweet spot (Price: {price:.1f}x, Tick: {tick})"
                 )
 
+    def batch_rules(self, segment: Segment) -> list[Rule]:
+        """decide() rules as masks (sell, buy, sidebet priority)"""
+        price, tick, balance = segment.price, segment.tick, segment.balance
+        rules = []
+        if segment.has_position:
+            pnl_pct = segment.pnl_pct
+            # Same falsy check as decide(): an entry at tick 0 never times out
+            entry_tick = segment.position_tick
+            ticks_held = tick - entry_tick if entry_tick else np.zeros_like(tick)
+            exit_mask = (
+                (pnl_pct >= float(self.PROFIT_TARGET))
+                | (pnl_pct <= float(self.STOP_LOSS))
+                | (tick >= self.MEDIAN_RUG_TICK)
+                | (ticks_held >= self.MAX_HOLD_TICKS)
+            )
+            rules.append((ACTION_SELL, None, exit_mask))
+        elif balance >= float(self.BUY_AMOUNT):
+            buy_mask = (
+                segment.can_buy
+                & (price >= float(self.ENTRY_PRICE_MIN))
+                & (price <= float(self.ENTRY_PRICE_MAX))
+                & (tick < self.SAFE_WINDOW_TICKS)
+            )
+            rules.append((ACTION_BUY, float(self.BUY_AMOUNT), buy_mask))
+        if balance >= float(self.SIDEBET_AMOUNT):
+            side_mask = (
+                segment.can_sidebet
+                & (tick >= self.SIDEBET_TICK_MIN)
+                & (tick <= self.SIDEBET_TICK_MAX)
+            )
+            rules.append((ACTION_SIDE, float(self.SIDEBET_AMOUNT), side_mask))
+        return rules
+
     def _should_enter(self, price: Decimal, tick: int, balance: Decimal) -> bool:
         """
         Check if we should enter a position
@@ -5,10 +5,17 @@ Sidebet-focused trading strategy
 from decimal import Decimal
 from typing import Any
 
-from .base import TradingStrategy
+from .base import TradingStrategy, VectorizedStrategy
+from .batch import (
+    ACTION_BUY,
+    ACTION_SELL,
+    ACTION_SIDE,
+    Rule,
+    Segment,
+)
 
 
-class SidebetStrategy(TradingStrategy):
+class SidebetStrategy(VectorizedStrategy, TradingStrategy):
     """
     Sidebet-focused strategy
 
@@ -68,3 +75,16 @@ class SidebetStrategy(TradingStrategy):
 
         # Default: wait
         return decide_action("WAIT", None, "Waiting for sidebet opportunity")
+
+    def batch_rules(self, segment: Segment) -> list[Rule]:
+        """decide() rules as masks (sidebet, buy, sell priority)"""
+        balance = segment.balance
+        rules = []
+        if balance >= float(self.SIDEBET_AMOUNT):
+            rules.append((ACTION_SIDE, float(self.SIDEBET_AMOUNT), segment.can_sidebet))
+        if segment.has_position:
+            rules.append((ACTION_SELL, None, segment.pnl_pct > float(self.TAKE_PROFIT)))
+        elif balance >= float(self.BUY_AMOUNT):
+            buy_mask = segment.can_buy & (segment.price < float(self.BUY_THRESHOLD))
+            rules.append((ACTION_BUY, float(self.BUY_AMOUNT), buy_mask))
+        return rules
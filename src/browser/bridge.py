@@ -28,6 +28,7 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
+from browser.dom.dispatcher import ButtonSpec, DispatchedClick, InPageDispatcher
 from services.event_bus import Events, event_bus
 from services.event_source_manager import EventSourceManager
 from services.rag_ingester import RAGIngester
@@ -204,6 +205,15 @@ class SelectorStrategy:
         """Get class name patterns for a button"""
         return cls.CLASS_PATTERNS.get(button, [button.lower()])
 
+    @classmethod
+    def get_button_spec(cls, button: str) -> ButtonSpec:
+        """All strategies for a button, for the in-page dispatcher"""
+        return ButtonSpec(
+            css=cls.get_css_selectors(button),
+            text=cls.get_text_patterns(button),
+            classes=cls.get_class_patterns(button),
+        )
+
 
 class BrowserBridge:
     """
@@ -244,6 +254,9 @@ class BrowserBridge:
         # Click statistics for debugging
         self._click_stats: dict[str, dict[str, int]] = {}
 
+        # Resolves and clicks in the page (cached per button, one round trip)
+        self._dispatcher = InPageDispatcher(SelectorStrategy.get_button_spec)
+
         # CDP WebSocket interception components (Task 8)
         self._cdp_interceptor = CDPWebSocketInterceptor()
         self._event_source_manager = EventSourceManager()
@@ -348,6 +361,11 @@ class BrowserBridge:
                             self._do_click_with_retry(action.get("button")),
                             timeout=self.CLICK_TIMEOUT,
                         )
+                    elif action_type == "click_plan":
+                        await asyncio.wait_for(
+                            self._do_click_plan(action.get("buttons")),
+                            timeout=self.CLICK_TIMEOUT,
+                        )
                     elif action_type == "stop":
                         break
                 except TimeoutError:
@@ -431,6 +449,13 @@ class BrowserBridge:
         self._queue_action({"type": "click", "button": "SIDEBET"})
         logger.debug("Bridge: Queued SIDEBET click")
 
+    def on_click_plan(self, buttons: list[str]):
+        """Queue several clicks (e.g. X, +0.01, +0.001, SIDEBET) as one in-page dispatch."""
+        if not self.is_connected() or not buttons:
+            return
+        self._queue_action({"type": "click_plan", "buttons": list(buttons)})
+        logger.debug(f"Bridge: Queued click plan {buttons}")
+
     def on_percentage_clicked(self, percentage: float):
         """Called when percentage button clicked in UI."""
         if not self.is_connected():
@@ -672,6 +697,7 @@ class BrowserBridge:
         Actually click a button in the browser (async).
 
         PRODUCTION FIX 2025-12-01: Reordered strategies to prevent X->X2 mismatch
+        0. In-page dispatcher (strategies 1-4 in one round trip, cached per button)
         1. CSS structural selectors FIRST (most reliable with new rugs.fun classes)
         2. Exact text match (prevents X matching X2)
         3. Starts-with text match (handles dynamic text like "BUY+0.030 SOL")
@@ -683,6 +709,19 @@ class BrowserBridge:
         try:
             page = self.cdp_manager.page
 
+            # Strategy 0: in-page dispatcher - same strategy order, but resolved
+            # in one round trip and cached per button after the first hit
+            try:
+                click = await self._dispatcher.click(page, button)
+                if click.success:
+                    return ClickResult(
+                        success=True,
+                        method=f"dispatch-{click.method}",
+                        button_text=click.selector,
+                    )
+            except Exception as e:
+                logger.debug(f"In-page dispatch failed for '{button}': {e}")
+
             # Strategy 1: CSS selector FIRST (most reliable - uses specific class names)
             # This prevents issues like 'X' matching 'X2' in text-based matching
             result = await self._try_css_selector_click(page, button)
@@ -714,6 +753,32 @@ class BrowserBridge:
             logger.error(f"Click error for {button}: {e}", exc_info=True)
             return ClickResult(success=False, error=str(e))
 
+    async def _do_click_plan(self, buttons: list[str]) -> list[DispatchedClick]:
+        """
+        Click a sequence of buttons in one in-page dispatch.
+
+        Stops at the first button that can't be found (no retries: later
+        clicks depend on earlier ones, so the caller re-plans).
+        """
+        if not self.cdp_manager or not self.cdp_manager.page:
+            logger.error("Click plan skipped: browser not connected")
+            return []
+
+        try:
+            clicks = await self._dispatcher.run_plan(self.cdp_manager.page, buttons)
+        except Exception as e:
+            logger.error(f"Click plan error for {buttons}: {e}")
+            for button in buttons:
+                self._record_click_stat(button, "failure", str(e))
+            return []
+
+        for click in clicks:
+            if click.success:
+                self._record_click_stat(click.button, "success", f"dispatch-{click.method}")
+            else:
+                self._record_click_stat(click.button, "failure", click.error)
+        return clicks
+
     async def _try_text_based_click(self, page, button: str) -> ClickResult:
         """
         Try to click button using text-based matching.
@@ -923,6 +988,10 @@ class BrowserBridge:
         """Get click statistics for debugging."""
         return self._click_stats.copy()
 
+    def get_dispatcher_stats(self) -> dict[str, Any]:
+        """Get in-page dispatcher statistics (plans, clicks, cache hits)."""
+        return self._dispatcher.get_stats()
+
 
 # Singleton instance for global access
 # PRODUCTION FIX: Thread-safe singleton with proper locking
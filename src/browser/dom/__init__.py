@@ -4,9 +4,12 @@ DOM Utilities Module
 Utilities for interacting with browser DOM elements.
 """
 
+from browser.dom.dispatcher import ButtonSpec, DispatchedClick, InPageDispatcher
 from browser.dom.selectors import (
     BALANCE_SELECTORS,
     BET_AMOUNT_INPUT_SELECTORS,
+    BUTTON_SELECTOR_MAP,
+    BUTTON_TEXT_PATTERNS,
     BUY_BUTTON_SELECTORS,
     INCREMENT_SELECTOR_MAP,
     PERCENTAGE_TEXT_MAP,
@@ -19,12 +22,17 @@ from browser.dom.timing import ExecutionTiming, TimingMetrics
 __all__ = [
     "BALANCE_SELECTORS",
     "BET_AMOUNT_INPUT_SELECTORS",
+    "BUTTON_SELECTOR_MAP",
+    "BUTTON_TEXT_PATTERNS",
     "BUY_BUTTON_SELECTORS",
     "INCREMENT_SELECTOR_MAP",
     "PERCENTAGE_TEXT_MAP",
     "POSITION_SELECTORS",
     "SELL_BUTTON_SELECTORS",
     "SIDEBET_BUTTON_SELECTORS",
+    "ButtonSpec",
+    "DispatchedClick",
     "ExecutionTiming",
+    "InPageDispatcher",
     "TimingMetrics",
 ]
@@ -0,0 +1,320 @@
+"""
+In-Page Click Dispatcher
+
+Runs a whole click plan (e.g. X, +0.01, +0.001 x3, SIDEBET) inside the page
+in one evaluate() call, instead of one or more CDP round trips per click.
+
+The injected script keeps a selector-resolution cache per button:
+
+- resolved: which strategy (css / text-exact / text-starts-with /
+  text-contains / class) and which selector or pattern found the button.
+  Later clicks try that first, so a missing first selector is only ever
+  paid for once. Dropped when it stops matching.
+- elements: the element itself, reused until the next DOM mutation
+  (childList, observed with a MutationObserver).
+
+Both live on window, so navigation (a new document) clears them. Every
+click returns a page-clock timestamp (epoch ms), so decision-to-click
+latency can be measured per click.
+
+Classes:
+    ButtonSpec: How to find one button (CSS selectors, text, class patterns)
+    DispatchedClick: Outcome of one click in a plan
+    InPageDispatcher: Installs the script and runs click plans
+"""
+
+import logging
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Bump when DISPATCHER_JS changes so open pages reinstall it
+DISPATCHER_VERSION = 1
+
+# Installs window.__rugsClickDispatcher (once per document) and runs a plan.
+# Selectors that aren't plain CSS (Playwright ">>" / ":has-text") are skipped.
+DISPATCHER_JS = """
+async ({version, steps, specs, delayMs}) => {
+    let d = window.__rugsClickDispatcher;
+    if (!d || d.version !== version) {
+        if (d && d.observer) d.observer.disconnect();
+        d = {version, resolved: {}, elements: {}, generation: 0};
+
+        d.usable = (el) => {
+            if (!el || !el.isConnected) return false;
+            const style = window.getComputedStyle(el);
+            const rect = el.getBoundingClientRect();
+            return !el.disabled &&
+                   !el.classList.contains('disabled') &&
+                   el.getAttribute('aria-disabled') !== 'true' &&
+                   style.display !== 'none' &&
+                   style.visibility !== 'hidden' &&
+                   rect.width > 0 && rect.height > 0;
+        };
+
+        d.byCss = (selector) => {
+            try {
+                const el = document.querySelector(selector);
+                return d.usable(el) ? el : null;
+            } catch (e) {
+                return null;  // Not plain CSS
+            }
+        };
+
+        d.clickables = () => [
+            ...document.querySelectorAll('button'),
+            ...document.querySelectorAll('div[class*="button"], div[class*="Button"]'),
+        ].filter(d.usable);
+
+        d.textMatch = (mode, text, pattern) => {
+            const upper = pattern.toUpperCase();
+            if (mode === 'text-exact') return text === pattern || text.toUpperCase() === upper;
+            if (mode === 'text-starts-with') {
+                // 'X' must not match 'X2'
+                if (pattern.length === 1 && text.length > 1) return false;
+                return text.toUpperCase().startsWith(upper);
+            }
+            return text.toUpperCase().includes(upper);
+        };
+
+        d.byText = (mode, pattern, candidates) =>
+            (candidates || d.clickables()).find(
+                (el) => d.textMatch(mode, el.textContent.trim(), pattern)
+            ) || null;
+
+        d.byClass = (pattern) =>
+            Array.from(document.querySelectorAll('button')).find(
+                (b) => b.className.toLowerCase().includes(pattern) && d.usable(b)
+            ) || null;
+
+        d.locate = (method, key) => {
+            if (method === 'css') return d.byCss(key);
+            if (method === 'class') return d.byClass(key);
+            return d.byText(method, key);
+        };
+
+        d.search = (spec) => {
+            for (const selector of spec.css || []) {
+                const el = d.byCss(selector);
+                if (el) return [el, 'css', selector];
+            }
+            const text = spec.text || [];
+            if (text.length) {
+                const candidates = d.clickables();
+                for (const mode of ['text-exact', 'text-starts-with', 'text-contains']) {
+                    for (const pattern of text) {
+                        const el = d.byText(mode, pattern, candidates);
+                        if (el) return [el, mode, pattern];
+                    }
+                }
+            }
+            for (const pattern of spec.classes || []) {
+                const el = d.byClass(pattern);
+                if (el) return [el, 'class', pattern];
+            }
+            return null;
+        };
+
+        d.find = (name, spec) => {
+            const hit = d.elements[name];
+            if (hit && d.usable(hit.el)) return {...hit, cached: true};
+            const known = d.resolved[name];
+            if (known) {
+                const el = d.locate(known.method, known.key);
+                if (el) {
+                    d.elements[name] = {el, method: known.method, key: known.key};
+                    return {...d.elements[name], cached: true};
+                }
+                delete d.resolved[name];
+            }
+            const found = d.search(spec);
+            if (!found) return null;
+            const [el, method, key] = found;
+            d.resolved[name] = {method, key};
+            d.elements[name] = {el, method, key};
+            return {el, method, key, cached: false};
+        };
+
+        d.observer = new MutationObserver(() => {
+            d.generation++;
+            d.elements = {};
+        });
+        d.observer.observe(document.documentElement, {childList: true, subtree: true});
+        window.__rugsClickDispatcher = d;
+    }
+
+    const results = [];
+    for (let i = 0; i < steps.length; i++) {
+        const name = steps[i];
+        const hit = d.find(name, specs[name] || {});
+        if (!hit) {
+            results.push({button: name, success: false, error: 'not found'});
+            break;  // Later clicks depend on this one (e.g. amount building)
+        }
+        hit.el.click();
+        results.push({
+            button: name,
+            success: true,
+            method: hit.method,
+            selector: hit.key,
+            cached: hit.cached,
+            timestamp: performance.timeOrigin + performance.now(),
+        });
+        if (i < steps.length - 1 && delayMs[1] > 0) {
+            const wait = delayMs[0] + Math.random() * (delayMs[1] - delayMs[0]);
+            await new Promise((resolve) => setTimeout(resolve, wait));
+        }
+    }
+    return results;
+}
+"""
+
+INVALIDATE_JS = """
+() => {
+    const d = window.__rugsClickDispatcher;
+    if (d && d.observer) d.observer.disconnect();
+    delete window.__rugsClickDispatcher;
+}
+"""
+
+
+@dataclass
+class ButtonSpec:
+    """
+    How to find one button, tried in this order.
+
+    Attributes:
+        css: CSS selectors (first usable match wins)
+        text: Text patterns (exact, then starts-with, then contains)
+        classes: Lowercase class-name substrings on <button> elements
+    """
+
+    css: list[str] = field(default_factory=list)
+    text: list[str] = field(default_factory=list)
+    classes: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, list[str]]:
+        return {"css": self.css, "text": self.text, "classes": self.classes}
+
+
+@dataclass
+class DispatchedClick:
+    """
+    Outcome of one click in a plan.
+
+    Attributes:
+        button: Button name from the plan
+        success: Whether the button was found and clicked
+        method: Strategy that found it (css, text-exact, ..., class)
+        selector: Selector or pattern that found it
+        cached: Found through the resolution cache
+        timestamp_ms: Page clock when clicked (epoch ms)
+        error: Failure reason
+    """
+
+    button: str
+    success: bool
+    method: str = ""
+    selector: str = ""
+    cached: bool = False
+    timestamp_ms: float = 0.0
+    error: str = ""
+
+
+class InPageDispatcher:
+    """
+    Runs click plans in the page with one evaluate() call per plan.
+
+    Args:
+        spec_for: Button name -> ButtonSpec (mapping or callable)
+        delay_ms: (min, max) human delay between clicks, applied in the page
+    """
+
+    def __init__(
+        self,
+        spec_for: Mapping[str, ButtonSpec] | Callable[[str], ButtonSpec],
+        delay_ms: tuple[float, float] = (0.0, 0.0),
+    ):
+        self._spec_for = spec_for.get if isinstance(spec_for, Mapping) else spec_for
+        self.delay_ms = delay_ms
+
+        # Statistics
+        self.total_plans = 0
+        self.total_clicks = 0
+        self.cache_hits = 0
+        self.failures = 0
+
+    async def run_plan(
+        self, page: Any, buttons: Sequence[str], delay_ms: tuple[float, float] | None = None
+    ) -> list[DispatchedClick]:
+        """
+        Click buttons in order, stopping at the first one that can't be found.
+
+        Args:
+            page: Playwright page
+            buttons: Button names, e.g. ["X", "+0.01", "+0.001", "SIDEBET"]
+            delay_ms: Override the (min, max) delay between clicks
+
+        Returns:
+            One DispatchedClick per attempted button (a short list means a
+            button was missing; the last entry says which)
+        """
+        if not buttons:
+            return []
+        specs = {}
+        for name in buttons:
+            if name not in specs:
+                spec = self._spec_for(name)
+                specs[name] = spec.to_dict() if spec else {}
+
+        raw = await page.evaluate(
+            DISPATCHER_JS,
+            {
+                "version": DISPATCHER_VERSION,
+                "steps": list(buttons),
+                "specs": specs,
+                "delayMs": list(delay_ms or self.delay_ms),
+            },
+        )
+
+        clicks = [
+            DispatchedClick(
+                button=r["button"],
+                success=r["success"],
+                method=r.get("method", ""),
+                selector=r.get("selector", ""),
+                cached=r.get("cached", False),
+                timestamp_ms=r.get("timestamp", 0.0),
+                error=r.get("error", ""),
+            )
+            for r in raw
+        ]
+        self.total_plans += 1
+        self.total_clicks += sum(1 for c in clicks if c.success)
+        self.cache_hits += sum(1 for c in clicks if c.cached)
+        if clicks and not clicks[-1].success:
+            self.failures += 1
+            logger.warning(f"Dispatcher: '{clicks[-1].button}' not found (plan {list(buttons)})")
+        return clicks
+
+    async def click(self, page: Any, button: str) -> DispatchedClick:
+        """Click a single button (one evaluate() call)."""
+        return (await self.run_plan(page, [button]))[0]
+
+    async def invalidate(self, page: Any) -> None:
+        """Drop the in-page script and its caches (reinstalled on next plan)."""
+        await page.evaluate(INVALIDATE_JS)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get dispatcher statistics"""
+        return {
+            "total_plans": self.total_plans,
+            "total_clicks": self.total_clicks,
+            "cache_hits": self.cache_hits,
+            "failures": self.failures,
+            "cache_hit_rate": (self.cache_hits / self.total_clicks * 100)
+            if self.total_clicks > 0
+            else 0.0,
+        }
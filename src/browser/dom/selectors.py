@@ -292,6 +292,30 @@ INCREMENT_SELECTOR_MAP = {
     "MAX": MAX_BUTTON_SELECTORS,
 }
 
+# Every clickable button by name (for the in-page dispatcher)
+BUTTON_SELECTOR_MAP = {
+    **INCREMENT_SELECTOR_MAP,
+    "BUY": BUY_BUTTON_SELECTORS,
+    "SELL": SELL_BUTTON_SELECTORS,
+    "SIDEBET": SIDEBET_BUTTON_SELECTORS,
+}
+
+# Text fallback for the in-page dispatcher, which can't use Playwright's
+# text= / :has-text() selectors (exact match, then starts-with, then contains)
+BUTTON_TEXT_PATTERNS = {
+    "X": ["×", "✕", "X", "✖"],
+    "+0.001": ["+0.001", "+ 0.001"],
+    "+0.01": ["+0.01", "+ 0.01"],
+    "+0.1": ["+0.1", "+ 0.1"],
+    "+1": ["+1", "+ 1"],
+    "1/2": ["1/2", "½", "÷2", "0.5x"],
+    "X2": ["X2", "×2", "2x"],
+    "MAX": ["MAX", "ALL"],
+    "BUY": ["BUY"],
+    "SELL": ["SELL"],
+    "SIDEBET": ["SIDEBET", "SIDE BET", "SIDE"],
+}
+
 PERCENTAGE_SELECTOR_MAP = {
     0.1: PERCENTAGE_10_SELECTORS,
     0.25: PERCENTAGE_25_SELECTORS,
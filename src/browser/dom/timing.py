@@ -61,10 +61,13 @@ class TimingMetrics:
     Attributes:
         executions: List of ExecutionTiming records
         max_history: Maximum number of executions to retain (default: 100)
+        button_latencies: Recent click latencies (ms) per amount button,
+            bounded to max_history each (weights for bot.click_planner)
     """
 
     executions: list[ExecutionTiming] = field(default_factory=list)
     max_history: int = 100  # Keep last 100 executions
+    button_latencies: dict[str, list[float]] = field(default_factory=dict)
 
     def add_execution(self, timing: ExecutionTiming) -> None:
         """
@@ -77,6 +80,32 @@ class TimingMetrics:
         if len(self.executions) > self.max_history:
             self.executions.pop(0)  # Remove oldest
 
+    def add_button_click(self, button: str, latency_ms: float) -> None:
+        """
+        Add one amount-button click latency (bounded to max_history per button)
+
+        Args:
+            button: Button identifier (+0.001, X2, 1/2, X, ...)
+            latency_ms: Time the click took, in milliseconds
+        """
+        samples = self.button_latencies.setdefault(button, [])
+        samples.append(latency_ms)
+        if len(samples) > self.max_history:
+            samples.pop(0)
+
+    def get_button_latency_ms(self) -> dict[str, float]:
+        """
+        Mean click latency per button
+
+        Returns:
+            {button: average latency in ms} for buttons with samples
+        """
+        return {
+            button: sum(samples) / len(samples)
+            for button, samples in self.button_latencies.items()
+            if samples
+        }
+
     def get_stats(self) -> dict[str, Any]:
         """
         Calculate timing statistics
@@ -138,6 +167,7 @@ class TimingMetrics:
     def clear(self) -> None:
         """Clear all execution history"""
         self.executions.clear()
+        self.button_latencies.clear()
 
     def get_recent(self, n: int = 10) -> list[ExecutionTiming]:
         """
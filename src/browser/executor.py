@@ -18,10 +18,15 @@ import asyncio
 import logging
 import time
 from decimal import Decimal
+from itertools import groupby, pairwise
 from typing import Any
 
+from bot.click_planner import plan_clicks
+from browser.dom.dispatcher import ButtonSpec, InPageDispatcher
 from browser.dom.selectors import (
     BET_AMOUNT_INPUT_SELECTORS,
+    BUTTON_SELECTOR_MAP,
+    BUTTON_TEXT_PATTERNS,
     BUY_BUTTON_SELECTORS,
     INCREMENT_SELECTOR_MAP,
     SELL_BUTTON_SELECTORS,
@@ -30,6 +35,7 @@ from browser.dom.selectors import (
 
 # Browser timing utilities
 from browser.dom.timing import TimingMetrics
+from services.latency_trace import STAGE_CLICK, latency_tracer
 
 # CDP Browser Manager - Reliable wallet persistence via Chrome DevTools Protocol
 try:
@@ -60,6 +66,14 @@ logger = logging.getLogger(__name__)
 # Note: ExecutionTiming and TimingMetrics moved to browser/dom/timing.py
 
 
+def _button_spec(button: str) -> ButtonSpec:
+    """Dispatcher lookup: Playwright selector lists plus text patterns."""
+    return ButtonSpec(
+        css=BUTTON_SELECTOR_MAP.get(button, []),
+        text=BUTTON_TEXT_PATTERNS.get(button, [button]),
+    )
+
+
 class BrowserExecutor:
     """
     Browser execution controller for live trading.
@@ -107,6 +121,11 @@ class BrowserExecutor:
         self.timing_metrics = TimingMetrics()
         self.current_decision_time = None  # Set when bot decides to act
 
+        # Whole click plans in one in-page call, with human delays (10-50ms)
+        self.dispatcher = InPageDispatcher(_button_spec, delay_ms=(10.0, 50.0))
+        # Button name -> Playwright selector that last found it
+        self._resolved_selectors: dict[str, str] = {}
+
         # Configuration
         self.max_retries = 3
         self.retry_delay = 1.0  # seconds
@@ -455,6 +474,7 @@ class BrowserExecutor:
                     )
                     if button:
                         await button.click()
+                        latency_tracer.stamp(STAGE_CLICK)
                         logger.info(f"Clicked BUY button ({amount if amount else 'default'} SOL)")
 
                         # Wait for action to process
@@ -503,6 +523,7 @@ class BrowserExecutor:
                     )
                     if button:
                         await button.click()
+                        latency_tracer.stamp(STAGE_CLICK)
                         pct_str = f"{percentage * 100:.0f}%" if percentage else "default"
                         logger.info(f"Clicked SELL button ({pct_str})")
 
@@ -541,6 +562,17 @@ class BrowserExecutor:
 
             page = self.page  # Use property (CDP or legacy)
 
+            # Amount and SIDEBET in one in-page round trip
+            plan = ["SIDEBET"] if amount is None else [*self._amount_plan(amount), "SIDEBET"]
+            dispatched = await self._dispatch(plan)
+            if dispatched is not None:
+                if not dispatched:
+                    return False
+                latency_tracer.stamp(STAGE_CLICK)
+                logger.info(f"Clicked SIDEBET button ({amount if amount else 'default'} SOL)")
+                await asyncio.sleep(self.validation_delay)
+                return True
+
             # Set bet amount if provided (Phase A.3: use incremental clicking)
             if amount is not None:
                 if not await self._build_amount_incrementally_in_browser(amount):
@@ -555,6 +587,7 @@ class BrowserExecutor:
                     )
                     if button:
                         await button.click()
+                        latency_tracer.stamp(STAGE_CLICK)
                         logger.info(
                             f"Clicked SIDEBET button ({amount if amount else 'default'} SOL)"
                         )
@@ -577,6 +610,70 @@ class BrowserExecutor:
     # INTERNAL HELPER METHODS
     # ========================================================================
 
+    @staticmethod
+    def _amount_plan(amount: Decimal) -> list[str]:
+        """Clear, then the fewest-clicks sequence from zero."""
+        return ["X", *plan_clicks(Decimal("0"), amount)]
+
+    async def _dispatch(self, buttons: list[str]) -> bool | None:
+        """
+        Run a click plan in the page with one evaluate() call.
+
+        Returns:
+            True/False for clicked/missing button, None if the dispatcher
+            itself failed (callers fall back to per-selector clicking)
+        """
+        try:
+            clicks = await self.dispatcher.run_plan(self.page, buttons)
+        except Exception as e:
+            logger.warning(f"In-page dispatch failed, falling back to selectors: {e}")
+            return None
+
+        for previous, click in pairwise(clicks):
+            if click.success:
+                self.timing_metrics.add_button_click(
+                    click.button, click.timestamp_ms - previous.timestamp_ms
+                )
+        if len(clicks) < len(buttons) or not clicks[-1].success:
+            stopped = clicks[-1].button if clicks else buttons[0]
+            logger.error(f"Dispatch stopped at '{stopped}' in {buttons}")
+            return False
+        logger.debug(f"Dispatched {buttons} via {[c.method for c in clicks]}")
+        return True
+
+    async def _find_button(self, page, name: str, selectors: list[str]) -> Any:
+        """
+        Find a visible button, trying the last selector that worked first.
+
+        Every selector is probed without waiting before any of them is
+        waited on, so a missing first selector doesn't burn the timeout.
+        """
+        cached = self._resolved_selectors.get(name)
+        ordered = [cached, *(s for s in selectors if s != cached)] if cached else list(selectors)
+
+        for selector in ordered:
+            try:
+                element = await page.query_selector(selector)
+                if element and await element.is_visible():
+                    self._resolved_selectors[name] = selector
+                    return element
+            except Exception:
+                continue
+
+        # Nothing rendered yet: wait on each selector in turn
+        self._resolved_selectors.pop(name, None)
+        for selector in ordered:
+            try:
+                element = await page.wait_for_selector(
+                    selector, timeout=self.action_timeout * 1000, state="visible"
+                )
+                if element:
+                    self._resolved_selectors[name] = selector
+                    return element
+            except Exception:
+                continue
+        return None
+
     async def _set_bet_amount_in_browser(self, amount: Decimal) -> bool:
         """
         Set bet amount in browser input field
@@ -694,17 +791,8 @@ class BrowserExecutor:
                 logger.error(f"Unknown button type: {button_type}")
                 return False
 
-            # Find button using selectors
-            button = None
-            for selector in selectors:
-                try:
-                    button = await page.wait_for_selector(
-                        selector, timeout=self.action_timeout * 1000, state="visible"
-                    )
-                    if button:
-                        break
-                except Exception:
-                    continue
+            # Find button using selectors (last working selector first)
+            button = await self._find_button(page, button_type, selectors)
 
             if not button:
                 logger.error(f"Could not find {button_type} button with any selector")
@@ -712,7 +800,11 @@ class BrowserExecutor:
 
             # Click button {times} times with human delays (10-50ms)
             for i in range(times):
+                click_start = time.perf_counter()
                 await button.click()
+                self.timing_metrics.add_button_click(
+                    button_type, (time.perf_counter() - click_start) * 1000
+                )
 
                 # Human delay between clicks (10-50ms)
                 if i < times - 1:
@@ -738,13 +830,14 @@ class BrowserExecutor:
 
         Strategy:
         1. Click 'X' to clear to 0.0
-        2. Calculate optimal button sequence (largest first)
-        3. Click buttons to reach target
+        2. Plan the fewest-clicks button sequence (bot.click_planner)
+        3. Click buttons to reach target, all in one in-page dispatch
+           (per-button Playwright clicks if the dispatch fails)
 
         Examples:
             0.003 → X, +0.001 (3x)
             0.015 → X, +0.01 (1x), +0.001 (5x)
-            1.234 → X, +1 (1x), +0.1 (2x), +0.01 (3x), +0.001 (4x)
+            0.999 → X, +0.001, +0.01, +0.1, X2 (3x), +0.001, +0.01, +0.1
 
         Args:
             target_amount: Decimal target amount
@@ -753,6 +846,11 @@ class BrowserExecutor:
             True if successful
         """
         try:
+            # Whole sequence in one in-page round trip when possible
+            dispatched = await self._dispatch(self._amount_plan(target_amount))
+            if dispatched is not None:
+                return dispatched
+
             # Clear to 0.0 first
             if not await self._click_increment_button_in_browser("X"):
                 logger.error("Failed to clear bet amount in browser")
@@ -763,24 +861,12 @@ class BrowserExecutor:
 
             await asyncio.sleep(random.uniform(0.010, 0.050))
 
-            # Calculate button sequence (greedy algorithm, largest first)
-            remaining = float(target_amount)
-            sequence = []
-
-            increments = [
-                (1.0, "+1"),
-                (0.1, "+0.1"),
-                (0.01, "+0.01"),
-                (0.001, "+0.001"),
+            # Fewest-clicks sequence from zero, with repeated presses grouped
+            sequence = [
+                (button_type, len(list(presses)))
+                for button_type, presses in groupby(plan_clicks(Decimal("0"), target_amount))
             ]
 
-            for increment_value, button_type in increments:
-                count = int(remaining / increment_value)
-                if count > 0:
-                    sequence.append((button_type, count))
-                    remaining -= count * increment_value
-                    remaining = round(remaining, 3)  # Avoid floating point errors
-
             # Execute sequence
             for button_type, count in sequence:
                 if not await self._click_increment_button_in_browser(button_type, count):
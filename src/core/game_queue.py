@@ -5,6 +5,7 @@ Handles sequential game loading for multi-game sessions
 
 import logging
 import random
+import threading
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -19,20 +20,26 @@ class GameQueue:
     - Shuffling
     - Queue reset
     - Progress tracking
+    - Background prefetch of the upcoming game (with a source that has prepare())
     """
 
-    def __init__(self, recordings_dir: Path, shuffle: bool = False):
+    def __init__(self, recordings_dir: Path, shuffle: bool = False, source=None):
         """
         Initialize game queue.
 
         Args:
             recordings_dir: Path to directory containing game recordings
             shuffle: Whether to randomize game order
+            source: Optional replay source with prepare(identifier) (e.g.
+                MmapReplaySource); the upcoming game is prepared in a
+                background thread so loading it is instant
         """
         self.recordings_dir = Path(recordings_dir)
         self.shuffle_enabled = shuffle
+        self.source = source
         self.games: list[Path] = []
         self.current_index = 0
+        self._prefetch_thread: threading.Thread | None = None
 
         # Load games
         self._load_games()
@@ -40,6 +47,8 @@ class GameQueue:
         # Shuffle if requested
         if self.shuffle_enabled:
             self.shuffle()
+        else:
+            self._prefetch_next()
 
         logger.info(f"GameQueue initialized with {len(self.games)} games")
 
@@ -70,10 +79,45 @@ class GameQueue:
 
         game = self.games[self.current_index]
         self.current_index += 1
+        self._prefetch_next()
 
         logger.debug(f"Next game: {game.name} ({self.current_index}/{len(self.games)})")
         return game
 
+    def _prefetch_next(self) -> None:
+        """Prepare the upcoming game in the background (no-op without a source)."""
+        if self.source is None or not hasattr(self.source, "prepare"):
+            return
+        game = self.peek_next()
+        if game is None:
+            return
+
+        # Builds are serialized by the source, so a still-running prefetch is harmless
+        self._prefetch_thread = threading.Thread(
+            target=self._prefetch_worker, args=(game,), daemon=True, name="GameQueuePrefetch"
+        )
+        self._prefetch_thread.start()
+
+    def _prefetch_worker(self, game: Path) -> None:
+        try:
+            self.source.prepare(str(game))
+            logger.debug(f"Prefetched {game.name}")
+        except Exception as e:
+            logger.warning(f"Prefetch failed for {game.name}: {e}")
+
+    def wait_for_prefetch(self, timeout: float | None = None) -> bool:
+        """
+        Wait for the current background prefetch to finish.
+
+        Returns:
+            True if no prefetch is running
+        """
+        thread = self._prefetch_thread
+        if thread is not None:
+            thread.join(timeout)
+            return not thread.is_alive()
+        return True
+
     def has_next(self) -> bool:
         """
         Check if more games available in queue.
@@ -86,11 +130,13 @@ class GameQueue:
     def reset(self) -> None:
         """Reset queue to beginning."""
         self.current_index = 0
+        self._prefetch_next()
         logger.info("Queue reset to beginning")
 
     def shuffle(self) -> None:
         """Randomize game order."""
         random.shuffle(self.games)
+        self._prefetch_next()
         logger.info(f"Queue shuffled ({len(self.games)} games)")
 
     def get_progress(self) -> tuple[int, int]:
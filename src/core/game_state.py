@@ -1,12 +1,25 @@
 """
 Game State Management Module
 Centralized state management with observer pattern for reactive updates
+
+State is copy-on-write: the state dict is never mutated once published;
+every mutation builds a new one (a shallow copy, so unchanged values are
+shared) and bumps the version. Readers therefore need no lock, and history
+keeps (state, timestamp) references, materializing StateSnapshot objects
+only in get_history().
+
+Session metrics are maintained incrementally: a PnLLedger accumulates
+realized trades and balance/position changes, and calculate_metrics()
+returns the metrics dict published by the last mutation, without locking
+or walking the trade history.
 """
 
 import logging
 import threading
+import time
 from collections import defaultdict, deque
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
@@ -19,6 +32,7 @@ if TYPE_CHECKING:
     from services.event_bus import EventBus
 
 from config import config
+from services.pnl_ledger import PnLLedger, PnLSnapshot
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +80,24 @@ class StateSnapshot:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+def _materialize_snapshot(state: dict[str, Any], timestamp: datetime) -> StateSnapshot:
+    """Build a StateSnapshot from a (never mutated) state version."""
+    position, sidebet = state["position"], state["sidebet"]
+    return StateSnapshot(
+        timestamp=timestamp,
+        tick=state["current_tick"],
+        balance=state["balance"],
+        position=dict(position) if position else None,
+        sidebet=dict(sidebet) if sidebet else None,
+        phase=state["current_phase"],
+        price=state["current_price"],
+        game_id=state["game_id"],
+        active=state.get("game_active", False),
+        rugged=state.get("rugged", False),
+        metadata={"bot_enabled": state["bot_enabled"]},
+    )
+
+
 class GameState:
     """
     Centralized game state management with thread-safe operations
@@ -76,23 +108,21 @@ class GameState:
         self, initial_balance: Decimal = Decimal("0.100"), event_bus: "EventBus | None" = None
     ):
         # Core state
+        # Copy-on-write: replaced, never mutated (see module docstring)
         self._state = self._build_initial_state(initial_balance)
+        self._version = 0
+        self._current_tick_cache: tuple[dict, dict[str, Any]] | None = None
 
         # Statistics
-        self._stats = {
-            "total_trades": 0,
-            "winning_trades": 0,
-            "losing_trades": 0,
-            "total_pnl": Decimal("0"),
-            "max_drawdown": Decimal("0"),
-            "peak_balance": initial_balance,
-            "sidebets_won": 0,
-            "sidebets_lost": 0,
-            "games_played": 0,
-        }
+        self._stats = self._build_initial_stats(initial_balance)
+        self._ledger = PnLLedger(initial_balance)
+        self._metrics: dict[str, Any] = {}
+        self._publish_metrics()
 
         # History - AUDIT FIX: Use deque with maxlen for O(1) bounded memory
-        self._history: deque[StateSnapshot] = deque(maxlen=MAX_HISTORY_SIZE)
+        # Holds (state, timestamp) references; snapshots are built in get_history()
+        self._history: deque[tuple[dict, float]] = deque(maxlen=MAX_HISTORY_SIZE)
+        self._batch_depth = 0  # >0 while inside batch_updates()
         self._transaction_log: deque[dict] = deque(maxlen=MAX_TRANSACTION_LOG_SIZE)
         self._closed_positions: deque[dict] = deque(maxlen=MAX_CLOSED_POSITIONS_SIZE)
 
@@ -102,8 +132,8 @@ class GameState:
         # Thread safety
         self._lock = threading.RLock()
 
-        # State validation rules
-        self._validators: list[Callable] = []
+        # State validation rules: (validator, watched fields or None for all)
+        self._validators: list[tuple[Callable, frozenset[str] | None]] = []
 
         # Live mode: subscribe to WebSocket events for tick/price/phase updates
         self._event_bus = event_bus
@@ -140,12 +170,26 @@ class GameState:
             "sell_percentage": Decimal("1.0"),  # UI default: 100% (full position close)
         }
 
+    @staticmethod
+    def _build_initial_stats(initial_balance: Decimal) -> dict[str, Any]:
+        """Create fresh session statistics."""
+        return {
+            "total_trades": 0,
+            "winning_trades": 0,
+            "losing_trades": 0,
+            "total_pnl": Decimal("0"),
+            "max_drawdown": Decimal("0"),
+            "peak_balance": initial_balance,
+            "sidebets_won": 0,
+            "sidebets_lost": 0,
+            "games_played": 0,
+        }
+
     # ========== State Access Methods ==========
 
     def get(self, key: str, default: Any = None) -> Any:
-        """Thread-safe state getter"""
-        with self._lock:
-            return self._state.get(key, default)
+        """Thread-safe state getter (lock-free: published state is never mutated)"""
+        return self._state.get(key, default)
 
     def get_stats(self, key: str | None = None) -> Any:
         """Get statistics"""
@@ -156,42 +200,44 @@ class GameState:
 
     def get_snapshot(self) -> StateSnapshot:
         """Get immutable snapshot of current state"""
-        with self._lock:
-            return StateSnapshot(
-                timestamp=datetime.now(),
-                tick=self._state["current_tick"],
-                balance=self._state["balance"],
-                position=dict(self._state["position"]) if self._state["position"] else None,
-                sidebet=dict(self._state["sidebet"]) if self._state["sidebet"] else None,
-                phase=self._state["current_phase"],
-                price=self._state["current_price"],
-                game_id=self._state["game_id"],
-                active=self._state.get("game_active", False),
-                rugged=self._state.get("rugged", False),
-                metadata={"bot_enabled": self._state["bot_enabled"]},
-            )
+        return _materialize_snapshot(self._state, datetime.now())
+
+    @property
+    def pnl_snapshot(self) -> PnLSnapshot:
+        """Session accounting (realized/unrealized P&L, exposure, per-game summaries)"""
+        return self._ledger.snapshot
+
+    @property
+    def version(self) -> int:
+        """Monotonic state version (incremented by every mutation)"""
+        return self._version
 
     def get_current_tick(self):
         """
         Get current tick as a GameTick object (for TradeManager compatibility)
-        Constructs a GameTick from current state data
+        Field values are derived once per state version; every call returns
+        its own GameTick, so callers may modify it freely
         """
         from models import GameTick
 
-        with self._lock:
-            return GameTick.from_dict(
-                {
-                    "game_id": self._state.get("game_id", "unknown"),
-                    "tick": self._state.get("current_tick", 0),
-                    "timestamp": "",  # Not tracked in state (used for JSONL only)
-                    "price": float(self._state.get("current_price", Decimal("1.0"))),
-                    "phase": self._state.get("current_phase", "UNKNOWN"),
-                    "active": self._state.get("game_active", False),
-                    "rugged": self._state.get("rugged", False),  # AUDIT FIX: Use correct field name
-                    "cooldown_timer": 0,  # Not tracked in state
-                    "trade_count": 0,  # Not tracked in state
-                }
-            )
+        state = self._state
+        cached = self._current_tick_cache
+        if cached is None or cached[0] is not state:
+            price = state["current_price"]
+            fields = {
+                "game_id": str(state["game_id"]),
+                "tick": int(state["current_tick"]),
+                "timestamp": "",  # Not tracked in state (used for JSONL only)
+                # Same float round-trip as the JSONL path
+                "price": Decimal(str(float(price if price is not None else Decimal("1.0")))),
+                "phase": str(state["current_phase"]),
+                "active": bool(state["game_active"]),
+                "rugged": bool(state["rugged"]),  # AUDIT FIX: Use correct field name
+                "cooldown_timer": 0,  # Not tracked in state
+                "trade_count": 0,  # Not tracked in state
+            }
+            cached = self._current_tick_cache = (state, fields)
+        return GameTick(**cached[1])
 
     def capture_demo_snapshot(self, bet_amount: Decimal) -> "DemoStateSnapshot":
         """
@@ -321,7 +367,7 @@ class GameState:
                     "server": server_cash,
                     "diff": abs(local_balance - server_cash),
                 }
-                self._state["balance"] = server_cash
+                self._replace(balance=server_cash)
                 logger.info(f"Balance reconciled: {local_balance} -> {server_cash}")
 
             # Position reconciliation
@@ -336,18 +382,20 @@ class GameState:
                         "server": "none",
                         "local_qty": self._state["position"].get("amount", Decimal("0")),
                     }
-                    self._state["position"] = None
+                    self._replace(position=None)
                     logger.info("Position reconciled: closed (server has no position)")
             else:
                 # Server says we have a position
                 if not self._state["position"] or self._state["position"].get("status") != "active":
                     # Local has no position but server does - create one
-                    self._state["position"] = {
-                        "entry_price": server_avg_cost,
-                        "amount": server_position_qty,
-                        "entry_tick": self._state.get("current_tick", 0),
-                        "status": "active",
-                    }
+                    self._replace(
+                        position={
+                            "entry_price": server_avg_cost,
+                            "amount": server_position_qty,
+                            "entry_tick": self._state.get("current_tick", 0),
+                            "status": "active",
+                        }
+                    )
                     drifts["position"] = {
                         "local": "none",
                         "server": "active",
@@ -357,9 +405,10 @@ class GameState:
                         f"Position reconciled: opened from server (qty={server_position_qty})"
                     )
                 else:
-                    # Both have position - check for qty/price drift
-                    local_qty = self._state["position"].get("amount", Decimal("0"))
-                    local_entry = self._state["position"].get("entry_price", Decimal("0"))
+                    # Both have position - check for qty/price drift (copy-on-write)
+                    position = dict(self._state["position"])
+                    local_qty = position.get("amount", Decimal("0"))
+                    local_entry = position.get("entry_price", Decimal("0"))
 
                     if local_qty != server_position_qty:
                         drifts["position_qty"] = {
@@ -367,7 +416,7 @@ class GameState:
                             "server": server_position_qty,
                             "diff": abs(local_qty - server_position_qty),
                         }
-                        self._state["position"]["amount"] = server_position_qty
+                        position["amount"] = server_position_qty
                         logger.info(
                             f"Position qty reconciled: {local_qty} -> {server_position_qty}"
                         )
@@ -378,9 +427,12 @@ class GameState:
                             "server": server_avg_cost,
                             "diff": abs(local_entry - server_avg_cost),
                         }
-                        self._state["position"]["entry_price"] = server_avg_cost
+                        position["entry_price"] = server_avg_cost
                         logger.info(f"Entry price reconciled: {local_entry} -> {server_avg_cost}")
 
+                    if "position_qty" in drifts or "entry_price" in drifts:
+                        self._replace(position=position)
+
         # Emit event outside lock to prevent deadlocks
         if drifts:
             self._emit(StateEvents.STATE_RECONCILED, drifts)
@@ -396,27 +448,41 @@ class GameState:
         Returns True if update was successful
         """
         with self._lock:
-            old_state = self._state.copy()
+            old_state = self._state
 
             try:
-                # Apply updates
-                for key, value in kwargs.items():
-                    if key in self._state:
-                        self._state[key] = value
-                    else:
-                        logger.warning(f"Attempted to update unknown state key: {key}")
-
-                # Validate new state
-                if not self._validate_state():
-                    # Rollback on validation failure
-                    self._state = old_state
+                # Build the next version (shallow copy-on-write)
+                changes = kwargs
+                if not kwargs.keys() <= old_state.keys():
+                    changes = {}
+                    for key, value in kwargs.items():
+                        if key in old_state:
+                            changes[key] = value
+                        else:
+                            logger.warning(f"Attempted to update unknown state key: {key}")
+                new_state = {**old_state, **changes}
+
+                # Validate new state (nothing is published on failure)
+                if not self._validate_state(new_state, changes):
                     return False
 
+                self._state = new_state
+                self._version += 1
+
+                if "balance" in changes or "position" in changes or "initial_balance" in changes:
+                    self._sync_ledger()
+                    self._publish_metrics()
+                elif "current_price" in changes and new_state["position"] is not None:
+                    # Flat: nothing to mark (_sync_ledger passes the price on open)
+                    self._ledger.mark(new_state["current_price"])
+
                 # Record history (AUDIT FIX: deque auto-evicts when maxlen reached)
-                self._history.append(self.get_snapshot())
+                if not self._batch_depth:
+                    self._history.append((new_state, time.time()))
 
-                # Notify observers of changes
-                self._notify_changes(old_state, self._state)
+                # Notify observers of changes (dirty fields only)
+                if self._observers:
+                    self._notify_changes(old_state, new_state, changes)
 
                 return True
 
@@ -425,6 +491,64 @@ class GameState:
                 self._state = old_state
                 return False
 
+    def _replace(self, **changes) -> None:
+        """Publish a new version without validation, history or notification (lock held)"""
+        self._state = {**self._state, **changes}
+        self._version += 1
+
+    def _sync_ledger(self) -> None:
+        """Push balance, position and price to the ledger (lock held)"""
+        position = self._state["position"]
+        active = position is not None and position.get("status") == "active"
+        self._ledger.update_account(
+            balance=self._state["balance"],
+            position_qty=position["amount"] if active else Decimal("0"),
+            avg_cost=position["entry_price"] if active else Decimal("0"),
+            mark_price=self._state["current_price"],
+        )
+
+    def _publish_metrics(self) -> None:
+        """Rebuild the calculate_metrics() result after a stats change (lock held)"""
+        total_trades = self._stats["total_trades"]
+        win_rate = Decimal("0")
+        if total_trades:
+            win_rate = Decimal(self._stats["winning_trades"]) / Decimal(total_trades)
+
+        initial_balance = self._state["initial_balance"]
+        roi = Decimal("0")
+        if initial_balance:
+            roi = (self._state["balance"] - initial_balance) / initial_balance
+
+        pnl = self._ledger.snapshot
+        self._metrics = {
+            "total_pnl": self._stats["total_pnl"],
+            "win_rate": win_rate,
+            "max_drawdown": self._stats["max_drawdown"],
+            "total_trades": total_trades,
+            "average_win": pnl.average_win,
+            "average_loss": pnl.average_loss,
+            "current_balance": self._state["balance"],
+            "roi": roi,
+        }
+
+    @contextmanager
+    def batch_updates(self) -> Iterator[None]:
+        """
+        Suspend per-update history snapshots (headless / bulk replay).
+
+        Updates still validate and notify observers; a single snapshot is
+        recorded when the outermost batch ends.
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self._history.append((self._state, time.time()))
+
     def update_balance(self, amount: Decimal, reason: str = "") -> bool:
         """Update balance with transaction logging"""
         with self._lock:
@@ -435,7 +559,7 @@ class GameState:
                 logger.warning(f"Balance would go negative: {new_balance}")
                 return False
 
-            self._state["balance"] = new_balance
+            self._replace(balance=new_balance)
 
             # Log transaction (AUDIT FIX: bounded)
             # AUDIT FIX: deque auto-evicts when maxlen reached
@@ -462,6 +586,9 @@ class GameState:
                 if drawdown > self._stats["max_drawdown"]:
                     self._stats["max_drawdown"] = drawdown
 
+            self._sync_ledger()
+            self._publish_metrics()
+
             # Notify observers
             self._emit(
                 StateEvents.BALANCE_CHANGED,
@@ -488,12 +615,14 @@ class GameState:
             old_initial = self._state["initial_balance"]
 
             # Update initial balance (the baseline for P&L)
-            self._state["initial_balance"] = new_baseline
+            self._replace(initial_balance=new_baseline)
 
             # Reset P&L stats since we're starting fresh from this baseline
             self._stats["total_pnl"] = Decimal("0")
             self._stats["peak_balance"] = new_baseline
             self._stats["max_drawdown"] = Decimal("0")
+            self._ledger.reset()
+            self._publish_metrics()
 
             # Log the transaction
             self._transaction_log.append(
@@ -546,7 +675,7 @@ class GameState:
 
             # If we have an active position, add to it (average entry price)
             if self._state["position"] and self._state["position"].get("status") == "active":
-                existing = self._state["position"]
+                existing = dict(self._state["position"])  # copy-on-write
                 old_amount = existing["amount"]
                 old_entry_price = existing["entry_price"]
 
@@ -559,6 +688,7 @@ class GameState:
                 existing["amount"] = total_amount
                 existing["entry_price"] = avg_entry_price
                 # Keep original entry time and tick from first position
+                self._replace(position=existing)
 
                 logger.info(
                     f"Added to position: {new_amount} SOL at {new_entry_price}x (avg: {avg_entry_price:.4f}x)"
@@ -572,7 +702,7 @@ class GameState:
                     "entry_tick": new_entry_tick,
                     "status": "active",
                 }
-                self._state["position"] = position_dict
+                self._replace(position=position_dict)
                 self._stats["total_trades"] += 1
                 logger.info(f"Opened position: {new_amount} SOL at {new_entry_price}x")
 
@@ -602,12 +732,14 @@ class GameState:
             pnl = exit_value - entry_value
             pnl_percent = ((exit_price / position["entry_price"]) - 1) * 100
 
-            # Update position
+            # Update position (copy-on-write)
+            position = dict(position)
             position["status"] = "closed"
             position["exit_price"] = exit_price
             position["exit_tick"] = exit_tick
             position["pnl_sol"] = pnl
             position["pnl_percent"] = pnl_percent
+            self._replace(position=position)
 
             # Update balance (P&L automatically tracked via update_balance)
             self.update_balance(exit_value, f"Position closed at {exit_price}")
@@ -617,6 +749,8 @@ class GameState:
                 self._stats["winning_trades"] += 1
             else:
                 self._stats["losing_trades"] += 1
+            self._ledger.record_trade(pnl, game_id=self._state["game_id"])
+            self._publish_metrics()
 
             self._emit(StateEvents.POSITION_CLOSED, position)
 
@@ -624,7 +758,7 @@ class GameState:
             self._closed_positions.append(position.copy())
 
             # Clear active position
-            self._state["position"] = None
+            self._replace(position=None)
 
             return position
 
@@ -658,7 +792,7 @@ class GameState:
                 "status": "active",
             }
 
-            self._state["sidebet"] = sidebet
+            self._replace(sidebet=sidebet)
             self.update_balance(-amount, "Sidebet placed")
 
             self._emit(StateEvents.SIDEBET_PLACED, sidebet)
@@ -674,21 +808,26 @@ class GameState:
             if tick is None:
                 tick = self._state.get("current_tick", 0)
 
+            sidebet = dict(sidebet)  # copy-on-write
             sidebet["status"] = "won" if won else "lost"
             sidebet["resolved_tick"] = tick
+            self._replace(sidebet=sidebet)
 
             if won:
                 winnings = sidebet["amount"] * Decimal("5.0")  # 5x multiplier
                 self.update_balance(winnings, "Sidebet won")
                 self._stats["sidebets_won"] += 1
+                net = winnings - sidebet["amount"]
             else:
                 self._stats["sidebets_lost"] += 1
+                net = -sidebet["amount"]
+            self._ledger.record_sidebet(won, net, game_id=self._state["game_id"])
 
             # Track last resolved tick for cooldown
-            self._state["last_sidebet_resolved_tick"] = tick
+            self._replace(last_sidebet_resolved_tick=tick)
 
             self._emit(StateEvents.SIDEBET_RESOLVED, sidebet)
-            self._state["sidebet"] = None
+            self._replace(sidebet=None)
 
             return sidebet
 
@@ -714,7 +853,7 @@ class GameState:
                 return False
 
             old_percentage = self._state["sell_percentage"]
-            self._state["sell_percentage"] = percentage
+            self._replace(sell_percentage=percentage)
 
             # Emit event
             self._emit(
@@ -787,8 +926,10 @@ class GameState:
             pnl = exit_value - entry_value
             pnl_percent = ((exit_price / position["entry_price"]) - 1) * 100
 
-            # Update position with reduced amount
+            # Update position with reduced amount (copy-on-write)
+            position = dict(position)
             position["amount"] = remaining_amount
+            self._replace(position=position)
 
             # Update balance (add proceeds from partial sell)
             self.update_balance(
@@ -800,6 +941,8 @@ class GameState:
                 self._stats["winning_trades"] += 1
             else:
                 self._stats["losing_trades"] += 1
+            self._ledger.record_trade(pnl, game_id=self._state["game_id"])
+            self._publish_metrics()
 
             # Create partial close record
             partial_close = {
@@ -843,6 +986,10 @@ class GameState:
 
     def _emit(self, event: StateEvents, data: Any = None):
         """Emit an event to all subscribers (releases lock before calling callbacks)"""
+        # Fast path: nothing subscribed (e.g. TICK_UPDATED in headless replay)
+        if not self._observers.get(event):
+            return
+
         # Get callbacks while holding lock, then release before calling
         with self._lock:
             callbacks = list(self._observers[event])  # Copy to avoid mutation during iteration
@@ -854,38 +1001,55 @@ class GameState:
             except Exception as e:
                 logger.error(f"Observer callback error for {event.value}: {e}")
 
-    def _notify_changes(self, old_state: dict, new_state: dict):
-        """Detect and notify about state changes"""
+    def _notify_changes(self, old_state: dict, new_state: dict, dirty: dict):
+        """Notify about state changes (only fields in dirty can have changed)"""
         # Tick change
-        if old_state["current_tick"] != new_state["current_tick"]:
+        if "current_tick" in dirty and old_state["current_tick"] != new_state["current_tick"]:
             self._emit(StateEvents.TICK_UPDATED, new_state["current_tick"])
 
         # Phase change
-        if old_state["current_phase"] != new_state["current_phase"]:
+        if "current_phase" in dirty and old_state["current_phase"] != new_state["current_phase"]:
             self._emit(StateEvents.PHASE_CHANGED, new_state["current_phase"])
 
         # Rug event
-        if not old_state["rugged"] and new_state["rugged"]:
+        if "rugged" in dirty and not old_state["rugged"] and new_state["rugged"]:
             self._emit(StateEvents.RUG_EVENT, new_state["current_tick"])
 
     # ========== Validation ==========
 
-    def add_validator(self, validator: Callable[[dict], bool]):
-        """Add a state validator function"""
-        self._validators.append(validator)
+    def add_validator(self, validator: Callable[[dict], bool], fields: Iterable[str] | None = None):
+        """
+        Add a state validator function
 
-    def _validate_state(self) -> bool:
-        """Validate current state against all validators"""
-        for validator in self._validators:
-            if not validator(self._state):
-                return False
+        With fields, the validator only runs on updates that touch one of
+        them (the rest of the state was valid when it was published).
+        """
+        self._validators.append((validator, frozenset(fields) if fields is not None else None))
+
+    def _validate_state(
+        self, state: dict | None = None, changed: Iterable[str] | None = None
+    ) -> bool:
+        """
+        Validate a state version (default: current)
+
+        Args:
+            state: State to check
+            changed: Keys that differ from the last published state (None = all)
+        """
+        if state is None:
+            state = self._state
+
+        for validator, fields in self._validators:
+            if changed is None or fields is None or not fields.isdisjoint(changed):
+                if not validator(state):
+                    return False
 
         # Built-in validations
-        if self._state["balance"] < 0:
+        if (changed is None or "balance" in changed) and state["balance"] < 0:
             logger.error("Invalid state: negative balance")
             return False
 
-        if self._state["current_tick"] < 0:
+        if (changed is None or "current_tick" in changed) and state["current_tick"] < 0:
             logger.error("Invalid state: negative tick")
             return False
 
@@ -900,57 +1064,50 @@ class GameState:
         Syncs tick/price/phase/game_active from gameStateUpdate events
         so validators have correct live game state.
 
-        Event structure from CDPWebSocketInterceptor:
-        {
-            "event": "gameStateUpdate",
-            "data": {tickCount, multiplier, phase, ...},
-            "timestamp": "...",
-            "direction": "received"
-        }
+        The payload is the shared RawWsEvent built by CDPWebSocketInterceptor
+        (legacy {"event", "data"} dicts are accepted via RawWsEvent.from_bus).
         """
+        from services.raw_ws_event import RawWsEvent
+
         try:
-            data = wrapped.get("data", wrapped)
-            if not isinstance(data, dict):
+            event = RawWsEvent.from_bus(wrapped)
+            if event is None or event.event_name != "gameStateUpdate":
                 return
 
-            # CDPWebSocketInterceptor puts event name at TOP level
-            # (not wrapped inside "data")
-            event_name = data.get("event")
-            if event_name != "gameStateUpdate":
-                return
+            changes: dict[str, Any] = {}
+
+            # Fields are extracted once by RawWsEvent (tickCount, multiplier/price)
+            # without decoding the full payload
+            if event.tick is not None:
+                changes["current_tick"] = event.tick
 
-            # The actual game data is in wrapped["data"]
-            event_data = data.get("data", {})
-            if not isinstance(event_data, dict):
+            # An unparseable price leaves the current price untouched
+            price = event.price_decimal
+            if price is not None:
+                changes["current_price"] = price
+
+            if event.game_id is not None:
+                changes["game_id"] = event.game_id
+
+            # Extract phase and determine game_active
+            if event.phase is not None:
+                changes["current_phase"] = event.phase
+                # Game is active if phase is ACTIVE (not PRESALE, RUG, END)
+                # Note: PRESALE allows trading (checked separately in validators)
+                changes["game_active"] = event.phase == "ACTIVE"
+
+            # Extract rugged status
+            if event.rugged is not None:
+                changes["rugged"] = event.rugged
+                changes["rug_detected"] = event.rugged
+
+            if not changes:
                 return
 
             with self._lock:
-                # Extract tick from tickCount (rugs.fun field name)
-                if "tickCount" in event_data:
-                    self._state["current_tick"] = int(event_data["tickCount"])
-
-                # Extract price/multiplier
-                if "multiplier" in event_data:
-                    self._state["current_price"] = Decimal(str(event_data["multiplier"]))
-                elif "price" in event_data:
-                    self._state["current_price"] = Decimal(str(event_data["price"]))
-
-                # Extract game ID
-                if "gameId" in event_data:
-                    self._state["game_id"] = event_data["gameId"]
-
-                # Extract phase and determine game_active
-                if "phase" in event_data:
-                    phase = event_data["phase"]
-                    self._state["current_phase"] = phase
-                    # Game is active if phase is ACTIVE (not PRESALE, RUG, END)
-                    # Note: PRESALE allows trading (checked separately in validators)
-                    self._state["game_active"] = phase == "ACTIVE"
-
-                # Extract rugged status
-                if "rugged" in event_data:
-                    self._state["rugged"] = bool(event_data["rugged"])
-                    self._state["rug_detected"] = bool(event_data["rugged"])
+                self._replace(**changes)
+                if "current_price" in changes and self._state["position"] is not None:
+                    self._ledger.mark(changes["current_price"])
 
                 logger.debug(
                     f"GameState synced: tick={self._state['current_tick']}, "
@@ -973,24 +1130,40 @@ class GameState:
             self._state = self._build_initial_state(
                 initial_balance, bot_enabled=bot_enabled, bot_strategy=bot_strategy
             )
+            self._version += 1
 
             if game_was_active:
                 self._stats["games_played"] += 1
 
+            self._ledger.start_game(None)
+            self._sync_ledger()
+            self._publish_metrics()
+
             self._history.clear()
             self._closed_positions.clear()
 
             logger.info("Game state reset")
 
+    def reset_stats(self):
+        """Reset session statistics (trades, P&L, drawdown) to the initial balance"""
+        with self._lock:
+            self._stats = self._build_initial_stats(self._state["initial_balance"])
+            self._closed_positions.clear()
+            self._ledger.reset()
+            self._publish_metrics()
+
     # ========== History and Analytics ==========
 
     def get_history(self, limit: int | None = None) -> list[StateSnapshot]:
-        """Get state history (AUDIT FIX: works with deque)"""
+        """Get state history (AUDIT FIX: works with deque); snapshots are built here"""
         with self._lock:
-            history_list = list(self._history)
-            if limit:
-                return history_list[-limit:]
-            return history_list
+            versions = list(self._history)
+        if limit:
+            versions = versions[-limit:]
+        return [
+            _materialize_snapshot(state, datetime.fromtimestamp(timestamp))
+            for state, timestamp in versions
+        ]
 
     def get_transaction_log(self, limit: int | None = None) -> list[dict]:
         """Get transaction log (AUDIT FIX: works with deque)"""
@@ -1001,45 +1174,14 @@ class GameState:
             return log_list
 
     def calculate_metrics(self) -> dict[str, Any]:
-        """Calculate performance metrics"""
-        with self._lock:
-            total_trades = self._stats["total_trades"]
-            if total_trades == 0:
-                win_rate = Decimal("0")
-                avg_win = Decimal("0")
-                avg_loss = Decimal("0")
-            else:
-                win_rate = Decimal(self._stats["winning_trades"]) / Decimal(total_trades)
-
-                wins = [
-                    pos["pnl_sol"]
-                    for pos in self._closed_positions
-                    if pos.get("pnl_sol") is not None and pos["pnl_sol"] > 0
-                ]
-                losses = [
-                    abs(pos["pnl_sol"])
-                    for pos in self._closed_positions
-                    if pos.get("pnl_sol") is not None and pos["pnl_sol"] < 0
-                ]
-
-                avg_win = (sum(wins) / len(wins)) if wins else Decimal("0")
-                avg_loss = (sum(losses) / len(losses)) if losses else Decimal("0")
+        """
+        Get performance metrics (lock-free, O(1))
 
-            initial_balance = self._state["initial_balance"]
-            roi = Decimal("0")
-            if initial_balance:
-                roi = (self._state["balance"] - initial_balance) / initial_balance
-
-            return {
-                "total_pnl": self._stats["total_pnl"],
-                "win_rate": win_rate,
-                "max_drawdown": self._stats["max_drawdown"],
-                "total_trades": total_trades,
-                "average_win": avg_win,
-                "average_loss": avg_loss,
-                "current_balance": self._state["balance"],
-                "roi": roi,
-            }
+        Returns a copy of the metrics published by the last stats change;
+        average win/loss cover every realized close (full and partial)
+        since the last reset_stats()/set_baseline_balance().
+        """
+        return dict(self._metrics)
 
     # ========== Test Helpers ==========
 
@@ -0,0 +1,223 @@
+"""
+Headless Replay - Run strategies through the real engine at full speed
+
+ReplayEngine.run_headless() plays one game without UI dispatch or
+wall-clock pacing. This module builds the full bot stack around it
+(GameState -> TradeManager -> BotInterface -> BotController) and runs many
+recorded games back to back, either from a GameQueue in-process or fanned
+out across a process pool with one independent engine per worker.
+"""
+
+import logging
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+from utils.parallel import map_in_pool
+
+from .game_queue import GameQueue
+from .game_state import GameState
+from .replay_engine import ReplayEngine
+from .replay_source import FileDirectorySource, MmapReplaySource, ReplaySource
+from .trade_manager import TradeManager
+
+logger = logging.getLogger(__name__)
+
+# Below this many games a process pool costs more than it saves
+MIN_PARALLEL_GAMES = 8
+
+DEFAULT_INITIAL_BALANCE = Decimal("0.100")
+
+
+@dataclass
+class HeadlessRunSummary:
+    """Aggregate result of a headless run over many games."""
+
+    strategy_name: str
+    games: list[dict[str, Any]] = field(default_factory=list)
+    errors: list[dict[str, str]] = field(default_factory=list)
+    elapsed_s: float = 0.0
+
+    @property
+    def total_ticks(self) -> int:
+        return sum(game["ticks"] for game in self.games)
+
+    @property
+    def ticks_per_sec(self) -> float:
+        return self.total_ticks / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    @property
+    def total_pnl(self) -> Decimal:
+        return sum((game["metrics"]["total_pnl"] for game in self.games), Decimal("0"))
+
+    def to_dict(self, include_games: bool = False) -> dict[str, Any]:
+        """Convert to JSON-serializable dict."""
+        result = {
+            "strategy_name": self.strategy_name,
+            "games_played": len(self.games),
+            "errors": len(self.errors),
+            "total_ticks": self.total_ticks,
+            "elapsed_s": round(self.elapsed_s, 3),
+            "ticks_per_sec": round(self.ticks_per_sec, 1),
+            "total_pnl": float(self.total_pnl),
+        }
+        if include_games:
+            result["games"] = [
+                {**game, "metrics": {k: float(v) for k, v in game["metrics"].items()}}
+                for game in self.games
+            ]
+        return result
+
+
+class HeadlessStack:
+    """One engine plus bot stack, reused across games."""
+
+    def __init__(
+        self,
+        replay_source: ReplaySource,
+        strategy_name: str = "conservative",
+        initial_balance: Decimal = DEFAULT_INITIAL_BALANCE,
+    ):
+        # Imported here: bot depends on core
+        from bot import BotController, BotInterface
+
+        self.state = GameState(initial_balance)
+        self.trade_manager = TradeManager(self.state)
+        self.bot_controller = BotController(
+            BotInterface(self.state, self.trade_manager), strategy_name
+        )
+        self.engine = ReplayEngine(self.state, replay_source)
+
+    def run_game(self, filepath: Path) -> dict[str, Any]:
+        """Play one game headless; wallet, session stats and bot are reset per game."""
+        self.state.reset_stats()
+        self.bot_controller.reset()
+        result = self.engine.run_headless(
+            filepath, bot_controller=self.bot_controller, trade_manager=self.trade_manager
+        )
+        result["filepath"] = str(filepath)
+        return result
+
+
+def _run_paths(stack: HeadlessStack, paths: Sequence[Path], summary: HeadlessRunSummary) -> None:
+    for path in paths:
+        try:
+            summary.games.append(stack.run_game(path))
+        except Exception as e:
+            logger.warning(f"Headless replay failed for {path}: {e}")
+            summary.errors.append({"filepath": str(path), "error": str(e)})
+
+
+def _build_stack(
+    source_dir: str, use_mmap: bool, strategy_name: str, initial_balance: Decimal
+) -> HeadlessStack:
+    source_cls = MmapReplaySource if use_mmap else FileDirectorySource
+    return HeadlessStack(source_cls(Path(source_dir)), strategy_name, initial_balance)
+
+
+def _run_on_stack(
+    stack: HeadlessStack, path: str
+) -> tuple[dict[str, Any] | None, dict[str, str] | None]:
+    try:
+        return stack.run_game(Path(path)), None
+    except Exception as e:
+        return None, {"filepath": path, "error": str(e)}
+
+
+def run_games(
+    game_paths: Sequence[Path],
+    strategy_name: str = "conservative",
+    initial_balance: Decimal = DEFAULT_INITIAL_BALANCE,
+    use_mmap: bool = False,
+    max_workers: int | None = None,
+) -> HeadlessRunSummary:
+    """
+    Run a strategy headless over many recordings.
+
+    Args:
+        game_paths: JSONL recordings (each game starts from initial_balance)
+        strategy_name: Strategy for BotController
+        initial_balance: Wallet at the start of every game
+        use_mmap: Load through MmapReplaySource (indexes cached next to the games)
+        max_workers: Process count (defaults to CPU count; 1 runs inline)
+
+    Returns:
+        HeadlessRunSummary with per-game results in input order
+    """
+    paths = [Path(p).resolve() for p in game_paths]
+    summary = HeadlessRunSummary(strategy_name=strategy_name)
+    if not paths:
+        return summary
+
+    source_dir = paths[0].parent
+    start = time.perf_counter()
+
+    # One stack per worker, built once so each task only pays for the game it plays
+    for game, error in map_in_pool(
+        _run_on_stack,
+        map(str, paths),
+        init=_build_stack,
+        initargs=(str(source_dir), use_mmap, strategy_name, initial_balance),
+        min_items=MIN_PARALLEL_GAMES,
+        workers=max_workers,
+    ):
+        if game is not None:
+            summary.games.append(game)
+        else:
+            logger.warning(f"Headless replay failed for {error['filepath']}: {error['error']}")
+            summary.errors.append(error)
+
+    summary.elapsed_s = time.perf_counter() - start
+    logger.info(
+        f"Headless run: {len(summary.games)} games, {summary.total_ticks} ticks "
+        f"in {summary.elapsed_s:.2f}s ({summary.ticks_per_sec:.0f} ticks/s)"
+    )
+    return summary
+
+
+def run_queue(
+    queue: GameQueue,
+    strategy_name: str = "conservative",
+    initial_balance: Decimal = DEFAULT_INITIAL_BALANCE,
+    max_games: int | None = None,
+    max_workers: int | None = 1,
+) -> HeadlessRunSummary:
+    """
+    Drain a GameQueue headless, back to back.
+
+    In-process runs load through the queue's source (so its background
+    prefetch overlaps with play); with max_workers > 1 the remaining games
+    are handed to run_games().
+
+    Args:
+        queue: GameQueue (consumed from its current position)
+        strategy_name: Strategy for BotController
+        initial_balance: Wallet at the start of every game
+        max_games: Stop after this many games
+        max_workers: Process count (1 runs inline; None = CPU count)
+    """
+    remaining = queue.get_remaining_count()
+    count = remaining if max_games is None else min(max_games, remaining)
+
+    if max_workers != 1:
+        paths = [queue.next_game() for _ in range(count)]
+        return run_games(
+            paths,
+            strategy_name,
+            initial_balance,
+            use_mmap=isinstance(queue.source, MmapReplaySource),
+            max_workers=max_workers,
+        )
+
+    source = queue.source or FileDirectorySource(queue.recordings_dir)
+    stack = HeadlessStack(source, strategy_name, initial_balance)
+    summary = HeadlessRunSummary(strategy_name=strategy_name)
+
+    start = time.perf_counter()
+    for _ in range(count):
+        _run_paths(stack, [queue.next_game()], summary)
+    summary.elapsed_s = time.perf_counter() - start
+    return summary
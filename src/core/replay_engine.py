@@ -7,7 +7,8 @@ import atexit
 import json
 import logging
 import threading
-from collections.abc import Callable
+import time
+from collections.abc import Callable, Sequence
 from contextlib import contextmanager
 from pathlib import Path
 
@@ -45,7 +46,8 @@ class ReplayEngine:
         self.replay_source = replay_source
 
         # Game data - CRITICAL FIX: Remove unbounded ticks list for live mode
-        self.file_mode_ticks: list[GameTick] = []  # Only used in file playback mode
+        # Only used in file playback mode (a list, or a memory-mapped TickIndex)
+        self.file_mode_ticks: Sequence[GameTick] = []
         self.is_live_mode = False  # Track current mode
         self.current_index = 0
         self.game_id: str | None = None
@@ -140,7 +142,7 @@ class ReplayEngine:
             self._lock.release()
 
     @property
-    def ticks(self) -> list[GameTick]:
+    def ticks(self) -> Sequence[GameTick]:
         """Get current tick list based on mode"""
         if self.is_live_mode:
             return self.live_ring_buffer.get_all()
@@ -527,6 +529,85 @@ class ReplayEngine:
 
     # Note: _playback_loop moved to PlaybackController (Phase 2 refactoring)
 
+    # ========================================================================
+    # HEADLESS REPLAY
+    # ========================================================================
+
+    def run_headless(
+        self,
+        filepath: Path | None = None,
+        bot_controller=None,
+        trade_manager=None,
+        on_tick: Callable | None = None,
+    ) -> dict:
+        """
+        Play a game start to finish as fast as possible, without UI dispatch
+
+        No EventBus tick events, no on_tick_callback and no wall-clock
+        pacing; GameState history snapshots are batched. Each tick goes
+        straight to the trade manager (rug / sidebet checks) and bot.
+
+        Args:
+            filepath: Recording to load (default: the currently loaded game)
+            bot_controller: BotController to step once per tick
+            trade_manager: TradeManager for rug and sidebet expiry handling
+            on_tick: Optional callback(tick, index, total)
+
+        Returns:
+            Dict with game_id, ticks, elapsed_s, ticks_per_sec, metrics and
+            bot stats (if a bot was given)
+        """
+        if filepath is not None:
+            loaded_ticks, game_id = self.replay_source.load(str(filepath))
+            with self._acquire_lock():
+                self.is_live_mode = False
+                self.file_mode_ticks = loaded_ticks
+                self.game_id = game_id
+                self.live_ring_buffer.clear()
+
+        ticks = self.ticks
+        total = len(ticks)
+        self.state.reset()
+        self.state.update(game_id=self.game_id, game_active=False)
+
+        start = time.perf_counter()
+        with self.state.batch_updates():
+            for index, tick in enumerate(ticks):
+                self.current_index = index
+                self.state.update(
+                    current_tick=tick.tick,
+                    current_price=tick.price,
+                    current_phase=tick.phase,
+                    rugged=tick.rugged,
+                    game_active=tick.active,
+                    game_id=tick.game_id,
+                )
+                if tick.rugged and not self.state.get("rug_detected"):
+                    self.state.update(rug_detected=True)
+
+                if trade_manager is not None:
+                    trade_manager.check_and_handle_rug(tick)
+                    trade_manager.check_sidebet_expiry(tick)
+                if bot_controller is not None:
+                    bot_controller.execute_step()
+                if on_tick is not None:
+                    on_tick(tick, index, total)
+
+        elapsed = time.perf_counter() - start
+        metrics = self.state.calculate_metrics()
+        self.state.update(game_active=False)
+
+        result = {
+            "game_id": self.game_id,
+            "ticks": total,
+            "elapsed_s": elapsed,
+            "ticks_per_sec": total / elapsed if elapsed > 0 else 0.0,
+            "metrics": metrics,
+        }
+        if bot_controller is not None:
+            result["bot"] = bot_controller.get_stats()
+        return result
+
     # ========================================================================
     # STATUS QUERIES
     # ========================================================================
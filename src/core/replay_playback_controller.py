@@ -206,12 +206,21 @@ class PlaybackController:
             if not self.engine.ticks:
                 return False
 
-            # Find tick with matching number
-            for i, tick in enumerate(self.engine.ticks):
-                if tick.tick == tick_number:
+            ticks = self.engine.ticks
+            if hasattr(ticks, "index_of_tick"):
+                # Memory-mapped tick index: O(1) lookup without decoding ticks
+                i = ticks.index_of_tick(tick_number)
+                if i is not None:
                     self.engine.current_index = i
                     self.engine.display_tick(i)
                     return True
+            else:
+                # Find tick with matching number
+                for i, tick in enumerate(ticks):
+                    if tick.tick == tick_number:
+                        self.engine.current_index = i
+                        self.engine.display_tick(i)
+                        return True
 
         logger.warning(f"Tick {tick_number} not found")
         return False
@@ -8,11 +8,18 @@ Defines the interface for providing tick data to ReplayEngine from various sourc
 - Recording playback
 """
 
+import logging
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from pathlib import Path
 
 from models import GameTick
 
+from .tick_index import INDEX_SUFFIX, TickIndex, index_event_store, index_jsonl
+
+logger = logging.getLogger(__name__)
+
 
 class ReplaySource(ABC):
     """
@@ -198,3 +205,116 @@ class FileDirectorySource(ReplaySource):
             # Path escaped the directory - return original directory to fail safely
             logger.warning(f"Path traversal attempt detected: {identifier}")
             return self.directory / "invalid_path"
+
+
+class MmapReplaySource(FileDirectorySource):
+    """
+    Memory-mapped replay source
+
+    Converts each JSONL recording once to a tick index (see core.tick_index)
+    and serves it as a lazily decoded, memory-mapped TickIndex. Loading is
+    O(1) after the first conversion; indexes are rebuilt automatically when
+    the recording changes.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        index_dir: Path | None = None,
+        events_parquet_dir: Path | None = None,
+    ):
+        """
+        Initialize memory-mapped source
+
+        Args:
+            directory: Path to directory containing JSONL files
+            index_dir: Where tick indexes are cached (default: directory/.tick_index)
+            events_parquet_dir: Parquet event store for load_from_store()
+        """
+        super().__init__(directory)
+        self.index_dir = Path(index_dir) if index_dir else self.directory / ".tick_index"
+        self.events_parquet_dir = Path(events_parquet_dir) if events_parquet_dir else None
+        # Serializes index builds between load() and background prefetch
+        self._index_lock = threading.Lock()
+
+    def load(self, identifier: str) -> tuple[Sequence[GameTick], str]:
+        """
+        Load game as a memory-mapped tick sequence
+
+        Args:
+            identifier: Filename or path to JSONL file
+
+        Returns:
+            Tuple of (TickIndex, game_id)
+        """
+        filepath = self._resolve_path(identifier)
+        index = self._open_index(filepath)
+
+        if not len(index):
+            index.close()
+            raise ValueError(f"No valid ticks found in {filepath}")
+
+        return index, index.game_id or filepath.stem
+
+    def load_from_store(self, game_id: str, refresh: bool = False) -> tuple[TickIndex, str]:
+        """
+        Load a game's game_tick rows from the Parquet event store
+
+        Args:
+            game_id: Game identifier
+            refresh: Rebuild the index even if one is cached
+
+        Returns:
+            Tuple of (TickIndex, game_id)
+        """
+        if self.events_parquet_dir is None:
+            raise ValueError("No events_parquet_dir configured")
+
+        index_path = self.index_dir / f"store_{Path(game_id).name}{INDEX_SUFFIX}"
+        if refresh or not index_path.exists():
+            with self._index_lock:
+                index_event_store(game_id, self.events_parquet_dir, index_path)
+
+        index = TickIndex(index_path)
+        if not len(index):
+            index.close()
+            raise ValueError(f"No game_tick rows for game {game_id}")
+        return index, game_id
+
+    def prepare(self, identifier: str) -> Path:
+        """
+        Build (if needed) and page in the index for a recording
+
+        Called from GameQueue's background prefetch so the next load() is instant.
+
+        Returns:
+            Path to the tick index
+        """
+        filepath = self._resolve_path(identifier)
+        with self._open_index(filepath) as index:
+            index.prefetch()
+            return index.path
+
+    def index_path(self, filepath: Path) -> Path:
+        """Cache path of the tick index for a recording"""
+        return self.index_dir / (Path(filepath).stem + INDEX_SUFFIX)
+
+    def _open_index(self, filepath: Path) -> TickIndex:
+        """Open the cached index for filepath, (re)building it if missing or stale"""
+        if not filepath.exists():
+            raise FileNotFoundError(f"File not found: {filepath}")
+
+        index_path = self.index_path(filepath)
+        with self._index_lock:
+            if index_path.exists():
+                try:
+                    index = TickIndex(index_path)
+                    if index.is_fresh(filepath):
+                        return index
+                    index.close()
+                except ValueError:
+                    logger.warning(f"Rebuilding unreadable tick index: {index_path}")
+
+            count = index_jsonl(filepath, index_path)
+            logger.info(f"Indexed {count} ticks from {filepath.name}")
+            return TickIndex(index_path)
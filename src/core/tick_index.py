@@ -0,0 +1,330 @@
+"""
+Tick Index - Memory-mapped, preindexed tick files for replay
+
+A tick index is a compact binary copy of one game recording, converted
+once from JSONL (or the Parquet event store) and then memory-mapped for
+playback. Ticks are decoded on access, so opening a game is O(1) and
+memory use stays flat no matter how long a replay session runs.
+
+File layout (little-endian):
+
+    header    magic, version, flags, count, blob/table offsets,
+              source mtime_ns + size (staleness check)
+    records   count fixed-size records (tick, cooldown, trades, flags,
+              phase/game_id ids, offset into blob)
+    blob      timestamp + exact price text per tick
+    table     JSON string table: phases and game_ids
+
+The exact price text (str(Decimal)) is stored, so decoded ticks are
+identical to GameTick.from_dict() on the original line.
+"""
+
+import json
+import logging
+import mmap
+import os
+import struct
+from collections.abc import Iterable, Sequence
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+from models import GameTick
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"RGTK"
+VERSION = 1
+INDEX_SUFFIX = ".tickidx"
+
+FLAG_CONTIGUOUS = 1  # tick numbers are first_tick + index
+
+# magic, version, flags, count, blob_offset, table_offset, source_mtime_ns, source_size
+_HEADER = struct.Struct("<4sHHIQQqq4x")
+# tick, cooldown_timer, trade_count, active, rugged, phase_id, game_id_id,
+# blob_offset, timestamp_len, price_len
+_RECORD = struct.Struct("<iiiBBHHIHH")
+
+
+def build_tick_index(
+    ticks: Iterable[GameTick],
+    dest: Path,
+    source_mtime_ns: int = 0,
+    source_size: int = 0,
+) -> int:
+    """
+    Write ticks to a tick index file (atomically).
+
+    Args:
+        ticks: Ticks in playback order
+        dest: Index file path
+        source_mtime_ns: Source file mtime, recorded for staleness checks
+        source_size: Source file size, recorded for staleness checks
+
+    Returns:
+        Number of ticks written
+    """
+    records = bytearray()
+    blob = bytearray()
+    phases: dict[str, int] = {}
+    game_ids: dict[str, int] = {}
+    contiguous = True
+    first_tick = None
+    count = 0
+
+    for tick in ticks:
+        timestamp = tick.timestamp.encode()
+        price = str(tick.price).encode()
+        phase_id = phases.setdefault(tick.phase, len(phases))
+        game_id_id = game_ids.setdefault(tick.game_id, len(game_ids))
+
+        records += _RECORD.pack(
+            tick.tick,
+            tick.cooldown_timer,
+            tick.trade_count,
+            tick.active,
+            tick.rugged,
+            phase_id,
+            game_id_id,
+            len(blob),
+            len(timestamp),
+            len(price),
+        )
+        blob += timestamp
+        blob += price
+
+        if first_tick is None:
+            first_tick = tick.tick
+        elif tick.tick != first_tick + count:
+            contiguous = False
+        count += 1
+
+    blob_offset = _HEADER.size + len(records)
+    table_offset = blob_offset + len(blob)
+    header = _HEADER.pack(
+        MAGIC,
+        VERSION,
+        FLAG_CONTIGUOUS if contiguous else 0,
+        count,
+        blob_offset,
+        table_offset,
+        source_mtime_ns,
+        source_size,
+    )
+    table = json.dumps({"phases": list(phases), "game_ids": list(game_ids)}).encode()
+
+    dest = Path(dest)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = dest.with_name(dest.name + ".tmp")
+    with open(temp_path, "wb") as f:
+        f.write(header)
+        f.write(records)
+        f.write(blob)
+        f.write(table)
+    os.replace(temp_path, dest)
+
+    logger.debug(f"Indexed {count} ticks to {dest}")
+    return count
+
+
+def iter_jsonl_ticks(filepath: Path) -> Iterable[GameTick]:
+    """
+    Parse a JSONL recording into ticks (same rules as FileDirectorySource.load).
+
+    Raises:
+        ValueError: If a line is not valid tick data
+    """
+    with open(filepath) as f:
+        for line_num, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield GameTick.from_dict(json.loads(line))
+            except Exception as e:
+                raise ValueError(f"Invalid tick data at line {line_num}: {e}")
+
+
+def index_jsonl(filepath: Path, dest: Path) -> int:
+    """Convert a JSONL recording to a tick index. Returns the tick count."""
+    stat = Path(filepath).stat()
+    return build_tick_index(iter_jsonl_ticks(filepath), dest, stat.st_mtime_ns, stat.st_size)
+
+
+def index_event_store(game_id: str, events_parquet_dir: Path, dest: Path) -> int:
+    """
+    Convert one game's game_tick rows from the Parquet event store to a tick index.
+
+    Args:
+        game_id: Game identifier
+        events_parquet_dir: EventStorePaths.events_parquet_dir
+        dest: Index file path
+
+    Returns:
+        Number of ticks written
+    """
+    import pyarrow.dataset as ds
+
+    tick_dir = Path(events_parquet_dir) / "doc_type=game_tick"
+    if not tick_dir.exists():
+        return build_tick_index([], dest)
+
+    dataset = ds.dataset(tick_dir, format="parquet", partitioning="hive")
+    table = dataset.to_table(
+        columns=["seq", "ts", "tick", "price", "raw_json"],
+        filter=ds.field("game_id") == game_id,
+    ).sort_by([("ts", "ascending"), ("seq", "ascending")])
+    cols = table.to_pydict()
+
+    def rows() -> Iterable[GameTick]:
+        for i in range(table.num_rows):
+            data: dict[str, Any] = json.loads(cols["raw_json"][i] or "{}")
+            data.update(
+                game_id=game_id,
+                tick=cols["tick"][i],
+                price=cols["price"][i],
+                timestamp=cols["ts"][i],
+            )
+            yield GameTick.from_dict(data)
+
+    return build_tick_index(rows(), dest)
+
+
+class TickIndex(Sequence):
+    """
+    Read-only, memory-mapped sequence of GameTick.
+
+    Supports len(), integer indexing (decoded on access, nothing cached),
+    slicing (returns a list) and O(1) index_of_tick().
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f"Not a tick index: {self.path}")
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (
+            magic,
+            version,
+            self._flags,
+            self._count,
+            self._blob_offset,
+            table_offset,
+            self.source_mtime_ns,
+            self.source_size,
+        ) = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(f"Not a tick index (or unsupported version): {self.path}")
+
+        table = json.loads(self._mm[table_offset:])
+        self._phases: list[str] = table["phases"]
+        self._game_ids: list[str] = table["game_ids"]
+        self._first_tick = self.tick_number(0) if self._count else 0
+        self._tick_positions: dict[int, int] | None = None
+
+    # ========== Sequence ==========
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._decode(i) for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("tick index out of range")
+        return self._decode(index)
+
+    def _decode(self, index: int) -> GameTick:
+        (
+            tick,
+            cooldown_timer,
+            trade_count,
+            active,
+            rugged,
+            phase_id,
+            game_id_id,
+            offset,
+            timestamp_len,
+            price_len,
+        ) = _RECORD.unpack_from(self._mm, _HEADER.size + index * _RECORD.size)
+        start = self._blob_offset + offset
+        price_start = start + timestamp_len
+        return GameTick(
+            game_id=self._game_ids[game_id_id],
+            tick=tick,
+            timestamp=self._mm[start:price_start].decode(),
+            price=Decimal(self._mm[price_start : price_start + price_len].decode()),
+            phase=self._phases[phase_id],
+            active=bool(active),
+            rugged=bool(rugged),
+            cooldown_timer=cooldown_timer,
+            trade_count=trade_count,
+        )
+
+    # ========== Lookup ==========
+
+    @property
+    def game_id(self) -> str | None:
+        """Game id of the first tick (None if empty)"""
+        if not self._count:
+            return None
+        game_id_id = _RECORD.unpack_from(self._mm, _HEADER.size)[6]
+        return self._game_ids[game_id_id]
+
+    def tick_number(self, index: int) -> int:
+        """Tick number at index, without decoding the full tick"""
+        return struct.unpack_from("<i", self._mm, _HEADER.size + index * _RECORD.size)[0]
+
+    def index_of_tick(self, tick_number: int) -> int | None:
+        """
+        Index of the first tick with this tick number, or None.
+
+        O(1) for contiguous recordings; otherwise a tick -> index map is
+        built from the record column on first use.
+        """
+        if self._flags & FLAG_CONTIGUOUS:
+            index = tick_number - self._first_tick
+            return index if 0 <= index < self._count else None
+
+        if self._tick_positions is None:
+            positions: dict[int, int] = {}
+            records = memoryview(self._mm)[_HEADER.size : _HEADER.size + self._count * _RECORD.size]
+            for index, record in enumerate(_RECORD.iter_unpack(records)):
+                positions.setdefault(record[0], index)
+            records.release()
+            self._tick_positions = positions
+        return self._tick_positions.get(tick_number)
+
+    def is_fresh(self, source: Path) -> bool:
+        """True if this index was built from the current version of source"""
+        stat = Path(source).stat()
+        return (self.source_mtime_ns, self.source_size) == (stat.st_mtime_ns, stat.st_size)
+
+    def prefetch(self) -> None:
+        """Hint the OS to page the whole file in (best effort)"""
+        if hasattr(mmap, "MADV_WILLNEED"):
+            try:
+                self._mm.madvise(mmap.MADV_WILLNEED)
+            except (OSError, ValueError):
+                pass
+
+    # ========== Lifecycle ==========
+
+    def close(self) -> None:
+        """Unmap the file"""
+        self._mm.close()
+
+    def __enter__(self) -> "TickIndex":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"TickIndex({self.path.name}, ticks={self._count})"
@@ -0,0 +1,610 @@
+"""
+Foundation Benchmark - Replay recorded feeds through the live pipeline
+
+Stands up a local fake rugs.fun Socket.IO server and drives the real
+Foundation path end to end:
+
+    FakeRugsServer (recorded frames at N x the recorded rate)
+      -> Socket.IO client -> RawWsEvent -> FoundationService.on_raw_event
+         (EventNormalizer -> WebSocketBroadcaster)
+      -> FoundationClient -> BaseSubscriber
+
+Every normalized event carries the normalizer's seq, which maps back to the
+frame the server sent, so latency is measured per frame from emit to
+subscriber callback (one process, perf_counter_ns). Each run reports
+latency percentiles per event type, offered vs achieved rate, drops and
+RSS growth; a sweep over speeds finds the saturation point. Reports are
+JSON and can be compared against a baseline to catch throughput
+regressions before deploying.
+
+Usage:
+    python -m foundation.benchmark recording.jsonl --speeds 1 10 100 0 \\
+        --out report.json --baseline previous.json
+
+Speed 0 replays as fast as the pipeline accepts frames.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import resource
+import socket
+import sys
+import time
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from aiohttp import web
+
+from foundation.client import FoundationClient
+from foundation.config import FoundationConfig
+from foundation.events import (
+    GameTickEvent,
+    PlayerStateEvent,
+    PlayerTradeEvent,
+    SidebetEvent,
+    SidebetResultEvent,
+)
+from foundation.service import FoundationService
+from foundation.subscriber import BaseSubscriber
+from services.latency_trace import LatencyTracer
+from services.raw_ws_event import RawWsEvent
+
+logger = logging.getLogger(__name__)
+
+REPORT_VERSION = 1
+
+# rugs.fun emits gameStateUpdate every ~250ms; used when frames have no timestamp
+DEFAULT_TICK_INTERVAL_S = 0.25
+
+DEFAULT_SPEEDS = (1.0, 10.0, 100.0)
+
+# A run is saturated when it delivers less than this share of the offered rate
+SATURATION_RATIO = 0.95
+
+# Stop waiting for stragglers after this long without progress
+DRAIN_TIMEOUT_S = 2.0
+
+# Histogram key covering every event type
+ALL_EVENTS = "all"
+
+
+# =============================================================================
+# Recordings
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class RecordedFrame:
+    """One Socket.IO event to replay, offset_s after the first frame."""
+
+    offset_s: float
+    event: str
+    data: Any
+
+
+def _parse_ts(value: Any) -> float | None:
+    """Epoch seconds from epoch s/ms, datetime or ISO string."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value.timestamp()
+    if isinstance(value, int | float):
+        return value / 1000 if value > 1e11 else float(value)
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def _as_rugs_event(event: str, data: Any) -> tuple[str, Any]:
+    """Map internal game_tick payloads back to the gameStateUpdate rugs.fun sends."""
+    if event != "game_tick" or not isinstance(data, dict):
+        return event, data
+    return "gameStateUpdate", {
+        "gameId": data.get("gameId") or data.get("game_id"),
+        "tickCount": data.get("tickCount", data.get("tick")),
+        "price": float(data.get("price", 1.0)),
+        "active": data.get("active", True),
+        "rugged": data.get("rugged", False),
+        "cooldownTimer": data.get("cooldownTimer", data.get("cooldown_timer", 0)),
+        "tradeCount": data.get("tradeCount", data.get("trade_count", 0)),
+    }
+
+
+def _to_frames(items: Iterable[tuple[Any, str, Any]]) -> list[RecordedFrame]:
+    """Build frames from (timestamp, event, data), keeping offsets monotonic."""
+    frames: list[RecordedFrame] = []
+    first_ts = None
+    offset = 0.0
+    for ts, event, data in items:
+        epoch = _parse_ts(ts)
+        if epoch is None:
+            offset = offset + DEFAULT_TICK_INTERVAL_S if frames else 0.0
+        else:
+            if first_ts is None:
+                first_ts = epoch - offset
+            offset = max(offset, epoch - first_ts)
+        event, data = _as_rugs_event(event, data)
+        frames.append(RecordedFrame(offset, event, data))
+    return frames
+
+
+def load_jsonl(path: Path) -> list[RecordedFrame]:
+    """
+    Load a JSONL recording.
+
+    Lines may be raw events ({"event", "data", "timestamp"}) or GameTick
+    recordings ({"tick", "price", ...}), which replay as gameStateUpdate.
+    """
+
+    def items():
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                obj = json.loads(line)
+                ts = obj.get("timestamp", obj.get("ts"))
+                if "event" in obj:
+                    yield ts, obj["event"], obj.get("data")
+                else:
+                    yield ts, "game_tick", obj
+
+    return _to_frames(items())
+
+
+def load_parquet(path: Path) -> list[RecordedFrame]:
+    """
+    Load frames from the event store.
+
+    Accepts the columnar tick dataset (services.event_store.ticks), an
+    events_parquet directory (its ws_event rows are used) or a single
+    Parquet file with ts/raw_json columns.
+    """
+    import pyarrow.dataset as ds
+
+    path = Path(path)
+    if path.is_dir() and (path / "doc_type=ws_event").exists():
+        path = path / "doc_type=ws_event"
+    dataset = ds.dataset(path, format="parquet")
+    names = set(dataset.schema.names)
+
+    if "payload_kind" in names:
+        from services.event_store.ticks import reconstruct_payloads
+
+        table = dataset.to_table().sort_by([("ts_ms", "ascending"), ("seq", "ascending")])
+        ts_ms = table.column("ts_ms").to_pylist()
+        return _to_frames(
+            (ts / 1000, event, data)
+            for ts, (event, data) in zip(ts_ms, reconstruct_payloads(table), strict=True)
+        )
+
+    seq = ["seq"] if "seq" in names else []
+    table = dataset.to_table(columns=["ts", "raw_json", *seq])
+    table = table.sort_by([(key, "ascending") for key in ["ts", *seq]])
+
+    def items():
+        for ts, raw in zip(
+            table.column("ts").to_pylist(), table.column("raw_json").to_pylist(), strict=True
+        ):
+            obj = json.loads(raw or "{}")
+            if isinstance(obj, dict) and "event" in obj:
+                yield ts, obj["event"], obj.get("data")
+
+    return _to_frames(items())
+
+
+def load_recording(path: Path) -> list[RecordedFrame]:
+    """Load a JSONL or Parquet recording."""
+    path = Path(path)
+    if path.is_dir() or path.suffix == ".parquet":
+        return load_parquet(path)
+    return load_jsonl(path)
+
+
+# =============================================================================
+# Fake rugs.fun server
+# =============================================================================
+
+
+class FakeRugsServer:
+    """Local Socket.IO server that replays recorded frames to every client."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        import socketio
+
+        self.host = host
+        self.port = port
+        self.clients = 0
+        self.sio = socketio.AsyncServer(async_mode="aiohttp", cors_allowed_origins="*")
+        self.sio.on("connect", self._on_connect)
+        self.sio.on("disconnect", self._on_disconnect)
+        self._app = web.Application()
+        self.sio.attach(self._app)
+        self._runner: web.AppRunner | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def _on_connect(self, sid, environ, auth=None) -> None:
+        self.clients += 1
+
+    async def _on_disconnect(self, sid, *args) -> None:
+        self.clients -= 1
+
+    async def start(self) -> None:
+        self._runner = web.AppRunner(self._app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        if not self.port:
+            self.port = self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def replay(
+        self, frames: Sequence[RecordedFrame], speed: float, sent_ns: list[int]
+    ) -> None:
+        """
+        Emit frames at speed x the recorded rate (0 = unthrottled).
+
+        sent_ns is filled with perf_counter_ns() per frame as it is emitted.
+        """
+        start = time.perf_counter()
+        for frame in frames:
+            if speed > 0:
+                delay = start + frame.offset_s / speed - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            else:
+                await asyncio.sleep(0)
+            sent_ns.append(time.perf_counter_ns())
+            await self.sio.emit(frame.event, frame.data)
+
+
+# =============================================================================
+# Measurement
+# =============================================================================
+
+
+class _RunRecorder:
+    """Maps delivered seqs back to send times for one run."""
+
+    def __init__(self, base_seq: int):
+        self.base_seq = base_seq
+        self.sent_ns: list[int] = []
+        self.tracer = LatencyTracer()
+        self.received = 0
+        self.last_received_ns = 0
+
+    def on_event(self, event_type: str, seq: int) -> None:
+        now = time.perf_counter_ns()
+        index = seq - self.base_seq - 1
+        if 0 <= index < len(self.sent_ns):
+            latency = now - self.sent_ns[index]
+            self.tracer.record(event_type, latency)
+            self.tracer.record(ALL_EVENTS, latency)
+            self.received += 1
+            self.last_received_ns = now
+
+
+class BenchSubscriber(BaseSubscriber):
+    """Subscriber that reports (type, seq) for every delivered event."""
+
+    def __init__(self, client: FoundationClient):
+        self.connected = False
+        self.recorder: _RunRecorder | None = None
+        super().__init__(client)
+
+    def _seen(self, event_type: str, seq: int) -> None:
+        if self.recorder is not None:
+            self.recorder.on_event(event_type, seq)
+
+    def on_game_tick(self, event: GameTickEvent) -> None:
+        self._seen(event.type, event.seq)
+
+    def on_player_state(self, event: PlayerStateEvent) -> None:
+        self._seen(event.type, event.seq)
+
+    def on_player_trade(self, event: PlayerTradeEvent) -> None:
+        self._seen(event.type, event.seq)
+
+    def on_sidebet_placed(self, event: SidebetEvent) -> None:
+        self._seen(event.type, event.seq)
+
+    def on_sidebet_result(self, event: SidebetResultEvent) -> None:
+        self._seen(event.type, event.seq)
+
+    def on_raw_event(self, event: dict) -> None:
+        self._seen(event.get("type", "unknown"), event.get("seq", 0))
+
+    def on_connection_change(self, connected: bool) -> None:
+        self.connected = connected
+
+
+def _rss_kb() -> int:
+    """Current resident set size (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _free_port(host: str) -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+# =============================================================================
+# Harness
+# =============================================================================
+
+
+class PipelineBenchmark:
+    """
+    Fake server + real Foundation pipeline + subscriber, reused across runs.
+
+    Usage:
+        async with PipelineBenchmark(frames) as bench:
+            report = await bench.sweep([1, 10, 100, 0])
+    """
+
+    def __init__(self, frames: Sequence[RecordedFrame], host: str = "127.0.0.1"):
+        self.frames = list(frames)
+        self.host = host
+        self.server = FakeRugsServer(host)
+        self.service = FoundationService(FoundationConfig(host=host, port=_free_port(host)))
+        self.client = FoundationClient(url=self.service.config.ws_url, reconnect_delay=0.1)
+        self.subscriber = BenchSubscriber(self.client)
+        self._ingest = None
+        self._tasks: list[asyncio.Task] = []
+
+    async def __aenter__(self) -> "PipelineBenchmark":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def start(self, timeout: float = 10.0) -> None:
+        """Start server, broadcaster, subscriber client and ingest client."""
+        import socketio
+
+        await self.server.start()
+        self._tasks.append(asyncio.create_task(self.service.broadcaster.start()))
+        await self._wait_for_port(self.host, self.service.config.port, timeout)
+        self._tasks.append(asyncio.create_task(self.client.connect()))
+        await self._wait_for(lambda: self.subscriber.connected, timeout, "Foundation client")
+
+        service = self.service
+        ingest = socketio.AsyncClient(reconnection=False)
+
+        # Stands in for the CDP interceptor: one RawWsEvent per received frame
+        async def on_frame(event, *args):
+            service.on_raw_event(
+                RawWsEvent(
+                    event_name=event,
+                    data=args[0] if args else None,
+                    direction="received",
+                    source="benchmark",
+                )
+            )
+
+        ingest.on("*", on_frame)
+        await ingest.connect(self.server.url, transports=["websocket"])
+        self._ingest = ingest
+        await self._wait_for(lambda: self.server.clients > 0, timeout, "fake rugs server")
+
+    async def close(self) -> None:
+        if self._ingest is not None:
+            await self._ingest.disconnect()
+            self._ingest = None
+        await self.client.disconnect()
+        await self.service.broadcaster.stop()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        await self.server.stop()
+
+    @staticmethod
+    async def _wait_for(condition, timeout: float, what: str) -> None:
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Timed out waiting for {what}")
+            await asyncio.sleep(0.01)
+
+    @staticmethod
+    async def _wait_for_port(host: str, port: int, timeout: float) -> None:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                _, writer = await asyncio.open_connection(host, port)
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Timed out waiting for {host}:{port}")
+                await asyncio.sleep(0.01)
+                continue
+            writer.close()
+            await writer.wait_closed()
+            return
+
+    async def run(self, speed: float) -> dict[str, Any]:
+        """Replay the recording once at speed x (0 = unthrottled) and measure it."""
+        recorder = _RunRecorder(self.service.normalizer.seq)
+        self.subscriber.recorder = recorder
+        dropped_before = self.service.broadcaster.get_stats()["events_dropped"]
+        rss_start = _rss_kb()
+
+        started_ns = time.perf_counter_ns()
+        await self.server.replay(self.frames, speed, recorder.sent_ns)
+        send_s = (time.perf_counter_ns() - started_ns) / 1e9
+
+        # Drain: wait for stragglers until delivery stops making progress
+        last_count, last_progress = -1, time.monotonic()
+        while recorder.received < len(self.frames):
+            if recorder.received != last_count:
+                last_count, last_progress = recorder.received, time.monotonic()
+            elif time.monotonic() - last_progress > DRAIN_TIMEOUT_S:
+                break
+            await asyncio.sleep(0.005)
+        self.subscriber.recorder = None
+
+        frames = len(self.frames)
+        span_s = self.frames[-1].offset_s if self.frames else 0.0
+        offered = frames / (span_s / speed) if speed > 0 and span_s > 0 else None
+        elapsed_s = (max(recorder.last_received_ns, started_ns) - started_ns) / 1e9
+        achieved = recorder.received / elapsed_s if elapsed_s > 0 else 0.0
+        dropped = frames - recorder.received
+
+        return {
+            "speed": speed,
+            "frames": frames,
+            "received": recorder.received,
+            "dropped": dropped,
+            "broadcaster_dropped": (
+                self.service.broadcaster.get_stats()["events_dropped"] - dropped_before
+            ),
+            "send_s": round(send_s, 4),
+            "elapsed_s": round(elapsed_s, 4),
+            "offered_rate": round(offered, 1) if offered else None,
+            "achieved_rate": round(achieved, 1),
+            "saturated": dropped > 0
+            or (offered is not None and achieved < offered * SATURATION_RATIO),
+            "latency_us": recorder.tracer.snapshot(),
+            "rss_start_kb": rss_start,
+            "rss_end_kb": _rss_kb(),
+            "rss_growth_kb": _rss_kb() - rss_start,
+        }
+
+    async def sweep(self, speeds: Sequence[float] = DEFAULT_SPEEDS) -> dict[str, Any]:
+        """Run every speed in order and build a report."""
+        runs = []
+        for speed in speeds:
+            result = await self.run(speed)
+            runs.append(result)
+            logger.info(
+                f"speed={speed or 'max'}: {result['achieved_rate']} ev/s, "
+                f"p99={result['latency_us'].get(ALL_EVENTS, {}).get('p99_us', 0):.0f}µs, "
+                f"dropped={result['dropped']}"
+            )
+
+        saturated = [run["speed"] for run in runs if run["saturated"]]
+        return {
+            "version": REPORT_VERSION,
+            "created": datetime.now().isoformat(),
+            "frames": len(self.frames),
+            "event_counts": dict(Counter(frame.event for frame in self.frames)),
+            "runs": runs,
+            "saturation_speed": saturated[0] if saturated else None,
+            "max_throughput": max((run["achieved_rate"] for run in runs), default=0.0),
+        }
+
+
+async def run_benchmark(
+    frames: Sequence[RecordedFrame], speeds: Sequence[float] = DEFAULT_SPEEDS
+) -> dict[str, Any]:
+    """Stand up the pipeline, sweep the speeds and tear everything down."""
+    async with PipelineBenchmark(frames) as bench:
+        return await bench.sweep(speeds)
+
+
+def compare_reports(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    throughput_tolerance: float = 0.10,
+    latency_tolerance: float = 0.25,
+) -> list[str]:
+    """
+    List regressions of current against baseline (empty if none).
+
+    Runs are matched by speed. Flags lower achieved rate or max throughput,
+    higher p99 latency and new drops beyond the given tolerances.
+    """
+    regressions = []
+    base_max = baseline.get("max_throughput") or 0.0
+    if base_max and current.get("max_throughput", 0.0) < base_max * (1 - throughput_tolerance):
+        regressions.append(
+            f"max throughput {current.get('max_throughput')} < baseline {base_max} ev/s"
+        )
+
+    base_runs = {run["speed"]: run for run in baseline.get("runs", [])}
+    for run in current.get("runs", []):
+        base = base_runs.get(run["speed"])
+        if base is None:
+            continue
+        label = f"speed={run['speed'] or 'max'}"
+        if run["achieved_rate"] < base["achieved_rate"] * (1 - throughput_tolerance):
+            regressions.append(
+                f"{label}: achieved {run['achieved_rate']} < baseline {base['achieved_rate']} ev/s"
+            )
+        if run["dropped"] > base["dropped"]:
+            regressions.append(f"{label}: dropped {run['dropped']} > baseline {base['dropped']}")
+        p99 = run["latency_us"].get(ALL_EVENTS, {}).get("p99_us")
+        base_p99 = base["latency_us"].get(ALL_EVENTS, {}).get("p99_us")
+        if p99 and base_p99 and p99 > base_p99 * (1 + latency_tolerance):
+            regressions.append(f"{label}: p99 {p99:.0f}µs > baseline {base_p99:.0f}µs")
+    return regressions
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("recording", type=Path, help="JSONL file or Parquet file/directory")
+    parser.add_argument(
+        "--speeds",
+        type=float,
+        nargs="+",
+        default=list(DEFAULT_SPEEDS),
+        help="Replay speeds (x recorded rate, 0 = unthrottled)",
+    )
+    parser.add_argument("--limit", type=int, help="Only replay the first N frames")
+    parser.add_argument("--out", type=Path, help="Write the JSON report here")
+    parser.add_argument("--baseline", type=Path, help="Fail on regressions against this report")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Throughput tolerance")
+    parser.add_argument(
+        "--latency-tolerance", type=float, default=0.25, help="p99 latency tolerance"
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    frames = load_recording(args.recording)[: args.limit]
+    if not frames:
+        print(f"No frames in {args.recording}", file=sys.stderr)
+        return 2
+
+    report = asyncio.run(run_benchmark(frames, args.speeds))
+    report["recording"] = str(args.recording)
+    text = json.dumps(report, indent=2)
+    if args.out:
+        args.out.write_text(text)
+    else:
+        print(text)
+
+    if args.baseline:
+        regressions = compare_reports(
+            json.loads(args.baseline.read_text()),
+            report,
+            throughput_tolerance=args.tolerance,
+            latency_tolerance=args.latency_tolerance,
+        )
+        for regression in regressions:
+            print(f"REGRESSION: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -40,6 +40,18 @@ class FoundationConfig:
     # rugs.fun connection
     rugs_url: str = field(default_factory=lambda: os.getenv("RUGS_URL", "https://rugs.fun"))
 
+    # Latency tracing: periodic Parquet dumps (disabled when no directory is set)
+    latency_dump_dir: Path | None = field(
+        default_factory=lambda: (
+            Path(os.environ["FOUNDATION_LATENCY_DUMP_DIR"]).expanduser()
+            if os.getenv("FOUNDATION_LATENCY_DUMP_DIR")
+            else None
+        )
+    )
+    latency_dump_interval: float = field(
+        default_factory=lambda: float(os.getenv("FOUNDATION_LATENCY_DUMP_INTERVAL", "60"))
+    )
+
     @property
     def chrome_profile_path(self) -> Path:
         """Full path to Chrome profile directory."""
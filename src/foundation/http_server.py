@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING
 from aiohttp import web
 
 from foundation.config import FoundationConfig
+from services.latency_trace import latency_tracer
 
 if TYPE_CHECKING:
     from browser.executor import BrowserExecutor
@@ -29,6 +30,7 @@ class FoundationHTTPServer:
     - POST /api/services/<name>/start - Start a service
     - POST /api/services/<name>/stop - Stop a service
     - GET /api/services/<name>/status - Get service status
+    - GET /api/latency - Hot-path latency percentiles per stage
     - GET /artifacts/<name>/* - Serve HTML artifacts
     """
 
@@ -79,6 +81,9 @@ class FoundationHTTPServer:
         self.app.router.add_post("/api/services/{name}/stop", self._handle_stop_service)
         self.app.router.add_get("/api/services/{name}/status", self._handle_service_status)
 
+        # Latency tracing
+        self.app.router.add_get("/api/latency", self._handle_latency)
+
         # Trade Execution API
         self.app.router.add_post("/api/trade/buy", self._handle_trade_buy)
         self.app.router.add_post("/api/trade/sell", self._handle_trade_sell)
@@ -220,6 +225,17 @@ class FoundationHTTPServer:
 
         return web.json_response(service.to_dict())
 
+    # =========================================================================
+    # Latency API
+    # =========================================================================
+
+    async def _handle_latency(self, request: web.Request) -> web.Response:
+        """GET /api/latency - p50/p99/p999 per hot-path stage (µs). ?reset=1 clears."""
+        stages = latency_tracer.snapshot()
+        if request.query.get("reset") in ("1", "true"):
+            latency_tracer.reset()
+        return web.json_response({"enabled": latency_tracer.enabled, "stages": stages})
+
     # =========================================================================
     # Trade Execution API
     # =========================================================================
@@ -48,6 +48,11 @@ class EventNormalizer:
         self._seq = 0
         self._current_game_id: str | None = None
 
+    @property
+    def seq(self) -> int:
+        """Sequence number of the last normalized event."""
+        return self._seq
+
     def normalize(self, raw: dict) -> NormalizedEvent:
         """
         Normalize a raw event to Foundation format.
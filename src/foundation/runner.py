@@ -8,6 +8,7 @@ import signal
 from foundation.config import FoundationConfig
 from foundation.http_server import FoundationHTTPServer
 from foundation.service import FoundationService
+from services.latency_trace import LatencyParquetDumper, latency_tracer
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +30,13 @@ class FoundationRunner:
         self.config = config or FoundationConfig()
         self.service = FoundationService(self.config)
         self.http_server = FoundationHTTPServer(self.config)
+        self.latency_dumper: LatencyParquetDumper | None = None
+        if self.config.latency_dump_dir:
+            self.latency_dumper = LatencyParquetDumper(
+                latency_tracer,
+                self.config.latency_dump_dir,
+                interval=self.config.latency_dump_interval,
+            )
 
         self._running = False
         self._tasks: list[asyncio.Task] = []
@@ -57,6 +65,9 @@ class FoundationRunner:
             port=self.config.http_port,
         )
 
+        if self.latency_dumper:
+            self.latency_dumper.start()
+
         # Setup signal handlers
         loop = asyncio.get_event_loop()
         for sig in (signal.SIGINT, signal.SIGTERM):
@@ -81,6 +92,9 @@ class FoundationRunner:
         # Stop broadcaster
         await self.service.broadcaster.stop()
 
+        if self.latency_dumper:
+            self.latency_dumper.stop()
+
         # Cancel tasks
         for task in self._tasks:
             task.cancel()
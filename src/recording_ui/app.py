@@ -19,7 +19,7 @@ import time
 from flask import Flask, jsonify, render_template, request
 from flask_socketio import SocketIO, emit, join_room, leave_room
 
-from recording_ui.services import explorer_data, ml_data, position_sizing
+from recording_ui.services import backtest_batch, explorer_data, ml_data, position_sizing
 from recording_ui.services.backtest_service import get_backtest_service
 from recording_ui.services.browser_service import get_browser_service
 from recording_ui.services.chrome_tab import is_chrome_running, open_dashboard_tab
@@ -32,6 +32,7 @@ from recording_ui.services.profile_service import (
     get_profile_service,
 )
 from recording_ui.services.session_tracker import SessionTracker
+from recording_ui.services.sweep_service import get_sweep_service
 from services.event_bus import event_bus
 from services.event_store.service import EventStoreService
 
@@ -61,6 +62,9 @@ live_backtest_service = get_live_backtest_service(socketio)
 # Initialize browser service for Chrome/trading integration
 browser_service = get_browser_service(socketio)
 
+# Initialize parameter sweep service (streams progress over SocketIO)
+sweep_service = get_sweep_service(socketio)
+
 # Guard against duplicate startup in Flask reloader/multi-worker setups
 # Only start services if this is the main process (not a reloader child)
 _services_started = False
@@ -455,6 +459,59 @@ def api_validation_info():
         return jsonify({"error": str(e)}), 500
 
 
+@app.route("/api/backtest/batch", methods=["POST"])
+def api_backtest_batch():
+    """Run strategies headlessly over the whole validation set.
+
+    Request JSON (one of):
+        strategy: Single strategy dict
+        strategies: List of strategy dicts (evaluated in parallel)
+        strategy_names: List of saved strategy names
+    Optional:
+        include_games: Include per-game results (default false)
+        max_workers: Process pool size (default: CPU count)
+    """
+    service = get_backtest_service()
+    data = request.get_json() or {}
+
+    if "strategy_names" in data:
+        strategies = []
+        for name in data["strategy_names"]:
+            strategy = service.load_strategy(name)
+            if not strategy:
+                return jsonify({"error": f"Strategy not found: {name}"}), 404
+            strategies.append(strategy)
+    elif "strategies" in data:
+        strategies = data["strategies"]
+    elif "strategy" in data:
+        strategies = [data["strategy"]]
+    else:
+        return jsonify({"error": "No strategy provided"}), 400
+
+    include_games = bool(data.get("include_games", False))
+    try:
+        start = time.perf_counter()
+        game_ids, durations = backtest_batch.games_to_arrays(service.get_validation_games())
+        results = backtest_batch.run_batch_grid(
+            strategies,
+            game_ids,
+            durations,
+            include_games=include_games,
+            max_workers=data.get("max_workers"),
+        )
+        return jsonify(
+            {
+                "success": True,
+                "total_games": len(game_ids),
+                "elapsed_s": round(time.perf_counter() - start, 3),
+                "results": [r.to_dict(include_games=include_games) for r in results],
+            }
+        )
+    except Exception as e:
+        logger.error(f"Batch backtest error: {e}")
+        return jsonify({"error": str(e)}), 500
+
+
 # =============================================================================
 # SOCKETIO - LIVE BACKTEST MODE
 # =============================================================================
@@ -521,6 +578,26 @@ def handle_get_live_state(data):
         emit("error", {"message": f"Session {session_id} not found"})
 
 
+@socketio.on("join_sweep")
+def handle_join_sweep(data):
+    """Subscribe to progress events of a sweep job."""
+    job_id = data.get("job_id")
+    job = sweep_service.get_job(job_id) if job_id else None
+    if not job:
+        emit("error", {"message": f"Sweep {job_id} not found"})
+        return
+    join_room(job_id)
+    emit("sweep_progress", job.to_dict())
+
+
+@socketio.on("leave_sweep")
+def handle_leave_sweep(data):
+    """Unsubscribe from a sweep job."""
+    job_id = data.get("job_id")
+    if job_id:
+        leave_room(job_id)
+
+
 @socketio.on("connect")
 def handle_connect():
     """Handle client connection."""
@@ -794,6 +871,56 @@ def api_explorer_kelly():
     )
 
 
+@app.route("/api/explorer/sweep", methods=["POST"])
+def api_explorer_sweep():
+    """Start a parallel parameter sweep.
+
+    POST body (JSON):
+        params: Parameter name -> scalar, list, or {start, stop, step}
+            (entry_tick, num_bets, bet_size, bet_sizes, kelly_fraction, ...)
+        ruin_samples: Shuffled game orders per point (default: 20)
+
+    Progress streams as 'sweep_progress' / 'sweep_done' SocketIO events to
+    clients that emitted 'join_sweep' with the returned job_id.
+
+    Returns:
+        JSON with job_id and total point count
+    """
+    data = request.get_json() or {}
+    try:
+        job = sweep_service.start_sweep(
+            data.get("params", {}),
+            ruin_samples=data.get("ruin_samples", 20),
+        )
+        return jsonify({"success": True, "job_id": job.job_id, "total": len(job.points)})
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    except FileNotFoundError as e:
+        return jsonify({"error": str(e)}), 404
+
+
+@app.route("/api/explorer/sweep/<job_id>")
+def api_explorer_sweep_status(job_id: str):
+    """Get sweep progress, Pareto front and (optionally) all results.
+
+    Query params:
+        results: Include every evaluated point (default: false)
+    """
+    job = sweep_service.get_job(job_id)
+    if not job:
+        return jsonify({"error": "Sweep not found"}), 404
+    include_results = request.args.get("results", "false").lower() == "true"
+    return jsonify(job.to_dict(include_results=include_results))
+
+
+@app.route("/api/explorer/sweep/<job_id>/cancel", methods=["POST"])
+def api_explorer_sweep_cancel(job_id: str):
+    """Cancel a running sweep."""
+    if not sweep_service.cancel(job_id):
+        return jsonify({"error": "Sweep not running"}), 404
+    return jsonify({"success": True, "job_id": job_id})
+
+
 @app.route("/api/explorer/monte-carlo", methods=["POST"])
 def api_explorer_monte_carlo():
     """Run Monte Carlo comparison across all 8 scaling strategies.
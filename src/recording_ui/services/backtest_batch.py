@@ -0,0 +1,291 @@
+"""
+Backtest Batch Engine - Headless strategy evaluation over whole game sets.
+
+BacktestService advances a PlaybackState one HTTP tick at a time, which is
+right for visual playback but far too slow for ranking strategy variants.
+
+This engine produces the same results in a single pass:
+- A strategy's outcome per game depends only on the rug tick (duration),
+  so bet reachability and the winning window are computed for all games at
+  once with NumPy.
+- The sequential part (wallet, peak, drawdown, stop conditions) is a tight
+  loop of O(num_bets) work per game using the shared calculate_bet_size().
+- Grids of strategies fan out across a process pool.
+
+Results match PlaybackState stats exactly (same float operation order).
+"""
+
+import logging
+import time
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from typing import Any
+
+import numpy as np
+
+from recording_ui.services.backtest_service import (
+    SIDEBET_COOLDOWN,
+    SIDEBET_PAYOUT,
+    SIDEBET_WINDOW,
+    calculate_bet_size,
+)
+from utils.parallel import map_in_pool, worker_count
+
+logger = logging.getLogger(__name__)
+
+# Below this many strategies a process pool costs more than it saves
+MIN_PARALLEL_STRATEGIES = 4
+
+
+@dataclass
+class GameResult:
+    """Outcome of one game for one strategy."""
+
+    game_id: str
+    duration: int
+    outcome: str  # early_rug, no_bet, win, loss
+    bets_placed: int
+    wagered: float
+    payout: float
+    wallet: float
+
+
+@dataclass
+class BatchResult:
+    """Aggregate result of running one strategy over a game set."""
+
+    strategy_name: str
+    initial_balance: float
+    wallet: float
+    peak_balance: float
+    wins: int = 0
+    losses: int = 0
+    early_rugs: int = 0
+    games_played: int = 0
+    games_evaluated: int = 0
+    total_wagered: float = 0.0
+    max_drawdown: float = 0.0
+    stop_reason: str = "completed"  # completed, take_profit, max_drawdown
+    equity_curve: list[float] = field(default_factory=list)
+    games: list[GameResult] = field(default_factory=list)
+
+    def to_dict(self, include_games: bool = False) -> dict[str, Any]:
+        """Convert to JSON-serializable dict (stats match PlaybackState.to_dict)."""
+        result = {
+            "strategy_name": self.strategy_name,
+            "initial_balance": self.initial_balance,
+            "wallet": round(self.wallet, 6),
+            "pnl": round(self.wallet - self.initial_balance, 6),
+            "pnl_pct": round((self.wallet - self.initial_balance) / self.initial_balance * 100, 2),
+            "stats": {
+                "wins": self.wins,
+                "losses": self.losses,
+                "early_rugs": self.early_rugs,
+                "games_played": self.games_played,
+                "win_rate": round(self.wins / self.games_played * 100, 1)
+                if self.games_played > 0
+                else 0,
+                "total_wagered": round(self.total_wagered, 6),
+                "max_drawdown": round(self.max_drawdown * 100, 2),
+            },
+            "games_evaluated": self.games_evaluated,
+            "stop_reason": self.stop_reason,
+            "equity_curve": [round(e, 6) for e in self.equity_curve],
+        }
+        if include_games:
+            result["games"] = [asdict(g) for g in self.games]
+        return result
+
+
+def _bet_schedule(
+    durations: np.ndarray, entry_tick: int, num_bets: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized bet reachability for every game.
+
+    A bet starting at tick s is placed only if the game is still running at
+    s (s <= duration - 1). Bets are spaced window + cooldown apart, so a later
+    bet is only reachable if the previous window expired, and only the last
+    reachable bet can win (duration <= its start + window).
+
+    Returns:
+        (bets_reachable, last_bet_wins) arrays aligned with durations
+    """
+    spacing = SIDEBET_WINDOW + SIDEBET_COOLDOWN
+    last_tick = durations.astype(np.int64) - 1
+    reachable = np.where(
+        last_tick >= entry_tick,
+        np.minimum((last_tick - entry_tick) // spacing + 1, num_bets),
+        0,
+    )
+    last_start = entry_tick + (reachable - 1) * spacing
+    last_wins = (reachable > 0) & (durations <= last_start + SIDEBET_WINDOW)
+    return reachable, last_wins
+
+
+def run_batch(
+    strategy: dict,
+    game_ids: list[str],
+    durations: np.ndarray | list[int],
+    include_games: bool = False,
+) -> BatchResult:
+    """
+    Run one strategy over a sequence of games (headless).
+
+    Args:
+        strategy: Strategy dict (same schema as Machine Learning/strategies/*.json)
+        game_ids: Game IDs in playback order
+        durations: Rug tick (price array length) per game
+        include_games: Collect a per-game GameResult list
+
+    Returns:
+        BatchResult with the same stats a full PlaybackState run produces
+    """
+    params = strategy.get("params", strategy)
+    entry_tick = params.get("entry_tick", 200)
+    num_bets = params.get("num_bets", 4)
+    take_profit = params.get("take_profit_target")
+    max_dd = params.get("max_drawdown_pct", 0.50)
+    initial_balance = strategy.get("initial_balance", 0.1)
+
+    durations = np.asarray(durations, dtype=np.int64)
+    reachable, last_wins = _bet_schedule(durations, entry_tick, num_bets)
+
+    result = BatchResult(
+        strategy_name=strategy.get("name", "unnamed"),
+        initial_balance=initial_balance,
+        wallet=initial_balance,
+        peak_balance=initial_balance,
+        equity_curve=[initial_balance],
+    )
+    wallet = initial_balance
+    peak = initial_balance
+
+    for i, (duration, n_bets, wins_last) in enumerate(
+        zip(durations.tolist(), reachable.tolist(), last_wins.tolist())
+    ):
+        if duration < entry_tick:
+            result.early_rugs += 1
+        else:
+            result.games_played += 1
+
+        # Placement (in bet order, skipping unaffordable bets)
+        placed: list[tuple[int, float]] = []
+        for bet_num in range(1, n_bets + 1):
+            size = calculate_bet_size(params, bet_num, wallet, peak)
+            if size > wallet:
+                continue
+            wallet -= size
+            result.total_wagered += size
+            placed.append((bet_num, size))
+
+        # Resolution at the rug tick
+        payout = 0.0
+        won = False
+        for bet_num, size in placed:
+            if wins_last and bet_num == n_bets:
+                payout = size * SIDEBET_PAYOUT
+                wallet += payout
+                result.wins += 1
+                won = True
+            else:
+                result.losses += 1
+
+        if wallet > peak:
+            peak = wallet
+        current_dd = (peak - wallet) / peak if peak > 0 else 0
+        result.max_drawdown = max(result.max_drawdown, current_dd)
+        result.equity_curve.append(wallet)
+        result.games_evaluated = i + 1
+
+        if include_games:
+            if duration < entry_tick:
+                outcome = "early_rug"
+            elif not placed:
+                outcome = "no_bet"
+            else:
+                outcome = "win" if won else "loss"
+            result.games.append(
+                GameResult(
+                    game_id=game_ids[i],
+                    duration=duration,
+                    outcome=outcome,
+                    bets_placed=len(placed),
+                    wagered=sum(size for _, size in placed),
+                    payout=payout,
+                    wallet=wallet,
+                )
+            )
+
+        if take_profit and wallet >= initial_balance * take_profit:
+            result.stop_reason = "take_profit"
+            break
+        if current_dd >= max_dd:
+            result.stop_reason = "max_drawdown"
+            break
+
+    result.wallet = wallet
+    result.peak_balance = peak
+    return result
+
+
+def _game_set(game_ids: list[str], durations: np.ndarray) -> tuple[list[str], np.ndarray]:
+    return game_ids, durations
+
+
+def _run_strategy(
+    games: tuple[list[str], np.ndarray], strategy: dict, include_games: bool
+) -> BatchResult:
+    game_ids, durations = games
+    return run_batch(strategy, game_ids, durations, include_games)
+
+
+def run_batch_grid(
+    strategies: list[dict],
+    game_ids: list[str],
+    durations: np.ndarray | list[int],
+    include_games: bool = False,
+    max_workers: int | None = None,
+) -> list[BatchResult]:
+    """
+    Run many strategies over the same games, in parallel across cores.
+
+    Args:
+        strategies: Strategy dicts to evaluate
+        game_ids: Game IDs in playback order
+        durations: Rug tick per game
+        include_games: Collect per-game results for every strategy
+        max_workers: Process count (defaults to CPU count; 1 runs inline)
+
+    Returns:
+        BatchResults in the same order as strategies
+    """
+    durations = np.asarray(durations, dtype=np.int64)
+    workers = worker_count(len(strategies), MIN_PARALLEL_STRATEGIES, max_workers)
+    start = time.perf_counter()
+
+    # The game set is installed once per worker so each task only ships its strategy
+    results = list(
+        map_in_pool(
+            partial(_run_strategy, include_games=include_games),
+            strategies,
+            init=_game_set,
+            initargs=(game_ids, durations),
+            min_items=MIN_PARALLEL_STRATEGIES,
+            workers=max_workers,
+        )
+    )
+
+    elapsed = time.perf_counter() - start
+    logger.info(
+        f"Batch backtest: {len(strategies)} strategies x {len(game_ids)} games "
+        f"in {elapsed:.2f}s ({workers} workers)"
+    )
+    return results
+
+
+def games_to_arrays(games: list[dict]) -> tuple[list[str], np.ndarray]:
+    """Split BacktestService game dicts into (game_ids, durations)."""
+    game_ids = [g["game_id"] for g in games]
+    durations = np.fromiter((g["duration"] for g in games), dtype=np.int64, count=len(games))
+    return game_ids, durations
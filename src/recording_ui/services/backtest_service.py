@@ -16,8 +16,7 @@ import uuid
 from dataclasses import dataclass, field
 from pathlib import Path
 
-import duckdb
-import pandas as pd
+from services.event_store.game_prices import get_game_prices_cache
 
 # Constants
 SIDEBET_WINDOW = 40
@@ -147,6 +146,53 @@ class PlaybackState:
         }
 
 
+def calculate_bet_size(strategy: dict, bet_num: int, wallet: float, peak_balance: float) -> float:
+    """
+    Calculate the bet size for a strategy's Nth bet in a game.
+
+    Shared by tick-by-tick playback and the headless batch engine so both
+    size bets identically.
+
+    Args:
+        strategy: Strategy params (the "params" dict of a strategy JSON)
+        bet_num: Bet number within the game (1-based)
+        wallet: Current wallet balance (after earlier bets this game)
+        peak_balance: Peak balance at the last game boundary
+    """
+    bet_sizes = strategy.get("bet_sizes", [0.001, 0.001, 0.001, 0.001])
+
+    if bet_num <= len(bet_sizes):
+        base_size = bet_sizes[bet_num - 1]
+    else:
+        base_size = 0.001
+
+    # Kelly sizing
+    if strategy.get("use_kelly_sizing", False):
+        kelly_fraction = strategy.get("kelly_fraction", 0.25)
+        # Simplified Kelly - use ~60% win rate assumption
+        kelly_full = 0.60 - (1 - 0.60) / SIDEBET_PAYOUT
+        kelly_adjusted = kelly_full * kelly_fraction
+        base_size = max(0.0001, wallet * kelly_adjusted / 4)
+
+    # Dynamic sizing adjustments
+    if strategy.get("use_dynamic_sizing", False):
+        # Apply multiplier if above threshold
+        threshold = strategy.get("high_confidence_threshold", 60) / 100
+        multiplier = strategy.get("high_confidence_multiplier", 2.0)
+        # For now, assume we're always above threshold in backtest
+        base_size *= multiplier
+
+    # Reduce on drawdown
+    if strategy.get("reduce_on_drawdown", False):
+        current_dd = (peak_balance - wallet) / peak_balance if peak_balance > 0 else 0
+        if current_dd > 0.05:
+            reduction = min(0.9, current_dd)
+            base_size *= 1 - reduction
+
+    # Round to 3 decimal places (thousandths) - rugs.fun UI precision
+    return round(max(0.001, base_size), 3)
+
+
 class BacktestService:
     """Service for managing backtest playback sessions."""
 
@@ -161,7 +207,7 @@ class BacktestService:
         self.sessions: dict[str, PlaybackState] = {}
 
         # Cached game data
-        self._games_cache: pd.DataFrame | None = None
+        self._games_cache: list[dict] | None = None
         self._validation_games: list[dict] | None = None
 
     # =========================================================================
@@ -224,39 +270,17 @@ class BacktestService:
     # GAME DATA
     # =========================================================================
 
-    def _load_games(self) -> pd.DataFrame:
-        """Load all games from parquet."""
+    def _load_games(self) -> list[dict]:
+        """Load all games from the shared game prices cache."""
         if self._games_cache is not None:
             return self._games_cache
 
-        parquet_path = self.data_dir / "events_parquet" / "doc_type=complete_game"
-        if not parquet_path.exists():
-            raise FileNotFoundError(f"No game data at {parquet_path}")
-
-        conn = duckdb.connect()
-        df = conn.execute(f"""
-            SELECT DISTINCT game_id, raw_json
-            FROM '{parquet_path}/**/*.parquet'
-            WHERE raw_json IS NOT NULL
-        """).df()
-
-        # Parse raw_json to extract prices
-        games = []
-        for _, row in df.iterrows():
-            try:
-                data = json.loads(row["raw_json"])
-                if "prices" in data and len(data["prices"]) > 50:  # Skip very short games
-                    games.append(
-                        {
-                            "game_id": row["game_id"],
-                            "prices": data["prices"],
-                            "duration": len(data["prices"]),
-                        }
-                    )
-            except Exception:
-                continue
+        cache = get_game_prices_cache(self.data_dir)
+        if not cache.dataset.source_dir.exists():
+            raise FileNotFoundError(f"No game data at {cache.dataset.source_dir}")
 
-        self._games_cache = pd.DataFrame(games)
+        # Skip very short games
+        self._games_cache = cache.games(min_ticks=51)
         return self._games_cache
 
     def _is_validation_game(self, game_id: str) -> bool:
@@ -269,17 +293,15 @@ class BacktestService:
         if self._validation_games is not None:
             return self._validation_games
 
-        df = self._load_games()
-        validation = []
-        for _, row in df.iterrows():
-            if self._is_validation_game(row["game_id"]):
-                validation.append(
-                    {
-                        "game_id": row["game_id"],
-                        "prices": row["prices"],
-                        "duration": row["duration"],
-                    }
-                )
+        validation = [
+            {
+                "game_id": game["game_id"],
+                "prices": game["prices"],
+                "duration": game["duration"],
+            }
+            for game in self._load_games()
+            if self._is_validation_game(game["game_id"])
+        ]
 
         self._validation_games = validation
         return self._validation_games
@@ -443,42 +465,7 @@ class BacktestService:
 
     def _calculate_bet_size(self, state: PlaybackState, strategy: dict, bet_num: int) -> float:
         """Calculate the bet size based on strategy."""
-        bet_sizes = strategy.get("bet_sizes", [0.001, 0.001, 0.001, 0.001])
-
-        if bet_num <= len(bet_sizes):
-            base_size = bet_sizes[bet_num - 1]
-        else:
-            base_size = 0.001
-
-        # Kelly sizing
-        if strategy.get("use_kelly_sizing", False):
-            kelly_fraction = strategy.get("kelly_fraction", 0.25)
-            # Simplified Kelly - use ~60% win rate assumption
-            kelly_full = 0.60 - (1 - 0.60) / SIDEBET_PAYOUT
-            kelly_adjusted = kelly_full * kelly_fraction
-            base_size = max(0.0001, state.wallet * kelly_adjusted / 4)
-
-        # Dynamic sizing adjustments
-        if strategy.get("use_dynamic_sizing", False):
-            # Apply multiplier if above threshold
-            threshold = strategy.get("high_confidence_threshold", 60) / 100
-            multiplier = strategy.get("high_confidence_multiplier", 2.0)
-            # For now, assume we're always above threshold in backtest
-            base_size *= multiplier
-
-        # Reduce on drawdown
-        if strategy.get("reduce_on_drawdown", False):
-            current_dd = (
-                (state.peak_balance - state.wallet) / state.peak_balance
-                if state.peak_balance > 0
-                else 0
-            )
-            if current_dd > 0.05:
-                reduction = min(0.9, current_dd)
-                base_size *= 1 - reduction
-
-        # Round to 3 decimal places (thousandths) - rugs.fun UI precision
-        return round(max(0.001, base_size), 3)
+        return calculate_bet_size(strategy, bet_num, state.wallet, state.peak_balance)
 
     def _handle_rug(self, state: PlaybackState):
         """Handle end of game (rug event)."""
@@ -14,6 +14,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from services.event_bus import Events, event_bus
+from services.raw_ws_event import RawWsEvent
 
 logger = logging.getLogger(__name__)
 
@@ -346,10 +347,15 @@ class BrowserService:
     # EVENT HANDLERS
     # =========================================================================
 
-    def _on_ws_event(self, event: dict[str, Any]):
+    def _on_ws_event(self, wrapped: dict[str, Any]):
         """Handle raw WebSocket events from EventBus."""
-        event_type = event.get("event")
-        data = event.get("data", {})
+        event = RawWsEvent.from_bus(wrapped)
+        if event is None:
+            return
+        event_type = event.event_name
+        if event_type not in ("gameStateUpdate", "usernameStatus", "playerUpdate"):
+            return  # Skip the payload decode for unrelated events
+        data = event.data if event.data is not None else {}
 
         if event_type == "gameStateUpdate":
             self._handle_game_state(data)
@@ -11,6 +11,8 @@ from typing import Any
 
 import duckdb
 
+from services.event_store.game_prices import get_game_prices_cache
+
 logger = logging.getLogger(__name__)
 
 # Default data directory
@@ -118,38 +120,35 @@ class DataService:
             limit = max(1, min(int(limit), 1000))  # Cap at 1000
             offset = max(0, int(offset))
 
+            # Summary fields come from the typed game prices dataset, so no
+            # raw_json is parsed here
             conn = self.get_connection()
+            conn.register("game_prices", get_game_prices_cache(self.data_dir.parent).table())
             result = conn.execute(f"""
                 SELECT
                     game_id,
                     ts,
-                    raw_json
-                FROM '{self.complete_game_path}/**/*.parquet'
+                    peak_multiplier,
+                    duration_ticks,
+                    sidebet_count,
+                    rugged
+                FROM game_prices
                 ORDER BY {order_by}
                 LIMIT {limit}
                 OFFSET {offset}
             """).fetchall()
 
-            games = []
-            for row in result:
-                game_id, ts, raw_json = row
-                try:
-                    data = json.loads(raw_json) if raw_json else {}
-                except json.JSONDecodeError:
-                    data = {}
-
-                games.append(
-                    {
-                        "game_id": game_id,
-                        "timestamp": ts,
-                        "peak_multiplier": data.get("peakMultiplier", 0),
-                        "tick_count": len(data.get("prices", [])),
-                        "sidebet_count": len(data.get("globalSidebets", [])),
-                        "rugged": data.get("rugged", False),
-                    }
-                )
-
-            return games
+            return [
+                {
+                    "game_id": game_id,
+                    "timestamp": ts,
+                    "peak_multiplier": peak_multiplier,
+                    "tick_count": tick_count,
+                    "sidebet_count": sidebet_count,
+                    "rugged": rugged,
+                }
+                for game_id, ts, peak_multiplier, tick_count, sidebet_count, rugged in result
+            ]
         except Exception as e:
             logger.error(f"Error getting games: {e}")
             return []
@@ -215,7 +214,10 @@ class DataService:
         Returns:
             List of price values (multipliers)
         """
-        game = self.get_game(game_id)
-        if game:
-            return game.get("prices", [])
-        return []
+        try:
+            if not self.complete_game_path.exists():
+                return []
+            return get_game_prices_cache(self.data_dir.parent).get_prices(game_id)
+        except Exception as e:
+            logger.error(f"Error getting prices for game {game_id}: {e}")
+            return []
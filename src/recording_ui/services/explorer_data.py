@@ -17,6 +17,8 @@ from typing import Any
 import numpy as np
 import pandas as pd
 
+from services.event_store.game_prices import get_parquet_table
+
 # Constants from rugs.fun sidebet mechanics
 SIDEBET_WINDOW = 40  # Ticks covered by each bet
 SIDEBET_COOLDOWN = 5  # Ticks to wait between bets
@@ -36,12 +38,20 @@ def get_training_data_path() -> Path:
     )
 
 
+# (source table, converted frame) - reconverted only when the file changes
+_games_df_cache: tuple[object, pd.DataFrame] | None = None
+
+
 def load_games_df() -> pd.DataFrame:
-    """Load games dataframe from parquet."""
+    """Load games dataframe from parquet (cached per process)."""
+    global _games_df_cache
     path = get_training_data_path()
     if not path.exists():
         raise FileNotFoundError(f"Training data not found: {path}")
-    return pd.read_parquet(path)
+    table = get_parquet_table(path)
+    if _games_df_cache is None or _games_df_cache[0] is not table:
+        _games_df_cache = (table, table.to_pandas())
+    return _games_df_cache[1]
 
 
 def calculate_bet_windows(entry_tick: int, num_bets: int = 4) -> list[dict]:
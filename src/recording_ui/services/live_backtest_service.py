@@ -23,6 +23,7 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from bot.execution_bridge import BotExecutionBridge
+    from services.live_state_provider import LiveStateProvider
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +66,9 @@ class LiveSession:
     # Active bets
     active_bets: list[LiveActiveBet] = field(default_factory=list)
 
+    # Bet whose outcome decides the amount staged in the execution bridge
+    staged_bet: LiveActiveBet | None = None
+
     # Stats
     wins: int = 0
     losses: int = 0
@@ -163,6 +167,9 @@ class LiveBacktestService:
         self.real_execution_enabled = False
         self._async_loop: asyncio.AbstractEventLoop | None = None
 
+        # Server-authoritative balance for sizing real bets (optional)
+        self.live_state_provider: LiveStateProvider | None = None
+
     @property
     def is_connected(self) -> bool:
         """Public property for WebSocket connection status."""
@@ -224,6 +231,16 @@ class LiveBacktestService:
         self.execution_bridge = bridge
         logger.info("Execution bridge wired to LiveBacktestService")
 
+    def set_live_state_provider(self, provider: "LiveStateProvider") -> None:
+        """
+        Wire LiveStateProvider so real bets are sized off the real balance.
+
+        Args:
+            provider: LiveStateProvider instance
+        """
+        self.live_state_provider = provider
+        logger.info("LiveStateProvider wired to LiveBacktestService")
+
     def enable_real_execution(self) -> None:
         """
         Enable real money execution.
@@ -299,7 +316,8 @@ class LiveBacktestService:
             # Import here to avoid circular imports
             from sources.websocket_feed import WebSocketFeed
 
-            self.ws_feed = WebSocketFeed(log_level="INFO")
+            # Sampled schema checks surface upstream payload drift in the logs
+            self.ws_feed = WebSocketFeed(log_level="INFO", schema_sample_every=100)
 
             # Register event handlers
             self.ws_feed.on("signal", self._on_game_tick)
@@ -373,6 +391,9 @@ class LiveBacktestService:
                 if session.current_game_id != tick_data["gameId"]:
                     self._on_new_game(session, tick_data)
 
+                # A staged bet whose window passed without a rug has lost
+                self._check_staged_expiry(session, tick_data)
+
                 # Run bet placement logic
                 self._check_bet_placement(session, tick_data)
 
@@ -475,11 +496,13 @@ class LiveBacktestService:
 
                 # REAL EXECUTION: Execute via browser if enabled
                 if self.real_execution_enabled and self.execution_bridge:
-                    # Stage NEXT bet amount for front-running
-                    if bet_num < num_bets:
-                        next_size = self._calculate_bet_size(session, strategy, bet_num + 1)
-                        self.execution_bridge.stage_next_amount(Decimal(str(next_size)))
-                        logger.info(f"Staged next bet: {next_size:.4f} SOL for front-running")
+                    # Stage NEXT bet amount for both outcomes of this one
+                    on_win, on_loss = self._predict_next_sizes(session, strategy, bet_num, bet_size)
+                    self.execution_bridge.stage_outcomes(
+                        None if on_win is None else Decimal(str(on_win)),
+                        None if on_loss is None else Decimal(str(on_loss)),
+                    )
+                    session.staged_bet = session.active_bets[-1]
 
                     # Execute current bet via async bridge
                     self._execute_in_async_loop(
@@ -487,7 +510,16 @@ class LiveBacktestService:
                     )
                     logger.info(f"Real execution triggered for bet {bet_num}")
 
-    def _calculate_bet_size(self, session: LiveSession, strategy: dict, bet_num: int) -> float:
+    def _sizing_wallet(self, session: LiveSession) -> float:
+        """Balance Kelly sizing uses: the real one when executing live."""
+        provider = self.live_state_provider
+        if self.real_execution_enabled and provider is not None and provider.is_live:
+            return float(provider.cash)
+        return session.wallet
+
+    def _calculate_bet_size(
+        self, session: LiveSession, strategy: dict, bet_num: int, pnl: float = 0.0
+    ) -> float:
         """
         Calculate bet size based on strategy (same logic as backtest_service).
 
@@ -495,10 +527,14 @@ class LiveBacktestService:
             session: Current session
             strategy: Strategy params
             bet_num: Which bet (1-4)
+            pnl: Projected balance change to size for (e.g. a pending payout)
 
         Returns:
             Bet size in SOL
         """
+        wallet = session.wallet + pnl
+        peak_balance = max(session.peak_balance, wallet)
+
         bet_sizes = strategy.get("bet_sizes", [0.001, 0.001, 0.001, 0.001])
 
         if bet_num <= len(bet_sizes):
@@ -512,7 +548,7 @@ class LiveBacktestService:
             # Simplified Kelly - use ~60% win rate assumption
             kelly_full = 0.60 - (1 - 0.60) / SIDEBET_PAYOUT
             kelly_adjusted = kelly_full * kelly_fraction
-            base_size = max(0.0001, session.wallet * kelly_adjusted / 4)
+            base_size = max(0.0001, (self._sizing_wallet(session) + pnl) * kelly_adjusted / 4)
 
         # Dynamic sizing
         if strategy.get("use_dynamic_sizing", False):
@@ -521,8 +557,8 @@ class LiveBacktestService:
 
         # Reduce on drawdown
         if strategy.get("reduce_on_drawdown", False):
-            if session.peak_balance > 0:
-                current_dd = (session.peak_balance - session.wallet) / session.peak_balance
+            if peak_balance > 0:
+                current_dd = (peak_balance - wallet) / peak_balance
                 if current_dd > 0.05:
                     reduction = min(0.9, current_dd)
                     base_size *= 1 - reduction
@@ -530,6 +566,55 @@ class LiveBacktestService:
         # Round to 3 decimal places (rugs.fun UI precision)
         return round(max(0.001, base_size), 3)
 
+    def _predict_next_sizes(
+        self, session: LiveSession, strategy: dict, bet_num: int, bet_size: float
+    ) -> tuple[float | None, float | None]:
+        """
+        Predict the next bet size for each outcome of a just-placed bet.
+
+        A win ends the sequence (next bet is bet 1 of the next game, sized
+        from the balance plus payout); a loss moves on to the next bet, or
+        back to bet 1 after the last one. None = the next bet is unaffordable.
+
+        Args:
+            session: Current session
+            strategy: Strategy params
+            bet_num: Bet just placed
+            bet_size: Its size (already deducted from the wallet)
+
+        Returns:
+            (size if it wins, size if it loses)
+        """
+        num_bets = strategy.get("num_bets", 4)
+
+        predictions = []
+        for pnl, next_bet in (
+            (bet_size * SIDEBET_PAYOUT, 1),
+            (0.0, bet_num + 1 if bet_num < num_bets else 1),
+        ):
+            size = self._calculate_bet_size(session, strategy, next_bet, pnl=pnl)
+            predictions.append(size if size <= session.wallet + pnl else None)
+        return predictions[0], predictions[1]
+
+    def _check_staged_expiry(self, session: LiveSession, tick_data: dict) -> None:
+        """Pre-stage the loss amount once the staged bet's window has passed."""
+        bet = session.staged_bet
+        if bet is None or tick_data.get("rugged"):
+            return
+        if tick_data["gameId"] == bet.game_id and tick_data["tickCount"] <= bet.window_end:
+            return
+        self._prestage_outcome(session, won=False)
+
+    def _prestage_outcome(self, session: LiveSession, won: bool) -> None:
+        """Outcome of the staged bet is known: click in the next amount now."""
+        session.staged_bet = None
+        if not (self.real_execution_enabled and self.execution_bridge):
+            return
+        amount = self.execution_bridge.resolve_outcome(won)
+        if amount is not None:
+            logger.info(f"Pre-staging next bet: {amount} SOL ({'won' if won else 'lost'})")
+            self._execute_in_async_loop(self.execution_bridge.prestage())
+
     def _check_bet_resolution(self, session: LiveSession, tick_data: dict) -> None:
         """
         Check if any active bets should be resolved.
@@ -541,6 +626,7 @@ class LiveBacktestService:
         rug_tick = tick_data["tickCount"]
         game_id = tick_data["gameId"]
 
+        staged = session.staged_bet
         any_resolved = False
         for bet in session.active_bets:
             if bet.resolved:
@@ -569,6 +655,9 @@ class LiveBacktestService:
                     f"(rug at tick {rug_tick}, window was {bet.tick_placed}-{bet.window_end})"
                 )
 
+            if bet is staged:
+                self._prestage_outcome(session, bet.won)
+
         if any_resolved:
             # Update peak and drawdown
             if session.wallet > session.peak_balance:
@@ -581,6 +670,22 @@ class LiveBacktestService:
             # Clean up resolved bets
             session.active_bets = [b for b in session.active_bets if not b.resolved]
 
+        # Lost at window expiry, but the game ended before the next bet: bet 1 is next
+        if any_resolved and staged is None:
+            self._prestage_next_game(session)
+
+    def _prestage_next_game(self, session: LiveSession) -> None:
+        """Game over with no staged outcome pending: stage bet 1 of the next game."""
+        if not (self.real_execution_enabled and self.execution_bridge):
+            return
+        strategy = session.strategy.get("params", session.strategy)
+        size = self._calculate_bet_size(session, strategy, 1)
+        if size > session.wallet:
+            return
+        self.execution_bridge.stage_next_amount(Decimal(str(size)))
+        logger.info(f"Pre-staging next game's first bet: {size:.4f} SOL")
+        self._execute_in_async_loop(self.execution_bridge.prestage())
+
     def disconnect_ws(self) -> None:
         """Disconnect from WebSocket."""
         if self.ws_feed:
@@ -185,8 +185,7 @@ def estimate_win_probability(games_df: pd.DataFrame, entry_tick: int, num_bets:
 
     # Games that rug within any window
     wins = 0
-    for _, row in playable.iterrows():
-        duration = int(row["duration_ticks"])
+    for duration in playable["duration_ticks"].tolist():
         for window in windows:
             if window["start_tick"] <= duration <= window["end_tick"]:
                 wins += 1
@@ -412,10 +411,9 @@ def run_simulation(
             games_df, config.entry_tick, len(config.bet_sizes)
         )
 
-    for _, row in games_df.iterrows():
-        duration = int(row["duration_ticks"])
-        game_id = row["game_id"]
-
+    for game_id, duration in zip(
+        games_df["game_id"].tolist(), games_df["duration_ticks"].astype(int).tolist()
+    ):
         balance_before = balance
 
         # Check take-profit target
@@ -0,0 +1,433 @@
+"""
+Strategy Sweep Service - Parallel parameter sweeps for the Game Explorer.
+
+The explorer evaluates one entry_tick / bet sizing configuration per request.
+A sweep takes parameter ranges, expands them into a grid and evaluates every
+point across a process pool using the existing bankroll simulation
+(position_sizing.run_simulation). Each point gets:
+- EV per game played and ROI
+- Max drawdown on the recorded game order
+- Ruin probability: share of shuffled game orders that hit the drawdown halt
+
+Partial results stream to the UI over Flask-SocketIO (room = job_id) with the
+current Pareto front (max EV, min drawdown, min ruin). Evaluated points are
+memoized across jobs (least recently used first out past MAX_MEMO_POINTS),
+and jobs can be cancelled.
+
+Usage:
+    service = get_sweep_service(socketio)
+    job = service.start_sweep({"entry_tick": {"start": 150, "stop": 300, "step": 10}})
+    service.cancel(job.job_id)
+"""
+
+import itertools
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from recording_ui.services import explorer_data, position_sizing
+from utils.parallel import map_in_pool
+
+logger = logging.getLogger(__name__)
+
+# Safety limits
+MAX_SWEEP_POINTS = 5000
+DEFAULT_RUIN_SAMPLES = 20
+MAX_RUIN_SAMPLES = 200
+
+# Memoized point results kept across jobs
+MAX_MEMO_POINTS = 4 * MAX_SWEEP_POINTS
+
+# Minimum seconds between progress emits (results are batched in between)
+EMIT_INTERVAL = 0.25
+
+# Point parameters and their defaults (explorer /simulate schema)
+POINT_DEFAULTS: dict[str, Any] = {
+    "initial_balance": 0.1,
+    "entry_tick": 200,
+    "num_bets": 4,
+    "bet_size": 0.001,
+    "max_drawdown_pct": 0.50,
+    "use_kelly_sizing": False,
+    "kelly_fraction": 0.25,
+    "use_dynamic_sizing": False,
+    "high_confidence_threshold": 60,
+    "high_confidence_multiplier": 2.0,
+    "reduce_on_drawdown": False,
+    "take_profit_target": None,
+}
+
+
+# =============================================================================
+# GRID EXPANSION
+# =============================================================================
+
+
+def _expand_values(name: str, spec: Any) -> list[Any]:
+    """Expand one parameter spec: scalar, list, or {start, stop, step} range."""
+    if isinstance(spec, dict):
+        start, stop = spec["start"], spec["stop"]
+        step = spec.get("step", 1)
+        if step <= 0:
+            raise ValueError(f"{name}: step must be positive")
+        if isinstance(start, int) and isinstance(stop, int) and isinstance(step, int):
+            return list(range(start, stop + 1, step))
+        count = int(np.floor((stop - start) / step + 1e-9)) + 1
+        return [round(start + i * step, 10) for i in range(count)]
+    if isinstance(spec, list):
+        return spec
+    return [spec]
+
+
+def expand_grid(params: dict[str, Any]) -> list[dict[str, Any]]:
+    """
+    Expand parameter ranges into a list of point configs.
+
+    Args:
+        params: Parameter name -> scalar | list | {start, stop, step}.
+            Unknown names raise ValueError. Missing names use POINT_DEFAULTS.
+            "bet_sizes" (explicit list per point) overrides num_bets/bet_size.
+
+    Returns:
+        List of point dicts (one per grid combination)
+
+    Raises:
+        ValueError: On unknown parameters or when the grid exceeds MAX_SWEEP_POINTS
+    """
+    unknown = set(params) - set(POINT_DEFAULTS) - {"bet_sizes"}
+    if unknown:
+        raise ValueError(f"Unknown sweep parameters: {sorted(unknown)}")
+
+    names = list(POINT_DEFAULTS)
+    axes = [_expand_values(n, params.get(n, POINT_DEFAULTS[n])) for n in names]
+    bet_sizes_axis = None
+    if "bet_sizes" in params:
+        # A list of lists sweeps over explicit size sequences
+        spec = params["bet_sizes"]
+        bet_sizes_axis = spec if spec and isinstance(spec[0], list) else [spec]
+
+    total = int(np.prod([len(a) for a in axes])) * (len(bet_sizes_axis or [None]))
+    if total > MAX_SWEEP_POINTS:
+        raise ValueError(f"Sweep has {total} points (max {MAX_SWEEP_POINTS})")
+
+    points = []
+    for combo in itertools.product(*axes, bet_sizes_axis or [None]):
+        point = dict(zip(names, combo[:-1]))
+        sizes = combo[-1]
+        point["bet_sizes"] = (
+            list(sizes) if sizes is not None else [point["bet_size"]] * int(point["num_bets"])
+        )
+        del point["bet_size"]
+        point["num_bets"] = len(point["bet_sizes"])
+        points.append(point)
+    return points
+
+
+def point_key(point: dict[str, Any]) -> str:
+    """Canonical memoization key for a point."""
+    return json.dumps(point, sort_keys=True)
+
+
+def point_to_config(point: dict[str, Any]) -> position_sizing.WalletConfig:
+    """Build the bankroll simulation config for a point."""
+    return position_sizing.WalletConfig(
+        initial_balance=float(point["initial_balance"]),
+        bet_sizes=[float(b) for b in point["bet_sizes"]],
+        entry_tick=int(point["entry_tick"]),
+        max_drawdown_pct=float(point["max_drawdown_pct"]),
+        use_dynamic_sizing=bool(point["use_dynamic_sizing"]),
+        high_confidence_threshold=float(point["high_confidence_threshold"]) / 100,
+        high_confidence_multiplier=float(point["high_confidence_multiplier"]),
+        reduce_on_drawdown=bool(point["reduce_on_drawdown"]),
+        take_profit_target=(
+            float(point["take_profit_target"]) if point["take_profit_target"] else None
+        ),
+        use_kelly_sizing=bool(point["use_kelly_sizing"]),
+        kelly_fraction=float(point["kelly_fraction"]),
+    )
+
+
+# =============================================================================
+# POINT EVALUATION (runs in worker processes)
+# =============================================================================
+
+
+def evaluate_point(
+    games_df: pd.DataFrame, point: dict[str, Any], ruin_samples: int, seed: int = 0
+) -> dict[str, Any]:
+    """
+    Evaluate one sweep point.
+
+    Args:
+        games_df: DataFrame with game_id, duration_ticks columns
+        point: Point config from expand_grid()
+        ruin_samples: Number of shuffled game orders for ruin probability
+        seed: RNG seed (same seed -> same shuffles for every point)
+
+    Returns:
+        Metrics dict (ev, roi_pct, max_drawdown_pct, ruin_probability, ...)
+    """
+    config = point_to_config(point)
+    result = position_sizing.run_simulation(games_df, config)
+    ev = result.total_profit / result.games_played if result.games_played else 0.0
+
+    ruined = 0
+    if ruin_samples > 0:
+        rng = np.random.default_rng(seed)
+        n = len(games_df)
+        for _ in range(ruin_samples):
+            shuffled = games_df.iloc[rng.permutation(n)]
+            sample = position_sizing.run_simulation(shuffled, config)
+            if any(g.outcome == "max_drawdown" for g in sample.games):
+                ruined += 1
+
+    return {
+        "ev": ev,
+        "roi_pct": result.roi_pct,
+        "max_drawdown_pct": result.max_drawdown_pct,
+        "ruin_probability": ruined / ruin_samples if ruin_samples > 0 else 0.0,
+        "win_rate": result.win_rate,
+        "games_played": result.games_played,
+        "ending_balance": result.ending_balance,
+        "sharpe_ratio": float(result.sharpe_ratio),
+    }
+
+
+# =============================================================================
+# PARETO FRONT
+# =============================================================================
+
+
+def _dominates(a: dict[str, Any], b: dict[str, Any]) -> bool:
+    """a dominates b: no worse on every objective, strictly better on one."""
+    ma, mb = a["metrics"], b["metrics"]
+    no_worse = (
+        ma["ev"] >= mb["ev"]
+        and ma["max_drawdown_pct"] <= mb["max_drawdown_pct"]
+        and ma["ruin_probability"] <= mb["ruin_probability"]
+    )
+    better = (
+        ma["ev"] > mb["ev"]
+        or ma["max_drawdown_pct"] < mb["max_drawdown_pct"]
+        or ma["ruin_probability"] < mb["ruin_probability"]
+    )
+    return no_worse and better
+
+
+def update_pareto_front(front: list[dict], candidate: dict) -> bool:
+    """
+    Insert candidate into the front (in place) if it is non-dominated.
+
+    Returns:
+        True if the front changed
+    """
+    if any(_dominates(p, candidate) for p in front):
+        return False
+    front[:] = [p for p in front if not _dominates(candidate, p)]
+    front.append(candidate)
+    return True
+
+
+# =============================================================================
+# JOBS
+# =============================================================================
+
+
+@dataclass
+class SweepJob:
+    """State of one sweep job."""
+
+    job_id: str
+    points: list[dict[str, Any]]
+    ruin_samples: int
+    status: str = "pending"  # pending, running, completed, cancelled, failed
+    completed: int = 0
+    cached: int = 0
+    error: str | None = None
+    started_at: float = field(default_factory=time.time)
+    finished_at: float | None = None
+    results: list[dict[str, Any]] = field(default_factory=list)
+    pareto_front: list[dict[str, Any]] = field(default_factory=list)
+    cancel_event: threading.Event = field(default_factory=threading.Event)
+
+    def to_dict(self, include_results: bool = False) -> dict[str, Any]:
+        """Convert to JSON-serializable dict."""
+        elapsed = (self.finished_at or time.time()) - self.started_at
+        data = {
+            "job_id": self.job_id,
+            "status": self.status,
+            "total": len(self.points),
+            "completed": self.completed,
+            "cached": self.cached,
+            "elapsed_s": round(elapsed, 2),
+            "points_per_sec": round(self.completed / elapsed, 1) if elapsed > 0 else 0,
+            "error": self.error,
+            "pareto_front": self.pareto_front,
+        }
+        if include_results:
+            data["results"] = self.results
+        return data
+
+
+class SweepService:
+    """Runs sweep jobs on a process pool and streams progress over SocketIO."""
+
+    def __init__(self, socketio=None, max_workers: int | None = None):
+        self.socketio = socketio
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.jobs: dict[str, SweepJob] = {}
+        # (point_key, dataset_key, ruin_samples) -> metrics, oldest use first
+        self._memo: OrderedDict[tuple[str, int, int], dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def start_sweep(
+        self,
+        params: dict[str, Any],
+        ruin_samples: int = DEFAULT_RUIN_SAMPLES,
+        games_df: pd.DataFrame | None = None,
+    ) -> SweepJob:
+        """
+        Expand params and start evaluating in a background thread.
+
+        Args:
+            params: Parameter ranges (see expand_grid)
+            ruin_samples: Shuffled game orders per point for ruin probability
+            games_df: Game set (defaults to the explorer training data)
+
+        Raises:
+            ValueError: Invalid parameters or grid too large
+            FileNotFoundError: Training data missing
+        """
+        points = expand_grid(params)
+        ruin_samples = max(0, min(int(ruin_samples), MAX_RUIN_SAMPLES))
+        if games_df is None:
+            games_df = explorer_data.load_games_df()
+        games_df = games_df[["game_id", "duration_ticks"]].reset_index(drop=True)
+
+        job = SweepJob(job_id=str(uuid.uuid4())[:8], points=points, ruin_samples=ruin_samples)
+        with self._lock:
+            self.jobs[job.job_id] = job
+
+        thread = threading.Thread(
+            target=self._run_job, args=(job, games_df), name=f"sweep-{job.job_id}", daemon=True
+        )
+        thread.start()
+        return job
+
+    def get_job(self, job_id: str) -> SweepJob | None:
+        return self.jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> bool:
+        """Request cancellation. Pending points are dropped, running ones finish."""
+        job = self.jobs.get(job_id)
+        if not job or job.status not in ("pending", "running"):
+            return False
+        job.cancel_event.set()
+        return True
+
+    def _run_job(self, job: SweepJob, games_df: pd.DataFrame) -> None:
+        job.status = "running"
+        dataset_key = int(pd.util.hash_pandas_object(games_df, index=False).sum())
+        last_emit = 0.0
+
+        try:
+            # Serve memoized points first
+            pending = []
+            for point in job.points:
+                memo = self._memo_get((point_key(point), dataset_key, job.ruin_samples))
+                if memo is not None:
+                    job.cached += 1
+                    self._record(job, point, memo)
+                else:
+                    pending.append(point)
+
+            if pending and not job.cancel_event.is_set():
+                # Worker context is the game set (pd.DataFrame(df) shares its data)
+                results = map_in_pool(
+                    partial(evaluate_point, ruin_samples=job.ruin_samples),
+                    pending,
+                    init=pd.DataFrame,
+                    initargs=(games_df,),
+                    workers=self.max_workers,
+                )
+                try:
+                    for point, metrics in zip(pending, results):
+                        self._memo_put((point_key(point), dataset_key, job.ruin_samples), metrics)
+                        self._record(job, point, metrics)
+                        if job.cancel_event.is_set():
+                            break
+                        if time.time() - last_emit >= EMIT_INTERVAL:
+                            self._emit(job, "sweep_progress")
+                            last_emit = time.time()
+                finally:
+                    # Drops queued points on cancel; running ones finish
+                    results.close()
+
+            job.status = "cancelled" if job.cancel_event.is_set() else "completed"
+        except Exception as e:
+            logger.error(f"Sweep {job.job_id} failed: {e}")
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            job.finished_at = time.time()
+            self._emit(job, "sweep_done")
+            logger.info(
+                f"Sweep {job.job_id} {job.status}: {job.completed}/{len(job.points)} points "
+                f"({job.cached} cached)"
+            )
+
+    def _memo_get(self, key: tuple[str, int, int]) -> dict[str, Any] | None:
+        with self._lock:
+            metrics = self._memo.get(key)
+            if metrics is not None:
+                self._memo.move_to_end(key)
+            return metrics
+
+    def _memo_put(self, key: tuple[str, int, int], metrics: dict[str, Any]) -> None:
+        with self._lock:
+            self._memo[key] = metrics
+            self._memo.move_to_end(key)
+            while len(self._memo) > MAX_MEMO_POINTS:
+                self._memo.popitem(last=False)
+
+    def _record(self, job: SweepJob, point: dict[str, Any], metrics: dict[str, Any]) -> None:
+        entry = {"params": point, "metrics": metrics}
+        job.results.append(entry)
+        job.completed += 1
+        update_pareto_front(job.pareto_front, entry)
+
+    def _emit(self, job: SweepJob, event: str) -> None:
+        if self.socketio:
+            try:
+                self.socketio.emit(event, job.to_dict(), room=job.job_id)
+            except Exception as e:
+                logger.debug(f"Sweep emit failed: {e}")
+
+
+# Singleton instance
+_service: SweepService | None = None
+
+
+def get_sweep_service(socketio=None) -> SweepService:
+    """
+    Get the singleton sweep service instance.
+
+    Args:
+        socketio: Flask-SocketIO instance (attached on first call that provides it)
+    """
+    global _service
+    if _service is None:
+        _service = SweepService(socketio)
+    elif socketio is not None and _service.socketio is None:
+        _service.socketio = socketio
+    return _service
@@ -26,9 +26,10 @@ from typing import Any
 
 import gymnasium as gym
 import numpy as np
-import pandas as pd
 from gymnasium import spaces
 
+from services.event_store.game_prices import get_parquet_table
+
 
 class SidebetV1ObservationBuilder:
     """
@@ -182,9 +183,9 @@ class SidebetV1Env(gym.Env):
         if data_path is None:
             data_path = str(self.DEFAULT_DATA_PATH)
 
-        # Load game data
-        self.games_df = pd.read_parquet(data_path)
-        self.num_games = len(self.games_df)
+        # Load game data (memory-mapped, shared by every env in this process)
+        self.games_table = get_parquet_table(data_path)
+        self.num_games = self.games_table.num_rows
         self.shuffle = shuffle
 
         # Spaces
@@ -234,10 +235,8 @@ class SidebetV1Env(gym.Env):
             self.current_game_idx = (self.current_game_idx + 1) % self.num_games
 
         # Load game
-        game_row = self.games_df.iloc[self.current_game_idx]
+        game_row = self.games_table.slice(int(self.current_game_idx), 1).to_pylist()[0]
         prices = game_row["prices"]
-        if isinstance(prices, np.ndarray):
-            prices = prices.tolist()
 
         self.current_game = {
             "game_id": game_row["game_id"],
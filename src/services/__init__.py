@@ -23,6 +23,14 @@ _LAZY_EXPORTS = {
     "POSITION_TOLERANCE": ("services.state_verifier", "POSITION_TOLERANCE"),
     # Phase 12C: Server-authoritative state in live mode
     "LiveStateProvider": ("services.live_state_provider", "LiveStateProvider"),
+    # Incremental P&L accounting with lock-free snapshots
+    "PnLLedger": ("services.pnl_ledger", "PnLLedger"),
+    "PnLSnapshot": ("services.pnl_ledger", "PnLSnapshot"),
+    # Parse-once WS_RAW_EVENT payload shared by all subscribers
+    "RawWsEvent": ("services.raw_ws_event", "RawWsEvent"),
+    # Hot-path latency tracing (capture -> decision -> click)
+    "LatencyTracer": ("services.latency_trace", "LatencyTracer"),
+    "latency_tracer": ("services.latency_trace", "latency_tracer"),
 }
 
 
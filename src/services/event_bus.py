@@ -12,6 +12,8 @@ from collections.abc import Callable, Hashable
 from enum import Enum
 from typing import Any
 
+from services.latency_trace import STAGE_BUS, latency_tracer
+
 logger = logging.getLogger(__name__)
 
 
@@ -261,7 +263,8 @@ class EventBus:
         AUDIT FIX: Track statistics and queue capacity monitoring
         """
         try:
-            self._queue.put_nowait((event, data))
+            # Tag with the live latency trace so dispatch can stamp queue delay
+            self._queue.put_nowait((event, data, latency_tracer.current()))
             self._stats["events_published"] += 1
 
             # AUDIT FIX: Warn at 80% capacity
@@ -283,7 +286,9 @@ class EventBus:
                 if item is None:  # Sentinel
                     break
 
-                event, data = item
+                event, data = item[0], item[1]
+                if len(item) > 2 and item[2] >= 0:
+                    latency_tracer.stamp(STAGE_BUS, item[2])
                 self._dispatch(event, data)
 
             except queue.Empty:
@@ -9,6 +9,7 @@ All producers publish to EventBus; EventStore subscribes and persists.
 """
 
 from .duckdb import EventStoreQuery
+from .game_prices import GamePricesCache, GamePricesDataset, get_game_prices_cache
 from .paths import (
     EventStorePaths,
     get_data_dir,
@@ -17,6 +18,7 @@ from .paths import (
 )
 from .schema import Direction, DocType, EventEnvelope, EventSource
 from .service import EventStoreService
+from .ticks import TickWriter, read_ticks, reconstruct_raw
 from .writer import ParquetWriter
 
 __all__ = [
@@ -27,9 +29,15 @@ __all__ = [
     "EventStorePaths",
     "EventStoreQuery",
     "EventStoreService",
+    "GamePricesCache",
+    "GamePricesDataset",
     "ParquetWriter",
+    "TickWriter",
     # Convenience path functions
     "get_data_dir",
+    "get_game_prices_cache",
     "get_legacy_recordings_dir",
     "get_raw_captures_dir",
+    "read_ticks",
+    "reconstruct_raw",
 ]
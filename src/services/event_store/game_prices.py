@@ -0,0 +1,457 @@
+"""
+Game Prices Dataset - Typed price arrays derived from complete_game
+
+The complete_game doc_type stores every gameHistory entry as a JSON string in
+raw_json. Consumers that only need the price series (backtest playback, the
+games API, RL training, offline exports) used to json.loads every row on
+every cold start.
+
+This module maintains a derived Parquet dataset with ``prices`` as a native
+list<double> column next to duration, peak and rug fields:
+
+- Incremental: each complete_game Parquet file is parsed exactly once and
+  recorded in a manifest; refresh() only parses new or modified files.
+- Deduplicated view: one row per game_id (longest price array wins, newest
+  date/ts breaks ties), snapshotted to an uncompressed Arrow IPC file.
+- Memory-mapped: the snapshot is mapped zero-copy and shared process-wide via
+  get_game_prices_cache(), so every consumer in a process reads one table.
+
+Layout:
+    {data_dir}/derived/game_prices/part-<key>.parquet   (one per source file)
+    {data_dir}/derived/game_prices/snapshot.arrow       (deduplicated view)
+    {data_dir}/manifests/game_prices_manifest.json      (processed sources)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from services.event_store.paths import EventStorePaths
+
+logger = logging.getLogger(__name__)
+
+# Bump when the derived schema or derivation rules change (forces a rebuild)
+GAME_PRICES_VERSION = 1
+
+GAME_PRICES_SCHEMA = pa.schema(
+    [
+        ("game_id", pa.string()),
+        ("date", pa.string()),
+        ("ts", pa.string()),
+        ("prices", pa.list_(pa.float64())),
+        ("duration_ticks", pa.int32()),
+        ("peak_multiplier", pa.float64()),
+        ("peak_tick", pa.int32()),
+        ("rugged", pa.bool_()),
+        ("sidebet_count", pa.int32()),
+    ]
+)
+
+SNAPSHOT_FILENAME = "snapshot.arrow"
+MANIFEST_FILENAME = "game_prices_manifest.json"
+
+
+def derive_game_row(
+    game_id: str | None, date: str | None, ts: str | None, raw_json: str | None
+) -> dict[str, Any] | None:
+    """
+    Derive one typed row from a complete_game raw_json payload.
+
+    Args:
+        game_id: game_id column value (falls back to the payload's "id")
+        date: Partition date (YYYY-MM-DD), falls back to ts[:10]
+        ts: Envelope timestamp (ISO string)
+        raw_json: Full gameHistory entry as JSON
+
+    Returns:
+        Row dict matching GAME_PRICES_SCHEMA, or None if the payload has no
+        usable price array
+    """
+    if not raw_json:
+        return None
+    try:
+        data = json.loads(raw_json)
+    except (json.JSONDecodeError, TypeError):
+        return None
+    if not isinstance(data, dict):
+        return None
+
+    raw_prices = data.get("prices")
+    if not isinstance(raw_prices, list):
+        return None
+    prices = [
+        float(p) for p in raw_prices if isinstance(p, (int, float)) and not isinstance(p, bool)
+    ]
+    if not prices:
+        return None
+
+    peak_tick = max(range(len(prices)), key=prices.__getitem__)
+    peak = data.get("peakMultiplier")
+    sidebets = data.get("globalSidebets")
+
+    return {
+        "game_id": game_id or data.get("id"),
+        "date": date or (ts[:10] if ts else None),
+        "ts": ts,
+        "prices": prices,
+        "duration_ticks": len(prices),
+        "peak_multiplier": float(peak) if isinstance(peak, (int, float)) else prices[peak_tick],
+        "peak_tick": peak_tick,
+        "rugged": bool(data.get("rugged", False)),
+        "sidebet_count": len(sidebets) if isinstance(sidebets, list) else 0,
+    }
+
+
+def _partition_date(path: Path) -> str | None:
+    """Extract the hive partition date (date=YYYY-MM-DD) from a file path."""
+    for part in path.parts:
+        if part.startswith("date="):
+            return part[len("date=") :]
+    return None
+
+
+def deduplicate_games(table: pa.Table) -> pa.Table:
+    """
+    Keep one row per game_id: longest price array, then newest date/ts.
+
+    gameHistory is broadcast repeatedly, so the same game is usually captured
+    several times (sometimes while its price array is still truncated).
+    """
+    if table.num_rows == 0:
+        return table
+
+    ranked = table.sort_by(
+        [
+            ("game_id", "ascending"),
+            ("duration_ticks", "descending"),
+            ("date", "descending"),
+            ("ts", "descending"),
+        ]
+    )
+    game_ids = ranked.column("game_id").to_pylist()
+    keep = [
+        i
+        for i, gid in enumerate(game_ids)
+        if gid is not None and (i == 0 or gid != game_ids[i - 1])
+    ]
+    return ranked.take(pa.array(keep, type=pa.int64())).sort_by([("ts", "ascending")])
+
+
+class GamePricesDataset:
+    """
+    Incrementally maintained game prices dataset.
+
+    Thread-safe: refresh() serializes on an internal lock. Concurrent
+    processes are tolerated because every file is written to a temp path and
+    renamed into place.
+    """
+
+    def __init__(self, paths: EventStorePaths | None = None, data_dir: Path | None = None):
+        """
+        Initialize dataset.
+
+        Args:
+            paths: EventStorePaths instance (takes precedence over data_dir)
+            data_dir: Override data directory (for testing)
+        """
+        self._paths = paths or EventStorePaths(data_dir=data_dir)
+        self._lock = threading.Lock()
+
+    @property
+    def source_dir(self) -> Path:
+        """complete_game Parquet partition root"""
+        return self._paths.events_parquet_dir / "doc_type=complete_game"
+
+    @property
+    def output_dir(self) -> Path:
+        """Derived dataset directory"""
+        return self._paths.derived_dir / "game_prices"
+
+    @property
+    def snapshot_path(self) -> Path:
+        """Deduplicated, memory-mappable Arrow IPC snapshot"""
+        return self.output_dir / SNAPSHOT_FILENAME
+
+    @property
+    def manifest_path(self) -> Path:
+        """Manifest of processed source files"""
+        return self._paths.manifests_dir / MANIFEST_FILENAME
+
+    def refresh(self) -> int:
+        """
+        Parse new or modified complete_game files and update the snapshot.
+
+        Returns:
+            Number of source files parsed in this call
+        """
+        with self._lock:
+            manifest = self._read_manifest()
+            sources: dict[str, dict[str, Any]] = manifest["sources"]
+            current = self._scan_sources()
+
+            parsed = 0
+            for rel_path, stat in current.items():
+                entry = sources.get(rel_path)
+                if entry and (entry["size"], entry["mtime_ns"]) == (stat["size"], stat["mtime_ns"]):
+                    continue
+                part_name = self._part_name(rel_path)
+                self._derive_file(self.source_dir / rel_path, self.output_dir / part_name)
+                sources[rel_path] = {**stat, "part": part_name}
+                parsed += 1
+
+            removed = [rel for rel in sources if rel not in current]
+            for rel_path in removed:
+                part = self.output_dir / sources.pop(rel_path)["part"]
+                part.unlink(missing_ok=True)
+
+            if parsed or removed or not self.snapshot_path.exists():
+                self._write_snapshot(sources)
+                self._write_manifest(manifest)
+                logger.info(
+                    f"Game prices dataset refreshed: {parsed} parsed, {len(removed)} removed, "
+                    f"{len(sources)} source files"
+                )
+            return parsed
+
+    def _scan_sources(self) -> dict[str, dict[str, int]]:
+        """Map source file relative path -> size/mtime for change detection."""
+        if not self.source_dir.exists():
+            return {}
+        result = {}
+        for path in sorted(self.source_dir.rglob("*.parquet")):
+            st = path.stat()
+            result[str(path.relative_to(self.source_dir))] = {
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+            }
+        return result
+
+    @staticmethod
+    def _part_name(rel_path: str) -> str:
+        digest = hashlib.sha1(rel_path.encode()).hexdigest()[:16]
+        return f"part-{digest}.parquet"
+
+    def _derive_file(self, source: Path, target: Path) -> None:
+        """Parse one complete_game Parquet file into a derived part file."""
+        pf = pq.ParquetFile(source)
+        names = set(pf.schema_arrow.names)
+        columns = [c for c in ("game_id", "ts", "raw_json") if c in names]
+        rows: list[dict[str, Any]] = []
+        if "raw_json" in names:
+            src = pf.read(columns=columns).to_pydict()
+            n = len(src["raw_json"])
+            date = _partition_date(source)
+            for i in range(n):
+                row = derive_game_row(
+                    src["game_id"][i] if "game_id" in src else None,
+                    date,
+                    src["ts"][i] if "ts" in src else None,
+                    src["raw_json"][i],
+                )
+                if row is not None:
+                    rows.append(row)
+
+        table = pa.Table.from_pylist(rows, schema=GAME_PRICES_SCHEMA)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(".tmp")
+        pq.write_table(table, tmp, compression="zstd")
+        os.replace(tmp, target)
+
+    def _write_snapshot(self, sources: dict[str, dict[str, Any]]) -> None:
+        """Rebuild the deduplicated Arrow IPC snapshot from all part files."""
+        tables = []
+        for entry in sources.values():
+            part = self.output_dir / entry["part"]
+            if part.exists():
+                tables.append(pq.read_table(part, schema=GAME_PRICES_SCHEMA))
+        if tables:
+            table = pa.concat_tables(tables)
+        else:
+            table = GAME_PRICES_SCHEMA.empty_table()
+        table = deduplicate_games(table).combine_chunks()
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.snapshot_path.with_suffix(".tmp")
+        with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp, self.snapshot_path)
+
+    def _read_manifest(self) -> dict[str, Any]:
+        try:
+            manifest = json.loads(self.manifest_path.read_text())
+            if manifest.get("version") == GAME_PRICES_VERSION:
+                return manifest
+            logger.info("Game prices manifest version changed, rebuilding dataset")
+        except FileNotFoundError:
+            pass
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Unreadable game prices manifest, rebuilding: {e}")
+        return {"version": GAME_PRICES_VERSION, "sources": {}}
+
+    def _write_manifest(self, manifest: dict[str, Any]) -> None:
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.manifest_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(manifest, indent=2))
+        os.replace(tmp, self.manifest_path)
+
+
+class GamePricesCache:
+    """
+    Process-wide, memory-mapped view of the game prices dataset.
+
+    The first access refreshes the dataset (parsing only unseen source files)
+    and maps the snapshot. Subsequent accesses return the same table until
+    reload() is called.
+    """
+
+    def __init__(self, dataset: GamePricesDataset):
+        self._dataset = dataset
+        self._lock = threading.Lock()
+        self._table: pa.Table | None = None
+        self._mmap: pa.MemoryMappedFile | None = None
+        self._index: dict[str, int] | None = None
+        self._offsets = None
+        self._values = None
+
+    @property
+    def dataset(self) -> GamePricesDataset:
+        return self._dataset
+
+    def table(self) -> pa.Table:
+        """Deduplicated game prices table (zero-copy, memory-mapped)."""
+        table = self._table
+        if table is None:
+            with self._lock:
+                if self._table is None:
+                    self._dataset.refresh()
+                    self._map_snapshot()
+                table = self._table
+        return table
+
+    def reload(self) -> pa.Table:
+        """Pick up newly recorded games and remap the snapshot."""
+        with self._lock:
+            self._dataset.refresh()
+            self._map_snapshot()
+            return self._table
+
+    def _map_snapshot(self) -> None:
+        mmap = pa.memory_map(str(self._dataset.snapshot_path), "r")
+        table = pa.ipc.open_file(mmap).read_all()
+        # Publish the new table before dropping the old mapping
+        self._table = table
+        self._index = None
+        self._offsets = None
+        self._values = None
+        self._mmap = mmap
+
+    def __len__(self) -> int:
+        return self.table().num_rows
+
+    def _price_arrays(self):
+        """Flat (offsets, values) numpy views over the prices column."""
+        if self._values is None:
+            prices = self.table().column("prices").combine_chunks()
+            self._offsets = prices.offsets.to_numpy()
+            self._values = prices.values.to_numpy(zero_copy_only=False)
+        return self._offsets, self._values
+
+    def prices_at(self, row: int):
+        """Price array for a row index as a read-only numpy view."""
+        offsets, values = self._price_arrays()
+        return values[offsets[row] : offsets[row + 1]]
+
+    def row_index(self, game_id: str) -> int | None:
+        """Row index for game_id, or None if unknown."""
+        if self._index is None:
+            ids = self.table().column("game_id").to_pylist()
+            self._index = {gid: i for i, gid in enumerate(ids)}
+        return self._index.get(game_id)
+
+    def get_prices(self, game_id: str) -> list[float]:
+        """Price array for a game (empty list if unknown)."""
+        row = self.row_index(game_id)
+        if row is None:
+            return []
+        return self.prices_at(row).tolist()
+
+    def games(self, min_ticks: int = 0) -> list[dict[str, Any]]:
+        """
+        All games with at least min_ticks prices.
+
+        Returns:
+            List of dicts with game_id, prices (numpy view), duration,
+            peak_multiplier, peak_tick, rugged
+        """
+        table = self.table()
+        cols = table.select(
+            ["game_id", "duration_ticks", "peak_multiplier", "peak_tick", "rugged"]
+        ).to_pydict()
+        games = []
+        for i, duration in enumerate(cols["duration_ticks"]):
+            if duration < min_ticks:
+                continue
+            games.append(
+                {
+                    "game_id": cols["game_id"][i],
+                    "prices": self.prices_at(i),
+                    "duration": duration,
+                    "peak_multiplier": cols["peak_multiplier"][i],
+                    "peak_tick": cols["peak_tick"][i],
+                    "rugged": cols["rugged"][i],
+                }
+            )
+        return games
+
+
+_caches: dict[Path, GamePricesCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_game_prices_cache(data_dir: Path | None = None) -> GamePricesCache:
+    """
+    Get the process-wide game prices cache for a data directory.
+
+    Args:
+        data_dir: RUGS_DATA_DIR root (defaults to the configured data dir)
+
+    Returns:
+        Shared GamePricesCache instance
+    """
+    paths = EventStorePaths(data_dir=data_dir)
+    key = paths.data_dir.resolve()
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = GamePricesCache(GamePricesDataset(paths=paths))
+            _caches[key] = cache
+        return cache
+
+
+_parquet_tables: dict[Path, tuple[int, pa.Table]] = {}
+_parquet_lock = threading.Lock()
+
+
+def get_parquet_table(path: str | Path) -> pa.Table:
+    """
+    Read a Parquet file once per process (memory-mapped), keyed by mtime.
+
+    Used for standalone training files such as games_with_prices.parquet so
+    several environments or services in one process share one table.
+    """
+    path = Path(path).resolve()
+    mtime_ns = path.stat().st_mtime_ns
+    with _parquet_lock:
+        cached = _parquet_tables.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        table = pq.read_table(path, memory_map=True)
+        _parquet_tables[path] = (mtime_ns, table)
+        return table
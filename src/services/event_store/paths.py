@@ -45,6 +45,11 @@ class EventStorePaths:
         """Canonical Parquet dataset directory"""
         return self._data_dir / "events_parquet"
 
+    @property
+    def ticks_parquet_dir(self) -> Path:
+        """Columnar, delta-encoded tick dataset (see event_store.ticks)"""
+        return self._data_dir / "ticks_parquet"
+
     @property
     def vectors_dir(self) -> Path:
         """VectorDB index directory (derived artifacts, implementation-specific)"""
@@ -55,6 +60,11 @@ class EventStorePaths:
         """Optional JSONL exports directory"""
         return self._data_dir / "exports"
 
+    @property
+    def derived_dir(self) -> Path:
+        """Derived datasets rebuilt from events_parquet (safe to delete)"""
+        return self._data_dir / "derived"
+
     @property
     def manifests_dir(self) -> Path:
         """Schema and checkpoint manifests"""
@@ -99,8 +99,19 @@ class EventEnvelope:
         game_id: str | None = None,
         player_id: str | None = None,
         username: str | None = None,
+        raw_data: str | None = None,
     ) -> "EventEnvelope":
-        """Create envelope from WebSocket event"""
+        """
+        Create envelope from WebSocket event
+
+        If raw_data (the exact JSON text of data, as received) is given it is
+        embedded as-is instead of re-serializing data.
+        """
+        if raw_data is not None:
+            raw_json = f'{{"event": {json.dumps(event_name)}, "data": {raw_data}}}'
+        else:
+            raw_json = json.dumps({"event": event_name, "data": data})
+
         return cls(
             ts=datetime.utcnow(),
             source=source,
@@ -108,7 +119,7 @@ class EventEnvelope:
             session_id=session_id,
             seq=seq,
             direction=Direction.RECEIVED,
-            raw_json=json.dumps({"event": event_name, "data": data}),
+            raw_json=raw_json,
             game_id=game_id,
             player_id=player_id,
             username=username,
@@ -278,6 +289,7 @@ class EventEnvelope:
         source: EventSource,
         session_id: str,
         seq: int,
+        raw_json: str | None = None,
     ) -> "EventEnvelope":
         """
         Create envelope from complete game (from gameHistory array).
@@ -294,11 +306,14 @@ class EventEnvelope:
             source: Event source (CDP or PUBLIC_WS)
             session_id: Recording session UUID
             seq: Sequence number
+            raw_json: Exact JSON text of the game as received (skips re-serializing)
 
         Returns:
             EventEnvelope with entire game preserved in raw_json
         """
         game_id = game_data.get("id")
+        if raw_json is None:
+            raw_json = json.dumps(game_data, default=str)  # Preserve EVERYTHING
 
         return cls(
             ts=datetime.utcnow(),
@@ -307,7 +322,7 @@ class EventEnvelope:
             session_id=session_id,
             seq=seq,
             direction=Direction.RECEIVED,
-            raw_json=json.dumps(game_data, default=str),  # Preserve EVERYTHING
+            raw_json=raw_json,
             game_id=game_id,
         )
 
@@ -338,5 +353,31 @@ class EventEnvelope:
         }
 
 
+_decoder = json.JSONDecoder()
+
+
+def find_raw_object(text: str, key: str, value: str, expected: dict[str, Any]) -> str | None:
+    """
+    Find the exact source text of a JSON object inside a larger JSON string.
+
+    Locates the object whose first member is `key: value` (compact encoding,
+    as sent by the server) and decodes only that object to confirm it equals
+    `expected`. Much cheaper than re-serializing when the object is one of
+    many (e.g. a new game inside gameHistory).
+
+    Returns:
+        The object's source text, or None if it could not be located exactly
+    """
+    marker = f"{{{json.dumps(key)}:{json.dumps(value)}"
+    start = text.find(marker)
+    if start == -1:
+        return None
+    try:
+        obj, end = _decoder.raw_decode(text, start)
+    except (json.JSONDecodeError, RecursionError):
+        return None
+    return text[start:end] if obj == expected else None
+
+
 # Schema version for migrations
 SCHEMA_VERSION = "1.0.0"
@@ -22,8 +22,10 @@ from typing import Any
 
 from services.event_bus import EventBus, Events
 from services.event_store.paths import EventStorePaths
-from services.event_store.schema import EventEnvelope, EventSource
+from services.event_store.schema import EventEnvelope, EventSource, find_raw_object
+from services.event_store.ticks import TickWriter
 from services.event_store.writer import ParquetWriter
+from services.raw_ws_event import RawWsEvent
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +56,7 @@ class EventStoreService:
         session_id: str | None = None,
         buffer_size: int = 100,
         flush_interval: float = 5.0,
+        columnar_ticks: bool = False,
     ):
         """
         Initialize EventStoreService.
@@ -64,6 +67,9 @@ class EventStoreService:
             session_id: Recording session UUID (generates new if None)
             buffer_size: Events to buffer before write
             flush_interval: Seconds between time-based flushes
+            columnar_ticks: Store game ticks and gameStateUpdate events in the
+                delta-encoded tick dataset (event_store.ticks) instead of
+                game_tick / ws_event envelopes
         """
         self._event_bus = event_bus
         self._paths = paths or EventStorePaths()
@@ -77,6 +83,9 @@ class EventStoreService:
             buffer_size=buffer_size,
             flush_interval=flush_interval,
         )
+        self._tick_writer = (
+            TickWriter(paths=self._paths, flush_interval=flush_interval) if columnar_ticks else None
+        )
 
         self._started = False
         self._paused = True  # Start paused by default (no recording until toggled)
@@ -299,14 +308,21 @@ class EventStoreService:
         self._event_bus.unsubscribe(Events.TRADE_CONFIRMED, self._on_trade_confirmed)
         self._event_bus.unsubscribe(Events.BUTTON_PRESS, self._on_button_press)
 
-        # Flush and close writer
+        # Flush and close writers
         self._writer.close()
+        if self._tick_writer is not None:
+            self._tick_writer.close()
 
         logger.info(f"EventStoreService stopped: {self._seq} events processed")
 
     def flush(self) -> list | None:
         """Manually flush buffered events"""
-        return self._writer.flush()
+        written = self._writer.flush()
+        if self._tick_writer is not None:
+            ticks = self._tick_writer.flush()
+            if ticks:
+                written = (written or []) + ticks
+        return written
 
     def _next_seq(self) -> int:
         """Get next sequence number (thread-safe)"""
@@ -314,62 +330,6 @@ class EventStoreService:
             self._seq += 1
             return self._seq
 
-    @staticmethod
-    def _unwrap_event_payload(wrapped: Any) -> dict[str, Any] | None:
-        """
-        Unwrap event payload from EventBus and BrowserBridge wrappers.
-
-        Handles three known formats:
-        1. Already-unwrapped dict: {"event": "...", "data": {...}, ...}
-           Returns: same dict
-
-        2. EventBus + BrowserBridge double-wrapped: {"name": "...", "data": {"data": cdp_event}}
-           Returns: cdp_event dict (inner "data")
-
-        3. BrowserBridge-only wrapped: {"data": {"event": "...", "data": {...}, ...}}
-           Returns: inner dict containing event details
-
-        Args:
-            wrapped: Raw event payload from EventBus subscription
-
-        Returns:
-            Unwrapped event dict with "event", "data", etc. fields, or None if invalid
-
-        Note:
-            The double-wrapping occurs because:
-            - BrowserBridge publishes: {"data": cdp_event}
-            - EventBus wraps it as: {"name": event_type, "data": bridge_payload}
-            - Result: {"name": event_type, "data": {"data": cdp_event}}
-        """
-        # Validate input is dict
-        if not isinstance(wrapped, dict):
-            logger.warning(f"_unwrap_event_payload: Expected dict, got {type(wrapped)}")
-            return None
-
-        # Check if already unwrapped (has "event" field at top level)
-        if "event" in wrapped:
-            return wrapped
-
-        # Try unwrapping one layer (could be EventBus or BrowserBridge wrapper)
-        outer_data = wrapped.get("data")
-        if outer_data is None or not isinstance(outer_data, dict):
-            logger.warning(
-                f"_unwrap_event_payload: Invalid first wrapper layer, got {type(outer_data)}"
-            )
-            return None
-
-        # Check if outer_data already has "event" field (BrowserBridge-only case)
-        if "event" in outer_data:
-            return outer_data
-
-        # Try unwrapping second layer (EventBus + BrowserBridge double-wrapped)
-        data = outer_data.get("data")
-        if data is None or not isinstance(data, dict):
-            logger.warning(f"_unwrap_event_payload: Invalid second wrapper layer, got {type(data)}")
-            return None
-
-        return data
-
     def _on_ws_raw_event(self, wrapped: dict[str, Any]) -> None:
         """Handle raw WebSocket event"""
         # Early return if recording is paused
@@ -378,35 +338,50 @@ class EventStoreService:
                 return
 
         try:
-            # Unwrap event payload from EventBus/BrowserBridge wrappers
-            data = self._unwrap_event_payload(wrapped)
-            if data is None:
+            # Shared parse-once event (unwraps EventBus/BrowserBridge wrappers)
+            event = RawWsEvent.from_bus(wrapped)
+            if event is None:
+                logger.warning(f"WS_RAW_EVENT: Invalid payload {type(wrapped)}")
                 return
 
-            # Extract event details
-            event_name = data.get("event")
+            event_name = event.event_name
             if not event_name:
                 logger.warning("WS_RAW_EVENT: Missing event name")
                 return
 
-            event_data = data.get("data") or {}  # Handle None value explicitly
-            source_str = data.get("source", "public_ws")
-            game_id = data.get("game_id") or (
-                event_data.get("gameId") if isinstance(event_data, dict) else None
-            )
-
-            source = EventSource.CDP if source_str == "cdp" else EventSource.PUBLIC_WS
-
-            # Write raw ws_event
-            envelope = EventEnvelope.from_ws_event(
-                event_name=event_name,
-                data=event_data,
-                source=source,
-                session_id=self._session_id,
-                seq=self._next_seq(),
-                game_id=game_id,
-            )
-            self._writer.write(envelope)
+            event_data = event.data or {}  # Handle None value explicitly
+            # Exact JSON text of data from the CDP interceptor (stored as-is)
+            raw_data = event.raw_data if event.data else None
+            game_id = event.game_id
+
+            source = EventSource.CDP if event.source == "cdp" else EventSource.PUBLIC_WS
+
+            if (
+                self._tick_writer is not None
+                and event_name == "gameStateUpdate"
+                and isinstance(event_data, dict)
+            ):
+                # Columnar tick row instead of a full raw_json envelope
+                self._tick_writer.write(
+                    event=event_name,
+                    data=event_data,
+                    session_id=self._session_id,
+                    seq=self._next_seq(),
+                    source=source.value,
+                    game_id=game_id,
+                )
+            else:
+                # Write raw ws_event
+                envelope = EventEnvelope.from_ws_event(
+                    event_name=event_name,
+                    data=event_data,
+                    source=source,
+                    session_id=self._session_id,
+                    seq=self._next_seq(),
+                    game_id=game_id,
+                    raw_data=raw_data,
+                )
+                self._writer.write(envelope)
             with self._state_lock:
                 self._total_events_recorded += 1
 
@@ -431,11 +406,15 @@ class EventStoreService:
                         )
 
                         for game in new_games:
+                            game_raw = None
+                            if raw_data is not None and game.get("id"):
+                                game_raw = find_raw_object(raw_data, "id", game["id"], game)
                             game_envelope = EventEnvelope.from_complete_game(
                                 game_data=game,
                                 source=source,
                                 session_id=self._session_id,
                                 seq=self._next_seq(),
+                                raw_json=game_raw,
                             )
                             self._writer.write(game_envelope)
                             with self._state_lock:
@@ -467,6 +446,19 @@ class EventStoreService:
             price_raw = data.get("price", data.get("multiplier", 1.0))
             game_id = data.get("gameId", data.get("game_id", "unknown"))
 
+            if self._tick_writer is not None:
+                self._tick_writer.write(
+                    event="game_tick",
+                    data=data,
+                    session_id=self._session_id,
+                    seq=self._next_seq(),
+                    source=EventSource.PUBLIC_WS.value,
+                    game_id=game_id,
+                )
+                with self._state_lock:
+                    self._total_events_recorded += 1
+                return
+
             # Convert price to Decimal
             if isinstance(price_raw, Decimal):
                 price = price_raw
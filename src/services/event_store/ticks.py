@@ -0,0 +1,454 @@
+"""
+Tick Store - Delta-encoded, columnar tick dataset
+
+game_tick and ws_event(gameStateUpdate) envelopes store the whole payload as
+JSON in raw_json on every tick, with ts/price as strings. Consecutive ticks
+differ in a handful of fields, so storage and tick-level scans are dominated
+by redundant JSON.
+
+This dataset stores one row per (game_id, tick):
+- Typed columns: ts_ms (int64 epoch ms), tick (int32), price (float64),
+  active/rugged (int8 flags), cooldown_timer (int32)
+- Dictionary-encoded strings: game_id, phase, event, source, session_id
+- payload: JSON of the remaining fields. Full on keyframes (first row of a
+  stream in each file, new game, phase change), only the changed fields on
+  deltas, null when nothing changed. `removed` lists keys that disappeared.
+
+Files use DELTA_BINARY_PACKED for the monotonic integer columns,
+BYTE_STREAM_SPLIT for price, dictionary/RLE for flags and low-cardinality
+strings, and zstd compression. Every file is self-contained (starts with a
+keyframe per stream), so rows can be filtered by file or game_id.
+
+reconstruct_payloads() / reconstruct_raw() rebuild the original payloads
+for consumers of the old raw_json format (values are equal; key order may
+differ).
+
+Layout:
+    {data_dir}/ticks_parquet/date=YYYY-MM-DD/<timestamp>_<id>.parquet
+"""
+
+import json
+import logging
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from services.event_store.paths import EventStorePaths
+
+logger = logging.getLogger(__name__)
+
+# payload_kind values
+PAYLOAD_NONE = 0  # No field changed since the previous row of the stream
+PAYLOAD_DELTA = 1  # payload holds only changed fields
+PAYLOAD_KEYFRAME = 2  # payload holds every non-typed field
+
+# Typed column -> payload key, per source event
+TYPED_FIELDS: dict[str, dict[str, str]] = {
+    "gameStateUpdate": {
+        "tick": "tickCount",
+        "price": "price",
+        "active": "active",
+        "rugged": "rugged",
+        "cooldown_timer": "cooldownTimer",
+    },
+    "game_tick": {"tick": "tick", "price": "price"},
+}
+
+TICK_SCHEMA = pa.schema(
+    [
+        ("ts_ms", pa.int64()),
+        ("session_id", pa.dictionary(pa.int32(), pa.string())),
+        ("seq", pa.int64()),
+        ("source", pa.dictionary(pa.int8(), pa.string())),
+        ("event", pa.dictionary(pa.int8(), pa.string())),
+        ("game_id", pa.dictionary(pa.int32(), pa.string())),
+        ("tick", pa.int32()),
+        ("price", pa.float64()),
+        ("active", pa.int8()),
+        ("rugged", pa.int8()),
+        ("cooldown_timer", pa.int32()),
+        ("phase", pa.dictionary(pa.int8(), pa.string())),
+        ("payload_kind", pa.int8()),
+        ("payload", pa.string()),
+        ("removed", pa.list_(pa.string())),
+    ]
+)
+
+DICTIONARY_COLUMNS = [
+    "session_id",
+    "source",
+    "event",
+    "game_id",
+    "phase",
+    "active",
+    "rugged",
+    "payload_kind",
+]
+COLUMN_ENCODING = {
+    "ts_ms": "DELTA_BINARY_PACKED",
+    "seq": "DELTA_BINARY_PACKED",
+    "tick": "DELTA_BINARY_PACKED",
+    "cooldown_timer": "DELTA_BINARY_PACKED",
+    "price": "BYTE_STREAM_SPLIT",
+}
+
+
+def tick_phase(data: dict[str, Any]) -> str:
+    """
+    Game phase for a tick payload.
+
+    Uses an explicit "phase" field when present, otherwise the rugs-expert
+    rules (same as the Foundation normalizer): COOLDOWN (cooldownTimer > 0),
+    RUGGED, PRESALE (allowPreRoundBuys and not active), ACTIVE, else UNKNOWN.
+    """
+    phase = data.get("phase")
+    if isinstance(phase, str):
+        return phase
+    cooldown = data.get("cooldownTimer", 0)
+    if isinstance(cooldown, (int, float)) and cooldown > 0:
+        return "COOLDOWN"
+    if data.get("rugged", False):
+        return "RUGGED"
+    if data.get("allowPreRoundBuys", False) and not data.get("active", False):
+        return "PRESALE"
+    if data.get("active", False):
+        return "ACTIVE"
+    return "UNKNOWN"
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _split_typed(event: str, data: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    Split a payload into typed column values and the remaining fields.
+
+    A field is moved into its column only when it has the exact JSON type the
+    column round-trips (so reconstruction is value-equal); otherwise it stays
+    in the payload and the column gets a best-effort conversion.
+    """
+    fields = TYPED_FIELDS.get(event, {})
+    typed: dict[str, Any] = {}
+    rest = dict(data)
+    for column, key in fields.items():
+        if key not in data:
+            continue
+        value = data[key]
+        if column in ("active", "rugged"):
+            if isinstance(value, bool):
+                typed[column] = int(value)
+                del rest[key]
+        elif column == "price":
+            if isinstance(value, float):
+                typed[column] = value
+                del rest[key]
+            elif isinstance(value, (int, Decimal)) and not isinstance(value, bool):
+                typed[column] = float(value)
+        elif _is_int(value):
+            typed[column] = value
+            del rest[key]
+    return typed, rest
+
+
+class TickWriter:
+    """
+    Buffered writer for the columnar tick dataset.
+
+    Mirrors ParquetWriter: rows are buffered and flushed when buffer_size is
+    reached, flush_interval has passed, or flush()/close() is called. Delta
+    state is reset on every flush so each file starts with keyframes.
+
+    Thread-safe for concurrent writes.
+    """
+
+    def __init__(
+        self,
+        paths: EventStorePaths,
+        buffer_size: int = 1000,
+        flush_interval: float = 5.0,
+    ):
+        """
+        Initialize TickWriter.
+
+        Args:
+            paths: EventStorePaths instance for directory management
+            buffer_size: Number of rows to buffer before auto-flush
+            flush_interval: Seconds between time-based auto-flushes
+        """
+        self._paths = paths
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+
+        # Rows by partition date
+        self._buffers: dict[str, list[dict[str, Any]]] = {}
+        self._buffer_count = 0
+        self._last_flush_time = time.time()
+
+        # Previous (game_id, phase, payload fields) per (date partition, session, event)
+        self._previous: dict[tuple[str, str, str], tuple[str | None, str, dict[str, Any]]] = {}
+
+        self._lock = threading.RLock()
+        self._closed = False
+
+    @property
+    def buffer_count(self) -> int:
+        """Current number of buffered rows"""
+        with self._lock:
+            return self._buffer_count
+
+    def write(
+        self,
+        event: str,
+        data: dict[str, Any],
+        session_id: str,
+        seq: int,
+        source: str,
+        game_id: str | None = None,
+        ts_ms: int | None = None,
+    ) -> None:
+        """
+        Buffer one tick.
+
+        Args:
+            event: Source event ("gameStateUpdate" or "game_tick")
+            data: Tick payload
+            session_id: Recording session UUID
+            seq: Sequence number within session
+            source: Event source value (cdp, public_ws, ...)
+            game_id: Game identifier (defaults to data["gameId"])
+            ts_ms: Epoch milliseconds (defaults to now)
+
+        Raises:
+            RuntimeError: If writer has been closed
+        """
+        if ts_ms is None:
+            ts_ms = time.time_ns() // 1_000_000
+        if game_id is None:
+            game_id = data.get("gameId")
+
+        typed, fields = _split_typed(event, data)
+        phase = tick_phase(data)
+        date_str = datetime.utcfromtimestamp(ts_ms / 1000).strftime("%Y-%m-%d")
+        # Same key as reconstruct_payloads(), per output file
+        stream = (date_str, session_id, event)
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Cannot write to closed TickWriter")
+
+            if self._should_time_flush():
+                self._do_flush()
+
+            previous = self._previous.get(stream)
+            removed = None
+            if previous is None or previous[0] != game_id or previous[1] != phase:
+                kind = PAYLOAD_KEYFRAME
+                payload = json.dumps(fields, default=str)
+            else:
+                prev_fields = previous[2]
+                changed = {
+                    k: v for k, v in fields.items() if k not in prev_fields or prev_fields[k] != v
+                }
+                removed = [k for k in prev_fields if k not in fields] or None
+                if changed or removed:
+                    kind = PAYLOAD_DELTA
+                    payload = json.dumps(changed, default=str)
+                else:
+                    kind = PAYLOAD_NONE
+                    payload = None
+            self._previous[stream] = (game_id, phase, fields)
+
+            self._buffers.setdefault(date_str, []).append(
+                {
+                    "ts_ms": ts_ms,
+                    "session_id": session_id,
+                    "seq": seq,
+                    "source": source,
+                    "event": event,
+                    "game_id": game_id,
+                    "tick": typed.get("tick"),
+                    "price": typed.get("price"),
+                    "active": typed.get("active"),
+                    "rugged": typed.get("rugged"),
+                    "cooldown_timer": typed.get("cooldown_timer"),
+                    "phase": phase,
+                    "payload_kind": kind,
+                    "payload": payload,
+                    "removed": removed,
+                }
+            )
+            self._buffer_count += 1
+
+            if self._buffer_count >= self._buffer_size:
+                self._do_flush()
+
+    def flush(self) -> list[Path] | None:
+        """
+        Flush buffered rows to Parquet files.
+
+        Returns:
+            List of written file paths, or None if buffer was empty
+        """
+        with self._lock:
+            if self._closed:
+                return None
+            return self._do_flush()
+
+    def _should_time_flush(self) -> bool:
+        if self._buffer_count == 0:
+            return False
+        return time.time() - self._last_flush_time >= self._flush_interval
+
+    def _do_flush(self) -> list[Path] | None:
+        """Internal flush implementation (must be called with lock held)."""
+        if self._buffer_count == 0:
+            return None
+
+        written: list[Path] = []
+        try:
+            for date_str, rows in self._buffers.items():
+                if rows:
+                    written.append(write_tick_file(self._paths, date_str, rows))
+                    logger.info(f"Wrote {len(rows)} ticks to {written[-1]}")
+        finally:
+            self._buffers.clear()
+            self._buffer_count = 0
+            self._previous.clear()  # Next file starts with keyframes
+            self._last_flush_time = time.time()
+
+        return written or None
+
+    def close(self) -> None:
+        """Close the writer, flushing any remaining rows. Safe to call multiple times."""
+        with self._lock:
+            if self._closed:
+                return
+            if self._buffer_count > 0:
+                try:
+                    self._do_flush()
+                except Exception as e:
+                    logger.error(f"Error flushing ticks on close: {e}")
+            self._closed = True
+
+    def __enter__(self) -> "TickWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+def write_tick_file(paths: EventStorePaths, date_str: str, rows: list[dict[str, Any]]) -> Path:
+    """Write tick rows to a new file in the date partition (atomic rename)."""
+    partition_dir = paths.ticks_parquet_dir / f"date={date_str}"
+    partition_dir.mkdir(parents=True, exist_ok=True)
+
+    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S_%f")
+    filename = f"{timestamp}_{str(uuid.uuid4())[:8]}.parquet"
+    final_path = partition_dir / filename
+    temp_path = partition_dir / f".{filename}.tmp"
+
+    table = pa.Table.from_pylist(rows, schema=TICK_SCHEMA)
+    try:
+        pq.write_table(
+            table,
+            temp_path,
+            compression="zstd",
+            use_dictionary=DICTIONARY_COLUMNS,
+            column_encoding=COLUMN_ENCODING,
+        )
+        temp_path.rename(final_path)
+    except Exception:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return final_path
+
+
+def read_ticks(
+    paths: EventStorePaths,
+    game_id: str | None = None,
+    columns: list[str] | None = None,
+) -> pa.Table:
+    """
+    Read the tick dataset (optionally one game), ordered by session and seq.
+
+    Args:
+        paths: EventStorePaths instance
+        game_id: Only rows for this game
+        columns: Column subset (payload columns are needed for reconstruction)
+    """
+    root = paths.ticks_parquet_dir
+    if not root.exists() or not any(root.rglob("*.parquet")):
+        return TICK_SCHEMA.empty_table()
+
+    dataset = ds.dataset(root, format="parquet", schema=TICK_SCHEMA)
+    filter_expr = ds.field("game_id") == game_id if game_id is not None else None
+    table = dataset.to_table(columns=columns, filter=filter_expr)
+    if {"ts_ms", "seq"} <= set(table.column_names):
+        table = table.sort_by([("ts_ms", "ascending"), ("seq", "ascending")])
+    return table
+
+
+def reconstruct_payloads(table: pa.Table) -> Iterator[tuple[str, dict[str, Any]]]:
+    """
+    Rebuild the original tick payloads from tick rows.
+
+    Rows must be in write order and include each stream's keyframe (as
+    produced by read_ticks() for a whole file, date or game).
+
+    Yields:
+        (event, data) per row
+    """
+    cols = table.to_pydict()
+    states: dict[tuple[str, str], dict[str, Any]] = {}
+
+    for i in range(table.num_rows):
+        event = cols["event"][i]
+        stream = (cols["session_id"][i], event)
+        kind = cols["payload_kind"][i]
+        payload = cols["payload"][i]
+
+        if kind == PAYLOAD_KEYFRAME:
+            state = json.loads(payload) if payload else {}
+        else:
+            state = dict(states.get(stream, {}))
+            for key in cols["removed"][i] or ():
+                state.pop(key, None)
+            if kind == PAYLOAD_DELTA and payload:
+                state.update(json.loads(payload))
+        states[stream] = state
+
+        data = dict(state)
+        for column, key in TYPED_FIELDS.get(event, {}).items():
+            value = cols[column][i]
+            if value is None or key in data:
+                continue
+            if column in ("active", "rugged"):
+                value = bool(value)
+            data[key] = value
+        yield event, data
+
+
+def reconstruct_raw(table: pa.Table) -> list[str]:
+    """
+    Rebuild raw_json strings in the EventEnvelope format.
+
+    gameStateUpdate rows become ws_event raw_json ({"event", "data"});
+    game_tick rows become the tick payload.
+    """
+    raw = []
+    for event, data in reconstruct_payloads(table):
+        if event == "game_tick":
+            raw.append(json.dumps(data))
+        else:
+            raw.append(json.dumps({"event": event, "data": data}))
+    return raw
@@ -41,6 +41,7 @@ from pathlib import Path
 from typing import Any
 
 from services.event_bus import EventBus, Events
+from services.raw_ws_event import RawWsEvent
 
 logger = logging.getLogger(__name__)
 
@@ -235,12 +236,14 @@ class GameHistoryCaptureService:
             return
 
         try:
-            data = wrapped.get("data", wrapped)
-            if not isinstance(data, dict):
+            event = RawWsEvent.from_bus(wrapped)
+            if event is None:
                 return
 
-            event_name = data.get("event")
-            event_data = data.get("data", {})
+            event_name = event.event_name
+            if event_name not in ("gameStateUpdate", "standard/newTrade", "newSideBet"):
+                return  # Skip the payload decode for unrelated events
+            event_data = event.data if event.data is not None else {}
             timestamp = time.time()  # Use current time for pairing detection
 
             # Route to appropriate handler
@@ -0,0 +1,324 @@
+"""
+Latency Trace - Low-overhead stage timing for the capture -> decision -> click path
+
+Every gameStateUpdate starts a trace where it enters the process (the CDP
+interceptor, or WebSocketFeed when running on the fallback feed). Later
+stages stamp the trace with time.perf_counter_ns(), and the time since the
+trace began is recorded in that stage's histogram:
+
+    capture   frame parsed into a RawWsEvent (CDP interceptor)
+    feed      GameSignal built (WebSocketFeed)
+    bus       first EventBus dispatch of an event published during the trace
+    decision  strategy decided (BotController.execute_step)
+    click     button clicked (BrowserExecutor)
+
+Stages that don't carry a trace id stamp the most recent trace, which is
+the tick they are acting on. Each (trace, stage) pair is recorded once, so
+a bot loop that runs twice on the same tick doesn't skew the numbers.
+
+Histograms are HDR-style log-linear buckets (~3% relative error) owned by
+one thread each: recording never takes a lock, and readers merge them on
+export. A stamp costs well under 1µs, so tracing stays on in production.
+
+Export: LatencyTracer.snapshot() (p50/p99/p999 per stage, in µs), the
+GET /api/latency endpoint on FoundationHTTPServer and LatencyParquetDumper.
+"""
+
+import itertools
+import logging
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+STAGE_CAPTURE = "capture"
+STAGE_FEED = "feed"
+STAGE_BUS = "bus"
+STAGE_DECISION = "decision"
+STAGE_CLICK = "click"
+
+# Pipeline order, used to sort exports
+STAGES = (STAGE_CAPTURE, STAGE_FEED, STAGE_BUS, STAGE_DECISION, STAGE_CLICK)
+
+NO_TRACE = -1
+
+# Log-linear buckets: exact below 2**SUB_BUCKET_BITS ns, then 16 sub-buckets
+# per power of two (~3% relative error)
+SUB_BUCKET_BITS = 5
+_HALF_BUCKETS = 1 << (SUB_BUCKET_BITS - 1)
+MAX_EXPONENT = 40  # ~2**45 ns (~10 hours); larger values land in the last bucket
+BUCKET_COUNT = (MAX_EXPONENT + 2) * _HALF_BUCKETS
+
+# Trace start times are kept for the last TRACE_RING_SIZE traces
+TRACE_RING_SIZE = 4096
+_RING_MASK = TRACE_RING_SIZE - 1
+
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+def bucket_index(value_ns: int) -> int:
+    """Histogram bucket for a duration in nanoseconds."""
+    if value_ns < 2 * _HALF_BUCKETS:
+        return value_ns if value_ns > 0 else 0
+    shift = value_ns.bit_length() - SUB_BUCKET_BITS
+    index = (shift << (SUB_BUCKET_BITS - 1)) + (value_ns >> shift)
+    return index if index < BUCKET_COUNT else BUCKET_COUNT - 1
+
+
+def bucket_value(index: int) -> int:
+    """Representative (midpoint) duration in nanoseconds for a bucket."""
+    if index < 2 * _HALF_BUCKETS:
+        return index
+    shift = (index >> (SUB_BUCKET_BITS - 1)) - 1
+    lower = (index - (shift << (SUB_BUCKET_BITS - 1))) << shift
+    return lower + (1 << shift) // 2
+
+
+def percentiles(counts: list[int], quantiles=PERCENTILES) -> dict[float, int]:
+    """Durations (ns) at the given percentiles of a bucket-count list."""
+    total = sum(counts)
+    result = dict.fromkeys(quantiles, 0)
+    if not total:
+        return result
+
+    targets = sorted((max(1, -(-total * q // 100)), q) for q in quantiles)
+    seen = 0
+    pending = iter(targets)
+    target, q = next(pending)
+    for index, count in enumerate(counts):
+        if not count:
+            continue
+        seen += count
+        while seen >= target:
+            result[q] = bucket_value(index)
+            try:
+                target, q = next(pending)
+            except StopIteration:
+                return result
+    return result
+
+
+class LatencyTracer:
+    """
+    Per-stage latency histograms keyed off per-event traces.
+
+    begin() and stamp() are safe to call from any thread. Histograms are
+    per (thread, stage) and written only by their owning thread; snapshot()
+    and reset() read them without locking, so a concurrent export may miss
+    a sample in flight.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._next_id = itertools.count()
+        self._ring_ids = [NO_TRACE] * TRACE_RING_SIZE
+        self._ring_starts = [0] * TRACE_RING_SIZE
+        self._last_trace = NO_TRACE
+        # stage -> last trace id recorded (first stamp per trace wins)
+        self._stamped: dict[str, int] = {}
+
+        self._local = threading.local()
+        self._registry_lock = threading.Lock()
+        self._registry: list[tuple[str, list[int]]] = []
+
+    # ========== Recording (hot path) ==========
+
+    def begin(self, start_ns: int | None = None) -> int:
+        """
+        Start a trace for one event.
+
+        Args:
+            start_ns: perf_counter_ns() when the event arrived (default: now)
+
+        Returns:
+            Trace id (NO_TRACE when disabled)
+        """
+        if not self.enabled:
+            return NO_TRACE
+        trace_id = next(self._next_id)
+        slot = trace_id & _RING_MASK
+        self._ring_starts[slot] = start_ns if start_ns is not None else time.perf_counter_ns()
+        self._ring_ids[slot] = trace_id
+        self._last_trace = trace_id
+        return trace_id
+
+    def current(self) -> int:
+        """Id of the most recently started trace (NO_TRACE if none)."""
+        return self._last_trace if self.enabled else NO_TRACE
+
+    def stamp(self, stage: str, trace_id: int = NO_TRACE) -> None:
+        """
+        Record time since the trace began for a stage.
+
+        Args:
+            stage: Stage name (one of STAGES, or any custom name)
+            trace_id: Trace to stamp (default: the most recent trace)
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter_ns()
+        if trace_id < 0:
+            trace_id = self._last_trace
+            if trace_id < 0:
+                return
+        slot = trace_id & _RING_MASK
+        if self._ring_ids[slot] != trace_id:
+            return  # Trace aged out of the ring
+        stamped = self._stamped
+        if stamped.get(stage) == trace_id:
+            return
+        stamped[stage] = trace_id
+        self._record(stage, now - self._ring_starts[slot])
+
+    def record(self, stage: str, duration_ns: int) -> None:
+        """Record a duration measured by the caller."""
+        if self.enabled:
+            self._record(stage, duration_ns)
+
+    def _record(self, stage: str, duration_ns: int) -> None:
+        try:
+            counts = self._local.histograms[stage]
+        except (AttributeError, KeyError):
+            counts = self._thread_histogram(stage)
+        # bucket_index(), inlined: this is the hot path
+        if duration_ns < 2 * _HALF_BUCKETS:
+            index = duration_ns if duration_ns > 0 else 0
+        else:
+            shift = duration_ns.bit_length() - SUB_BUCKET_BITS
+            index = (shift << (SUB_BUCKET_BITS - 1)) + (duration_ns >> shift)
+            if index >= BUCKET_COUNT:
+                index = BUCKET_COUNT - 1
+        counts[index] += 1
+
+    def _thread_histogram(self, stage: str) -> list[int]:
+        histograms = getattr(self._local, "histograms", None)
+        if histograms is None:
+            histograms = self._local.histograms = {}
+        counts = histograms[stage] = [0] * BUCKET_COUNT
+        with self._registry_lock:
+            self._registry.append((stage, counts))
+        return counts
+
+    # ========== Export ==========
+
+    def histogram(self, stage: str) -> list[int]:
+        """Bucket counts for a stage, merged across threads."""
+        merged = [0] * BUCKET_COUNT
+        with self._registry_lock:
+            registry = list(self._registry)
+        for name, counts in registry:
+            if name == stage:
+                merged = [a + b for a, b in zip(merged, counts, strict=True)]
+        return merged
+
+    def stages(self) -> list[str]:
+        """Stages with recorded samples, in pipeline order."""
+        with self._registry_lock:
+            names = {name for name, counts in self._registry if any(counts)}
+        order = {stage: i for i, stage in enumerate(STAGES)}
+        return sorted(names, key=lambda name: (order.get(name, len(order)), name))
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        Per-stage summary, in microseconds.
+
+        Returns:
+            {stage: {"count", "p50_us", "p90_us", "p99_us", "p999_us", "max_us"}}
+        """
+        result = {}
+        for stage in self.stages():
+            counts = self.histogram(stage)
+            pcts = percentiles(counts)
+            top = max((i for i, count in enumerate(counts) if count), default=0)
+            result[stage] = {
+                "count": sum(counts),
+                "p50_us": pcts[50.0] / 1000,
+                "p90_us": pcts[90.0] / 1000,
+                "p99_us": pcts[99.0] / 1000,
+                "p999_us": pcts[99.9] / 1000,
+                "max_us": bucket_value(top) / 1000,
+            }
+        return result
+
+    def reset(self) -> None:
+        """Zero all histograms (samples recorded concurrently may be lost)."""
+        with self._registry_lock:
+            for _, counts in self._registry:
+                counts[:] = [0] * BUCKET_COUNT
+        self._stamped.clear()
+
+
+class LatencyParquetDumper:
+    """
+    Periodically writes LatencyTracer.snapshot() to Parquet.
+
+    One file per interval (latency_YYYYmmdd_HHMMSS.parquet), one row per
+    stage. Requires pyarrow.
+    """
+
+    def __init__(
+        self,
+        tracer: LatencyTracer,
+        directory: Path,
+        interval: float = 60.0,
+        reset_after_dump: bool = False,
+    ):
+        self.tracer = tracer
+        self.directory = Path(directory)
+        self.interval = interval
+        self.reset_after_dump = reset_after_dump
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def dump(self) -> Path | None:
+        """Write one snapshot now. Returns the file path, or None if nothing recorded."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        snapshot = self.tracer.snapshot()
+        if not snapshot:
+            return None
+        if self.reset_after_dump:
+            self.tracer.reset()
+
+        now = datetime.now()
+        rows = [{"ts": now, "stage": stage, **stats} for stage, stats in snapshot.items()]
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"latency_{now:%Y%m%d_%H%M%S}.parquet"
+        pq.write_table(pa.Table.from_pylist(rows), path)
+        return path
+
+    def start(self) -> None:
+        """Start dumping on a daemon thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="LatencyDumper")
+        self._thread.start()
+        logger.info(f"Latency dumps every {self.interval}s to {self.directory}")
+
+    def stop(self, final_dump: bool = True) -> None:
+        """Stop the thread (optionally writing one last dump)."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        if final_dump:
+            self._dump_safely()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._dump_safely()
+
+    def _dump_safely(self) -> None:
+        try:
+            self.dump()
+        except Exception as e:
+            logger.error(f"Latency dump failed: {e}")
+
+
+# Global instance
+latency_tracer = LatencyTracer()
@@ -28,9 +28,29 @@ from decimal import Decimal
 from typing import Any
 
 from services.event_bus import EventBus, Events
+from services.pnl_ledger import PnLLedger, PnLSnapshot
+from services.raw_ws_event import RawWsEvent
+from utils.decimal_utils import SOL_PRECISION
+from utils.fixed_point import (
+    NUMERIC_MODE_DECIMAL,
+    NUMERIC_MODE_FIXED,
+    NUMERIC_MODES,
+    PRICE_DECIMALS,
+    fixed_to_decimal,
+    to_fixed,
+)
 
 logger = logging.getLogger(__name__)
 
+# Per-tick fields kept as scaled integers in fixed numeric mode (decimal places)
+FIXED_TICK_FIELDS = {
+    "current_multiplier": PRICE_DECIMALS,
+    "rugpool_amount": SOL_PRECISION,
+    "rugpool_threshold": SOL_PRECISION,
+    "average_multiplier": PRICE_DECIMALS,
+    "highest_today": PRICE_DECIMALS,
+}
+
 
 @dataclass
 class LiveState:
@@ -71,6 +91,10 @@ class LiveState:
     # Update tracking
     last_update_seq: int = 0
 
+    # Fixed numeric mode: FIXED_TICK_FIELDS values as scaled integers
+    # (the Decimal fields above keep their defaults until read)
+    fixed: dict[str, int] = field(default_factory=dict)
+
 
 class LiveStateProvider:
     """
@@ -82,22 +106,37 @@ class LiveStateProvider:
     - GAME_TICK: Track current price/tick from server
     - WS_RAW_EVENT: Capture rugpool and session stats from gameStateUpdate
 
-    Thread-safe: All state access is protected by lock.
+    Thread-safe: All state writes are protected by lock. P&L/exposure are
+    maintained incrementally by a PnLLedger, and get_snapshot() returns a
+    snapshot cached until the next event, so polling readers don't lock.
     """
 
-    def __init__(self, event_bus: EventBus):
+    def __init__(self, event_bus: EventBus, numeric_mode: str = NUMERIC_MODE_DECIMAL):
         """
         Initialize LiveStateProvider.
 
         Args:
             event_bus: EventBus instance to subscribe to
+            numeric_mode: "decimal", or "fixed" to store per-tick fields
+                (multiplier, rugpool, session stats) as scaled integers and
+                convert to Decimal only when read. Player state (cash,
+                position) is always Decimal.
         """
+        if numeric_mode not in NUMERIC_MODES:
+            raise ValueError(f"Invalid numeric_mode '{numeric_mode}'. Valid: {NUMERIC_MODES}")
+        self._fixed_mode = numeric_mode == NUMERIC_MODE_FIXED
         self._event_bus = event_bus
         self._state = LiveState()
         self._connected = False
         self._source = "unknown"  # "cdp", "public_ws", "replay"
         self._lock = threading.RLock()
 
+        # Incremental accounting (realized trades from cumulativePnL deltas)
+        self._ledger = PnLLedger()
+        self._last_cumulative_pnl: Decimal | None = None
+        # get_snapshot() cache, cleared by every event handler
+        self._snapshot: dict[str, Any] | None = None
+
         # Subscribe to relevant events
         self._event_bus.subscribe(Events.PLAYER_UPDATE, self._on_player_update, weak=False)
         self._event_bus.subscribe(Events.WS_SOURCE_CHANGED, self._on_source_changed, weak=False)
@@ -184,7 +223,7 @@ class LiveStateProvider:
     def current_multiplier(self) -> Decimal:
         """Current price multiplier."""
         with self._lock:
-            return self._state.current_multiplier
+            return self._tick_value("current_multiplier")
 
     # ========== Position Timing Properties (for RL training) ==========
 
@@ -214,21 +253,21 @@ class LiveStateProvider:
     def rugpool_amount(self) -> Decimal:
         """Current rugpool amount in SOL."""
         with self._lock:
-            return self._state.rugpool_amount
+            return self._tick_value("rugpool_amount")
 
     @property
     def rugpool_threshold(self) -> Decimal:
         """Rugpool threshold (instarug trigger level)."""
         with self._lock:
-            return self._state.rugpool_threshold
+            return self._tick_value("rugpool_threshold")
 
     @property
     def rugpool_ratio(self) -> Decimal:
         """Rugpool ratio (amount / threshold). Higher = more risk."""
         with self._lock:
-            if self._state.rugpool_threshold <= Decimal("0"):
+            if self._tick_value("rugpool_threshold") <= Decimal("0"):
                 return Decimal("0")
-            return self._state.rugpool_amount / self._state.rugpool_threshold
+            return self._tick_value("rugpool_amount") / self._tick_value("rugpool_threshold")
 
     # ========== Session Stats Properties (from gameStateUpdate) ==========
 
@@ -236,7 +275,7 @@ class LiveStateProvider:
     def average_multiplier(self) -> Decimal:
         """Session average multiplier."""
         with self._lock:
-            return self._state.average_multiplier
+            return self._tick_value("average_multiplier")
 
     @property
     def count_2x(self) -> int:
@@ -266,7 +305,7 @@ class LiveStateProvider:
     def highest_today(self) -> Decimal:
         """Highest multiplier reached today."""
         with self._lock:
-            return self._state.highest_today
+            return self._tick_value("highest_today")
 
     # ========== Computed Properties ==========
 
@@ -279,27 +318,71 @@ class LiveStateProvider:
     @property
     def unrealized_pnl(self) -> Decimal:
         """
-        Calculate unrealized P&L based on current position and price.
+        Unrealized P&L of the open position (lock-free, from the ledger).
 
         P&L = (current_price - avg_cost) * position_qty
         """
-        with self._lock:
-            if self._state.position_qty <= Decimal("0"):
-                return Decimal("0")
+        return self._ledger.snapshot.unrealized_pnl
 
-            if self._state.avg_cost <= Decimal("0"):
-                return Decimal("0")
+    @property
+    def position_value(self) -> Decimal:
+        """Current value of open position at market price (lock-free)."""
+        return self._ledger.snapshot.exposure
 
-            # P&L = (current_multiplier - avg_cost) * position_qty
-            return (
-                self._state.current_multiplier - self._state.avg_cost
-            ) * self._state.position_qty
+    @property
+    def pnl_snapshot(self) -> PnLSnapshot:
+        """
+        Session accounting: realized/unrealized P&L, exposure, win rate,
+        drawdown and per-game summaries (immutable, lock-free).
+        """
+        return self._ledger.snapshot
+
+    # ========== Fixed-Point Properties (analytics, no Decimal) ==========
 
     @property
-    def position_value(self) -> Decimal:
-        """Current value of open position at market price."""
+    def current_multiplier_fp(self) -> int:
+        """Current price multiplier, 10**8 fixed point."""
         with self._lock:
-            return self._state.position_qty * self._state.current_multiplier
+            return self._tick_fixed("current_multiplier")
+
+    @property
+    def rugpool_amount_lamports(self) -> int:
+        """Current rugpool amount in lamports."""
+        with self._lock:
+            return self._tick_fixed("rugpool_amount")
+
+    @property
+    def rugpool_threshold_lamports(self) -> int:
+        """Rugpool threshold in lamports."""
+        with self._lock:
+            return self._tick_fixed("rugpool_threshold")
+
+    def _set_tick_value(self, name: str, raw: Any) -> None:
+        """Store a per-tick field (scaled integer in fixed mode). Caller holds the lock."""
+        if self._fixed_mode:
+            self._state.fixed[name] = to_fixed(raw, FIXED_TICK_FIELDS[name])
+        else:
+            setattr(self._state, name, Decimal(str(raw)))
+
+    def _tick_value(self, name: str) -> Decimal:
+        """Per-tick field as Decimal. Caller holds the lock."""
+        value = self._state.fixed.get(name)
+        if value is None:
+            return getattr(self._state, name)
+        return fixed_to_decimal(value, FIXED_TICK_FIELDS[name])
+
+    def _mark_position(self) -> None:
+        """Mark the ledger to the current price. Caller holds the lock."""
+        # Flat: nothing to revalue (skips the Decimal conversion in fixed mode)
+        if self._state.position_qty > Decimal("0"):
+            self._ledger.mark(self._tick_value("current_multiplier"))
+
+    def _tick_fixed(self, name: str) -> int:
+        """Per-tick field as a scaled integer. Caller holds the lock."""
+        value = self._state.fixed.get(name)
+        if value is None:
+            return to_fixed(getattr(self._state, name), FIXED_TICK_FIELDS[name])
+        return value
 
     # ========== State Snapshot ==========
 
@@ -307,11 +390,19 @@ class LiveStateProvider:
         """
         Get a complete snapshot of live state.
 
+        Built at most once per event and cached; repeated polls return the
+        cached dict without locking (treat it as read-only).
+
         Returns:
             Dict with all current state values
         """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+
         with self._lock:
-            return {
+            pnl = self._ledger.snapshot
+            snapshot = {
                 "connected": self._connected,
                 "source": self._source,
                 "is_live": self._source in ("cdp", "public_ws"),
@@ -324,25 +415,31 @@ class LiveStateProvider:
                 "username": self._state.username,
                 "game_id": self._state.game_id,
                 "current_tick": self._state.current_tick,
-                "current_multiplier": self._state.current_multiplier,
-                "unrealized_pnl": self.unrealized_pnl,
-                "position_value": self.position_value,
+                "current_multiplier": self._tick_value("current_multiplier"),
+                "unrealized_pnl": pnl.unrealized_pnl,
+                "position_value": pnl.exposure,
                 "last_update_seq": self._state.last_update_seq,
                 # Position timing for RL training (time_in_position feature)
                 "entry_tick": self._state.entry_tick,
                 "time_in_position": self.time_in_position,
                 # Rugpool fields for instarug risk prediction
-                "rugpool_amount": self._state.rugpool_amount,
-                "rugpool_threshold": self._state.rugpool_threshold,
+                "rugpool_amount": self._tick_value("rugpool_amount"),
+                "rugpool_threshold": self._tick_value("rugpool_threshold"),
                 "rugpool_ratio": self.rugpool_ratio,
                 # Session statistics for RL training context
-                "average_multiplier": self._state.average_multiplier,
+                "average_multiplier": self._tick_value("average_multiplier"),
                 "count_2x": self._state.count_2x,
                 "count_10x": self._state.count_10x,
                 "count_50x": self._state.count_50x,
                 "count_100x": self._state.count_100x,
-                "highest_today": self._state.highest_today,
+                "highest_today": self._tick_value("highest_today"),
+                # Session accounting (PnLLedger)
+                "realized_pnl": pnl.realized_pnl,
+                "win_rate": pnl.win_rate,
+                "max_drawdown": pnl.max_drawdown,
             }
+            self._snapshot = snapshot
+            return snapshot
 
     # ========== Event Handlers ==========
 
@@ -403,7 +500,9 @@ class LiveStateProvider:
                         )
 
                     # Detect position CLOSED: non-zero → 0
-                    elif old_position_qty > Decimal("0") and self._state.position_qty <= Decimal("0"):
+                    elif old_position_qty > Decimal("0") and self._state.position_qty <= Decimal(
+                        "0"
+                    ):
                         logger.debug(
                             f"Position closed, was open since tick {self._state.entry_tick}"
                         )
@@ -413,8 +512,14 @@ class LiveStateProvider:
                     self._state.avg_cost = Decimal(str(data["avgCost"]))
 
                 # Update P&L tracking
+                realized = None
                 if data.get("cumulativePnL") is not None:
                     self._state.cumulative_pnl = Decimal(str(data["cumulativePnL"]))
+                    # A cumulativePnL change is a realized trade (first update is the baseline)
+                    last = self._last_cumulative_pnl
+                    if last is not None and self._state.cumulative_pnl != last:
+                        realized = self._state.cumulative_pnl - last
+                    self._last_cumulative_pnl = self._state.cumulative_pnl
 
                 if data.get("totalInvested") is not None:
                     self._state.total_invested = Decimal(str(data["totalInvested"]))
@@ -429,8 +534,18 @@ class LiveStateProvider:
                 if data.get("gameId") is not None:
                     self._state.game_id = data["gameId"]
 
+                if realized is not None:
+                    self._ledger.record_trade(realized, game_id=self._state.game_id)
+                self._ledger.update_account(
+                    balance=self._state.cash,
+                    position_qty=self._state.position_qty,
+                    avg_cost=self._state.avg_cost,
+                    mark_price=self._tick_value("current_multiplier"),
+                )
+
                 # Track update sequence
                 self._state.last_update_seq += 1
+                self._snapshot = None
 
                 # Mark as connected if we got valid data
                 if not self._connected:
@@ -465,6 +580,7 @@ class LiveStateProvider:
             with self._lock:
                 old_source = self._source
                 self._source = new_source
+                self._snapshot = None
 
                 # Reset connection state on source change
                 if new_source != old_source:
@@ -489,11 +605,13 @@ class LiveStateProvider:
                 return
 
             with self._lock:
+                self._snapshot = None
                 tick_value = data.get("tick")
                 if tick_value is not None and hasattr(tick_value, "tick"):
                     self._state.current_tick = tick_value.tick
-                    self._state.current_multiplier = Decimal(str(tick_value.price))
+                    self._set_tick_value("current_multiplier", tick_value.price)
                     self._state.game_id = tick_value.game_id
+                    self._mark_position()
                     return
 
                 # Update tick
@@ -502,9 +620,10 @@ class LiveStateProvider:
 
                 # Update multiplier/price
                 if "multiplier" in data:
-                    self._state.current_multiplier = Decimal(str(data["multiplier"]))
+                    self._set_tick_value("current_multiplier", data["multiplier"])
                 elif "price" in data:
-                    self._state.current_multiplier = Decimal(str(data["price"]))
+                    self._set_tick_value("current_multiplier", data["price"])
+                self._mark_position()
 
                 # Update game ID
                 if "gameId" in data:
@@ -520,53 +639,53 @@ class LiveStateProvider:
         Extracts rugpool and session stats from gameStateUpdate events.
         """
         try:
-            data = wrapped.get("data", wrapped)
-            if not isinstance(data, dict):
-                return
-
             # Only process gameStateUpdate events
-            event_name = data.get("event")
-            if event_name != "gameStateUpdate":
+            event = RawWsEvent.from_bus(wrapped)
+            if event is None or event.event_name != "gameStateUpdate":
                 return
 
-            event_data = data.get("data", {})
+            event_data = event.data
             if not isinstance(event_data, dict):
                 return
 
             with self._lock:
+                self._snapshot = None
                 # Detect game_id change (new game starts) → reset entry_tick
                 old_game_id = self._state.game_id
 
-                # Extract tick/price/game_id from gameStateUpdate
-                # NOTE: Field is "tickCount" not "tick" in rugs.fun WebSocket events
-                if "tickCount" in event_data:
-                    self._state.current_tick = int(event_data["tickCount"])
-                if "multiplier" in event_data:
-                    self._state.current_multiplier = Decimal(str(event_data["multiplier"]))
-                elif "price" in event_data:
-                    self._state.current_multiplier = Decimal(str(event_data["price"]))
-                if "gameId" in event_data:
-                    self._state.game_id = event_data["gameId"]
+                # Tick/price/game_id are extracted once by RawWsEvent
+                # (tickCount, multiplier falling back to price, gameId)
+                if event.tick is not None:
+                    self._state.current_tick = event.tick
+                if event.price is not None:
+                    if self._fixed_mode:
+                        self._set_tick_value("current_multiplier", event.price)
+                    else:
+                        self._state.current_multiplier = event.price_decimal
+                    self._mark_position()
+                if event.game_id is not None:
+                    self._state.game_id = event.game_id
 
                     # Reset entry_tick on new game (positions don't carry over)
-                    if old_game_id is not None and event_data["gameId"] != old_game_id:
+                    if old_game_id is not None and event.game_id != old_game_id:
                         logger.debug(
-                            f"New game detected: {old_game_id} → {event_data['gameId']}, "
+                            f"New game detected: {old_game_id} → {event.game_id}, "
                             f"resetting entry_tick"
                         )
                         self._state.entry_tick = None
+                        self._ledger.start_game(event.game_id)
 
                 # Extract rugpool fields
                 rugpool = event_data.get("rugpool")
                 if isinstance(rugpool, dict):
                     if "rugpoolAmount" in rugpool:
-                        self._state.rugpool_amount = Decimal(str(rugpool["rugpoolAmount"]))
+                        self._set_tick_value("rugpool_amount", rugpool["rugpoolAmount"])
                     if "threshold" in rugpool:
-                        self._state.rugpool_threshold = Decimal(str(rugpool["threshold"]))
+                        self._set_tick_value("rugpool_threshold", rugpool["threshold"])
 
                 # Extract session stats (at top level of gameStateUpdate, not nested)
                 if "averageMultiplier" in event_data:
-                    self._state.average_multiplier = Decimal(str(event_data["averageMultiplier"]))
+                    self._set_tick_value("average_multiplier", event_data["averageMultiplier"])
                 if "count2x" in event_data:
                     self._state.count_2x = int(event_data["count2x"])
                 if "count10x" in event_data:
@@ -576,7 +695,7 @@ class LiveStateProvider:
                 if "count100x" in event_data:
                     self._state.count_100x = int(event_data["count100x"])
                 if "highestToday" in event_data:
-                    self._state.highest_today = Decimal(str(event_data["highestToday"]))
+                    self._set_tick_value("highest_today", event_data["highestToday"])
 
         except Exception as e:
             logger.error(f"Error handling WS_RAW_EVENT: {e}")
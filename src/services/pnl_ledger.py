@@ -0,0 +1,311 @@
+"""
+PnL Ledger - Incremental P&L and position accounting
+
+Maintains running aggregates (realized/unrealized P&L, exposure, win rate,
+drawdown, per-game summaries) as account, trade and price events arrive,
+instead of recomputing them from raw fields or walking trade history on
+every read.
+
+Every update publishes a new immutable PnLSnapshot by replacing a single
+reference, so readers (UI polling, status endpoints) just read
+`ledger.snapshot`: no lock, O(1) regardless of session length. Writers are
+serialized by the ledger's own lock.
+
+Usage:
+    ledger = PnLLedger(initial_balance=Decimal("0.1"))
+    ledger.update_account(balance=cash, position_qty=qty, avg_cost=avg)
+    ledger.mark(price)
+    ledger.record_trade(Decimal("0.002"), game_id="game-1")
+
+    snap = ledger.snapshot
+    snap.unrealized_pnl, snap.win_rate, snap.max_drawdown
+"""
+
+import threading
+from collections import deque
+from decimal import Decimal
+from typing import Any, NamedTuple
+
+MAX_GAME_SUMMARIES = 100  # Completed games kept in snapshots
+
+_ZERO = Decimal("0")
+
+
+class GameSummary(NamedTuple):
+    """Realized results of a single game."""
+
+    game_id: str | None
+    trades: int = 0
+    wins: int = 0
+    losses: int = 0
+    realized_pnl: Decimal = _ZERO
+    sidebets_won: int = 0
+    sidebets_lost: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return self._asdict()
+
+
+class PnLSnapshot(NamedTuple):
+    """
+    Immutable accounting state published by PnLLedger.
+
+    A NamedTuple rather than a frozen dataclass: mark() publishes one per
+    tick while a position is open, and tuple construction is ~5x cheaper.
+    """
+
+    version: int = 0
+    # Position fields (republished by every mark; keep them first)
+    balance: Decimal = _ZERO
+    position_qty: Decimal = _ZERO
+    avg_cost: Decimal = _ZERO
+    unrealized_pnl: Decimal = _ZERO
+    exposure: Decimal = _ZERO  # Position value at the mark price
+    equity: Decimal = _ZERO  # Balance + exposure
+    peak_equity: Decimal = _ZERO
+    max_drawdown: Decimal = _ZERO  # Fraction of peak equity
+    # Realized totals (change only on trades and game rollover)
+    realized_pnl: Decimal = _ZERO
+    trades: int = 0
+    wins: int = 0
+    losses: int = 0
+    gross_profit: Decimal = _ZERO
+    gross_loss: Decimal = _ZERO  # Positive magnitude
+    sidebets_won: int = 0
+    sidebets_lost: int = 0
+    current_game: GameSummary | None = None
+    games: tuple[GameSummary, ...] = ()  # Completed games, oldest first
+
+    @property
+    def total_pnl(self) -> Decimal:
+        """Realized plus unrealized P&L."""
+        return self.realized_pnl + self.unrealized_pnl
+
+    @property
+    def win_rate(self) -> Decimal:
+        """Winning fraction of realized trades."""
+        return Decimal(self.wins) / Decimal(self.trades) if self.trades else _ZERO
+
+    @property
+    def average_win(self) -> Decimal:
+        return self.gross_profit / self.wins if self.wins else _ZERO
+
+    @property
+    def average_loss(self) -> Decimal:
+        return self.gross_loss / self.losses if self.losses else _ZERO
+
+    def to_dict(self) -> dict[str, Any]:
+        """Plain dict including derived metrics (Decimals kept)."""
+        result = self._asdict()
+        result.update(
+            total_pnl=self.total_pnl,
+            win_rate=self.win_rate,
+            average_win=self.average_win,
+            average_loss=self.average_loss,
+            current_game=self.current_game.to_dict() if self.current_game else None,
+            games=[game.to_dict() for game in self.games],
+        )
+        return result
+
+
+# Index of the first realized-totals field (see _publish_position)
+_TOTALS_START = PnLSnapshot._fields.index("realized_pnl")
+
+
+class PnLLedger:
+    """
+    Incremental accounting engine with lock-free snapshot reads.
+
+    Writers (update_account, mark, record_trade, ...) update running
+    totals and publish a new PnLSnapshot; readers use `snapshot`.
+    """
+
+    def __init__(self, initial_balance: Decimal = _ZERO, max_games: int = MAX_GAME_SUMMARIES):
+        """
+        Initialize PnLLedger.
+
+        Args:
+            initial_balance: Starting balance (drawdown peak baseline)
+            max_games: Completed per-game summaries kept in snapshots
+        """
+        self._lock = threading.Lock()
+        self._mark_price = _ZERO
+        self._games: deque[GameSummary] = deque(maxlen=max_games)
+        self._games_changed = False
+        self._snapshot = self._initial_snapshot(0, initial_balance)
+
+    @staticmethod
+    def _initial_snapshot(version: int, balance: Decimal) -> PnLSnapshot:
+        return PnLSnapshot(version=version, balance=balance, equity=balance, peak_equity=balance)
+
+    @property
+    def snapshot(self) -> PnLSnapshot:
+        """Latest published snapshot (lock-free)."""
+        return self._snapshot
+
+    # ========== Writers ==========
+
+    def update_account(
+        self,
+        *,
+        balance: Decimal | None = None,
+        position_qty: Decimal | None = None,
+        avg_cost: Decimal | None = None,
+        mark_price: Decimal | None = None,
+    ) -> None:
+        """
+        Apply authoritative account fields (None leaves a field unchanged).
+
+        Args:
+            balance: Cash balance
+            position_qty: Open position size
+            avg_cost: Average entry price of the position
+            mark_price: Current price, if it changed with the account
+        """
+        with self._lock:
+            snap = self._snapshot
+            if mark_price is not None:
+                self._mark_price = mark_price
+            self._publish_position(
+                snap,
+                snap.balance if balance is None else balance,
+                snap.position_qty if position_qty is None else position_qty,
+                snap.avg_cost if avg_cost is None else avg_cost,
+            )
+
+    def mark(self, price: Decimal) -> None:
+        """
+        Mark the open position to a new price.
+
+        Nothing is republished while flat (no derived value changes), so
+        this is cheap to call every tick.
+        """
+        with self._lock:
+            self._mark_price = price
+            snap = self._snapshot
+            if snap.position_qty > _ZERO:
+                self._publish_position(snap, snap.balance, snap.position_qty, snap.avg_cost)
+
+    def record_trade(self, pnl: Decimal, game_id: str | None = None) -> None:
+        """
+        Record a realized trade (full or partial close).
+
+        Args:
+            pnl: Realized P&L of the trade (> 0 counts as a win)
+            game_id: Game the trade belongs to (rolls the current game over)
+        """
+        with self._lock:
+            snap = self._snapshot
+            won = pnl > _ZERO
+            game = self._game_for(snap, game_id)
+            game = game._replace(
+                trades=game.trades + 1,
+                wins=game.wins + won,
+                losses=game.losses + (not won),
+                realized_pnl=game.realized_pnl + pnl,
+            )
+            self._publish(
+                snap,
+                realized_pnl=snap.realized_pnl + pnl,
+                trades=snap.trades + 1,
+                wins=snap.wins + won,
+                losses=snap.losses + (not won),
+                gross_profit=snap.gross_profit + pnl if won else snap.gross_profit,
+                gross_loss=snap.gross_loss if won else snap.gross_loss - pnl,
+                current_game=game,
+            )
+
+    def record_sidebet(self, won: bool, pnl: Decimal, game_id: str | None = None) -> None:
+        """
+        Record a resolved sidebet.
+
+        Args:
+            won: Whether the sidebet paid out
+            pnl: Net result (payout minus stake, or minus the stake)
+            game_id: Game the sidebet belongs to
+        """
+        with self._lock:
+            snap = self._snapshot
+            game = self._game_for(snap, game_id)
+            game = game._replace(
+                realized_pnl=game.realized_pnl + pnl,
+                sidebets_won=game.sidebets_won + won,
+                sidebets_lost=game.sidebets_lost + (not won),
+            )
+            self._publish(
+                snap,
+                realized_pnl=snap.realized_pnl + pnl,
+                sidebets_won=snap.sidebets_won + won,
+                sidebets_lost=snap.sidebets_lost + (not won),
+                current_game=game,
+            )
+
+    def start_game(self, game_id: str | None) -> None:
+        """Close the current game summary if game_id starts a different game."""
+        with self._lock:
+            snap = self._snapshot
+            if snap.current_game is not None and snap.current_game.game_id != game_id:
+                self._roll_game(snap.current_game)
+                self._publish(snap, current_game=None)
+
+    def reset(self, initial_balance: Decimal | None = None) -> None:
+        """Start a new session (keeps the current balance by default)."""
+        with self._lock:
+            snap = self._snapshot
+            balance = snap.balance if initial_balance is None else initial_balance
+            self._games.clear()
+            self._games_changed = False
+            self._snapshot = self._initial_snapshot(snap.version + 1, balance)
+
+    # ========== Internals (lock held) ==========
+
+    def _game_for(self, snap: PnLSnapshot, game_id: str | None) -> GameSummary:
+        """Current game summary for game_id, rolling the previous one over."""
+        current = snap.current_game
+        if current is None:
+            return GameSummary(game_id=game_id)
+        if game_id is not None and current.game_id != game_id:
+            self._roll_game(current)
+            return GameSummary(game_id=game_id)
+        return current
+
+    def _roll_game(self, game: GameSummary) -> None:
+        self._games.append(game)
+        self._games_changed = True
+
+    def _publish_position(
+        self, snap: PnLSnapshot, balance: Decimal, qty: Decimal, avg_cost: Decimal
+    ) -> None:
+        if qty > _ZERO:
+            exposure = qty * self._mark_price
+            unrealized = (self._mark_price - avg_cost) * qty if avg_cost > _ZERO else _ZERO
+        else:
+            exposure = unrealized = _ZERO
+
+        equity = balance + exposure
+        peak = snap.peak_equity
+        drawdown = snap.max_drawdown
+        if equity > peak:
+            peak = equity
+        elif peak > _ZERO:
+            drawdown = max(drawdown, (peak - equity) / peak)
+
+        # Positional build: the realized totals are carried over as-is
+        self._snapshot = PnLSnapshot(
+            snap.version + 1,
+            balance,
+            qty,
+            avg_cost,
+            unrealized,
+            exposure,
+            equity,
+            peak,
+            drawdown,
+            *snap[_TOTALS_START:],
+        )
+
+    def _publish(self, snap: PnLSnapshot, **changes: Any) -> None:
+        if self._games_changed:
+            changes["games"] = tuple(self._games)
+            self._games_changed = False
+        self._snapshot = snap._replace(version=snap.version + 1, **changes)
@@ -12,6 +12,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from services.raw_ws_event import RawWsEvent
+
 logger = logging.getLogger(__name__)
 
 # Known event types (documented in WEBSOCKET_EVENTS_SPEC.md)
@@ -121,19 +123,21 @@ class RAGIngester:
             logger.info(f"RAG capture session started: {self.current_session}")
             return self.current_session
 
-    def catalog(self, event: dict[str, Any]):
+    def catalog(self, event: RawWsEvent | dict[str, Any]):
         """
         Catalog an event for RAG indexing.
 
         Args:
-            event: Event dict with 'event', 'data', 'timestamp', 'direction'
+            event: RawWsEvent (or legacy dict with 'event', 'data', 'timestamp', 'direction')
         """
         if not self._file_handle:
             return
 
+        event = RawWsEvent.from_bus(event) or RawWsEvent("unknown")
+
         with self._lock:
             self.sequence_number += 1
-            event_type = event.get("event", "unknown")
+            event_type = event.event_name or "unknown"
 
             # Track counts
             self.event_counts[event_type] = self.event_counts.get(event_type, 0) + 1
@@ -144,18 +148,26 @@ class RAGIngester:
                     self.novel_events.add(event_type)
                     logger.info(f"🆕 Novel event type discovered: {event_type}")
 
-            # Build record (compatible with event_chunker.py)
+            # Build record (compatible with event_chunker.py); data is
+            # appended last through a fixed envelope
             record = {
                 "seq": self.sequence_number,
-                "ts": event.get("timestamp", datetime.now().isoformat()),
+                "ts": event.timestamp or datetime.now().isoformat(),
                 "event": event_type,
-                "data": event.get("data"),
                 "source": "cdp_intercept",
-                "direction": event.get("direction", "received"),
+                "direction": event.direction or "received",
             }
 
             try:
-                json_line = json.dumps(record, default=str)
+                # One decode validates the original data text and trims any
+                # trailing ack arguments; it is written as-is rather than
+                # re-serialized (the decoded value stays cached on the event)
+                data = event.data
+                if data is not None and event.raw_data is not None:
+                    data_text = event.raw_data
+                else:
+                    data_text = json.dumps(data, default=str)
+                json_line = f'{json.dumps(record, default=str)[:-1]}, "data": {data_text}}}'
                 self._file_handle.write(json_line + "\n")
                 self._file_handle.flush()
             except Exception as e:
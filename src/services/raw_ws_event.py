@@ -0,0 +1,240 @@
+"""
+RawWsEvent - Parse-once, immutable WebSocket frame shared by all subscribers.
+
+Every WS_RAW_EVENT subscriber used to unwrap the EventBus/BrowserBridge
+envelopes and dig through the same nested dicts on its own. The CDP
+interceptor now builds one RawWsEvent per frame:
+
+- Commonly used fields (event_name, game_id, tick, price, rugged, phase)
+  are extracted once at construction. For CDP frames they are decoded
+  straight from the frame text, without decoding the rest of the payload.
+- `data` itself is decoded from the frame text (raw_data) on first access,
+  so subscribers that only route on the fields above never pay for
+  leaderboard/gameHistory decodes. Other heavy decodes (Decimal price,
+  typed gameHistory / leaderboard) are lazy and cached too.
+- The object is a read-only Mapping, so legacy `.get("event")` /
+  `.get("data")` callers keep working unchanged.
+
+Subscribers call RawWsEvent.from_bus(wrapped), which returns the shared
+instance as-is and only builds a new one for legacy dict publishers
+(websocket_feed, tests, scripts).
+
+The `data` payload is shared between subscribers and must not be mutated.
+"""
+
+from collections.abc import Iterator, Mapping
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+from sources.socketio_parser import decode_data_text, top_level_fields
+
+_UNSET = object()
+
+# Payload members extracted at construction
+_ROUTING_KEYS = ("gameId", "tickCount", "multiplier", "price", "rugged", "phase")
+
+# Keys exposed through the Mapping interface when their value is set
+_OPTIONAL_KEYS = ("timestamp", "direction", "source", "raw", "raw_data", "game_id")
+
+
+def _as_int(value: Any) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class RawWsEvent(Mapping):
+    """One parsed WebSocket event, shared read-only across subscribers."""
+
+    __slots__ = (
+        "_data",
+        "_game_history",
+        "_keys",
+        "_leaderboard",
+        "_price_decimal",
+        "direction",
+        "event_name",
+        "game_id",
+        "phase",
+        "price",
+        "raw",
+        "raw_data",
+        "rugged",
+        "source",
+        "tick",
+        "timestamp",
+    )
+
+    def __init__(
+        self,
+        event_name: str,
+        data: Any = _UNSET,
+        timestamp: str | None = None,
+        direction: str | None = None,
+        source: str | None = None,
+        raw: str | None = None,
+        raw_data: str | None = None,
+        game_id: str | None = None,
+    ):
+        if data is _UNSET and raw_data is None:
+            data = None
+        if data is _UNSET:
+            # Decode data lazily; routing fields come straight from the text
+            fields = top_level_fields(raw_data, _ROUTING_KEYS) or {}
+        else:
+            fields = data if isinstance(data, dict) else {}
+
+        init = object.__setattr__
+        init(self, "event_name", event_name)
+        init(self, "_data", data)
+        init(self, "timestamp", timestamp)
+        init(self, "direction", direction)
+        init(self, "source", source)
+        init(self, "raw", raw)
+        init(self, "raw_data", raw_data)
+        init(self, "game_id", game_id or fields.get("gameId"))
+        init(self, "tick", _as_int(fields.get("tickCount")))
+
+        price = fields.get("multiplier")
+        if price is None:
+            price = fields.get("price")
+        init(self, "price", price)
+        init(self, "rugged", bool(fields["rugged"]) if "rugged" in fields else None)
+        init(self, "phase", fields.get("phase"))
+
+        keys = ["event", "data"]
+        keys.extend(k for k in _OPTIONAL_KEYS if getattr(self, k) is not None)
+        init(self, "_keys", tuple(keys))
+        init(self, "_price_decimal", _UNSET)
+        init(self, "_game_history", _UNSET)
+        init(self, "_leaderboard", _UNSET)
+
+    @classmethod
+    def from_dict(cls, event: Mapping[str, Any]) -> "RawWsEvent":
+        """Build from a legacy event dict ({"event", "data", "timestamp", ...})."""
+        return cls(
+            event_name=event.get("event"),
+            data=event.get("data"),
+            timestamp=event.get("timestamp"),
+            direction=event.get("direction"),
+            source=event.get("source"),
+            raw=event.get("raw"),
+            raw_data=event.get("raw_data"),
+            game_id=event.get("game_id"),
+        )
+
+    @classmethod
+    def from_bus(cls, wrapped: Any) -> "RawWsEvent | None":
+        """
+        Resolve a WS_RAW_EVENT callback payload to its RawWsEvent.
+
+        Handles the EventBus wrapper ({"name", "data"}), the legacy
+        BrowserBridge/websocket_feed wrapper ({"data": event}) and bare
+        events. Returns None if no event can be found.
+        """
+        payload = wrapped
+        for _ in range(3):
+            if isinstance(payload, RawWsEvent):
+                return payload
+            if not isinstance(payload, Mapping):
+                return None
+            if "event" in payload:
+                return cls.from_dict(payload)
+            payload = payload.get("data")
+        return None
+
+    # ========== Lazy Decodes ==========
+
+    @property
+    def data(self) -> Any:
+        """Event payload, decoded from raw_data on first access (None if invalid)."""
+        if self._data is _UNSET:
+            element = decode_data_text(self.raw_data)
+            if element is None:
+                object.__setattr__(self, "_data", None)
+            else:
+                object.__setattr__(self, "_data", element[0])
+                object.__setattr__(self, "raw_data", element[1])
+        return self._data
+
+    @property
+    def price_decimal(self) -> Decimal | None:
+        """Price/multiplier as Decimal (converted via str, cached)."""
+        if self._price_decimal is _UNSET:
+            value = None
+            if self.price is not None:
+                try:
+                    value = Decimal(str(self.price))
+                except InvalidOperation:
+                    value = None
+            object.__setattr__(self, "_price_decimal", value)
+        return self._price_decimal
+
+    @property
+    def game_history(self) -> tuple:
+        """Typed gameHistory entries (GameHistoryEntry), validated once."""
+        if self._game_history is _UNSET:
+            from models.events.game_state_update import GameHistoryEntry
+
+            object.__setattr__(
+                self, "_game_history", self._validate_list("gameHistory", GameHistoryEntry)
+            )
+        return self._game_history
+
+    @property
+    def leaderboard(self) -> tuple:
+        """Typed leaderboard entries (LeaderboardEntry), validated once."""
+        if self._leaderboard is _UNSET:
+            from models.events.game_state_update import LeaderboardEntry
+
+            object.__setattr__(
+                self, "_leaderboard", self._validate_list("leaderboard", LeaderboardEntry)
+            )
+        return self._leaderboard
+
+    def _validate_list(self, key: str, model) -> tuple:
+        from pydantic import ValidationError
+
+        items = self.data.get(key) if isinstance(self.data, dict) else None
+        if not isinstance(items, list):
+            return ()
+        entries = []
+        for item in items:
+            try:
+                entries.append(model.model_validate(item))
+            except ValidationError:
+                continue
+        return tuple(entries)
+
+    # ========== Immutability ==========
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("RawWsEvent is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("RawWsEvent is immutable")
+
+    # ========== Mapping (legacy dict access) ==========
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._keys:
+            raise KeyError(key)
+        if key == "event":
+            return self.event_name
+        return getattr(self, key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return (
+            f"RawWsEvent(event={self.event_name!r}, game_id={self.game_id!r}, "
+            f"tick={self.tick!r}, direction={self.direction!r})"
+        )
@@ -12,20 +12,90 @@ Features:
 - Skip out-of-scope events silently
 - Track unknown events for review
 - Batch validation with progress reporting
+
+Throughput:
+- Lines are read in bulk and parsed with orjson when installed
+- Event names are resolved to their schema validator once and cached
+- Optional sampling validates 1 in N events plus every new payload shape,
+  cheap enough to run inline on the live feed
+- Directories are validated across a process pool
+- Results report events/sec
 """
 
 import json
+import time
 from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
-from pydantic import ValidationError
+from utils.parallel import map_in_pool
 
 from .registry import (
     get_schema_for_event,
     is_out_of_scope,
 )
 
+# Try to import orjson for faster line parsing (optional)
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Bytes of lines read per batch in validate_file
+READ_BATCH_BYTES = 1 << 20
+
+# Nesting depth considered when fingerprinting payload shapes for sampling
+SHAPE_DEPTH = 3
+
+# Cap on distinct shapes remembered by sampling (beyond it only 1-in-N applies)
+MAX_TRACKED_SHAPES = 10_000
+
+# Below this many files a process pool costs more than it saves
+MIN_PARALLEL_FILES = 4
+
+# Event classification results (cached per event name)
+_SKIP = "skip"
+_UNKNOWN = "unknown"
+
+
+def _loads(line: bytes) -> Any:
+    """Parse one JSON line, falling back to json for inputs orjson rejects (NaN, big ints)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(line)
+
+
+def payload_shape(value: Any, depth: int = SHAPE_DEPTH) -> Any:
+    """
+    Cheap structural fingerprint of a JSON payload.
+
+    Dicts contribute their keys and value shapes, lists the shape of their
+    first element, scalars their type. Tick-keyed maps (e.g. partialPrices
+    values) contribute only the shape of their first value so every tick does
+    not look new. Values below `depth` only contribute their type.
+    """
+    if isinstance(value, dict):
+        if depth <= 0 or not value:
+            return dict
+        first_key = next(iter(value))
+        if isinstance(first_key, str) and first_key.isdigit():
+            return (dict, payload_shape(value[first_key], depth - 1))
+        return tuple((k, payload_shape(v, depth - 1)) for k, v in value.items())
+    if isinstance(value, list):
+        if depth <= 0 or not value:
+            return list
+        return (list, payload_shape(value[0], depth - 1))
+    return type(value)
+
 
 @dataclass
 class SchemaValidationError:
@@ -60,6 +130,8 @@ class ValidationResult:
     events_validated: int = 0
     events_skipped: int = 0  # Out of scope
     events_unknown: int = 0  # No schema, not out of scope
+    events_sampled_out: int = 0  # In scope but skipped by sampling
+    elapsed_s: float = 0.0
     errors: list[SchemaValidationError] = field(default_factory=list)
 
     @property
@@ -72,6 +144,11 @@ class ValidationResult:
         """Number of validation errors."""
         return len(self.errors)
 
+    @property
+    def events_per_sec(self) -> float:
+        """Validation throughput (all events read per wall-clock second)."""
+        return self.events_total / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
     def merge(self, other: "ValidationResult") -> "ValidationResult":
         """Merge another result into this one."""
         return ValidationResult(
@@ -80,6 +157,8 @@ class ValidationResult:
             events_validated=self.events_validated + other.events_validated,
             events_skipped=self.events_skipped + other.events_skipped,
             events_unknown=self.events_unknown + other.events_unknown,
+            events_sampled_out=self.events_sampled_out + other.events_sampled_out,
+            elapsed_s=self.elapsed_s + other.elapsed_s,
             errors=self.errors + other.errors,
         )
 
@@ -91,12 +170,46 @@ class ValidationResult:
             "events_validated": self.events_validated,
             "events_skipped": self.events_skipped,
             "events_unknown": self.events_unknown,
+            "events_sampled_out": self.events_sampled_out,
+            "elapsed_s": round(self.elapsed_s, 3),
+            "events_per_sec": round(self.events_per_sec, 1),
             "error_count": self.error_count,
             "is_success": self.is_success,
             "errors": [e.to_dict() for e in self.errors],
         }
 
 
+@cache
+def _cached_validator(schema: type[BaseModel]) -> Callable[[Any], Any]:
+    """
+    TypeAdapter(schema).validate_python, built once per schema and process.
+
+    Pydantic compiles a model's core schema when the model class is defined;
+    this only saves rebuilding the adapter around it for every event.
+    """
+    return TypeAdapter(schema).validate_python
+
+
+def _format_validation_error(e: ValidationError) -> str:
+    """Format Pydantic validation errors as 'loc: msg; ...'."""
+    error_details = []
+    for err in e.errors():
+        loc = ".".join(str(x) for x in err["loc"])
+        msg = err["msg"]
+        error_details.append(f"{loc}: {msg}")
+    return "; ".join(error_details)
+
+
+def _iter_lines(file_path: Path) -> Iterator[tuple[int, bytes]]:
+    """Yield (line_number, raw_line) reading the file in bulk batches."""
+    with open(file_path, "rb") as f:
+        line_num = 0
+        for batch in iter(lambda: f.readlines(READ_BATCH_BYTES), []):
+            for line in batch:
+                line_num += 1
+                yield line_num, line
+
+
 class SchemaValidator:
     """
     Validates recorded events against Pydantic schemas.
@@ -107,12 +220,17 @@ class SchemaValidator:
         if not result.is_success:
             for error in result.errors:
                 print(f"Error: {error.error_message}")
+
+    Live feed (sampled):
+        validator = SchemaValidator(sample_every=100)
+        error = validator.validate_sampled(event_name, data)
     """
 
     def __init__(
         self,
         max_errors: int | None = None,
         include_raw_line: bool = False,
+        sample_every: int = 1,
     ):
         """
         Initialize the validator.
@@ -120,9 +238,53 @@ class SchemaValidator:
         Args:
             max_errors: Stop after this many errors (None = no limit)
             include_raw_line: Include raw JSON line in error reports
+            sample_every: Validate 1 in N events per event name, plus the
+                first event of every new payload shape (1 = validate all)
         """
         self.max_errors = max_errors
         self.include_raw_line = include_raw_line
+        self.sample_every = max(1, sample_every)
+
+        # Per event name: cached validator, _SKIP or _UNKNOWN
+        self._validators: dict[str, Any] = {}
+
+        # Sampling state (approximate under concurrent callers, which is fine)
+        self._seen_shapes: set[tuple] = set()
+        self._sample_counts: dict[str, int] = {}
+
+    def _validator_for(self, event_name: str) -> Any:
+        """Classify an event name once and cache its validator."""
+        validator = self._validators.get(event_name)
+        if validator is None:
+            schema = get_schema_for_event(event_name)
+            if schema is not None:
+                validator = _cached_validator(schema)
+            elif is_out_of_scope(event_name):
+                validator = _SKIP
+            else:
+                validator = _UNKNOWN
+            self._validators[event_name] = validator
+        return validator
+
+    def should_sample(self, event_name: str, data: Any) -> bool:
+        """
+        Decide whether an event is validated under sampling.
+
+        Always True for the first event with a new (event name, payload shape);
+        otherwise True for every Nth event of that name.
+        """
+        if self.sample_every <= 1:
+            return True
+
+        if len(self._seen_shapes) < MAX_TRACKED_SHAPES:
+            shape = (event_name, payload_shape(data))
+            if shape not in self._seen_shapes:
+                self._seen_shapes.add(shape)
+                return True
+
+        count = self._sample_counts.get(event_name, 0) + 1
+        self._sample_counts[event_name] = count
+        return count % self.sample_every == 0
 
     def validate_event(
         self,
@@ -139,11 +301,12 @@ class SchemaValidator:
         Returns:
             SchemaValidationError if validation fails, None if success or skipped
         """
-        schema = get_schema_for_event(event_name)
+        validator = self._validator_for(event_name)
 
-        if schema is None:
-            if is_out_of_scope(event_name):
-                return None  # Silently skip out-of-scope events
+        if validator is _SKIP:
+            return None  # Silently skip out-of-scope events
+
+        if validator is _UNKNOWN:
             # Unknown event - return error for tracking
             return SchemaValidationError(
                 file_path=file_path,
@@ -156,123 +319,143 @@ class SchemaValidator:
             )
 
         try:
-            schema.model_validate(data)
+            validator(data)
             return None  # Success
         except ValidationError as e:
-            # Format Pydantic validation errors
-            error_details = []
-            for err in e.errors():
-                loc = ".".join(str(x) for x in err["loc"])
-                msg = err["msg"]
-                error_details.append(f"{loc}: {msg}")
-
             return SchemaValidationError(
                 file_path=file_path,
                 line_number=line_number,
                 event_name=event_name,
                 seq=seq,
                 error_type="validation",
-                error_message="; ".join(error_details),
+                error_message=_format_validation_error(e),
                 raw_line=raw_line if self.include_raw_line else "",
             )
 
+    def validate_sampled(self, event_name: str, data: dict) -> SchemaValidationError | None:
+        """
+        Validate a live event if sampling selects it.
+
+        Returns:
+            SchemaValidationError if a sampled event fails, None otherwise
+        """
+        if not self.should_sample(event_name, data):
+            return None
+        return self.validate_event(event_name, data)
+
     def validate_file(self, file_path: Path) -> ValidationResult:
         """
         Validate all events in a JSONL file.
 
         Expected format: {"seq": int, "ts": str, "event": str, "data": {...}}
         """
+        start = time.perf_counter()
         result = ValidationResult(files_processed=1)
         errors = []
+        path_str = str(file_path)
+        include_raw = self.include_raw_line
+        sampling = self.sample_every > 1
+
+        def raw_text(line: bytes) -> str:
+            return line.decode("utf-8", "replace") if include_raw else ""
 
         try:
-            with open(file_path, encoding="utf-8") as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    result.events_total += 1
-
-                    # Check error limit
-                    if self.max_errors and len(errors) >= self.max_errors:
-                        break
-
-                    # Parse JSON
-                    try:
-                        record = json.loads(line)
-                    except json.JSONDecodeError as e:
-                        errors.append(
-                            SchemaValidationError(
-                                file_path=str(file_path),
-                                line_number=line_num,
-                                event_name="(parse_error)",
-                                seq=None,
-                                error_type="json_parse",
-                                error_message=f"JSON parse error: {e}",
-                                raw_line=line if self.include_raw_line else "",
-                            )
+            for line_num, line in _iter_lines(file_path):
+                line = line.strip()
+                if not line:
+                    continue
+
+                result.events_total += 1
+
+                # Check error limit
+                if self.max_errors and len(errors) >= self.max_errors:
+                    break
+
+                # Parse JSON
+                try:
+                    record = _loads(line)
+                except ValueError as e:
+                    errors.append(
+                        SchemaValidationError(
+                            file_path=path_str,
+                            line_number=line_num,
+                            event_name="(parse_error)",
+                            seq=None,
+                            error_type="json_parse",
+                            error_message=f"JSON parse error: {e}",
+                            raw_line=raw_text(line),
+                        )
+                    )
+                    continue
+
+                # Extract event info
+                event_name = record.get("event")
+                data = record.get("data", {})
+                seq = record.get("seq")
+
+                if not event_name:
+                    errors.append(
+                        SchemaValidationError(
+                            file_path=path_str,
+                            line_number=line_num,
+                            event_name="(missing)",
+                            seq=seq,
+                            error_type="json_parse",
+                            error_message="Missing 'event' field in record",
+                            raw_line=raw_text(line),
                         )
-                        continue
-
-                    # Extract event info
-                    event_name = record.get("event")
-                    data = record.get("data", {})
-                    seq = record.get("seq")
-
-                    if not event_name:
-                        errors.append(
-                            SchemaValidationError(
-                                file_path=str(file_path),
-                                line_number=line_num,
-                                event_name="(missing)",
-                                seq=seq,
-                                error_type="json_parse",
-                                error_message="Missing 'event' field in record",
-                                raw_line=line if self.include_raw_line else "",
-                            )
+                    )
+                    continue
+
+                validator = self._validator_for(event_name)
+
+                # Check if out of scope
+                if validator is _SKIP:
+                    result.events_skipped += 1
+                    continue
+
+                # Check if has schema
+                if validator is _UNKNOWN:
+                    result.events_unknown += 1
+                    # Still record as unknown for tracking
+                    errors.append(
+                        SchemaValidationError(
+                            file_path=path_str,
+                            line_number=line_num,
+                            event_name=event_name,
+                            seq=seq,
+                            error_type="missing_schema",
+                            error_message=f"No schema for event: {event_name}",
+                            raw_line=raw_text(line),
                         )
-                        continue
-
-                    # Check if out of scope
-                    if is_out_of_scope(event_name):
-                        result.events_skipped += 1
-                        continue
-
-                    # Check if has schema
-                    if get_schema_for_event(event_name) is None:
-                        result.events_unknown += 1
-                        # Still record as unknown for tracking
-                        errors.append(
-                            SchemaValidationError(
-                                file_path=str(file_path),
-                                line_number=line_num,
-                                event_name=event_name,
-                                seq=seq,
-                                error_type="missing_schema",
-                                error_message=f"No schema for event: {event_name}",
-                                raw_line=line if self.include_raw_line else "",
-                            )
+                    )
+                    continue
+
+                if sampling and not self.should_sample(event_name, data):
+                    result.events_sampled_out += 1
+                    continue
+
+                # Validate
+                result.events_validated += 1
+                try:
+                    validator(data)
+                except ValidationError as e:
+                    errors.append(
+                        SchemaValidationError(
+                            file_path=path_str,
+                            line_number=line_num,
+                            event_name=event_name,
+                            seq=seq,
+                            error_type="validation",
+                            error_message=_format_validation_error(e),
+                            raw_line=raw_text(line),
                         )
-                        continue
-
-                    # Validate
-                    result.events_validated += 1
-                    error = self.validate_event(
-                        event_name=event_name,
-                        data=data,
-                        file_path=str(file_path),
-                        line_number=line_num,
-                        seq=seq,
-                        raw_line=line,
                     )
-                    if error:
-                        errors.append(error)
 
         except Exception as e:
             errors.append(
                 SchemaValidationError(
-                    file_path=str(file_path),
+                    file_path=path_str,
                     line_number=0,
                     event_name="(file_error)",
                     seq=None,
@@ -282,6 +465,7 @@ class SchemaValidator:
             )
 
         result.errors = errors
+        result.elapsed_s = time.perf_counter() - start
         return result
 
     def validate_directory(
@@ -289,6 +473,7 @@ class SchemaValidator:
         directory: Path,
         recursive: bool = True,
         progress_callback: Callable | None = None,
+        max_workers: int | None = None,
     ) -> ValidationResult:
         """
         Validate all JSONL files in a directory.
@@ -297,23 +482,36 @@ class SchemaValidator:
             directory: Directory to scan
             recursive: Search subdirectories
             progress_callback: Called with (current_file, file_number, total_files)
+            max_workers: Process count (defaults to CPU count; 1 runs inline)
         """
+        start = time.perf_counter()
         pattern = "**/*.jsonl" if recursive else "*.jsonl"
         files = list(directory.glob(pattern))
-
         total_result = ValidationResult()
 
-        for i, file_path in enumerate(files):
-            if progress_callback:
-                progress_callback(file_path, i + 1, len(files))
+        # Each worker builds its own validator with this one's settings
+        results = map_in_pool(
+            type(self).validate_file,
+            files,
+            init=type(self),
+            initargs=(self.max_errors, self.include_raw_line, self.sample_every),
+            min_items=MIN_PARALLEL_FILES,
+            workers=max_workers,
+        )
+        try:
+            for i, (file_path, file_result) in enumerate(zip(files, results)):
+                if progress_callback:
+                    progress_callback(file_path, i + 1, len(files))
 
-            file_result = self.validate_file(file_path)
-            total_result = total_result.merge(file_result)
+                total_result = total_result.merge(file_result)
 
-            # Check error limit
-            if self.max_errors and total_result.error_count >= self.max_errors:
-                break
+                # Check error limit
+                if self.max_errors and total_result.error_count >= self.max_errors:
+                    break
+        finally:
+            results.close()
 
+        total_result.elapsed_s = time.perf_counter() - start
         return total_result
 
     def iter_errors(self, file_path: Path) -> Iterator[SchemaValidationError]:
@@ -10,7 +10,11 @@ from sources.feed_degradation import GracefulDegradationManager, OperatingMode
 
 # Feed monitors
 from sources.feed_monitors import ConnectionHealth, ConnectionHealthMonitor, LatencySpikeDetector
-from sources.feed_rate_limiter import PriorityRateLimiter, TokenBucketRateLimiter
+from sources.feed_rate_limiter import (
+    CoalescingRateLimiter,
+    PriorityRateLimiter,
+    TokenBucketRateLimiter,
+)
 from sources.game_state_machine import GameSignal, GameStateMachine
 
 # Price history handler
@@ -28,6 +32,7 @@ __all__ = [
     # Rate limiters
     "TokenBucketRateLimiter",
     "PriorityRateLimiter",
+    "CoalescingRateLimiter",
     # Degradation
     "OperatingMode",
     "GracefulDegradationManager",
@@ -12,6 +12,8 @@ from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any
 
+from services.latency_trace import STAGE_CAPTURE, latency_tracer
+from services.raw_ws_event import RawWsEvent
 from sources.socketio_parser import parse_socketio_frame
 
 logger = logging.getLogger(__name__)
@@ -40,7 +42,7 @@ class CDPWebSocketInterceptor:
         self._cdp_client = None
 
         # Event callback
-        self.on_event: Callable[[dict[str, Any]], None] | None = None
+        self.on_event: Callable[[RawWsEvent], None] | None = None
 
         # CDP timestamps are monotonic (not UNIX epoch). Capture a base mapping
         # so we can emit reasonable wall-clock timestamps for downstream consumers.
@@ -109,6 +111,7 @@ class CDPWebSocketInterceptor:
 
     def _process_frame(self, payload: str, timestamp: float, direction: str):
         """Process a WebSocket frame and emit event."""
+        arrived_ns = time.perf_counter_ns()
         frame = parse_socketio_frame(payload)
 
         if frame is None:
@@ -120,14 +123,20 @@ class CDPWebSocketInterceptor:
 
         event_epoch = self._to_epoch_seconds(timestamp)
 
-        # Build event dict
-        event = {
-            "event": frame.event_name,
-            "data": frame.data,
-            "timestamp": datetime.fromtimestamp(event_epoch, tz=UTC).isoformat(),
-            "direction": direction,
-            "raw": frame.raw,
-        }
+        # Parsed once here and shared read-only by every subscriber. Only the
+        # routing fields are decoded now; data decodes on first access.
+        event = RawWsEvent(
+            event_name=frame.event_name,
+            timestamp=datetime.fromtimestamp(event_epoch, tz=UTC).isoformat(),
+            direction=direction,
+            raw=frame.raw,
+            # Exact JSON text of "data" so recorders can store it as-is
+            raw_data=frame.data_raw,
+        )
+
+        # Each server tick starts a latency trace for the decision pipeline
+        if direction == "received" and frame.event_name == "gameStateUpdate":
+            latency_tracer.stamp(STAGE_CAPTURE, latency_tracer.begin(arrived_ns))
 
         # Update stats
         with self._lock:
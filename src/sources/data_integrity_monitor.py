@@ -5,7 +5,8 @@ Monitors data feed integrity and triggers monitor mode when thresholds exceeded.
 
 Triggers:
 - WebSocket connection loss/reconnect
-- Data gaps (missing ticks in sequence)
+- Data gaps (missing ticks in sequence; ticks the feed coalesced on purpose
+  are reported with the next tick and don't count as loss)
 - Abnormal game end (no proper rug/crash event)
 
 Thresholds (mutually exclusive):
@@ -17,7 +18,7 @@ Recovery:
 """
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from enum import Enum
 from typing import Any
 
@@ -72,6 +73,7 @@ class DataIntegrityMonitor:
         self._is_triggered = False
         self._consecutive_tick_gaps = 0
         self._consecutive_bad_games = 0
+        self._coalesced_ticks = 0
         self._last_tick: int | None = None
         self._current_game_id: str | None = None
 
@@ -104,6 +106,11 @@ class DataIntegrityMonitor:
         """Consecutive bad games detected."""
         return self._consecutive_bad_games
 
+    @property
+    def coalesced_ticks(self) -> int:
+        """Ticks skipped by feed coalescing (not counted as gaps)."""
+        return self._coalesced_ticks
+
     @property
     def last_tick(self) -> int | None:
         """Last tick number seen."""
@@ -114,18 +121,31 @@ class DataIntegrityMonitor:
         """Current game ID being monitored."""
         return self._current_game_id
 
-    def on_tick(self, tick: int) -> None:
+    def on_tick(self, tick: int, coalesced: Sequence[tuple[int, int]] = ()) -> None:
         """
         Process a tick event.
 
         Args:
             tick: Current tick number
+            coalesced: Inclusive (first, last) tick ranges the feed skipped on
+                purpose before this tick (GameSignal.coalescedTicks)
         """
         if self._last_tick is not None:
             expected_tick = self._last_tick + 1
             if tick > expected_tick:
+                # Ticks the feed coalesced away were seen upstream, not lost
+                skipped = sum(
+                    min(last, tick - 1) - max(first, expected_tick) + 1
+                    for first, last in coalesced
+                    if last >= expected_tick and first < tick
+                )
+                self._coalesced_ticks += skipped
+                gap_size = tick - expected_tick - skipped
+            else:
+                gap_size = 0
+
+            if gap_size > 0:
                 # Gap detected
-                gap_size = tick - expected_tick
                 self._consecutive_tick_gaps += gap_size
                 logger.debug(
                     f"Tick gap detected: expected {expected_tick}, got {tick} (gap={gap_size})"
@@ -135,8 +155,8 @@ class DataIntegrityMonitor:
                 if self._threshold_type == ThresholdType.TICKS:
                     if self._consecutive_tick_gaps >= self._threshold_value:
                         self._trigger(IntegrityIssue.TICK_GAP, {"gap_size": gap_size})
-            elif tick == expected_tick:
-                # Sequential tick - reset gap counter
+            elif tick >= expected_tick:
+                # Sequential (or fully coalesced) tick - reset gap counter
                 self._consecutive_tick_gaps = 0
 
         self._last_tick = tick
@@ -211,6 +231,7 @@ class DataIntegrityMonitor:
         self._is_triggered = False
         self._consecutive_tick_gaps = 0
         self._consecutive_bad_games = 0
+        self._coalesced_ticks = 0
         self._last_tick = None
         self._current_game_id = None
         logger.debug("Data integrity monitor reset")
@@ -239,6 +260,7 @@ class DataIntegrityMonitor:
             "threshold_value": self._threshold_value,
             "consecutive_tick_gaps": self._consecutive_tick_gaps,
             "consecutive_bad_games": self._consecutive_bad_games,
+            "coalesced_ticks": self._coalesced_ticks,
             "current_game_id": self._current_game_id,
             "last_tick": self._last_tick,
         }
@@ -4,6 +4,8 @@ Feed Rate Limiter - Phase 10.4A Modular Refactor
 Extracted from websocket_feed.py:
 - TokenBucketRateLimiter: Token bucket rate limiter for WebSocket flood protection
 - PriorityRateLimiter: Rate limiter with priority bypass for critical signals
+- CoalescingRateLimiter: Latest-wins rate limiter that coalesces bursts
+  instead of dropping signals
 
 These classes handle rate limiting for the WebSocket feed without
 containing any Socket.IO-specific code.
@@ -11,8 +13,16 @@ containing any Socket.IO-specific code.
 
 import threading
 import time
+from collections import deque
 from typing import Any
 
+CRITICAL_PHASES = frozenset({"RUG_EVENT", "RUG_EVENT_1", "RUG_EVENT_2"})
+
+
+def is_critical_signal(signal: Any) -> bool:
+    """Rug events must never be rate limited."""
+    return getattr(signal, "rugged", False) or getattr(signal, "phase", "") in CRITICAL_PHASES
+
 
 class TokenBucketRateLimiter:
     """
@@ -81,7 +91,7 @@ class TokenBucketRateLimiter:
 class PriorityRateLimiter(TokenBucketRateLimiter):
     """Rate limiter with priority bypass for critical signals"""
 
-    CRITICAL_PHASES = {"RUG_EVENT", "RUG_EVENT_1", "RUG_EVENT_2"}
+    CRITICAL_PHASES = CRITICAL_PHASES
 
     def __init__(self, rate: float = 20.0, burst: int = None):
         super().__init__(rate=rate, burst=burst)
@@ -93,6 +103,145 @@ class PriorityRateLimiter(TokenBucketRateLimiter):
         return self.acquire()
 
     def _is_critical(self, signal: Any) -> bool:
-        return (
-            getattr(signal, "rugged", False) or getattr(signal, "phase", "") in self.CRITICAL_PHASES
-        )
+        return is_critical_signal(signal)
+
+
+class CoalescingRateLimiter:
+    """
+    Latest-wins rate limiter: coalesces bursts instead of dropping signals.
+
+    Time is divided into slots of 1/rate seconds. The first signal in a slot
+    is emitted at once; later signals in the same slot are held, one per
+    game, each replacing the one already held. Held signals go out with the
+    first signal of the next slot (or on flush()).
+
+    Replaced ticks are recorded on the next emitted signal for that game as
+    coalescedTicks (inclusive (first, last) ranges), so consumers such as
+    DataIntegrityMonitor can tell intentional coalescing from real data loss.
+    Critical signals and phase changes are never held.
+
+    offer() is meant for the single feed thread: outside a burst it costs
+    one slot comparison and takes no lock. Held signals are guarded by a
+    lock (taken only while holding or releasing), so a slot timer on another
+    thread may call flush_due()/flush(). get_stats() may be read from any
+    thread.
+
+    Args:
+        rate: Maximum emitted signals per second (outside critical bypass)
+    """
+
+    # Skipped ranges kept for get_stats()
+    RECENT_RANGES = 100
+
+    def __init__(self, rate: float = 20.0):
+        self.rate = rate
+        self._slot = -1
+        self._last_game: str | None = None
+        self._last_phase: str | None = None
+        # gameId -> held signal / [first, last] tick ranges replaced since last emit
+        self._pending: dict[str, Any] = {}
+        self._skipped: dict[str, list[list[int]]] = {}
+        self.recent_skipped_ranges: deque[tuple[str, int, int]] = deque(maxlen=self.RECENT_RANGES)
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.total_requests = 0
+        self.total_emitted = 0
+        self.total_coalesced = 0
+
+    def offer(self, signal: Any) -> list[Any]:
+        """
+        Submit a signal.
+
+        Returns:
+            Signals to emit now, oldest first (empty while the signal is held)
+        """
+        self.total_requests += 1
+        slot = int(time.monotonic() * self.rate)
+        game_id = signal.gameId
+        changed = game_id != self._last_game or signal.phase != self._last_phase
+        self._last_game = game_id
+        self._last_phase = signal.phase
+
+        if slot == self._slot and not changed and not is_critical_signal(signal):
+            with self._lock:
+                self._hold(signal)
+            return []
+
+        self._slot = slot
+        # Only this thread adds held signals, so an empty check needs no lock
+        if not self._pending:
+            self.total_emitted += 1
+            return [signal]
+        with self._lock:
+            return self._release(signal)
+
+    def flush_due(self) -> list[Any]:
+        """
+        Emit held signals once their slot has passed (for a slot timer).
+
+        Takes the current slot, so a signal arriving later in it is held
+        rather than exceeding the rate.
+        """
+        slot = int(time.monotonic() * self.rate)
+        if slot == self._slot or not self._pending:
+            return []
+        with self._lock:
+            self._slot = slot
+            return self._release() if self._pending else []
+
+    def flush(self) -> list[Any]:
+        """Emit any held signals now (e.g. when the feed stops)."""
+        with self._lock:
+            return self._release() if self._pending else []
+
+    def _hold(self, signal: Any) -> None:
+        held = self._pending.get(signal.gameId)
+        if held is not None:
+            self._skip(signal.gameId, held.tickCount)
+        self._pending[signal.gameId] = signal
+
+    def _skip(self, game_id: str, tick: int) -> None:
+        self.total_coalesced += 1
+        ranges = self._skipped.setdefault(game_id, [])
+        if ranges and ranges[-1][0] <= tick <= ranges[-1][1] + 1:
+            ranges[-1][1] = max(ranges[-1][1], tick)
+        else:
+            ranges.append([tick, tick])
+
+    def _release(self, signal: Any = None) -> list[Any]:
+        pending = self._pending
+        self._pending = {}
+        if signal is not None:
+            # The new signal supersedes the one held for its game
+            held = pending.pop(signal.gameId, None)
+            if held is not None:
+                self._skip(signal.gameId, held.tickCount)
+            pending[signal.gameId] = signal
+
+        released = list(pending.values())
+        for emitted in released:
+            ranges = self._skipped.pop(emitted.gameId, None)
+            if ranges:
+                emitted.coalescedTicks = tuple((first, last) for first, last in ranges)
+                self.recent_skipped_ranges.extend(
+                    (emitted.gameId, first, last) for first, last in ranges
+                )
+        self.total_emitted += len(released)
+        return released
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get rate limiter statistics"""
+        requests = self.total_requests
+        return {
+            "rate": self.rate,
+            "total_requests": requests,
+            "total_emitted": self.total_emitted,
+            "total_coalesced": self.total_coalesced,
+            "pending": len(self._pending),
+            # The latest state per game is always emitted, so nothing is lost
+            "total_dropped": 0,
+            "drop_rate": 0.0,
+            "coalesce_rate": (self.total_coalesced / requests * 100) if requests > 0 else 0.0,
+            "recent_skipped_ranges": list(self.recent_skipped_ranges),
+        }
@@ -46,6 +46,11 @@ class GameSignal:
     isValid: bool = True
     timestamp: int = field(default_factory=lambda: int(time.time() * 1000))
     latency: float = 0.0
+    # Inclusive (first, last) tick ranges coalesced away before this signal
+    coalescedTicks: tuple[tuple[int, int], ...] = ()
+    # Fixed-point price (10**8 scale) when the feed runs in fixed numeric
+    # mode; price then carries the wire float instead of a Decimal
+    priceFp: int | None = None
 
 
 class GameStateMachine:
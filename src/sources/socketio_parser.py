@@ -1,21 +1,81 @@
 """Socket.IO frame parser for CDP WebSocket interception."""
 
+import functools
 import json
 import logging
-from dataclasses import dataclass
+import re
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+_UNSET = object()
+
+
 class SocketIOFrame:
-    """Parsed Socket.IO frame."""
+    """
+    Parsed Socket.IO frame.
+
+    Event frames keep the JSON text of their data in data_raw; `data` is
+    decoded from it on first access and cached, so frames nobody reads
+    never pay for the decode.
+    """
+
+    __slots__ = ("_data", "data_raw", "event_name", "raw", "type")
+
+    def __init__(
+        self,
+        type: str,  # "connect", "disconnect", "event", "ping", "pong", "error"
+        event_name: str | None = None,
+        data: Any = _UNSET,
+        raw: str = "",
+        data_raw: str | None = None,  # Exact JSON text of data, as received
+    ):
+        self.type = type
+        self.event_name = event_name
+        self.raw = raw
+        self.data_raw = data_raw
+        self._data = None if data is _UNSET and data_raw is None else data
+
+    @property
+    def data(self) -> Any | None:
+        """Event data, decoded from data_raw on first access (None if invalid)."""
+        if self._data is _UNSET:
+            element = decode_data_text(self.data_raw)
+            if element is None:
+                self._data = None
+            else:
+                self._data, self.data_raw = element
+        return self._data
+
+    @data.setter
+    def data(self, value: Any) -> None:
+        self._data = value
+
+    def __repr__(self) -> str:
+        return f"SocketIOFrame(type={self.type!r}, event_name={self.event_name!r})"
+
+
+def decode_data_text(text: str) -> tuple[Any, str] | None:
+    """
+    Decode event data text captured by the parser (SocketIOFrame.data_raw).
 
-    type: str  # "connect", "disconnect", "event", "ping", "pong", "error"
-    event_name: str | None = None
-    data: Any | None = None
-    raw: str = ""
+    Elements after the data (ack arguments) are not part of it, so the
+    returned text is trimmed to the data element.
+
+    Returns:
+        (value, exact JSON text of value), or None if text is invalid
+    """
+    try:
+        value, end = _decoder.raw_decode(text)
+        idx = _skip_ws(text, end)
+        if idx != len(text) and text[idx] != ",":
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, idx)
+    except (json.JSONDecodeError, RecursionError) as e:
+        truncated = text[:200] if len(text) > 200 else text
+        logger.warning(f"Invalid JSON in event data: {e}. Payload: {truncated}...")
+        return None
+    return value, text if idx == len(text) else text[:end]
 
 
 # Socket.IO Engine.IO packet types
@@ -124,6 +184,130 @@ def _parse_socketio_message(data: str, raw: str) -> SocketIOFrame | None:
     return SocketIOFrame(type=sio_packet_type, raw=raw)
 
 
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+def _skip_ws(text: str, idx: int) -> int:
+    while idx < len(text) and text[idx] in _WHITESPACE:
+        idx += 1
+    return idx
+
+
+# JSON string or structural bracket (numbers/literals are skipped by search)
+_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\]]')
+
+
+@functools.lru_cache(maxsize=16)
+def _keys_pattern(keys: tuple[str, ...]) -> re.Pattern:
+    names = "|".join(re.escape(key) for key in keys)
+    return re.compile(rf'"({names})"\s*:\s*')
+
+
+def top_level_fields(text: str, keys: tuple[str, ...]) -> dict[str, Any] | None:
+    """
+    Decode selected top-level members of a JSON object without decoding the rest.
+
+    Candidate keys are located with a regex; each is confirmed to sit at the
+    object's top level by walking string/bracket tokens up to it, so the walk
+    only covers the text before the last key needed. Routing keys sit near
+    the start of rugs.fun payloads, ahead of leaderboards and gameHistory.
+
+    Returns:
+        {key: value} for the keys found, or None if text is not an object
+    """
+    start = _skip_ws(text, 0)
+    if start >= len(text) or text[start] != "{":
+        return None
+
+    found: dict[str, Any] = {}
+    pos, depth = start, 0
+    for match in _keys_pattern(keys).finditer(text, start):
+        key = match.group(1)
+        if key in found:
+            continue
+        target = match.start()
+        inside_string = False
+        while True:
+            token = _TOKEN.search(text, pos)
+            if token is None or token.start() >= target:
+                break
+            if token.end() > target:
+                inside_string = True
+                break
+            char = text[token.start()]
+            if char in "{[":
+                depth += 1
+            elif char in "}]":
+                depth -= 1
+                if depth == 0:
+                    return found  # End of the object
+            pos = token.end()
+        if inside_string or depth != 1:
+            continue
+        try:
+            found[key], _ = _decoder.raw_decode(text, match.end())
+        except json.JSONDecodeError:
+            continue
+        if len(found) == len(keys):
+            break
+    return found
+
+
+# Trace metadata element of the traced event format (see _parse_event)
+_TRACE_ELEMENT = re.compile(r'\{\s*"(?:__trace|traceparent)"')
+
+
+def _split_event_head(payload: str) -> tuple[Any, str | None] | None:
+    """
+    Split a Socket.IO event array into its name and the text of its data.
+
+    Only the event name (and trace metadata, if present) is decoded; the
+    data element is returned as source text for SocketIOFrame to decode
+    lazily. Raises json.JSONDecodeError on a malformed array frame.
+
+    Returns:
+        (event_name, data_text or None), or None if payload is not a
+        non-empty array
+    """
+    idx = _skip_ws(payload, 0)
+    if idx >= len(payload) or payload[idx] != "[":
+        return None
+    idx = _skip_ws(payload, idx + 1)
+    if idx < len(payload) and payload[idx] == "]":
+        if _skip_ws(payload, idx + 1) != len(payload):
+            raise json.JSONDecodeError("Extra data", payload, idx + 1)
+        return None
+
+    close = len(payload.rstrip(_WHITESPACE)) - 1
+    if payload[close] != "]":
+        raise json.JSONDecodeError("Expecting ',' delimiter", payload, close + 1)
+
+    event_name, end = _decoder.raw_decode(payload, idx)
+    idx = _skip_ws(payload, end)
+    if idx == close:
+        return event_name, None
+    if payload[idx] != ",":
+        raise json.JSONDecodeError("Expecting ',' delimiter", payload, idx)
+    idx = _skip_ws(payload, idx + 1)
+
+    # rugs.fun sends events in two formats:
+    # 1. 42["event", {data}] - standard format
+    # 2. 42["event", {__trace, traceparent}, {actual_data}] - traced format
+    #
+    # For traced format, the actual data follows the (small) trace element
+    if _TRACE_ELEMENT.match(payload, idx):
+        _, trace_end = _decoder.raw_decode(payload, idx)
+        after = _skip_ws(payload, trace_end)
+        if payload[after] == ",":
+            idx = _skip_ws(payload, after + 1)
+
+    data_text = payload[idx:close].rstrip(_WHITESPACE)
+    if not data_text:
+        raise json.JSONDecodeError("Expecting value", payload, idx)
+    return event_name, data_text
+
+
 def _parse_event(data: str, raw: str) -> SocketIOFrame | None:
     """Parse Socket.IO event from JSON array.
 
@@ -132,6 +316,10 @@ def _parse_event(data: str, raw: str) -> SocketIOFrame | None:
     - 42123["event", {...}] (ack id)
     - 42/namespace,["event", {...}] (namespace)
     - 42/namespace,123["event", {...}] (namespace + ack id)
+
+    Only the event name is decoded here. The exact JSON text of the event
+    data is kept in data_raw (stored without re-serializing) and decoded on
+    first access to frame.data.
     """
     if not data:
         return None
@@ -151,35 +339,15 @@ def _parse_event(data: str, raw: str) -> SocketIOFrame | None:
     json_payload = data[bracket_idx:]
 
     try:
-        parsed = json.loads(json_payload)
-    except json.JSONDecodeError as e:
+        head = _split_event_head(json_payload)
+    except (json.JSONDecodeError, RecursionError) as e:
         # Truncate payload for logging
         truncated = json_payload[:200] if len(json_payload) > 200 else json_payload
         logger.warning(f"Invalid JSON in message packet: {e}. Payload: {truncated}...")
         return None
 
-    if isinstance(parsed, list) and len(parsed) >= 1:
-        event_name = parsed[0]
-
-        # rugs.fun sends events in two formats:
-        # 1. 42["event", {data}] - standard format
-        # 2. 42["event", {__trace, traceparent}, {actual_data}] - traced format
-        #
-        # For traced format, the actual data is in parsed[2], not parsed[1]
-        if len(parsed) == 3 and isinstance(parsed[1], dict):
-            # Check if parsed[1] is trace metadata
-            if "__trace" in parsed[1] or "traceparent" in parsed[1]:
-                # Actual data is in parsed[2]
-                event_data = parsed[2]
-            else:
-                event_data = parsed[1]
-        elif len(parsed) > 1:
-            event_data = parsed[1]
-        else:
-            event_data = None
-
-        return SocketIOFrame(type="event", event_name=event_name, data=event_data, raw=raw)
+    if head is None:
+        return None
 
-    # AUDIT FIX: Removed unreachable duplicate code (lines 169-183)
-    # The duplicate parsing logic was never executed due to return None at line 167
-    return None
+    event_name, data_raw = head
+    return SocketIOFrame(type="event", event_name=event_name, raw=raw, data_raw=data_raw)
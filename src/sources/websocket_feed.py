@@ -19,6 +19,7 @@ Usage:
 """
 
 import logging
+import threading
 import time
 from collections import deque  # AUDIT FIX: For efficient latency tracking
 from collections.abc import Callable
@@ -45,23 +46,51 @@ except ModuleNotFoundError:  # pragma: no cover
 
 # Modular architecture: Extracted feed components for testability
 from services.event_bus import Events, event_bus
+from services.latency_trace import STAGE_FEED, latency_tracer
+from services.schema_validator import SchemaValidator
+from sources.data_integrity_monitor import DataIntegrityMonitor
 from sources.feed_degradation import GracefulDegradationManager
 from sources.feed_monitors import ConnectionHealth, ConnectionHealthMonitor, LatencySpikeDetector
-from sources.feed_rate_limiter import PriorityRateLimiter
+from sources.feed_rate_limiter import CoalescingRateLimiter, PriorityRateLimiter
 from sources.game_state_machine import GameSignal, GameStateMachine
+from utils.fixed_point import (
+    NUMERIC_MODE_DECIMAL,
+    NUMERIC_MODE_FIXED,
+    NUMERIC_MODES,
+    fixed_price_to_decimal,
+    price_to_fixed,
+)
 
 
 class WebSocketFeed:
     """Real-time WebSocket feed for Rugs.fun game state"""
 
-    def __init__(self, log_level: str = "INFO", rate_limit: float = 20.0):
+    def __init__(
+        self,
+        log_level: str = "INFO",
+        rate_limit: float = 20.0,
+        coalesce: bool = False,
+        numeric_mode: str = NUMERIC_MODE_DECIMAL,
+        schema_sample_every: int = 0,
+    ):
         """
         Initialize WebSocket feed
 
         Args:
             log_level: Logging level (DEBUG, INFO, WARN, ERROR)
             rate_limit: Max signals per second (PHASE 3.1 AUDIT FIX)
+            coalesce: Coalesce bursts to the latest state per game instead of
+                dropping signals (skipped ticks land on GameSignal.coalescedTicks
+                and gaps are tracked by integrity_monitor)
+            numeric_mode: "decimal" (price as Decimal) or "fixed" (price as the
+                wire float plus GameSignal.priceFp; Decimal only in signal_to_game_tick)
+            schema_sample_every: Validate 1 in N events (plus every new payload
+                shape) against the event schemas; 0 disables
         """
+        if numeric_mode not in NUMERIC_MODES:
+            raise ValueError(f"Invalid numeric_mode '{numeric_mode}'. Valid: {NUMERIC_MODES}")
+        self.numeric_mode = numeric_mode
+
         if getattr(socketio, "Client", None) is None:
             raise ModuleNotFoundError(
                 "python-socketio is required for WebSocketFeed. "
@@ -82,7 +111,11 @@ class WebSocketFeed:
         self.state_machine = GameStateMachine()
 
         # PHASE 3.1 AUDIT FIX: Rate limiter to prevent data floods (with critical bypass)
-        self.rate_limiter = PriorityRateLimiter(rate=rate_limit)
+        self.coalesce = coalesce
+        if coalesce:
+            self.rate_limiter = CoalescingRateLimiter(rate=rate_limit)
+        else:
+            self.rate_limiter = PriorityRateLimiter(rate=rate_limit)
 
         # PHASE 3.2 AUDIT FIX: Connection health monitor
         self.health_monitor = ConnectionHealthMonitor()
@@ -94,6 +127,19 @@ class WebSocketFeed:
         self.degradation_manager = GracefulDegradationManager()
         self.degradation_manager.on_mode_change = self._on_mode_change
 
+        # Tick gap tracking, coalesce mode only: there every skipped tick is
+        # reported as a coalesced range, whereas PriorityRateLimiter drops
+        # ticks on purpose and would show up as gaps
+        self.integrity_monitor: DataIntegrityMonitor | None = None
+        if coalesce:
+            self.integrity_monitor = DataIntegrityMonitor()
+            self.integrity_monitor.on_threshold_exceeded = self._on_integrity_issue
+
+        # Sampled schema validation (too slow to run on every live event)
+        self.schema_validator = (
+            SchemaValidator(sample_every=schema_sample_every) if schema_sample_every > 0 else None
+        )
+
         # Metrics
         self.metrics = {
             "start_time": time.time(),
@@ -107,6 +153,7 @@ class WebSocketFeed:
             "errors": 0,  # AUDIT FIX: Track callback errors
             "rate_limited": 0,  # PHASE 3.1: Track rate-limited signals
             "latency_spikes": 0,  # PHASE 3.5: Track latency spikes
+            "schema_errors": 0,  # Sampled events that failed their schema
         }
 
         # State
@@ -118,6 +165,10 @@ class WebSocketFeed:
         # AUDIT FIX: Guard to prevent duplicate event listener registration
         self._listeners_setup = False
 
+        # Coalescing: slot timer releasing held signals when the feed goes quiet
+        self._flush_stop = threading.Event()
+        self._flush_thread: threading.Thread | None = None
+
         # Setup logging
         self.logger = logging.getLogger("WebSocketFeed")
         self.logger.setLevel(getattr(logging, log_level.upper()))
@@ -148,6 +199,10 @@ class WebSocketFeed:
             },
         )
 
+    def _on_integrity_issue(self, issue, details: dict[str, Any]):
+        """Forward DataIntegrityMonitor threshold breaches to consumers."""
+        self._emit_event("integrity_issue", {"issue": issue.value, "details": details})
+
     def _setup_event_listeners(self):
         """
         Setup Socket.IO event listeners
@@ -189,6 +244,8 @@ class WebSocketFeed:
                 recovery_info = self.state_machine.recover_from_disconnect()
                 # PHASE 3.6: Notify degradation manager
                 self.degradation_manager.record_disconnect()
+                if self.integrity_monitor:
+                    self.integrity_monitor.on_connection_lost()
                 # FIX: Reset latency baseline to prevent spike spam on reconnect
                 self.last_tick_time = None
                 self.spike_detector.latencies.clear()
@@ -225,6 +282,8 @@ class WebSocketFeed:
                 state_summary = self.state_machine.get_state_summary()
                 # PHASE 3.6: Notify degradation manager
                 self.degradation_manager.record_reconnect()
+                if self.integrity_monitor:
+                    self.integrity_monitor.on_connection_restored()
                 # FIX: Reset latency baseline to prevent spike spam after reconnect
                 self.last_tick_time = None
                 self.spike_detector.latencies.clear()
@@ -290,6 +349,9 @@ class WebSocketFeed:
                         },
                     )
 
+                if self.schema_validator is not None and args and isinstance(args[0], dict):
+                    self._check_schema(event, args[0])
+
                 if event != "gameStateUpdate":
                     self.metrics["noise_filtered"] += 1
                     self.logger.debug(f"❌ NOISE filtered: {event}")
@@ -299,6 +361,7 @@ class WebSocketFeed:
 
     def _handle_game_state_update(self, raw_data: dict[str, Any]):
         """Handle gameStateUpdate event - PRIMARY SIGNAL SOURCE"""
+        trace_id = latency_tracer.begin()
         receive_time = time.time() * 1000  # milliseconds
 
         # Calculate tick interval
@@ -340,6 +403,9 @@ class WebSocketFeed:
         # PHASE 3.6: Check for recovery from degraded state
         self.degradation_manager.check_recovery()
 
+        if self.schema_validator is not None:
+            self._check_schema("gameStateUpdate", raw_data)
+
         # Extract signal (9 fields only)
         signal_dict = self._extract_signal(raw_data)
 
@@ -358,9 +424,15 @@ class WebSocketFeed:
 
         # Update processing latency now that parsing/validation is done
         signal.latency = (time.time() * 1000) - receive_time
+        latency_tracer.stamp(STAGE_FEED, trace_id)
 
         # PHASE 3.1 AUDIT FIX: Apply rate limiting with critical bypass
-        if not self.rate_limiter.should_process(signal):
+        if self.coalesce:
+            # Held signals go out with the first signal of the next slot
+            ready = self.rate_limiter.offer(signal)
+            if not ready:
+                return
+        elif not self.rate_limiter.should_process(signal):
             self.metrics["rate_limited"] += 1
             if self.metrics["rate_limited"] % 100 == 1:
                 stats = self.rate_limiter.get_stats()
@@ -370,10 +442,8 @@ class WebSocketFeed:
                     f"(drop rate: {drop_rate:.1f}%)"
                 )
             return  # Drop this signal
-
-        # Update metrics
-        self.metrics["total_signals"] += 1
-        self.metrics["total_ticks"] += 1
+        else:
+            ready = [signal]
 
         if validation["phase"] != validation["previousPhase"]:
             self.metrics["phase_transitions"] += 1
@@ -382,29 +452,64 @@ class WebSocketFeed:
         if not validation["isValid"]:
             self.metrics["anomalies"] += 1
 
-        # Store last signal
-        self.last_signal = signal
+        self._broadcast_ready(ready, validation)
 
-        # Broadcast signal
-        self._broadcast_signal(signal, validation)
+    def _broadcast_ready(self, ready: list[GameSignal], validation: dict[str, Any]):
+        """Count, store and broadcast released signals, oldest first."""
+        if not ready:
+            return
+        self.metrics["total_signals"] += len(ready)
+        self.metrics["total_ticks"] += len(ready)
+        self.last_signal = ready[-1]
+        for ready_signal in ready:
+            self._broadcast_signal(ready_signal, validation)
+
+    def _flush_loop(self):
+        """Slot timer: release coalesced signals once their slot has passed."""
+        interval = min(1.0, 1.0 / self.rate_limiter.rate)
+        while not self._flush_stop.wait(interval):
+            try:
+                self._broadcast_ready(self.rate_limiter.flush_due(), {})
+            except Exception as e:
+                self.logger.error(f"Error flushing coalesced signals: {e}", exc_info=True)
+                self.metrics["errors"] += 1
+
+    def _check_schema(self, event_name: str, data: dict[str, Any]):
+        """Validate a sampled live event; schema failures are counted and emitted."""
+        error = self.schema_validator.validate_sampled(event_name, data)
+        # Events without a schema are noise here, not drift
+        if error is None or error.error_type != "validation":
+            return
+        self.metrics["schema_errors"] += 1
+        self.logger.warning(f"Schema mismatch in {event_name}: {error.error_message}")
+        self._emit_event("schema_error", error)
 
     def _extract_signal(self, raw_data: dict[str, Any]) -> dict[str, Any]:
-        """Extract ONLY the 9 signal fields from raw gameStateUpdate"""
-        # AUDIT FIX: Convert price to Decimal for financial precision
+        """Extract ONLY the 9 signal fields from raw gameStateUpdate (+ priceFp in fixed mode)"""
         raw_price = raw_data.get("price", 1.0)
-        price = Decimal(str(raw_price)) if raw_price is not None else Decimal("1.0")
+        price_fp = None
+        if self.numeric_mode == NUMERIC_MODE_FIXED:
+            # Fixed point: no Decimal until the trading boundary
+            price = float(raw_price) if raw_price is not None else 1.0
+            price_fp = price_to_fixed(price)
+        else:
+            # AUDIT FIX: Convert price to Decimal for financial precision
+            price = Decimal(str(raw_price)) if raw_price is not None else Decimal("1.0")
 
-        return {
+        signal = {
             "gameId": raw_data.get("gameId", ""),
             "active": raw_data.get("active", False),
             "rugged": raw_data.get("rugged", False),
             "tickCount": raw_data.get("tickCount", 0),
-            "price": price,  # AUDIT FIX: Now Decimal, not float
+            "price": price,  # AUDIT FIX: Now Decimal, not float (except fixed mode)
             "cooldownTimer": raw_data.get("cooldownTimer", 0),
             "allowPreRoundBuys": raw_data.get("allowPreRoundBuys", False),
             "tradeCount": raw_data.get("tradeCount", 0),
             "gameHistory": raw_data.get("gameHistory"),
         }
+        if price_fp is not None:
+            signal["priceFp"] = price_fp
+        return signal
 
     def _broadcast_signal(self, signal: GameSignal, validation: dict[str, Any]):
         """Broadcast clean signal to consumers"""
@@ -416,6 +521,11 @@ class WebSocketFeed:
 
         # Emit tick event during active gameplay
         if signal.phase == "ACTIVE_GAMEPLAY":
+            monitor = self.integrity_monitor
+            if monitor:
+                if signal.gameId != monitor.current_game_id:
+                    monitor.on_game_start(signal.gameId)
+                monitor.on_tick(signal.tickCount, coalesced=signal.coalescedTicks)
             self._emit_event(
                 "tick",
                 {
@@ -423,6 +533,8 @@ class WebSocketFeed:
                     "tickCount": signal.tickCount,
                     "price": signal.price,
                     "timestamp": signal.timestamp,
+                    # Ranges skipped on purpose by coalescing (not data loss)
+                    "coalescedTicks": signal.coalescedTicks,
                 },
             )
 
@@ -433,6 +545,13 @@ class WebSocketFeed:
     def _handle_game_complete(self, signal: GameSignal):
         """Handle game completion"""
         self.metrics["total_games"] += 1
+        # A rugged game ending without outstanding tick gaps clears monitor mode
+        monitor = self.integrity_monitor
+        if monitor:
+            no_gaps = monitor.consecutive_tick_gaps == 0
+            monitor.on_game_end(signal.gameId, clean=True)
+            if no_gaps:
+                monitor.on_clean_game_observed()
 
         # Extract seed data if available
         seed_data = None
@@ -550,10 +669,24 @@ class WebSocketFeed:
             self.logger.error(f"🚨 Connection failed: {e}")
             raise
 
+        if self.coalesce and self._flush_thread is None:
+            self._flush_stop.clear()
+            self._flush_thread = threading.Thread(
+                target=self._flush_loop, daemon=True, name="WebSocketFeed-Flush"
+            )
+            self._flush_thread.start()
+
     def disconnect(self):
         """Disconnect from backend"""
         self.logger.info("🔌 Disconnecting...")
         self.sio.disconnect()
+        if self.coalesce:
+            self._flush_stop.set()
+            if self._flush_thread is not None:
+                self._flush_thread.join(timeout=2.0)
+                self._flush_thread = None
+            # Deliver the latest state held for each game
+            self._broadcast_ready(self.rate_limiter.flush(), {})
         self.print_metrics()
 
     def get_last_signal(self) -> GameSignal | None:
@@ -574,7 +707,10 @@ class WebSocketFeed:
             game_id=signal.gameId,
             tick=signal.tickCount,
             timestamp=datetime.fromtimestamp(signal.timestamp / 1000).isoformat(),
-            price=signal.price,  # AUDIT FIX: Already Decimal, no conversion needed
+            # AUDIT FIX: Already Decimal in decimal mode; fixed mode converts here
+            price=signal.price
+            if signal.priceFp is None
+            else fixed_price_to_decimal(signal.priceFp),
             phase=signal.phase,
             active=signal.active,
             rugged=signal.rugged,
@@ -613,6 +749,8 @@ class WebSocketFeed:
             # PHASE 3.1: Rate limiting stats
             "rateLimited": self.metrics["rate_limited"],
             "rateLimitDropRate": f"{rate_stats['drop_rate']:.1f}%",
+            "coalesced": rate_stats.get("total_coalesced", 0),
+            "schemaErrors": self.metrics["schema_errors"],
             "errors": self.metrics["errors"],
         }
 
@@ -2,12 +2,14 @@
 Tests for ConfirmationMonitor and MockConfirmationMonitor.
 """
 
+import time
 from decimal import Decimal
 from unittest.mock import MagicMock
 
 import pytest
 
 from bot.action_interface.confirmation import ConfirmationMonitor, MockConfirmationMonitor
+from bot.action_interface.confirmation.monitor import LatencyHistogram
 from bot.action_interface.types import ActionType
 from models.events.player_action import PlayerState
 from services.event_bus import EventBus, Events
@@ -89,7 +91,7 @@ class TestConfirmationMonitor:
         monitor.register_pending("action1", ActionType.BUY, state_before=state)
 
         assert len(monitor._pending) == 1
-        pending = monitor._pending[0]
+        pending = monitor._pending["action1"]
         assert pending.action_id == "action1"
         assert pending.action_type == ActionType.BUY
         assert pending.state_before == state
@@ -102,7 +104,7 @@ class TestConfirmationMonitor:
         monitor.register_pending("action1", ActionType.BUY, callback=callback)
 
         assert len(monitor._pending) == 1
-        assert monitor._pending[0].callback == callback
+        assert monitor._pending["action1"].callback == callback
 
     def test_on_player_update_confirms_action(self, monitor, event_bus):
         """Test that PLAYER_UPDATE event confirms pending action."""
@@ -137,8 +139,6 @@ class TestConfirmationMonitor:
         event_bus.publish(Events.PLAYER_UPDATE, event_data)
 
         # Wait for event processing
-        import time
-
         time.sleep(0.2)
 
         # Action should be confirmed
@@ -164,7 +164,7 @@ class TestConfirmationMonitor:
         # Register pending action
         monitor.register_pending("action1", ActionType.BUY)
 
-        assert len(monitor._latency_samples) == 0
+        assert len(monitor._latency) == 0
 
         # Publish PLAYER_UPDATE event
         event_data = {
@@ -177,13 +177,11 @@ class TestConfirmationMonitor:
         event_bus.publish(Events.PLAYER_UPDATE, event_data)
 
         # Wait for event processing
-        import time
-
         time.sleep(0.2)
 
         # Latency sample should be recorded (>= 0ms, fast processing may be 0ms)
-        assert len(monitor._latency_samples) == 1
-        assert monitor._latency_samples[0] >= 0
+        assert len(monitor._latency) == 1
+        assert monitor._latency.samples[0] >= 0
 
     def test_get_latency_stats_empty(self, monitor):
         """Test latency stats with no samples."""
@@ -199,7 +197,8 @@ class TestConfirmationMonitor:
         monitor.start()
 
         # Add some latency samples manually
-        monitor._latency_samples.extend([10, 20, 30, 40, 50])
+        for latency in [10, 20, 30, 40, 50]:
+            monitor._latency.add(latency)
 
         stats = monitor.get_latency_stats()
 
@@ -232,8 +231,6 @@ class TestConfirmationMonitor:
         event_bus.publish(Events.PLAYER_UPDATE, event_data)
 
         # Wait for event processing
-        import time
-
         time.sleep(0.2)
 
         # First action should be confirmed
@@ -262,8 +259,6 @@ class TestConfirmationMonitor:
         event_bus.publish(Events.PLAYER_UPDATE, event_data)
 
         # Wait for event processing
-        import time
-
         time.sleep(0.2)
 
         # Action should still be confirmed (callback error handled)
@@ -284,12 +279,10 @@ class TestConfirmationMonitor:
         event_bus.publish(Events.PLAYER_UPDATE, event_data)
 
         # Wait for event processing
-        import time
-
         time.sleep(0.2)
 
         # No latency samples should be added
-        assert len(monitor._latency_samples) == 0
+        assert len(monitor._latency) == 0
 
     def test_max_pending_limit(self, monitor):
         """Test that pending actions are limited by maxlen."""
@@ -303,6 +296,156 @@ class TestConfirmationMonitor:
         assert len(monitor._pending) == 100
 
 
+def player_update(cash, qty):
+    """playerUpdate as the server sends it (flat cash / positionQty)."""
+    return {"data": {"cash": cash, "positionQty": qty, "avgCost": 0, "cumulativePnL": 0}}
+
+
+def legacy_player_update(cash, qty):
+    return {"currentBalance": cash, "position": {"qty": qty}, "cumulativePnl": 0}
+
+
+class TestSignatureMatching:
+    """Updates confirm the oldest action whose expected state change they show."""
+
+    def test_matches_by_direction_not_order(self, monitor):
+        buy, sell = MagicMock(), MagicMock()
+        monitor._on_player_update(player_update(1.0, 0))
+        monitor.register_pending("sell", ActionType.SELL, callback=sell)
+        monitor.register_pending("buy", ActionType.BUY, callback=buy)
+
+        monitor._on_player_update(player_update(0.9, 10))
+
+        buy.assert_called_once()
+        sell.assert_not_called()
+        assert list(monitor._pending) == ["sell"]
+
+    def test_fifo_within_signature(self, monitor):
+        monitor._on_player_update(player_update(1.0, 0))
+        monitor.register_pending("buy1", ActionType.BUY)
+        monitor.register_pending("buy2", ActionType.BUY)
+
+        monitor._on_player_update(player_update(0.9, 10))
+
+        assert list(monitor._pending) == ["buy2"]
+
+    def test_sidebet_signature(self, monitor):
+        monitor._on_player_update(player_update(1.0, 10))
+        monitor.register_pending("buy", ActionType.BUY)
+        monitor.register_pending("side", ActionType.SIDEBET)
+
+        monitor._on_player_update(player_update(0.99, 10))
+
+        assert list(monitor._pending) == ["buy"]
+
+    def test_server_shaped_buy_confirms(self, monitor):
+        callback = MagicMock()
+        monitor._on_player_update(player_update(1.0, 0))
+        monitor.register_pending("buy", ActionType.BUY, callback=callback)
+
+        monitor._on_player_update(player_update(0.9, 0.1))
+
+        assert callback.call_args[0][0].success is True
+        assert monitor._pending == {}
+
+    def test_legacy_shape_still_matches(self, monitor):
+        monitor._on_player_update(legacy_player_update(1.0, 0))
+        monitor.register_pending("sell", ActionType.SELL)
+        monitor.register_pending("buy", ActionType.BUY)
+
+        monitor._on_player_update(legacy_player_update(0.9, 10))
+
+        assert list(monitor._pending) == ["sell"]
+
+    def test_unmatched_update_falls_back_to_fifo(self, monitor):
+        monitor._on_player_update(player_update(1.0, 0))
+        monitor.register_pending("buy", ActionType.BUY)
+        monitor.register_pending("sell", ActionType.SELL)
+
+        monitor._on_player_update(player_update(1.1, 0))
+
+        assert list(monitor._pending) == ["sell"]
+        assert monitor.get_latency_stats()["count"] == 1
+
+    def test_unsignatured_action_takes_leftover_update(self, monitor):
+        monitor._on_player_update(player_update(1.0, 0))
+        monitor.register_pending("buy", ActionType.BUY)
+        monitor.register_pending("click", ActionType.BET_INCREMENT)
+
+        monitor._on_player_update(player_update(1.0, 0))
+
+        assert list(monitor._pending) == ["buy"]
+
+    def test_max_pending_evicts_from_index(self, event_bus):
+        monitor = ConfirmationMonitor(event_bus, max_pending=2)
+        monitor._on_player_update(player_update(1.0, 0))
+        for name in ("buy1", "buy2", "buy3"):
+            monitor.register_pending(name, ActionType.BUY)
+
+        monitor._on_player_update(player_update(0.9, 10))
+
+        assert list(monitor._pending) == ["buy3"]
+
+
+class TestTimeouts:
+    """Unconfirmed actions are failed from the timing wheel."""
+
+    def test_timed_out_action_fails(self, event_bus, monkeypatch):
+        now = [1_000.0]
+        monkeypatch.setattr(time, "time", lambda: now[0])
+        monitor = ConfirmationMonitor(event_bus, timeout_ms=500)
+        callback = MagicMock()
+        monitor.register_pending("buy", ActionType.BUY, callback=callback)
+
+        now[0] += 0.4
+        assert monitor.expire_timeouts() == 0
+        now[0] += 0.2
+        assert monitor.expire_timeouts() == 1
+
+        result = callback.call_args[0][0]
+        assert not result.success
+        assert result.action_id == "buy"
+        assert not monitor._pending
+        assert monitor.get_latency_stats()["timeouts"] == 1
+
+    def test_confirmed_action_not_timed_out(self, event_bus, monkeypatch):
+        now = [1_000.0]
+        monkeypatch.setattr(time, "time", lambda: now[0])
+        monitor = ConfirmationMonitor(event_bus, timeout_ms=500)
+        callback = MagicMock()
+        monitor.register_pending("buy", ActionType.BUY, callback=callback)
+        monitor._on_player_update(player_update(0.9, 10))
+
+        now[0] += 10
+        assert monitor.expire_timeouts() == 0
+        assert callback.call_args[0][0].success
+
+
+class TestLatencyHistogram:
+    def test_percentiles(self):
+        histogram = LatencyHistogram(window=1000)
+        for latency in range(1, 101):
+            histogram.add(latency)
+
+        stats = histogram.stats()
+
+        assert stats["p50_ms"] == pytest.approx(50, rel=0.05)
+        assert stats["p99_ms"] == pytest.approx(99, rel=0.05)
+        assert stats["avg_ms"] == 50.5
+
+    def test_window_rolls(self):
+        histogram = LatencyHistogram(window=3)
+        for latency in [500, 10, 20, 30]:
+            histogram.add(latency)
+
+        stats = histogram.stats()
+
+        assert stats["count"] == 3
+        assert stats["max_ms"] == 30
+        assert stats["min_ms"] == 10
+        assert stats["p99_ms"] == 30
+
+
 class TestMockConfirmationMonitor:
     """Test suite for MockConfirmationMonitor."""
 
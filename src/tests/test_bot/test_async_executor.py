@@ -0,0 +1,171 @@
+"""
+Tests for AsyncBotExecutor - FIFO queue and latest-wins mailbox modes
+"""
+
+import threading
+import time
+from dataclasses import replace
+
+import pytest
+
+from bot.async_executor import AsyncBotExecutor
+
+
+class SlowController:
+    """Records which tick each decision saw; blocks until released."""
+
+    def __init__(self, result=None):
+        self.gate = threading.Event()
+        self.started = threading.Event()
+        self.current_tick = None
+        self.seen = []
+        self.deadlines = []
+        self.result = result or {"success": True, "action": "WAIT"}
+
+    def execute_step(self, deadline=None):
+        self.seen.append(self.current_tick)
+        self.started.set()
+        self.gate.wait(timeout=2.0)
+        self.deadlines.append(deadline)
+        return self.result
+
+
+def wait_for(predicate, timeout=2.0):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+@pytest.fixture
+def ticks(sample_tick):
+    return [replace(sample_tick, tick=i) for i in range(6)]
+
+
+def run_burst(executor, controller, ticks):
+    """Queue ticks[0], wait until it is being decided, then queue the rest"""
+    executor.start()
+    controller.current_tick = ticks[0].tick
+    executor.queue_execution(ticks[0])
+    assert controller.started.wait(timeout=2.0)
+    for tick in ticks[1:]:
+        controller.current_tick = tick.tick
+        executor.queue_execution(tick)
+
+
+class TestQueueMode:
+    def test_processes_every_tick_in_order(self, ticks):
+        controller = SlowController()
+        controller.gate.set()
+        executor = AsyncBotExecutor(controller)
+        executor.start()
+        try:
+            for tick in ticks:
+                assert executor.queue_execution(tick)
+            assert wait_for(lambda: executor.executions == len(ticks))
+        finally:
+            executor.stop()
+
+        results = [executor.get_latest_result()["tick"] for _ in ticks]
+        assert results == [t.tick for t in ticks]
+        stats = executor.get_stats()
+        assert stats["mode"] == "queue"
+        assert stats["skipped_ticks"] == 0
+        assert controller.deadlines == [None] * len(ticks)
+
+    def test_disabled_rejects(self, ticks):
+        executor = AsyncBotExecutor(SlowController())
+
+        assert not executor.queue_execution(ticks[0])
+
+
+class TestMailboxMode:
+    def test_newest_tick_wins(self, ticks):
+        controller = SlowController()
+        executor = AsyncBotExecutor(controller, mailbox=True)
+        try:
+            run_burst(executor, controller, ticks)
+            assert executor.get_stats()["queue_size"] == 1
+            controller.gate.set()
+            assert wait_for(lambda: executor.executions == 2)
+        finally:
+            executor.stop()
+
+        assert [executor.get_latest_result()["tick"] for _ in range(2)] == [0, 5]
+        assert executor.get_latest_result() is None
+        stats = executor.get_stats()
+        assert stats["mode"] == "mailbox"
+        assert stats["skipped_ticks"] == 4
+        assert stats["queue_drops"] == 0
+
+    def test_staleness_measured(self, ticks):
+        controller = SlowController()
+        executor = AsyncBotExecutor(controller, mailbox=True)
+        try:
+            run_burst(executor, controller, ticks[:2])
+            time.sleep(0.05)
+            controller.gate.set()
+            assert wait_for(lambda: executor.executions == 2)
+        finally:
+            executor.stop()
+
+        stats = executor.get_stats()
+        # Tick 1 waited behind tick 0's decision
+        assert stats["staleness_max_ms"] >= 40
+        assert 0 < stats["staleness_avg_ms"] <= stats["staleness_max_ms"]
+
+    def test_stop_wakes_idle_worker(self):
+        executor = AsyncBotExecutor(SlowController(), mailbox=True)
+        executor.start()
+        start = time.monotonic()
+        executor.stop()
+
+        assert time.monotonic() - start < 1.0
+        assert not executor.worker_thread.is_alive()
+
+
+class TestDeadline:
+    def test_stale_tick_discarded_before_deciding(self, ticks):
+        controller = SlowController()
+        executor = AsyncBotExecutor(controller, mailbox=True, deadline=0.02)
+        try:
+            run_burst(executor, controller, ticks[:2])
+            time.sleep(0.05)
+            controller.gate.set()
+            assert wait_for(lambda: executor.deadline_discards == 1)
+        finally:
+            executor.stop()
+
+        # Only tick 0 reached the controller; tick 1 expired while waiting
+        assert controller.seen == [0]
+        assert executor.get_stats()["deadline_discards"] == 1
+        assert executor.get_stats()["deadline_ms"] == pytest.approx(20)
+
+    def test_deadline_passed_to_controller(self, ticks):
+        controller = SlowController()
+        controller.gate.set()
+        executor = AsyncBotExecutor(controller, deadline=5.0)
+        executor.start()
+        try:
+            executor.queue_execution(ticks[0])
+            assert wait_for(lambda: executor.executions == 1)
+        finally:
+            executor.stop()
+
+        assert controller.deadlines[0] > time.perf_counter()
+
+    def test_discarded_decision_not_counted(self, ticks):
+        controller = SlowController({"success": False, "action": "BUY", "discarded": True})
+        controller.gate.set()
+        executor = AsyncBotExecutor(controller, deadline=5.0)
+        executor.start()
+        try:
+            executor.queue_execution(ticks[0])
+            assert wait_for(lambda: executor.deadline_discards == 1)
+        finally:
+            executor.stop()
+
+        assert executor.executions == 0
+        assert executor.get_latest_result() is None
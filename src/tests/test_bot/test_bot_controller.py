@@ -94,6 +94,14 @@ class TestBotControllerStatistics:
         assert stats["success_rate"] >= 0.0
         assert stats["success_rate"] <= 100.0
 
+    def test_expired_deadline_discards_decision(self, loaded_game_state, bot_controller):
+        """Test a decision past its deadline is not executed"""
+        result = bot_controller.execute_step(deadline=0.0)
+
+        assert result["discarded"] is True
+        assert result["success"] is False
+        assert bot_controller.get_stats()["actions_taken"] == 0
+
 
 class TestBotControllerStrategyChange:
     """Tests for strategy changes"""
@@ -0,0 +1,136 @@
+"""
+Tests for ClickPlanner - shortest-path bet amount planner.
+
+The exhaustive test proves the planner is never worse than the
+calculate_optimal_sequence() heuristic over a full amount range.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from bot.bet_amount_sequencer import calculate_optimal_sequence
+from bot.click_planner import (
+    BUTTONS,
+    UNIT,
+    ClickPlanner,
+    apply_button,
+    plan_clicks,
+    to_units,
+)
+
+# Exhaustive range (0.000 - 0.150 SOL, every pair); the heuristic never
+# leaves [0, max(current, target)], so its plans are in the planner's space
+EXHAUSTIVE_UNITS = 150
+
+
+def simulate(units: int, sequence: list[str]) -> int:
+    for button in sequence:
+        units = apply_button(units, button)
+    return units
+
+
+def amount(units: int) -> Decimal:
+    return units * UNIT
+
+
+class TestApplyButton:
+    def test_increments(self):
+        assert apply_button(4, "+0.001") == 5
+        assert apply_button(4, "+0.01") == 14
+        assert apply_button(4, "+0.1") == 104
+        assert apply_button(4, "+1") == 1004
+
+    def test_double_clear(self):
+        assert apply_button(4, "X2") == 8
+        assert apply_button(4, "X") == 0
+
+    def test_half_rounds_half_even(self):
+        """Matches Decimal.quantize() in the sequencer and execution bridge"""
+        for units in range(50):
+            expected = (amount(units) / 2).quantize(UNIT)
+            assert amount(apply_button(units, "1/2")) == expected
+
+    def test_unknown_button(self):
+        with pytest.raises(ValueError):
+            apply_button(1, "MAX")
+
+
+class TestClickPlanner:
+    @pytest.fixture(scope="class")
+    def planner(self):
+        return ClickPlanner(max_units=EXHAUSTIVE_UNITS)
+
+    def test_same_amount(self, planner):
+        assert planner.plan(Decimal("0.004"), Decimal("0.004")) == []
+
+    def test_examples(self, planner):
+        assert planner.plan(Decimal("0.004"), Decimal("0.002")) == ["1/2"]
+        assert planner.plan(Decimal("0.004"), Decimal("0.008")) == ["X2"]
+        assert planner.plan(Decimal("0.004"), Decimal("0.005")) == ["+0.001"]
+        assert planner.plan(Decimal("0"), Decimal("0.1")) == ["+0.1"]
+
+    def test_beats_clear_and_rebuild(self, planner):
+        """0.004 → 0.003: 1/2, +0.001 instead of X, +0.001 x3"""
+        assert planner.plan(Decimal("0.004"), Decimal("0.003")) == ["1/2", "+0.001"]
+
+    def test_exhaustive_never_worse_than_heuristic(self, planner):
+        for start in range(EXHAUSTIVE_UNITS + 1):
+            for goal in range(EXHAUSTIVE_UNITS + 1):
+                current, target = amount(start), amount(goal)
+                plan = planner.plan(current, target)
+                heuristic = calculate_optimal_sequence(current, target)
+
+                assert simulate(start, plan) == goal, (current, target, plan)
+                assert simulate(start, heuristic) == goal, (current, target, heuristic)
+                assert len(plan) <= len(heuristic), (current, target, plan, heuristic)
+
+    def test_full_bet_range_from_zero(self):
+        planner = ClickPlanner()
+        for goal in range(0, planner.max_units + 1):
+            target = amount(goal)
+            plan = planner.plan(Decimal("0"), target)
+            assert simulate(0, plan) == goal
+            assert len(plan) <= len(calculate_optimal_sequence(Decimal("0"), target))
+
+    def test_weighted_costs(self):
+        """Slow X2 is avoided when plain increments are faster overall"""
+        planner = ClickPlanner({"X2": 1000.0, "+0.001": 10.0})
+
+        plan = planner.plan(Decimal("0.001"), Decimal("0.002"))
+
+        assert plan == ["+0.001"]
+        assert planner.cost(plan) == 10.0
+
+    def test_weighted_never_worse_than_heuristic(self):
+        costs = {"+0.001": 30.0, "+0.01": 35.0, "+0.1": 40.0, "+1": 45.0, "X2": 20.0}
+        planner = ClickPlanner(costs, max_units=60)
+        for start in range(61):
+            for goal in range(61):
+                current, target = amount(start), amount(goal)
+                heuristic = calculate_optimal_sequence(current, target)
+                assert planner.cost(planner.plan(current, target)) <= planner.cost(heuristic)
+
+    def test_missing_costs_use_mean(self):
+        planner = ClickPlanner({"+0.001": 10.0, "X2": 30.0})
+
+        assert planner.costs["1/2"] == 20.0
+        assert set(planner.costs) == set(BUTTONS)
+
+    def test_invalid_costs(self):
+        with pytest.raises(ValueError):
+            ClickPlanner({"X2": 0.0})
+
+    def test_out_of_range_falls_back(self, planner):
+        current, target = Decimal("0"), Decimal("1.234")
+
+        assert planner.plan(current, target) == calculate_optimal_sequence(current, target)
+
+    def test_precompute(self, planner):
+        planner.precompute([Decimal("0.010"), Decimal("5")])
+
+        assert to_units(Decimal("0.010")) in planner._tables
+        assert to_units(Decimal("5")) not in planner._tables
+
+    def test_plan_clicks(self):
+        assert plan_clicks(Decimal("0.007"), Decimal("0.003")) == ["1/2", "1/2", "+0.001"]
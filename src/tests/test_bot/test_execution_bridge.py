@@ -0,0 +1,147 @@
+"""
+Tests for BotExecutionBridge - front-running and speculative staging
+"""
+
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from bot.execution_bridge import BotExecutionBridge
+
+
+class FakeTradingController:
+    """Records button clicks instead of clicking."""
+
+    def __init__(self):
+        self.clicks = []
+
+    def clear_bet_amount(self):
+        self.clicks.append("X")
+
+    def double_bet_amount(self):
+        self.clicks.append("X2")
+
+    def half_bet_amount(self):
+        self.clicks.append("1/2")
+
+    def increment_bet_amount(self, amount):
+        self.clicks.append(f"+{amount}")
+
+    def execute_sidebet(self):
+        self.clicks.append("SIDEBET")
+
+
+class FakeBrowserBridge:
+    def is_connected(self):
+        return True
+
+
+@pytest.fixture
+def controller():
+    return FakeTradingController()
+
+
+@pytest.fixture
+def bridge(controller):
+    bridge = BotExecutionBridge(controller, FakeBrowserBridge())
+    bridge.INTER_CLICK_DELAY_MS = 0
+    bridge.enable()
+    return bridge
+
+
+class TestFrontRunning:
+    async def test_staged_amount_prepared_after_sidebet(self, bridge, controller):
+        bridge.stage_next_amount(Decimal("0.002"))
+
+        assert await bridge.execute_sidebet(Decimal("0.001"))
+
+        assert controller.clicks[:2] == ["+0.001", "SIDEBET"]
+        assert len(controller.clicks) == 3
+        assert bridge.current_amount == Decimal("0.002")
+        assert bridge.staged_amount is None
+
+
+class TestSpeculativeStaging:
+    async def test_equal_predictions_front_run_immediately(self, bridge, controller):
+        bridge.stage_outcomes(on_win=Decimal("0.002"), on_loss=Decimal("0.002"))
+
+        await bridge.execute_sidebet(Decimal("0.001"))
+
+        assert len(controller.clicks) == 3
+        assert bridge.current_amount == Decimal("0.002")
+
+    async def test_waits_for_outcome(self, bridge, controller):
+        bridge.stage_outcomes(on_win=Decimal("0.001"), on_loss=Decimal("0.002"))
+        await bridge.execute_sidebet(Decimal("0.001"))
+
+        assert controller.clicks == ["+0.001", "SIDEBET"]
+        assert bridge.get_staging_stats()["pending_outcomes"]
+
+    async def test_prestage_leaves_only_sidebet(self, bridge, controller):
+        bridge.stage_outcomes(on_win=Decimal("0.001"), on_loss=Decimal("0.004"))
+        await bridge.execute_sidebet(Decimal("0.001"))
+
+        assert bridge.resolve_outcome(won=False) == Decimal("0.004")
+        assert await bridge.prestage()
+        controller.clicks.clear()
+
+        await bridge.execute_sidebet(Decimal("0.004"))
+
+        assert controller.clicks == ["SIDEBET"]
+        assert bridge.get_staging_stats()["hits"] == 1
+
+    async def test_misprediction_corrected(self, bridge, controller):
+        bridge.stage_outcomes(on_win=Decimal("0.001"), on_loss=Decimal("0.004"))
+        await bridge.execute_sidebet(Decimal("0.001"))
+        bridge.resolve_outcome(won=False)
+        await bridge.prestage()
+        controller.clicks.clear()
+
+        await bridge.execute_sidebet(Decimal("0.002"))
+
+        assert controller.clicks == ["1/2", "SIDEBET"]
+        assert bridge.current_amount == Decimal("0.002")
+        stats = bridge.get_staging_stats()
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.0
+
+    async def test_no_next_bet_for_outcome(self, bridge):
+        bridge.stage_outcomes(on_win=None, on_loss=Decimal("0.002"))
+
+        assert bridge.resolve_outcome(won=True) is None
+        assert not await bridge.prestage()
+
+    async def test_execution_cancels_running_prestage(self, bridge, controller):
+        bridge.INTER_CLICK_DELAY_MS = 50
+        bridge.stage_next_amount(Decimal("0.007"))
+
+        prestage = asyncio.create_task(bridge.prestage())
+        await asyncio.sleep(0.075)
+        assert await bridge.execute_sidebet(Decimal("0.001"))
+
+        assert not await prestage
+        assert controller.clicks[-1] == "SIDEBET"
+        assert bridge.current_amount == Decimal("0.001")
+        assert bridge.get_staging_stats()["cancelled"] == 1
+
+    async def test_prestage_backs_off_when_cancel_precedes_lock(self, bridge, controller):
+        bridge.stage_next_amount(Decimal("0.007"))
+        bridge._click_lock.acquire()  # a prestage mid-click
+        execution = asyncio.create_task(bridge.execute_sidebet(Decimal("0.001")))
+        await asyncio.sleep(0.01)  # execution has requested the cancel and is waiting
+        bridge._click_lock.release()
+
+        assert not await bridge.prestage()
+        assert await execution
+
+        assert controller.clicks[:2] == ["+0.001", "SIDEBET"]
+        assert bridge.get_staging_stats()["cancelled"] == 1
+        assert not bridge._prestage_cancel.is_set()
+
+    async def test_disabled_does_not_prestage(self, bridge, controller):
+        bridge.stage_next_amount(Decimal("0.002"))
+        bridge.disable()
+
+        assert not await bridge.prestage()
+        assert controller.clicks == []
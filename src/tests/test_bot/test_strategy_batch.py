@@ -0,0 +1,172 @@
+"""
+Tests for batch strategy evaluation - vectorized decide_batch() vs decide()
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from bot.strategies import (
+    STRATEGIES,
+    BatchState,
+    GameArrays,
+    TradingStrategy,
+    VectorizedStrategy,
+    evaluate_strategy,
+    get_strategy,
+    parity_mismatches,
+)
+from bot.strategies.batch import ACTION_BUY, ACTION_SELL, ACTION_SIDE, run_scalar
+
+
+def random_game(rng, index):
+    """Random-walk game: presale, active play, rug on the last tick"""
+    length = int(rng.integers(20, 400))
+    scale = rng.choice([1.0, 2.0, 30.0])
+    steps = rng.normal(0.0, 0.08, length)
+    price = scale * np.exp(np.cumsum(steps))
+    phase = ["ACTIVE_GAMEPLAY"] * length
+    phase[: min(5, length)] = ["PRESALE"] * min(5, length)
+    phase[-1] = "RUG_EVENT"
+    active = [p == "ACTIVE_GAMEPLAY" for p in phase]
+    rugged = np.zeros(length, dtype=bool)
+    rugged[-1] = True
+    return GameArrays.from_columns(
+        price=price,
+        tick=np.arange(length),
+        phase=phase,
+        active=active,
+        rugged=rugged,
+        game_id=f"game-{index}",
+    )
+
+
+@pytest.fixture
+def games():
+    rng = np.random.default_rng(7)
+    return [random_game(rng, i) for i in range(150)]
+
+
+class TestGameArrays:
+    def test_tradeable_from_phase(self):
+        game = GameArrays.from_columns(
+            price=[1.0, 1.0, 1.0, 1.0],
+            tick=[0, 1, 2, 3],
+            phase=["PRESALE", "ACTIVE_GAMEPLAY", "COOLDOWN", "ACTIVE_GAMEPLAY"],
+            active=[False, True, True, False],
+        )
+
+        assert game.tradeable.tolist() == [True, True, False, False]
+        assert not game.rugged.any()
+
+    def test_from_ticks(self, sample_tick):
+        game = GameArrays.from_ticks([sample_tick])
+
+        assert game.price[0] == float(sample_tick.price)
+        assert game.game_id == sample_tick.game_id
+
+
+class TestParity:
+    @pytest.mark.parametrize("name", list(STRATEGIES))
+    def test_vectorized_matches_scalar(self, name, games):
+        assert parity_mismatches(STRATEGIES[name], games) == []
+
+    @pytest.mark.parametrize("name", list(STRATEGIES))
+    def test_parity_with_low_balance(self, name, games):
+        """Refused buys and exhausted wallets take the same path"""
+        assert parity_mismatches(STRATEGIES[name], games, initial_balance=0.007) == []
+
+    def test_detects_divergence(self, games):
+        class Broken(STRATEGIES["conservative"]):
+            def batch_rules(self, segment):
+                return [(code, 0.001, mask) for code, _, mask in super().batch_rules(segment)]
+
+        assert parity_mismatches(Broken, games[:20])
+
+
+class TestVectorizedOptIn:
+    def test_builtin_strategies_opt_in(self):
+        assert all(issubclass(cls, VectorizedStrategy) for cls in STRATEGIES.values())
+
+    def test_plain_strategy_has_no_rules(self):
+        assert not hasattr(TradingStrategy, "batch_rules")
+
+    def test_rules_required(self):
+        class NoRules(VectorizedStrategy, TradingStrategy):
+            def decide(self, observation, info):
+                return ("WAIT", None, "")
+
+        with pytest.raises(TypeError):
+            NoRules()
+
+
+class TestGameModel:
+    def game(self, price, rug_at=None):
+        length = len(price)
+        rugged = np.zeros(length, dtype=bool)
+        if rug_at is not None:
+            rugged[rug_at] = True
+        return GameArrays.from_columns(
+            price=price,
+            tick=np.arange(length),
+            phase=["ACTIVE_GAMEPLAY"] * length,
+            active=[True] * length,
+            rugged=rugged,
+        )
+
+    def test_sidebet_wins_on_rug_inside_window(self):
+        state = BatchState(balance=0.1)
+        actions = get_strategy("sidebet").decide_batch(self.game([5.0] * 25, rug_at=20), state)
+
+        assert actions[0] == ACTION_SIDE
+        assert state.sidebets_won == 1
+        assert state.balance == pytest.approx(0.1 - 0.003 + 0.003 * 5)
+
+    def test_sidebet_expiry_and_cooldown(self):
+        state = BatchState(balance=0.1)
+        actions = get_strategy("sidebet").decide_batch(self.game([5.0] * 60), state)
+
+        # Expires at tick 41, next allowed once the cooldown has passed
+        assert np.flatnonzero(actions == ACTION_SIDE).tolist() == [0, 47]
+        assert state.sidebets_lost == 2
+
+    def test_position_closed_at_game_end(self):
+        state = BatchState(balance=0.1)
+        actions = get_strategy("conservative").decide_batch(self.game([1.0, 1.1, 1.15]), state)
+
+        assert actions[0] == ACTION_BUY
+        assert ACTION_SELL not in actions
+        assert state.position_price is None
+        assert state.balance == pytest.approx(0.1 + 0.005 * 0.15)
+
+    def test_default_decide_batch_is_scalar(self, games):
+        class ScalarOnly(STRATEGIES["aggressive"]):
+            decide_batch = STRATEGIES["aggressive"].__bases__[0].decide_batch
+
+        expected = run_scalar(get_strategy("aggressive"), games[0], BatchState())
+        actions = ScalarOnly().decide_batch(games[0], BatchState())
+
+        assert (actions == expected).all()
+
+
+class TestEvaluate:
+    def test_summary(self, games):
+        evaluation = evaluate_strategy(get_strategy("foundational"), games)
+        summary = evaluation.to_dict()
+
+        assert summary["games"] == len(games)
+        assert summary["ticks"] == sum(len(g) for g in games)
+        assert sum(summary["action_counts"].values()) == summary["ticks"]
+        assert summary["pnl"] == pytest.approx(summary["final_balance"] - 0.1)
+
+    def test_faster_than_scalar(self, games):
+        start = time.perf_counter()
+        state = BatchState()
+        for game in games:
+            run_scalar(get_strategy("conservative"), game, state)
+        scalar = time.perf_counter() - start
+
+        batch = evaluate_strategy(get_strategy("conservative"), games).elapsed_s
+
+        assert batch < scalar
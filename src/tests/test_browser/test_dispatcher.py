@@ -0,0 +1,188 @@
+"""
+Tests for the in-page click dispatcher.
+
+The browser tests load a static trade-panel fixture in headless Chromium
+and are skipped when Playwright or its browser isn't installed.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from browser.dom.dispatcher import DISPATCHER_VERSION, ButtonSpec, InPageDispatcher
+from browser.executor import _button_spec
+
+FIXTURE = Path(__file__).parent / "fixtures" / "trade_controls.html"
+
+
+class FakePage:
+    """Records evaluate() calls and answers with canned results."""
+
+    def __init__(self, results):
+        self.results = results
+        self.calls = []
+
+    async def evaluate(self, script, arg=None):
+        self.calls.append(arg)
+        return self.results
+
+
+class TestInPageDispatcherUnit:
+    async def test_one_evaluate_per_plan(self):
+        page = FakePage(
+            [
+                {"button": "X", "success": True, "method": "css", "timestamp": 1.0},
+                {"button": "SIDEBET", "success": True, "cached": True, "timestamp": 2.0},
+            ]
+        )
+        dispatcher = InPageDispatcher({"X": ButtonSpec(css=[".clear"])}, delay_ms=(10, 50))
+
+        clicks = await dispatcher.run_plan(page, ["X", "SIDEBET"])
+
+        assert len(page.calls) == 1
+        arg = page.calls[0]
+        assert arg["version"] == DISPATCHER_VERSION
+        assert arg["steps"] == ["X", "SIDEBET"]
+        assert arg["specs"] == {
+            "X": {"css": [".clear"], "text": [], "classes": []},
+            "SIDEBET": {},
+        }
+        assert arg["delayMs"] == [10, 50]
+        assert [c.timestamp_ms for c in clicks] == [1.0, 2.0]
+        assert dispatcher.get_stats()["cache_hits"] == 1
+
+    async def test_missing_button_counted(self):
+        page = FakePage([{"button": "X2", "success": False, "error": "not found"}])
+        dispatcher = InPageDispatcher(_button_spec)
+
+        click = await dispatcher.click(page, "X2")
+
+        assert not click.success
+        assert click.error == "not found"
+        assert dispatcher.get_stats()["failures"] == 1
+
+    async def test_empty_plan(self):
+        page = FakePage([])
+
+        assert await InPageDispatcher(_button_spec).run_plan(page, []) == []
+        assert page.calls == []
+
+
+@pytest.fixture
+async def page():
+    async_api = pytest.importorskip("playwright.async_api")
+    async with async_api.async_playwright() as playwright:
+        try:
+            browser = await playwright.chromium.launch(headless=True)
+        except Exception as e:
+            pytest.skip(f"Chromium not available: {e}")
+        page = await browser.new_page()
+        await page.goto(FIXTURE.as_uri())
+        yield page
+        await browser.close()
+
+
+async def page_clicks(page) -> list[str]:
+    return await page.evaluate("() => window.clicks")
+
+
+class TestInPageDispatcherChromium:
+    async def test_plan_builds_amount_and_clicks_sidebet(self, page):
+        dispatcher = InPageDispatcher(_button_spec)
+        plan = ["X", "+0.01", "+0.001", "+0.001", "+0.001", "SIDEBET"]
+
+        clicks = await dispatcher.run_plan(page, plan)
+
+        assert [c.success for c in clicks] == [True] * len(plan)
+        assert await page_clicks(page) == [
+            "×",
+            "+0.01",
+            "+0.001",
+            "+0.001",
+            "+0.001",
+            "SIDEBET@0.013",
+        ]
+        timestamps = [c.timestamp_ms for c in clicks]
+        assert timestamps == sorted(timestamps)
+        assert dispatcher.get_stats()["total_plans"] == 1
+
+    async def test_resolution_cached(self, page):
+        dispatcher = InPageDispatcher(_button_spec)
+
+        first = await dispatcher.run_plan(page, ["X", "X2"])
+        second = await dispatcher.run_plan(page, ["X", "X2"])
+
+        assert [c.cached for c in first] == [False, False]
+        assert [c.cached for c in second] == [True, True]
+        assert second[0].selector == first[0].selector
+
+    async def test_missing_first_selector_paid_once(self, page):
+        spec = ButtonSpec(css=["#not-there", "button >> text=BUY", ".bet-button"])
+        dispatcher = InPageDispatcher({"SIDEBET": spec})
+
+        first = await dispatcher.click(page, "SIDEBET")
+        second = await dispatcher.click(page, "SIDEBET")
+
+        assert first.selector == ".bet-button"
+        assert not first.cached
+        assert second.cached
+
+    async def test_dom_mutation_relocates(self, page):
+        dispatcher = InPageDispatcher(_button_spec)
+        await dispatcher.click(page, "+0.1")
+
+        # Re-render the increment row: cached element is gone, resolution stays
+        await page.evaluate(
+            """() => {
+                const row = document.getElementById('increments');
+                const old = row.querySelector('[data-step="0.1"]');
+                const fresh = document.createElement('button');
+                fresh.textContent = '+0.1';
+                fresh.addEventListener('click', () => window.clicks.push('fresh'));
+                row.replaceChild(fresh, old);
+            }"""
+        )
+        click = await dispatcher.click(page, "+0.1")
+
+        assert click.success and click.cached
+        assert (await page_clicks(page))[-1] == "fresh"
+
+    async def test_stale_resolution_dropped(self, page):
+        dispatcher = InPageDispatcher({"SIDEBET": ButtonSpec(css=[".bet-button"], text=["SIDE"])})
+        await dispatcher.click(page, "SIDEBET")
+
+        # Class renamed by a UI update: the cached selector no longer matches
+        await page.evaluate(
+            "() => { document.querySelector('.bet-button').className = 'side-button' }"
+        )
+        click = await dispatcher.click(page, "SIDEBET")
+
+        assert click.success
+        assert not click.cached
+        assert click.method == "text-starts-with"
+
+    async def test_navigation_clears_cache(self, page):
+        dispatcher = InPageDispatcher(_button_spec)
+        await dispatcher.click(page, "X")
+
+        await page.reload()
+        click = await dispatcher.click(page, "X")
+
+        assert click.success
+        assert not click.cached
+
+    async def test_stops_at_missing_button(self, page):
+        dispatcher = InPageDispatcher(_button_spec)
+
+        clicks = await dispatcher.run_plan(page, ["+0.001", "MAX", "SIDEBET"])
+
+        assert [c.button for c in clicks] == ["+0.001", "MAX"]
+        assert not clicks[-1].success
+        assert await page_clicks(page) == ["+0.001"]
+
+    async def test_delays_applied_in_page(self, page):
+        dispatcher = InPageDispatcher(_button_spec, delay_ms=(20, 20))
+
+        clicks = await dispatcher.run_plan(page, ["+0.001", "+0.001"])
+
+        assert clicks[1].timestamp_ms - clicks[0].timestamp_ms >= 15
@@ -4,7 +4,7 @@ Tests for GameState
 
 from decimal import Decimal
 
-from core import GameState
+from core import GameState, StateEvents
 from models import Position
 
 
@@ -170,6 +170,17 @@ class TestGameStateGameManagement:
         assert game_state.get("game_active") is True
         assert game_state.get("current_tick") == 10
 
+    def test_ws_raw_event_skips_unparseable_price(self, game_state):
+        """A bad price leaves current_price alone; other fields still sync"""
+        game_state.update(current_price=Decimal("1.5"))
+
+        game_state._on_ws_raw_event(
+            {"event": "gameStateUpdate", "data": {"tickCount": 7, "price": "n/a"}}
+        )
+
+        assert game_state.get("current_tick") == 7
+        assert game_state.get("current_price") == Decimal("1.5")
+
 
 class TestGameStateSnapshot:
     """Tests for state snapshot"""
@@ -246,6 +257,44 @@ class TestGameStateResetAndMetrics:
         assert metrics["average_win"] > Decimal("0")
         assert metrics["average_loss"] > Decimal("0")
 
+    def test_metrics_published_after_partial_close(self, game_state, sample_position):
+        """calculate_metrics() reflects partial closes without recomputation"""
+        game_state.open_position(sample_position)
+        game_state.set_sell_percentage(Decimal("0.5"))
+        game_state.partial_close_position(Decimal("0.5"), Decimal("2.0"), exit_tick=3)
+
+        metrics = game_state.calculate_metrics()
+
+        assert metrics["average_win"] == Decimal("0.005")
+        assert metrics["current_balance"] == game_state.get("balance")
+
+    def test_metrics_follow_direct_balance_update(self, game_state):
+        game_state.update(balance=Decimal("0.2"))
+
+        metrics = game_state.calculate_metrics()
+
+        assert metrics["current_balance"] == Decimal("0.2")
+        assert metrics["roi"] == Decimal("1")
+
+    def test_metrics_are_a_copy(self, game_state):
+        game_state.calculate_metrics()["roi"] = Decimal("99")
+
+        assert game_state.calculate_metrics()["roi"] == Decimal("0")
+
+    def test_pnl_snapshot_tracks_position_and_games(self, game_state, sample_position):
+        game_state.update(game_id="g1", current_price=Decimal("1.0"))
+        game_state.open_position(sample_position)
+        game_state.update(current_price=Decimal("1.5"))
+
+        assert game_state.pnl_snapshot.unrealized_pnl == Decimal("0.005")
+
+        game_state.close_position(Decimal("1.5"))
+        game_state.reset()
+
+        pnl = game_state.pnl_snapshot
+        assert pnl.position_qty == Decimal("0")
+        assert [(g.game_id, g.wins) for g in pnl.games] == [("g1", 1)]
+
 
 class TestCaptureDemoSnapshot:
     """Tests for capture_demo_snapshot() - Phase 10 Demo Recording"""
@@ -330,3 +379,96 @@ class TestCaptureDemoSnapshot:
         assert "balance" in snapshot_dict
         assert "bet_amount" in snapshot_dict
         assert "current_tick" in snapshot_dict
+
+
+class TestCopyOnWrite:
+    """Tests for copy-on-write state versions and lazy history"""
+
+    def test_update_bumps_version(self, game_state):
+        """Each successful update publishes a new version"""
+        version = game_state.version
+
+        game_state.update(current_tick=1)
+
+        assert game_state.version == version + 1
+
+    def test_failed_validation_publishes_nothing(self, game_state):
+        """A rejected update leaves state and version untouched"""
+        version = game_state.version
+
+        assert game_state.update(current_tick=-1) is False
+
+        assert game_state.get("current_tick") == 0
+        assert game_state.version == version
+
+    def test_published_position_is_never_mutated(self, game_state, sample_position):
+        """Closing a position does not change dicts already handed out"""
+        game_state.open_position(sample_position)
+        before = game_state.get("position")
+
+        game_state.close_position(Decimal("1.5"))
+
+        assert before["status"] == "active"
+        assert "exit_price" not in before
+
+    def test_history_is_materialized_lazily(self, game_state, sample_position):
+        """History snapshots reflect each version as it was"""
+        game_state.open_position(sample_position)
+        game_state.update(current_tick=1, current_price=Decimal("1.2"))
+        game_state.close_position(Decimal("1.2"))
+        game_state.update(current_tick=2)
+
+        history = game_state.get_history()
+
+        assert [snap.tick for snap in history] == [1, 2]
+        assert history[0].position["status"] == "active"
+        assert history[1].position is None
+        assert game_state.get_history(limit=1)[0].tick == 2
+
+    def test_observers_only_for_changed_fields(self, game_state):
+        """Events fire only for fields that were updated and changed"""
+        ticks, phases = [], []
+        game_state.subscribe(StateEvents.TICK_UPDATED, ticks.append)
+        game_state.subscribe(StateEvents.PHASE_CHANGED, phases.append)
+
+        game_state.update(current_tick=3)
+        game_state.update(current_tick=3, current_phase="ACTIVE")
+        game_state.update(balance=Decimal("0.2"))
+
+        assert ticks == [3]
+        assert phases == ["ACTIVE"]
+
+    def test_current_tick_follows_version(self, game_state):
+        """get_current_tick reflects the latest state version"""
+        game_state.update(current_tick=5, current_price=Decimal("1.25"))
+
+        tick = game_state.get_current_tick()
+
+        assert (tick.tick, tick.price) == (5, Decimal("1.25"))
+        game_state.update(current_tick=6)
+        assert game_state.get_current_tick().tick == 6
+
+    def test_current_tick_not_shared(self, game_state):
+        """Modifying a returned tick does not leak into other callers"""
+        game_state.update(current_tick=5, current_price=Decimal("1.25"))
+
+        tick = game_state.get_current_tick()
+        tick.price = Decimal("9")
+
+        assert game_state.get_current_tick() is not tick
+        assert game_state.get_current_tick().price == Decimal("1.25")
+
+    def test_validator_runs_only_for_watched_fields(self, game_state):
+        """Validators registered with fields skip updates that don't touch them"""
+        calls = []
+
+        def no_big_ticks(state):
+            calls.append(state["current_tick"])
+            return state["current_tick"] < 100
+
+        game_state.add_validator(no_big_ticks, fields=["current_tick"])
+
+        assert game_state.update(current_price=Decimal("2"))
+        assert calls == []
+        assert not game_state.update(current_tick=100)
+        assert game_state.get("current_tick") == 0
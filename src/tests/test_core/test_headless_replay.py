@@ -0,0 +1,125 @@
+"""
+Tests for headless (as-fast-as-possible) replay
+"""
+
+import json
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core import GameState, ReplayEngine, headless_replay
+from core.game_queue import GameQueue
+from core.headless_replay import run_games, run_queue
+from core.replay_source import FileDirectorySource, MmapReplaySource
+
+
+def write_game(path, game_id: str, rug_tick: int = 5) -> None:
+    with path.open("w") as fh:
+        for tick in range(rug_tick + 1):
+            rugged = tick == rug_tick
+            row = {
+                "game_id": game_id,
+                "tick": tick,
+                "timestamp": f"2025-01-01T00:00:{tick:02d}",
+                "price": 0.01 if rugged else 1.0 + tick * 0.1,
+                "phase": "RUG_EVENT" if rugged else "ACTIVE",
+                "active": True,
+                "rugged": rugged,
+                "cooldown_timer": 0,
+                "trade_count": tick,
+            }
+            fh.write(json.dumps(row) + "\n")
+
+
+@pytest.fixture
+def games_dir(tmp_path):
+    for n in range(3):
+        write_game(tmp_path / f"game_{n}.jsonl", f"game-{n}", rug_tick=4 + n)
+    return tmp_path
+
+
+class TestRunHeadless:
+    def test_plays_every_tick_without_ui_dispatch(self, games_dir):
+        state = GameState(Decimal("0.100"))
+        engine = ReplayEngine(state, FileDirectorySource(games_dir))
+        engine.on_tick_callback = MagicMock()
+        bot = MagicMock()
+        bot.get_stats.return_value = {"actions_taken": 5}
+        seen = []
+
+        with patch("core.replay_engine.event_bus") as bus:
+            result = engine.run_headless(
+                games_dir / "game_0.jsonl",
+                bot_controller=bot,
+                on_tick=lambda tick, index, total: seen.append((tick.tick, index, total)),
+            )
+
+        assert result["game_id"] == "game-0"
+        assert result["ticks"] == 5
+        assert result["ticks_per_sec"] > 0
+        assert result["bot"] == {"actions_taken": 5}
+        assert seen == [(i, i, 5) for i in range(5)]
+        assert bot.execute_step.call_count == 5
+        bus.publish.assert_not_called()
+        engine.on_tick_callback.assert_not_called()
+        assert state.get("rug_detected") is True
+        assert state.get("current_tick") == 4
+
+    def test_history_is_batched(self, games_dir):
+        state = GameState(Decimal("0.100"))
+        engine = ReplayEngine(state, FileDirectorySource(games_dir))
+
+        engine.run_headless(games_dir / "game_2.jsonl")
+
+        # reset + initial update, one batch snapshot, final game_active=False
+        assert len(state.get_history()) == 3
+
+    def test_batch_updates_nested(self):
+        state = GameState(Decimal("0.100"))
+
+        with state.batch_updates():
+            with state.batch_updates():
+                state.update(current_tick=1)
+            state.update(current_tick=2)
+            assert state.get_history() == []
+
+        assert [snap.tick for snap in state.get_history()] == [2]
+
+
+class TestBatchRuns:
+    def test_run_games_inline(self, games_dir):
+        paths = sorted(games_dir.glob("game_*.jsonl"))
+
+        summary = run_games(paths, strategy_name="conservative", max_workers=1)
+
+        assert [game["game_id"] for game in summary.games] == ["game-0", "game-1", "game-2"]
+        assert summary.total_ticks == 5 + 6 + 7
+        assert summary.errors == []
+        assert summary.to_dict()["games_played"] == 3
+
+    def test_run_games_collects_errors(self, games_dir):
+        (games_dir / "game_bad.jsonl").write_text("not json\n")
+
+        summary = run_games(sorted(games_dir.glob("game_*.jsonl")), max_workers=1)
+
+        assert len(summary.games) == 3
+        assert summary.errors[0]["filepath"].endswith("game_bad.jsonl")
+
+    def test_run_games_process_pool(self, games_dir):
+        paths = sorted(games_dir.glob("game_*.jsonl"))
+
+        with patch.object(headless_replay, "MIN_PARALLEL_GAMES", 1):
+            parallel = run_games(paths, max_workers=2, use_mmap=True)
+        inline = run_games(paths, max_workers=1)
+
+        assert [g["game_id"] for g in parallel.games] == [g["game_id"] for g in inline.games]
+        assert [g["metrics"] for g in parallel.games] == [g["metrics"] for g in inline.games]
+
+    def test_run_queue_back_to_back(self, games_dir):
+        queue = GameQueue(games_dir, source=MmapReplaySource(games_dir))
+
+        summary = run_queue(queue, max_games=2)
+
+        assert [game["game_id"] for game in summary.games] == ["game-0", "game-1"]
+        assert queue.get_remaining_count() == 1
@@ -0,0 +1,195 @@
+"""
+Tests for memory-mapped tick indexes, MmapReplaySource and GameQueue prefetch
+"""
+
+import json
+import os
+from decimal import Decimal
+
+import pytest
+
+from core.game_queue import GameQueue
+from core.replay_source import FileDirectorySource, MmapReplaySource
+from core.tick_index import TickIndex, build_tick_index, index_jsonl
+from models import GameTick
+
+
+def tick_dict(tick: int, price, game_id: str = "game-1", **overrides) -> dict:
+    data = {
+        "game_id": game_id,
+        "tick": tick,
+        "timestamp": f"2025-11-15T00:00:{tick:02d}",
+        "price": price,
+        "phase": "ACTIVE",
+        "active": True,
+        "rugged": False,
+        "cooldown_timer": 0,
+        "trade_count": tick,
+    }
+    data.update(overrides)
+    return data
+
+
+def write_game(path, rows) -> None:
+    path.write_text("\n".join(json.dumps(row) for row in rows) + "\n")
+
+
+@pytest.fixture
+def game_file(tmp_path):
+    path = tmp_path / "game_001.jsonl"
+    write_game(
+        path,
+        [
+            tick_dict(0, 1.0, phase="PRESALE", active=False),
+            tick_dict(1, 1.23456789),
+            tick_dict(2, "2.50"),
+            tick_dict(3, 0.1, rugged=True, phase="RUG_EVENT", cooldown_timer=15000),
+        ],
+    )
+    return path
+
+
+class TestTickIndex:
+    def test_matches_file_directory_source(self, tmp_path, game_file):
+        expected, _ = FileDirectorySource(tmp_path).load(game_file.name)
+        index_jsonl(game_file, tmp_path / "game.tickidx")
+
+        with TickIndex(tmp_path / "game.tickidx") as index:
+            assert len(index) == 4
+            assert list(index) == expected
+            assert str(index[2].price) == "2.50"
+            assert index[-1].phase == "RUG_EVENT"
+            assert index[1:3] == expected[1:3]
+            assert index.game_id == "game-1"
+
+    def test_out_of_range(self, tmp_path, game_file):
+        index_jsonl(game_file, tmp_path / "game.tickidx")
+
+        with TickIndex(tmp_path / "game.tickidx") as index, pytest.raises(IndexError):
+            index[4]
+
+    def test_index_of_tick_contiguous(self, tmp_path, game_file):
+        index_jsonl(game_file, tmp_path / "game.tickidx")
+
+        with TickIndex(tmp_path / "game.tickidx") as index:
+            assert index.index_of_tick(2) == 2
+            assert index.index_of_tick(4) is None
+            assert index.index_of_tick(-1) is None
+
+    def test_index_of_tick_with_gaps(self, tmp_path):
+        ticks = [GameTick.from_dict(tick_dict(n, 1.0)) for n in (5, 6, 9, 9, 12)]
+        build_tick_index(ticks, tmp_path / "gaps.tickidx")
+
+        with TickIndex(tmp_path / "gaps.tickidx") as index:
+            assert index.index_of_tick(5) == 0
+            assert index.index_of_tick(9) == 2
+            assert index.index_of_tick(12) == 4
+            assert index.index_of_tick(7) is None
+
+    def test_rejects_foreign_file(self, tmp_path, game_file):
+        with pytest.raises(ValueError):
+            TickIndex(game_file)
+
+    def test_freshness(self, tmp_path, game_file):
+        index_jsonl(game_file, tmp_path / "game.tickidx")
+
+        with TickIndex(tmp_path / "game.tickidx") as index:
+            assert index.is_fresh(game_file)
+            with open(game_file, "a") as f:
+                f.write(json.dumps(tick_dict(4, 0.0)) + "\n")
+            assert not index.is_fresh(game_file)
+
+
+class TestMmapReplaySource:
+    def test_load(self, tmp_path, game_file):
+        source = MmapReplaySource(tmp_path)
+
+        ticks, game_id = source.load(game_file.name)
+
+        assert isinstance(ticks, TickIndex)
+        assert game_id == "game-1"
+        assert ticks[1].price == Decimal("1.23456789")
+        assert source.index_path(game_file).exists()
+
+    def test_index_reused_until_source_changes(self, tmp_path, game_file):
+        source = MmapReplaySource(tmp_path)
+        source.load(game_file.name)
+        index_path = source.index_path(game_file)
+        built_at = index_path.stat().st_mtime_ns
+
+        source.load(game_file.name)
+        assert index_path.stat().st_mtime_ns == built_at
+
+        write_game(game_file, [tick_dict(0, 3.0)])
+        os.utime(game_file, ns=(built_at + 10**9, built_at + 10**9))
+        ticks, _ = source.load(game_file.name)
+
+        assert len(ticks) == 1
+        assert ticks[0].price == Decimal("3.0")
+
+    def test_load_invalid(self, tmp_path):
+        (tmp_path / "empty.jsonl").write_text("")
+        (tmp_path / "bad.jsonl").write_text("not json\n")
+        source = MmapReplaySource(tmp_path)
+
+        with pytest.raises(ValueError):
+            source.load("empty.jsonl")
+        with pytest.raises(ValueError):
+            source.load("bad.jsonl")
+        with pytest.raises(FileNotFoundError):
+            source.load("missing.jsonl")
+
+    def test_list_available_ignores_index_dir(self, tmp_path, game_file):
+        source = MmapReplaySource(tmp_path)
+        source.load(game_file.name)
+
+        assert source.list_available() == ["game_001.jsonl"]
+
+    def test_load_from_store(self, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        tick_dir = tmp_path / "events_parquet" / "doc_type=game_tick" / "date=2025-11-15"
+        tick_dir.mkdir(parents=True)
+        rows = {
+            "ts": ["2025-11-15T00:00:01", "2025-11-15T00:00:00", "2025-11-15T00:00:00"],
+            "seq": [2, 1, 1],
+            "game_id": ["g1", "g1", "g2"],
+            "tick": [1, 0, 0],
+            "price": ["1.5", "1.0", "9.0"],
+            "raw_json": ['{"phase": "ACTIVE", "active": true}', "{}", "{}"],
+        }
+        pq.write_table(pa.table(rows), tick_dir / "part.parquet")
+        source = MmapReplaySource(tmp_path, events_parquet_dir=tmp_path / "events_parquet")
+
+        ticks, game_id = source.load_from_store("g1")
+
+        assert game_id == "g1"
+        assert [t.tick for t in ticks] == [0, 1]
+        assert ticks[1].price == Decimal("1.5")
+        assert ticks[1].phase == "ACTIVE"
+        with pytest.raises(ValueError):
+            source.load_from_store("missing")
+
+
+class TestGameQueuePrefetch:
+    def test_prefetches_upcoming_game(self, tmp_path):
+        for n in range(3):
+            write_game(tmp_path / f"game_{n}.jsonl", [tick_dict(0, 1.0, game_id=f"g{n}")])
+        source = MmapReplaySource(tmp_path)
+
+        queue = GameQueue(tmp_path, source=source)
+        assert queue.wait_for_prefetch(timeout=5)
+        assert source.index_path(tmp_path / "game_0.jsonl").exists()
+        assert not source.index_path(tmp_path / "game_1.jsonl").exists()
+
+        queue.next_game()
+        assert queue.wait_for_prefetch(timeout=5)
+        assert source.index_path(tmp_path / "game_1.jsonl").exists()
+
+    def test_prefetch_failure_is_not_fatal(self, tmp_path):
+        (tmp_path / "game_bad.jsonl").write_text("not json\n")
+
+        queue = GameQueue(tmp_path, source=MmapReplaySource(tmp_path))
+
+        assert queue.wait_for_prefetch(timeout=5)
+        assert queue.next_game() == tmp_path / "game_bad.jsonl"
@@ -0,0 +1,177 @@
+"""Tests for the Foundation pipeline benchmark harness."""
+
+import json
+from datetime import datetime
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from foundation.benchmark import (
+    ALL_EVENTS,
+    DEFAULT_TICK_INTERVAL_S,
+    RecordedFrame,
+    compare_reports,
+    load_jsonl,
+    load_recording,
+    main,
+    run_benchmark,
+)
+from services.event_store.paths import EventStorePaths
+from services.event_store.ticks import TickWriter
+
+
+def write_jsonl(path, rows):
+    path.write_text("\n".join(json.dumps(row) for row in rows) + "\n")
+    return path
+
+
+def game_state(tick: int) -> dict:
+    return {"gameId": "g1", "tickCount": tick, "price": 1.0 + tick / 100, "active": True}
+
+
+class TestLoadRecording:
+    def test_raw_events(self, tmp_path):
+        path = write_jsonl(
+            tmp_path / "events.jsonl",
+            [
+                {"event": "gameStateUpdate", "data": game_state(0), "timestamp": 1000.0},
+                {"event": "standard/newTrade", "data": {"qty": 1}, "timestamp": 1000.1},
+                {"event": "gameStateUpdate", "data": game_state(1), "timestamp": 1000.25},
+            ],
+        )
+
+        frames = load_recording(path)
+
+        assert [f.event for f in frames] == [
+            "gameStateUpdate",
+            "standard/newTrade",
+            "gameStateUpdate",
+        ]
+        assert [f.offset_s for f in frames] == pytest.approx([0.0, 0.1, 0.25])
+
+    def test_game_tick_lines(self, tmp_path):
+        path = write_jsonl(
+            tmp_path / "game.jsonl",
+            [
+                {"game_id": "g1", "tick": 0, "price": "1.0", "timestamp": "2026-01-01T00:00:00"},
+                {"game_id": "g1", "tick": 1, "price": "1.5", "timestamp": "2026-01-01T00:00:00.5"},
+            ],
+        )
+
+        frames = load_jsonl(path)
+
+        assert frames[1].event == "gameStateUpdate"
+        assert frames[1].data["tickCount"] == 1
+        assert frames[1].data["price"] == 1.5
+        assert frames[1].offset_s == pytest.approx(0.5)
+
+    def test_missing_timestamps_use_tick_interval(self, tmp_path):
+        path = write_jsonl(tmp_path / "x.jsonl", [{"event": "e", "data": {}}] * 3)
+
+        offsets = [f.offset_s for f in load_jsonl(path)]
+
+        assert offsets == pytest.approx([0, DEFAULT_TICK_INTERVAL_S, 2 * DEFAULT_TICK_INTERVAL_S])
+
+    def test_event_store_parquet(self, tmp_path):
+        rows = [
+            {
+                "ts": datetime(2026, 1, 1, 0, 0, 2),
+                "seq": 2,
+                "raw_json": json.dumps({"event": "b", "data": {}}),
+            },
+            {
+                "ts": datetime(2026, 1, 1, 0, 0, 1),
+                "seq": 1,
+                "raw_json": json.dumps({"event": "a", "data": {}}),
+            },
+            {"ts": datetime(2026, 1, 1, 0, 0, 3), "seq": 3, "raw_json": json.dumps({"tick": 1})},
+        ]
+        path = tmp_path / "events.parquet"
+        pq.write_table(pa.Table.from_pylist(rows), path)
+
+        frames = load_recording(path)
+
+        assert [f.event for f in frames] == ["a", "b"]
+        assert frames[1].offset_s == pytest.approx(1.0)
+
+    def test_tick_dataset(self, tmp_path):
+        paths = EventStorePaths(data_dir=tmp_path)
+        writer = TickWriter(paths, flush_interval=3600)
+        for i in range(3):
+            writer.write(
+                "gameStateUpdate",
+                game_state(i),
+                session_id="s1",
+                seq=i + 1,
+                source="cdp",
+                ts_ms=1_767_225_600_000 + i * 250,
+            )
+        writer.close()
+
+        frames = load_recording(paths.ticks_parquet_dir)
+
+        assert [f.data for f in frames] == [game_state(i) for i in range(3)]
+        assert frames[2].offset_s == pytest.approx(0.5)
+
+
+class TestCompareReports:
+    def report(self, rate=1000.0, p99=500.0, dropped=0):
+        run = {
+            "speed": 10.0,
+            "achieved_rate": rate,
+            "dropped": dropped,
+            "latency_us": {ALL_EVENTS: {"p99_us": p99}},
+        }
+        return {"max_throughput": rate, "runs": [run]}
+
+    def test_no_regression(self):
+        assert compare_reports(self.report(), self.report(rate=950.0, p99=550.0)) == []
+
+    def test_throughput_regression(self):
+        regressions = compare_reports(self.report(), self.report(rate=800.0))
+
+        assert len(regressions) == 2
+        assert "max throughput" in regressions[0]
+
+    def test_latency_and_drop_regressions(self):
+        regressions = compare_reports(self.report(), self.report(p99=1000.0, dropped=3))
+
+        assert any("p99" in r for r in regressions)
+        assert any("dropped" in r for r in regressions)
+
+
+class TestEndToEnd:
+    async def test_pipeline_delivers_every_frame(self):
+        frames = [RecordedFrame(i * 0.25, "gameStateUpdate", game_state(i)) for i in range(20)]
+        frames.append(RecordedFrame(5.0, "standard/newTrade", {"username": "u", "qty": 1}))
+        frames.append(RecordedFrame(5.1, "somethingNew", {"x": 1}))
+
+        report = await run_benchmark(frames, speeds=[100.0, 0])
+
+        assert report["frames"] == 22
+        assert report["event_counts"]["gameStateUpdate"] == 20
+        for run in report["runs"]:
+            assert run["received"] == 22
+            assert run["dropped"] == 0
+            latency = run["latency_us"]
+            assert latency[ALL_EVENTS]["count"] == 22
+            assert latency["game.tick"]["count"] == 20
+            assert latency["player.trade"]["count"] == 1
+            assert latency["raw.somethingNew"]["count"] == 1
+            assert latency[ALL_EVENTS]["p50_us"] > 0
+
+    def test_cli_writes_report(self, tmp_path):
+        recording = write_jsonl(
+            tmp_path / "r.jsonl",
+            [{"event": "gameStateUpdate", "data": game_state(i)} for i in range(5)],
+        )
+        out = tmp_path / "report.json"
+
+        assert main([str(recording), "--speeds", "0", "--out", str(out)]) == 0
+        args = ["--baseline", str(out), "--tolerance", "1", "--latency-tolerance", "1000"]
+        assert main([str(recording), "--speeds", "0", *args]) == 0
+
+        report = json.loads(out.read_text())
+        assert report["runs"][0]["received"] == 5
+        assert report["recording"] == str(recording)
@@ -0,0 +1,130 @@
+"""
+Tests for the headless batch backtest engine.
+
+Parity: every batch result must equal what tick-by-tick PlaybackState
+produces for the same strategy and games.
+"""
+
+import random
+
+import pytest
+
+from recording_ui.services.backtest_batch import (
+    games_to_arrays,
+    run_batch,
+    run_batch_grid,
+)
+from recording_ui.services.backtest_service import BacktestService
+
+
+def make_games(n: int, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    games = []
+    for i in range(n):
+        duration = rng.choice([rng.randint(51, 200), rng.randint(150, 500), rng.randint(200, 900)])
+        games.append({"game_id": f"game-{i}", "prices": [1.0] * duration, "duration": duration})
+    return games
+
+
+def run_playback(tmp_path, strategy: dict, games: list[dict]):
+    service = BacktestService(data_dir=str(tmp_path), strategies_dir=str(tmp_path / "strategies"))
+    service._validation_games = games
+    session_id = service.start_playback(strategy)
+    state = service.get_state(session_id)
+    while not state.finished:
+        service.tick(session_id)
+    return state
+
+
+STRATEGIES = [
+    {"name": "flat", "initial_balance": 0.1, "params": {"entry_tick": 200, "num_bets": 4}},
+    {
+        "name": "kelly",
+        "initial_balance": 0.26,
+        "params": {
+            "entry_tick": 219,
+            "num_bets": 4,
+            "bet_sizes": [0.001, 0.001, 0.001, 0.001],
+            "use_kelly_sizing": True,
+            "kelly_fraction": 0.25,
+            "use_dynamic_sizing": True,
+            "high_confidence_multiplier": 3,
+            "reduce_on_drawdown": True,
+            "max_drawdown_pct": 0.5,
+            "take_profit_target": 1.8,
+        },
+    },
+    {
+        "name": "martingale",
+        "initial_balance": 0.05,
+        "params": {
+            "entry_tick": 120,
+            "num_bets": 3,
+            "bet_sizes": [0.002, 0.004, 0.008],
+            "max_drawdown_pct": 0.3,
+        },
+    },
+    {
+        "name": "unaffordable",
+        "initial_balance": 0.005,
+        "params": {"entry_tick": 100, "num_bets": 4, "bet_sizes": [0.01, 0.001, 0.01, 0.001]},
+    },
+]
+
+
+class TestBatchParity:
+    @pytest.mark.parametrize("strategy", STRATEGIES, ids=lambda s: s["name"])
+    def test_matches_playback(self, tmp_path, strategy):
+        games = make_games(150)
+        state = run_playback(tmp_path, strategy, games)
+
+        game_ids, durations = games_to_arrays(games)
+        result = run_batch(strategy, game_ids, durations)
+
+        assert result.wins == state.wins
+        assert result.losses == state.losses
+        assert result.early_rugs == state.early_rugs
+        assert result.games_played == state.games_played
+        assert result.total_wagered == state.total_wagered
+        assert result.wallet == state.wallet
+        assert result.max_drawdown == state.max_drawdown
+        assert result.equity_curve == state.equity_curve
+        assert result.to_dict()["stats"] == state.to_dict()["stats"]
+
+
+class TestBatchResults:
+    def test_per_game_results(self):
+        games = make_games(20)
+        game_ids, durations = games_to_arrays(games)
+
+        result = run_batch(STRATEGIES[0], game_ids, durations, include_games=True)
+
+        assert len(result.games) == result.games_evaluated
+        outcomes = {g.outcome for g in result.games}
+        assert outcomes <= {"early_rug", "no_bet", "win", "loss"}
+        assert sum(g.outcome == "win" for g in result.games) == result.wins
+        assert result.games[-1].wallet == result.wallet
+
+    def test_stop_on_max_drawdown(self):
+        strategy = {
+            "initial_balance": 0.01,
+            "params": {"entry_tick": 10, "num_bets": 1, "bet_sizes": [0.005]},
+        }
+        # Never rugs inside the window -> every bet loses
+        result = run_batch(strategy, ["a", "b", "c"], [500, 500, 500])
+
+        assert result.stop_reason == "max_drawdown"
+        assert result.games_evaluated == 1
+
+    def test_grid_matches_individual_runs(self):
+        games = make_games(100)
+        game_ids, durations = games_to_arrays(games)
+        grid = [
+            {"name": f"e{e}", "params": {"entry_tick": e, "num_bets": 4}}
+            for e in range(100, 300, 25)
+        ]
+
+        parallel = run_batch_grid(grid, game_ids, durations, max_workers=2)
+        serial = [run_batch(s, game_ids, durations) for s in grid]
+
+        assert [r.to_dict() for r in parallel] == [r.to_dict() for r in serial]
@@ -0,0 +1,163 @@
+"""
+Tests for speculative bet staging in LiveBacktestService.
+
+Checks which next-bet amounts are predicted for each outcome and when the
+execution bridge is told to pre-stage them.
+"""
+
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from recording_ui.services.live_backtest_service import (
+    SIDEBET_PAYOUT,
+    SIDEBET_WINDOW,
+    LiveBacktestService,
+)
+from sources.game_state_machine import GameSignal
+
+
+def signal(tick: int, game_id: str = "g1", rugged: bool = False) -> GameSignal:
+    return GameSignal(
+        gameId=game_id,
+        active=not rugged,
+        rugged=rugged,
+        tickCount=tick,
+        price=Decimal("1.5"),
+        cooldownTimer=0,
+        allowPreRoundBuys=False,
+        tradeCount=0,
+        gameHistory=None,
+        phase="RUGGED" if rugged else "ACTIVE_GAMEPLAY",
+    )
+
+
+class FakeBridge:
+    """Records staging calls; coroutines are named, not run."""
+
+    def __init__(self):
+        self.calls = []
+        self.predicted = None
+
+    def stage_outcomes(self, on_win, on_loss):
+        self.predicted = {True: on_win, False: on_loss}
+        self.calls.append(("stage_outcomes", on_win, on_loss))
+
+    def stage_next_amount(self, amount):
+        self.calls.append(("stage_next_amount", amount))
+
+    def resolve_outcome(self, won):
+        self.calls.append(("resolve_outcome", won))
+        return self.predicted[won]
+
+    async def prestage(self):
+        return True
+
+    async def execute_sidebet(self, amount):
+        return True
+
+
+STRATEGY = {"entry_tick": 10, "num_bets": 2, "bet_sizes": [0.001, 0.002]}
+
+
+@pytest.fixture
+def service():
+    service = LiveBacktestService()
+    service.execution_bridge = FakeBridge()
+    service.real_execution_enabled = True
+    service.scheduled = []
+
+    def run(coro):
+        service.scheduled.append(coro.__qualname__)
+        coro.close()
+
+    service._execute_in_async_loop = run
+    return service
+
+
+@pytest.fixture
+def session(service):
+    return service.start_session("s1", {"params": STRATEGY})
+
+
+def staging_calls(service):
+    return [c for c in service.execution_bridge.calls if c[0] != "stage_outcomes"]
+
+
+class TestPredictNextSizes:
+    def test_fixed_sizes(self, service, session):
+        on_win, on_loss = service._predict_next_sizes(session, STRATEGY, 1, 0.001)
+
+        assert (on_win, on_loss) == (0.001, 0.002)
+
+    def test_last_bet_loss_restarts_sequence(self, service, session):
+        assert service._predict_next_sizes(session, STRATEGY, 2, 0.002) == (0.001, 0.001)
+
+    def test_kelly_win_sized_from_payout(self, service, session):
+        strategy = {**STRATEGY, "use_kelly_sizing": True, "kelly_fraction": 0.25}
+
+        on_win, on_loss = service._predict_next_sizes(session, strategy, 1, 0.01)
+
+        session.wallet += 0.01 * SIDEBET_PAYOUT
+        assert on_win == service._calculate_bet_size(session, strategy, 1)
+        assert on_win > on_loss
+
+    def test_unaffordable(self, service, session):
+        session.wallet = 0.0015
+
+        assert service._predict_next_sizes(session, STRATEGY, 1, 0.001) == (0.001, None)
+
+    def test_live_balance_used_for_kelly(self, service, session):
+        strategy = {**STRATEGY, "use_kelly_sizing": True, "kelly_fraction": 0.25}
+        paper = service._calculate_bet_size(session, strategy, 1)
+
+        service.set_live_state_provider(SimpleNamespace(is_live=True, cash=Decimal("1.0")))
+
+        assert service._calculate_bet_size(session, strategy, 1) > paper
+
+
+class TestStagingFlow:
+    def test_loss_prestaged_when_window_expires(self, service, session):
+        service._on_game_tick(signal(10))
+        assert service.execution_bridge.calls[0] == (
+            "stage_outcomes",
+            Decimal("0.001"),
+            Decimal("0.002"),
+        )
+        assert session.staged_bet is session.active_bets[0]
+
+        service._on_game_tick(signal(10 + SIDEBET_WINDOW))
+        assert staging_calls(service) == []
+
+        service._on_game_tick(signal(11 + SIDEBET_WINDOW))
+        assert staging_calls(service) == [("resolve_outcome", False)]
+        assert service.scheduled[-1] == "FakeBridge.prestage"
+        assert session.staged_bet is None
+
+    def test_win_prestaged_at_rug(self, service, session):
+        service._on_game_tick(signal(10))
+        service._on_game_tick(signal(20, rugged=True))
+
+        assert staging_calls(service) == [("resolve_outcome", True)]
+        assert session.wins == 1
+
+    def test_rug_after_lost_window_stages_next_game(self, service, session):
+        service._on_game_tick(signal(10))
+        service._on_game_tick(signal(11 + SIDEBET_WINDOW))
+        service._on_game_tick(signal(12 + SIDEBET_WINDOW, rugged=True))
+        service._on_game_tick(signal(12 + SIDEBET_WINDOW, rugged=True))
+
+        assert staging_calls(service) == [
+            ("resolve_outcome", False),
+            ("stage_next_amount", Decimal("0.001")),
+        ]
+
+    def test_paper_mode_does_not_stage(self, service, session):
+        service.real_execution_enabled = False
+
+        service._on_game_tick(signal(10))
+        service._on_game_tick(signal(20, rugged=True))
+
+        assert service.execution_bridge.calls == []
+        assert service.scheduled == []
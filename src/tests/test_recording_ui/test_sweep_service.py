@@ -0,0 +1,170 @@
+"""
+Tests for the parallel strategy sweep service.
+"""
+
+import time
+
+import pandas as pd
+import pytest
+
+from recording_ui.services.sweep_service import (
+    MAX_SWEEP_POINTS,
+    SweepService,
+    evaluate_point,
+    expand_grid,
+    update_pareto_front,
+)
+
+
+@pytest.fixture
+def games_df():
+    durations = [30, 120, 210, 215, 250, 260, 300, 450, 90, 205] * 10
+    return pd.DataFrame(
+        {"game_id": [f"g{i}" for i in range(len(durations))], "duration_ticks": durations}
+    )
+
+
+def wait_for(job, timeout: float = 30.0):
+    deadline = time.time() + timeout
+    while job.status in ("pending", "running") and time.time() < deadline:
+        time.sleep(0.05)
+    return job
+
+
+class TestExpandGrid:
+    def test_range_and_list(self):
+        points = expand_grid(
+            {"entry_tick": {"start": 100, "stop": 120, "step": 10}, "num_bets": [1, 2]}
+        )
+
+        assert len(points) == 6
+        assert {p["entry_tick"] for p in points} == {100, 110, 120}
+        assert {len(p["bet_sizes"]) for p in points} == {1, 2}
+
+    def test_float_range(self):
+        points = expand_grid({"kelly_fraction": {"start": 0.1, "stop": 0.3, "step": 0.1}})
+
+        assert [p["kelly_fraction"] for p in points] == [0.1, 0.2, 0.3]
+
+    def test_explicit_bet_sizes(self):
+        points = expand_grid({"bet_sizes": [[0.001, 0.002], [0.001, 0.002, 0.004]]})
+
+        assert [p["num_bets"] for p in points] == [2, 3]
+
+    def test_unknown_parameter(self):
+        with pytest.raises(ValueError, match="Unknown"):
+            expand_grid({"bogus": [1, 2]})
+
+    def test_too_many_points(self):
+        with pytest.raises(ValueError, match="max"):
+            expand_grid({"entry_tick": {"start": 0, "stop": MAX_SWEEP_POINTS + 1}})
+
+
+class TestParetoFront:
+    @staticmethod
+    def entry(ev, dd, ruin):
+        return {"metrics": {"ev": ev, "max_drawdown_pct": dd, "ruin_probability": ruin}}
+
+    def test_dominated_points_are_removed(self):
+        front = []
+        update_pareto_front(front, self.entry(0.001, 10, 0.2))
+        assert update_pareto_front(front, self.entry(0.002, 5, 0.1))
+
+        assert len(front) == 1
+        assert front[0]["metrics"]["ev"] == 0.002
+
+    def test_tradeoffs_are_kept(self):
+        front = []
+        update_pareto_front(front, self.entry(0.001, 5, 0.1))
+        update_pareto_front(front, self.entry(0.003, 20, 0.3))
+        assert not update_pareto_front(front, self.entry(0.0005, 25, 0.5))
+
+        assert len(front) == 2
+
+
+class TestEvaluatePoint:
+    def test_metrics(self, games_df):
+        point = expand_grid({"entry_tick": 200})[0]
+
+        metrics = evaluate_point(games_df, point, ruin_samples=5)
+
+        assert set(metrics) >= {"ev", "roi_pct", "max_drawdown_pct", "ruin_probability"}
+        assert 0.0 <= metrics["ruin_probability"] <= 1.0
+
+    def test_deterministic(self, games_df):
+        point = expand_grid({"entry_tick": 200, "bet_size": 0.02})[0]
+
+        assert evaluate_point(games_df, point, 5, seed=1) == evaluate_point(
+            games_df, point, 5, seed=1
+        )
+
+
+class TestSweepService:
+    def test_sweep_completes_with_front(self, games_df):
+        service = SweepService(max_workers=2)
+
+        job = service.start_sweep(
+            {"entry_tick": [150, 200, 250], "bet_size": [0.001, 0.01]},
+            ruin_samples=3,
+            games_df=games_df,
+        )
+        wait_for(job)
+
+        assert job.status == "completed"
+        assert job.completed == 6
+        assert job.pareto_front
+        assert job.to_dict(include_results=True)["results"]
+
+    def test_memoized_points_are_reused(self, games_df):
+        service = SweepService(max_workers=2)
+        params = {"entry_tick": [150, 200]}
+
+        wait_for(service.start_sweep(params, ruin_samples=2, games_df=games_df))
+        second = wait_for(service.start_sweep(params, ruin_samples=2, games_df=games_df))
+
+        assert second.cached == 2
+        assert second.status == "completed"
+
+    def test_memo_is_bounded(self, games_df, monkeypatch):
+        monkeypatch.setattr("recording_ui.services.sweep_service.MAX_MEMO_POINTS", 2)
+        service = SweepService(max_workers=1)
+
+        wait_for(
+            service.start_sweep({"entry_tick": [150, 200, 250]}, ruin_samples=0, games_df=games_df)
+        )
+        again = wait_for(
+            service.start_sweep({"entry_tick": [250]}, ruin_samples=0, games_df=games_df)
+        )
+
+        assert len(service._memo) == 2
+        assert again.cached == 1
+
+    def test_cancel(self, games_df):
+        service = SweepService(max_workers=1)
+
+        job = service.start_sweep(
+            {"entry_tick": {"start": 100, "stop": 400, "step": 1}},
+            ruin_samples=50,
+            games_df=games_df,
+        )
+        assert service.cancel(job.job_id)
+        wait_for(job)
+
+        assert job.status == "cancelled"
+        assert job.completed < len(job.points)
+        assert not service.cancel(job.job_id)
+
+    def test_emits_progress(self, games_df):
+        class FakeSocketIO:
+            def __init__(self):
+                self.events = []
+
+            def emit(self, event, data, room=None):
+                self.events.append((event, room))
+
+        socketio = FakeSocketIO()
+        service = SweepService(socketio=socketio, max_workers=2)
+
+        job = wait_for(service.start_sweep({"entry_tick": [200]}, games_df=games_df))
+
+        assert ("sweep_done", job.job_id) in socketio.events
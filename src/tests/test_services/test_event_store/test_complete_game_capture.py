@@ -11,7 +11,7 @@ import duckdb
 
 from services.event_bus import EventBus, Events
 from services.event_store.paths import EventStorePaths
-from services.event_store.schema import DocType
+from services.event_store.schema import DocType, find_raw_object
 from services.event_store.service import EventStoreService
 
 
@@ -244,3 +244,20 @@ class TestCompleteGameCapture:
 
         # Deduplication: Only 1 record for the same game_id
         assert df["count"].iloc[0] == 1
+
+
+class TestFindRawObject:
+    """Test slicing a game's original JSON out of the gameStateUpdate text"""
+
+    def test_returns_exact_text(self):
+        text = '{"gameHistory":[{"id":"g1","prices":[1.0, 2]},{"id":"g2","prices":[]}]}'
+        game = {"id": "g2", "prices": []}
+
+        assert find_raw_object(text, "id", "g2", game) == '{"id":"g2","prices":[]}'
+
+    def test_mismatch_falls_back(self):
+        # "id" not the first key -> cannot be located exactly
+        text = '{"gameHistory":[{"prices":[1.0],"id":"g1"}]}'
+
+        assert find_raw_object(text, "id", "g1", {"prices": [1.0], "id": "g1"}) is None
+        assert find_raw_object(text, "id", "missing", {}) is None
@@ -0,0 +1,157 @@
+"""
+Tests for the derived game prices dataset and loader cache
+"""
+
+import os
+
+import pyarrow as pa
+import pytest
+
+from services.event_store.game_prices import (
+    GAME_PRICES_SCHEMA,
+    GamePricesCache,
+    GamePricesDataset,
+    derive_game_row,
+    get_game_prices_cache,
+)
+from services.event_store.paths import EventStorePaths
+from services.event_store.schema import EventEnvelope, EventSource
+from services.event_store.writer import ParquetWriter
+
+
+def _game(game_id: str, prices: list, **extra) -> dict:
+    return {"id": game_id, "prices": prices, "rugged": True, **extra}
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return EventStorePaths(data_dir=tmp_path)
+
+
+def _write_games(paths: EventStorePaths, games: list[dict]) -> None:
+    writer = ParquetWriter(paths, buffer_size=1000, flush_interval=3600)
+    for i, game in enumerate(games):
+        writer.write(
+            EventEnvelope.from_complete_game(
+                game_data=game, source=EventSource.CDP, session_id="s1", seq=i
+            )
+        )
+    writer.close()
+
+
+class TestDeriveGameRow:
+    def test_extracts_typed_fields(self):
+        row = derive_game_row(
+            "g1",
+            "2026-01-05",
+            "2026-01-05T10:00:00",
+            '{"prices": [1, 1.5, 3.0, 0.2], "peakMultiplier": 3.1, "rugged": true, '
+            '"globalSidebets": [{}, {}]}',
+        )
+
+        assert row["prices"] == [1.0, 1.5, 3.0, 0.2]
+        assert row["duration_ticks"] == 4
+        assert row["peak_multiplier"] == 3.1
+        assert row["peak_tick"] == 2
+        assert row["rugged"] is True
+        assert row["sidebet_count"] == 2
+
+    def test_peak_falls_back_to_max_price(self):
+        row = derive_game_row("g1", None, "2026-01-05T10:00:00", '{"prices": [1.0, 2.0]}')
+
+        assert row["peak_multiplier"] == 2.0
+        assert row["date"] == "2026-01-05"
+
+    @pytest.mark.parametrize("raw", [None, "", "not json", "[]", '{"prices": "x"}', '{"a": 1}'])
+    def test_unusable_payloads_are_skipped(self, raw):
+        assert derive_game_row("g1", None, None, raw) is None
+
+
+class TestGamePricesDataset:
+    def test_refresh_builds_snapshot(self, paths):
+        _write_games(paths, [_game("g1", [1.0, 1.2, 0.5]), _game("g2", [1.0] * 10)])
+        dataset = GamePricesDataset(paths=paths)
+
+        assert dataset.refresh() == 1
+        assert dataset.snapshot_path.exists()
+        assert dataset.manifest_path.exists()
+
+        table = GamePricesCache(dataset).table()
+        assert table.schema.equals(GAME_PRICES_SCHEMA)
+        assert table.schema.field("prices").type == pa.list_(pa.float64())
+        assert sorted(table.column("game_id").to_pylist()) == ["g1", "g2"]
+
+    def test_refresh_is_incremental(self, paths):
+        _write_games(paths, [_game("g1", [1.0, 2.0])])
+        dataset = GamePricesDataset(paths=paths)
+        dataset.refresh()
+
+        # Nothing new -> nothing parsed
+        assert dataset.refresh() == 0
+
+        _write_games(paths, [_game("g2", [1.0, 3.0])])
+        assert dataset.refresh() == 1
+
+    def test_removed_source_drops_games(self, paths):
+        _write_games(paths, [_game("g1", [1.0, 2.0])])
+        dataset = GamePricesDataset(paths=paths)
+        dataset.refresh()
+
+        for f in dataset.source_dir.rglob("*.parquet"):
+            os.remove(f)
+        dataset.refresh()
+
+        assert GamePricesCache(dataset).table().num_rows == 0
+
+    def test_duplicates_keep_longest_prices(self, paths):
+        _write_games(
+            paths,
+            [
+                _game("g1", [1.0, 2.0]),
+                _game("g1", [1.0, 2.0, 3.0, 0.1]),
+                _game("g1", [1.0]),
+            ],
+        )
+        dataset = GamePricesDataset(paths=paths)
+        dataset.refresh()
+
+        cache = GamePricesCache(dataset)
+        assert cache.table().num_rows == 1
+        assert cache.get_prices("g1") == [1.0, 2.0, 3.0, 0.1]
+
+    def test_empty_store(self, paths):
+        dataset = GamePricesDataset(paths=paths)
+        dataset.refresh()
+
+        assert GamePricesCache(dataset).table().num_rows == 0
+
+
+class TestGamePricesCache:
+    def test_games_filters_by_length(self, paths):
+        _write_games(paths, [_game("short", [1.0] * 3), _game("long", [1.0] * 60)])
+        cache = GamePricesCache(GamePricesDataset(paths=paths))
+
+        games = cache.games(min_ticks=51)
+
+        assert [g["game_id"] for g in games] == ["long"]
+        assert games[0]["duration"] == 60
+        assert len(games[0]["prices"]) == 60
+
+    def test_unknown_game_returns_empty_prices(self, paths):
+        _write_games(paths, [_game("g1", [1.0])])
+        cache = GamePricesCache(GamePricesDataset(paths=paths))
+
+        assert cache.get_prices("missing") == []
+
+    def test_reload_picks_up_new_games(self, paths):
+        _write_games(paths, [_game("g1", [1.0])])
+        cache = GamePricesCache(GamePricesDataset(paths=paths))
+        assert cache.table().num_rows == 1
+
+        _write_games(paths, [_game("g2", [1.0, 2.0])])
+        assert cache.table().num_rows == 1  # Stable until reload
+        assert cache.reload().num_rows == 2
+        assert cache.get_prices("g2") == [1.0, 2.0]
+
+    def test_process_wide_cache_is_shared(self, tmp_path):
+        assert get_game_prices_cache(tmp_path) is get_game_prices_cache(tmp_path)
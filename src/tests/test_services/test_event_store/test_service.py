@@ -4,12 +4,15 @@ Tests for EventStoreService - EventBus integration
 Phase 12B, Issue #25
 """
 
+import json
+
 import pyarrow.parquet as pq
 import pytest
 
 from services.event_bus import EventBus, Events
 from services.event_store.paths import EventStorePaths
 from services.event_store.service import EventStoreService
+from services.raw_ws_event import RawWsEvent
 
 
 @pytest.fixture
@@ -181,6 +184,37 @@ class TestWebSocketEventHandling:
         assert table.column("doc_type")[0].as_py() == "ws_event"
         service.stop()
 
+    def test_ws_event_raw_data_stored_verbatim(self, event_bus, paths, temp_data_dir):
+        """raw_data from the CDP interceptor is stored without re-serializing"""
+        service = EventStoreService(event_bus, paths, buffer_size=1)
+        service.start()
+        service.resume()
+
+        raw_data = '{"gameId":"game-1","price":1.50,"gameHistory":[{"id":"g0","prices":[1.0,2]}]}'
+        event_bus.publish(
+            Events.WS_RAW_EVENT,
+            {
+                "event": "gameStateUpdate",
+                "data": json.loads(raw_data),
+                "raw_data": raw_data,
+                "source": "cdp",
+            },
+        )
+
+        import time
+
+        time.sleep(0.3)
+        service.stop()
+
+        ws_files = list(temp_data_dir.rglob("doc_type=ws_event/**/*.parquet"))
+        raw_json = pq.read_table(ws_files[0]).column("raw_json")[0].as_py()
+        assert raw_json == f'{{"event": "gameStateUpdate", "data": {raw_data}}}'
+
+        game_files = list(temp_data_dir.rglob("doc_type=complete_game/**/*.parquet"))
+        table = pq.read_table(game_files[0])
+        assert table.column("game_id")[0].as_py() == "g0"
+        assert table.column("raw_json")[0].as_py() == '{"id":"g0","prices":[1.0,2]}'
+
     def test_ws_event_with_null_data_field(self, event_bus, paths, temp_data_dir):
         """WS_RAW_EVENT with null data field is handled gracefully (regression test)"""
         service = EventStoreService(event_bus, paths, buffer_size=1)
@@ -428,10 +462,10 @@ class TestFlush:
 
 
 class TestUnwrapEventPayload:
-    """Tests for _unwrap_event_payload helper function"""
+    """Tests for the WS_RAW_EVENT wrappers the service resolves via RawWsEvent.from_bus"""
 
     def test_unwrap_already_unwrapped_dict(self):
-        """Should return dict as-is if it already has 'event' field"""
+        """Should read a bare event dict directly"""
         payload = {
             "event": "playerUpdate",
             "data": {"cash": "1.0"},
@@ -439,10 +473,12 @@ class TestUnwrapEventPayload:
             "game_id": "game-123",
         }
 
-        result = EventStoreService._unwrap_event_payload(payload)
+        result = RawWsEvent.from_bus(payload)
 
-        assert result == payload
-        assert result is payload  # Same object reference
+        assert result.event_name == "playerUpdate"
+        assert result.data == {"cash": "1.0"}
+        assert result.source == "cdp"
+        assert result.game_id == "game-123"
 
     def test_unwrap_eventbus_browserbridge_double_wrapped(self):
         """Should unwrap EventBus + BrowserBridge double-wrapped format"""
@@ -460,12 +496,12 @@ class TestUnwrapEventPayload:
             },
         }
 
-        result = EventStoreService._unwrap_event_payload(wrapped)
+        result = RawWsEvent.from_bus(wrapped)
 
         assert result is not None
-        assert result["event"] == "playerUpdate"
-        assert result["data"] == {"cash": "1.0"}
-        assert result["source"] == "cdp"
+        assert result.event_name == "playerUpdate"
+        assert result.data == {"cash": "1.0"}
+        assert result.source == "cdp"
 
     def test_unwrap_browserbridge_wrapped(self):
         """Should unwrap BrowserBridge-wrapped format (single layer)"""
@@ -477,48 +513,38 @@ class TestUnwrapEventPayload:
             }
         }
 
-        result = EventStoreService._unwrap_event_payload(wrapped)
+        result = RawWsEvent.from_bus(wrapped)
 
         assert result is not None
-        assert result["event"] == "gameStateUpdate"
-        assert result["data"] == {"tick": 100}
+        assert result.event_name == "gameStateUpdate"
+        assert result.data == {"tick": 100}
 
     def test_unwrap_non_dict_returns_none(self):
-        """Should return None and log warning for non-dict input"""
-        result = EventStoreService._unwrap_event_payload("not a dict")
-        assert result is None
-
-        result = EventStoreService._unwrap_event_payload(123)
-        assert result is None
-
-        result = EventStoreService._unwrap_event_payload(None)
-        assert result is None
+        """Should return None for non-dict input"""
+        assert RawWsEvent.from_bus("not a dict") is None
+        assert RawWsEvent.from_bus(123) is None
+        assert RawWsEvent.from_bus(None) is None
 
     def test_unwrap_invalid_eventbus_layer_returns_none(self):
         """Should return None if EventBus 'data' field is missing or invalid"""
-        # Missing 'data' field
-        wrapped = {"name": "ws.raw_event"}
-        result = EventStoreService._unwrap_event_payload(wrapped)
-        assert result is None
-
-        # Invalid 'data' field (not a dict)
-        wrapped = {"name": "ws.raw_event", "data": "invalid"}
-        result = EventStoreService._unwrap_event_payload(wrapped)
-        assert result is None
+        assert RawWsEvent.from_bus({"name": "ws.raw_event"}) is None
+        assert RawWsEvent.from_bus({"name": "ws.raw_event", "data": "invalid"}) is None
 
     def test_unwrap_invalid_browserbridge_layer_returns_none(self):
         """Should return None if BrowserBridge 'data' field is missing or invalid"""
-        # EventBus layer valid, but BrowserBridge layer missing
-        wrapped = {"name": "ws.raw_event", "data": {}}
-        result = EventStoreService._unwrap_event_payload(wrapped)
-        assert result is None
-
-        # BrowserBridge 'data' field is not a dict
-        wrapped = {"name": "ws.raw_event", "data": {"data": "invalid"}}
-        result = EventStoreService._unwrap_event_payload(wrapped)
-        assert result is None
+        assert RawWsEvent.from_bus({"name": "ws.raw_event", "data": {}}) is None
+        assert RawWsEvent.from_bus({"name": "ws.raw_event", "data": {"data": "invalid"}}) is None
 
     def test_unwrap_empty_dict_returns_none(self):
         """Should return None for empty dict (no 'event' or 'data' fields)"""
-        result = EventStoreService._unwrap_event_payload({})
-        assert result is None
+        assert RawWsEvent.from_bus({}) is None
+
+    def test_invalid_payload_is_not_recorded(self, event_bus, paths):
+        """Should skip WS_RAW_EVENT payloads that hold no event"""
+        service = EventStoreService(event_bus, paths)
+        service.start()
+
+        service._on_ws_raw_event({"name": "ws.raw_event", "data": "invalid"})
+
+        assert service.event_count == 0
+        service.stop()
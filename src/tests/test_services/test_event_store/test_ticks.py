@@ -0,0 +1,238 @@
+"""
+Tests for the delta-encoded, columnar tick dataset
+"""
+
+import json
+import time
+
+import pyarrow.parquet as pq
+import pytest
+
+from services.event_bus import EventBus, Events
+from services.event_store.paths import EventStorePaths
+from services.event_store.service import EventStoreService
+from services.event_store.ticks import (
+    PAYLOAD_DELTA,
+    PAYLOAD_KEYFRAME,
+    PAYLOAD_NONE,
+    TickWriter,
+    read_ticks,
+    reconstruct_payloads,
+    reconstruct_raw,
+    tick_phase,
+)
+
+T0 = 1_767_225_600_000  # 2026-01-01T00:00:00Z
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return EventStorePaths(data_dir=tmp_path)
+
+
+def game_state(tick: int, price: float, game_id: str = "g1", **extra) -> dict:
+    data = {
+        "gameId": game_id,
+        "active": True,
+        "rugged": False,
+        "price": price,
+        "tickCount": tick,
+        "connectedPlayers": 100,
+        "leaderboard": [{"id": "p1", "pnl": 0.1}],
+    }
+    data.update(extra)
+    return data
+
+
+def write_all(paths, payloads, event="gameStateUpdate", **writer_kwargs) -> list:
+    writer = TickWriter(paths, flush_interval=3600, **writer_kwargs)
+    for i, data in enumerate(payloads):
+        writer.write(event, data, session_id="s1", seq=i + 1, source="cdp", ts_ms=T0 + i * 250)
+    writer.close()
+    return sorted(paths.ticks_parquet_dir.rglob("*.parquet"))
+
+
+class TestTickPhase:
+    def test_explicit_phase_wins(self):
+        assert tick_phase({"phase": "PRESALE", "active": True}) == "PRESALE"
+
+    def test_derived_phases(self):
+        assert tick_phase({"cooldownTimer": 5000}) == "COOLDOWN"
+        assert tick_phase({"active": True, "rugged": True}) == "RUGGED"
+        assert tick_phase({"allowPreRoundBuys": True, "active": False}) == "PRESALE"
+        assert tick_phase({"active": True, "rugged": False}) == "ACTIVE"
+        assert tick_phase({}) == "UNKNOWN"
+
+
+class TestTickWriter:
+    def test_typed_columns(self, paths):
+        files = write_all(paths, [game_state(0, 1.0), game_state(1, 1.05)])
+
+        table = pq.read_table(files[0])
+
+        assert table.column("tick").to_pylist() == [0, 1]
+        assert table.column("price").to_pylist() == [1.0, 1.05]
+        assert table.column("active").to_pylist() == [1, 1]
+        assert table.column("ts_ms").to_pylist() == [T0, T0 + 250]
+        assert table.column("phase").to_pylist() == ["ACTIVE", "ACTIVE"]
+        assert files[0].parent.name == "date=2026-01-01"
+
+    def test_payload_only_on_change(self, paths):
+        lb = [{"id": "p1", "pnl": 0.5}]
+        files = write_all(
+            paths,
+            [
+                game_state(0, 1.0),
+                game_state(1, 1.1),  # only typed fields changed
+                game_state(2, 1.2, leaderboard=lb),  # leaderboard changed
+                game_state(3, 1.3, leaderboard=lb, rugged=True),  # phase change
+            ],
+        )
+
+        table = pq.read_table(files[0])
+        kinds = table.column("payload_kind").to_pylist()
+        payloads = table.column("payload").to_pylist()
+
+        assert kinds == [PAYLOAD_KEYFRAME, PAYLOAD_NONE, PAYLOAD_DELTA, PAYLOAD_KEYFRAME]
+        assert "tickCount" not in json.loads(payloads[0])
+        assert payloads[1] is None
+        assert json.loads(payloads[2]) == {"leaderboard": lb}
+
+    def test_new_game_is_keyframe(self, paths):
+        files = write_all(paths, [game_state(0, 1.0), game_state(0, 1.0, game_id="g2")])
+
+        kinds = pq.read_table(files[0]).column("payload_kind").to_pylist()
+
+        assert kinds == [PAYLOAD_KEYFRAME, PAYLOAD_KEYFRAME]
+
+    def test_each_file_starts_with_keyframe(self, paths):
+        files = write_all(paths, [game_state(i, 1.0 + i / 100) for i in range(5)], buffer_size=2)
+
+        assert len(files) == 3
+        for path in files:
+            assert pq.read_table(path).column("payload_kind")[0].as_py() == PAYLOAD_KEYFRAME
+
+    def test_parquet_encodings(self, paths):
+        files = write_all(paths, [game_state(i, 1.0 + i / 100) for i in range(10)])
+
+        row_group = pq.ParquetFile(files[0]).metadata.row_group(0)
+        encodings = {
+            row_group.column(i).path_in_schema: row_group.column(i).encodings
+            for i in range(row_group.num_columns)
+        }
+
+        assert row_group.column(0).compression == "ZSTD"
+        assert "DELTA_BINARY_PACKED" in encodings["tick"]
+        assert "BYTE_STREAM_SPLIT" in encodings["price"]
+        assert "RLE_DICTIONARY" in encodings["phase"]
+
+    def test_closed_writer_rejects_writes(self, paths):
+        writer = TickWriter(paths)
+        writer.close()
+
+        with pytest.raises(RuntimeError):
+            writer.write("game_tick", {"tick": 1, "price": 1.0}, "s1", 1, "public_ws")
+
+
+class TestReconstruct:
+    def test_round_trip(self, paths):
+        payloads = [
+            game_state(0, 1.0, cooldownTimer=0),
+            game_state(1, 1.1),  # cooldownTimer removed
+            game_state(2, 1.2, leaderboard=[]),
+            game_state(3, 1.3, leaderboard=[], rugged=True, gameHistory=[{"id": "g0"}]),
+            {"gameId": "g2", "cooldownTimer": 9000, "allowPreRoundBuys": True},
+        ]
+        write_all(paths, payloads, buffer_size=3)
+
+        rebuilt = [data for _, data in reconstruct_payloads(read_ticks(paths))]
+
+        assert rebuilt == payloads
+
+    def test_round_trip_two_sessions(self, paths):
+        writer = TickWriter(paths, flush_interval=3600)
+        written = []
+        for i in range(4):
+            session = "s1" if i % 2 == 0 else "s2"
+            data = game_state(i // 2, 1.0 + i // 2, bar=session)
+            writer.write(
+                "gameStateUpdate", data, session_id=session, seq=i, source="cdp", ts_ms=T0 + i
+            )
+            written.append(data)
+        writer.close()
+
+        table = read_ticks(paths)
+        rebuilt = [data for _, data in reconstruct_payloads(table)]
+
+        assert table.column("payload_kind").to_pylist()[:2] == [PAYLOAD_KEYFRAME] * 2
+        assert rebuilt == written
+
+    def test_untyped_values_stay_in_payload(self, paths):
+        payloads = [game_state(0, 1), game_state(1, 1.5, tickCount="1")]
+        write_all(paths, payloads)
+
+        table = read_ticks(paths)
+        rebuilt = [data for _, data in reconstruct_payloads(table)]
+
+        assert table.column("price").to_pylist() == [1.0, 1.5]
+        assert rebuilt == payloads
+        assert type(rebuilt[0]["price"]) is int
+
+    def test_filter_by_game(self, paths):
+        payloads = [game_state(i, 1.0, game_id="g1") for i in range(3)] + [
+            game_state(i, 2.0, game_id="g2") for i in range(3)
+        ]
+        write_all(paths, payloads)
+
+        rebuilt = [data for _, data in reconstruct_payloads(read_ticks(paths, game_id="g2"))]
+
+        assert rebuilt == payloads[3:]
+
+    def test_raw_json_formats(self, paths):
+        write_all(paths, [{"tick": 5, "price": 2.5, "gameId": "g1"}], event="game_tick")
+        write_all(paths, [game_state(0, 1.0)])
+
+        raw = reconstruct_raw(read_ticks(paths))
+
+        assert json.loads(raw[0]) == {"tick": 5, "price": 2.5, "gameId": "g1"}
+        assert json.loads(raw[1]) == {"event": "gameStateUpdate", "data": game_state(0, 1.0)}
+
+    def test_empty_dataset(self, paths):
+        assert read_ticks(paths).num_rows == 0
+
+
+class TestServiceColumnarTicks:
+    @pytest.fixture
+    def event_bus(self):
+        bus = EventBus()
+        bus.start()
+        yield bus
+        bus.stop()
+        bus.clear_all()
+
+    def test_ticks_routed_to_tick_dataset(self, event_bus, paths):
+        service = EventStoreService(event_bus, paths, columnar_ticks=True)
+        service.start()
+        service.resume()
+
+        event_bus.publish(
+            Events.WS_RAW_EVENT,
+            {"event": "gameStateUpdate", "data": game_state(10, 1.5), "source": "cdp"},
+        )
+        event_bus.publish(Events.WS_RAW_EVENT, {"event": "newTrade", "data": {"gameId": "g1"}})
+        event_bus.publish(Events.GAME_TICK, {"tick": 11, "price": 1.6, "gameId": "g1"})
+        time.sleep(0.3)
+        service.stop()
+
+        ticks = read_ticks(paths)
+        events = [
+            name
+            for path in paths.events_parquet_dir.rglob("*.parquet")
+            for name in pq.read_table(path).column("event_name").to_pylist()
+        ]
+
+        assert ticks.column("event").to_pylist() == ["gameStateUpdate", "game_tick"]
+        assert ticks.column("tick").to_pylist() == [10, 11]
+        assert ticks.column("source").to_pylist() == ["cdp", "public_ws"]
+        assert events == ["newTrade"]
+        assert service.event_count == 3
@@ -0,0 +1,171 @@
+"""Tests for hot-path latency tracing."""
+
+import importlib
+import threading
+import time
+
+import pytest
+
+from services.event_bus import EventBus, Events
+from services.latency_trace import (
+    BUCKET_COUNT,
+    NO_TRACE,
+    STAGE_BUS,
+    STAGE_CAPTURE,
+    STAGE_DECISION,
+    TRACE_RING_SIZE,
+    LatencyParquetDumper,
+    LatencyTracer,
+    bucket_index,
+    bucket_value,
+    percentiles,
+)
+
+
+@pytest.fixture
+def tracer():
+    return LatencyTracer()
+
+
+class TestBuckets:
+    def test_small_values_exact(self):
+        for value in range(32):
+            assert bucket_value(bucket_index(value)) == value
+
+    def test_relative_error_bounded(self):
+        for value in (100, 1_234, 56_789, 1_000_000, 987_654_321):
+            estimate = bucket_value(bucket_index(value))
+            assert abs(estimate - value) / value < 0.04
+
+    def test_indexes_monotonic(self):
+        indexes = [bucket_index(v) for v in range(0, 100_000, 7)]
+        assert indexes == sorted(indexes)
+
+    def test_out_of_range_clamped(self):
+        assert bucket_index(-5) == 0
+        assert bucket_index(2**60) == BUCKET_COUNT - 1
+
+    def test_percentiles(self):
+        counts = [0] * BUCKET_COUNT
+        for value in range(1, 1001):
+            counts[bucket_index(value * 1000)] += 1
+
+        pcts = percentiles(counts)
+
+        assert pcts[50.0] == pytest.approx(500_000, rel=0.04)
+        assert pcts[99.0] == pytest.approx(990_000, rel=0.04)
+        assert pcts[99.9] == pytest.approx(999_000, rel=0.04)
+
+    def test_percentiles_empty(self):
+        assert percentiles([0] * BUCKET_COUNT)[50.0] == 0
+
+
+class TestLatencyTracer:
+    def test_stamp_records_time_since_begin(self, tracer):
+        trace_id = tracer.begin(time.perf_counter_ns() - 2_000_000)
+        tracer.stamp(STAGE_CAPTURE, trace_id)
+
+        stats = tracer.snapshot()[STAGE_CAPTURE]
+
+        assert stats["count"] == 1
+        assert 1900 < stats["p50_us"] < 10_000
+
+    def test_stamp_defaults_to_latest_trace(self, tracer):
+        tracer.begin()
+        tracer.stamp(STAGE_DECISION)
+
+        assert tracer.snapshot()[STAGE_DECISION]["count"] == 1
+
+    def test_stage_recorded_once_per_trace(self, tracer):
+        tracer.begin()
+        tracer.stamp(STAGE_DECISION)
+        tracer.stamp(STAGE_DECISION)
+        tracer.begin()
+        tracer.stamp(STAGE_DECISION)
+
+        assert tracer.snapshot()[STAGE_DECISION]["count"] == 2
+
+    def test_no_trace_no_sample(self, tracer):
+        tracer.stamp(STAGE_DECISION)
+
+        assert tracer.snapshot() == {}
+
+    def test_aged_out_trace_ignored(self, tracer):
+        old = tracer.begin()
+        for _ in range(TRACE_RING_SIZE):
+            tracer.begin()
+
+        tracer.stamp(STAGE_CAPTURE, old)
+
+        assert tracer.snapshot() == {}
+
+    def test_disabled(self):
+        tracer = LatencyTracer(enabled=False)
+
+        assert tracer.begin() == NO_TRACE
+        tracer.stamp(STAGE_CAPTURE)
+        tracer.record(STAGE_CAPTURE, 1000)
+        assert tracer.snapshot() == {}
+
+    def test_threads_merged(self, tracer):
+        def work():
+            for _ in range(100):
+                tracer.record(STAGE_CAPTURE, 5000)
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert tracer.snapshot()[STAGE_CAPTURE]["count"] == 400
+
+    def test_snapshot_in_pipeline_order(self, tracer):
+        tracer.record("custom", 1)
+        tracer.record(STAGE_DECISION, 1)
+        tracer.record(STAGE_CAPTURE, 1)
+
+        assert list(tracer.snapshot()) == [STAGE_CAPTURE, STAGE_DECISION, "custom"]
+
+    def test_reset(self, tracer):
+        tracer.record(STAGE_CAPTURE, 1000)
+        tracer.reset()
+
+        assert tracer.snapshot() == {}
+
+
+class TestEventBusStamp:
+    def test_dispatch_stamps_bus_stage(self, monkeypatch):
+        tracer = LatencyTracer()
+        # services re-exports the bus instance under the module's name
+        module = importlib.import_module("services.event_bus")
+        monkeypatch.setattr(module, "latency_tracer", tracer)
+        bus = EventBus()
+        received = threading.Event()
+        bus.subscribe(Events.WS_RAW_EVENT, lambda _: received.set(), weak=False)
+        bus.start()
+
+        tracer.begin()
+        bus.publish(Events.WS_RAW_EVENT, {"event": "gameStateUpdate"})
+        assert received.wait(2.0)
+        bus.stop()
+
+        assert tracer.snapshot()[STAGE_BUS]["count"] == 1
+
+
+class TestParquetDumper:
+    def test_dump(self, tracer, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        tracer.record(STAGE_CAPTURE, 1000)
+        tracer.record(STAGE_DECISION, 2000)
+
+        path = LatencyParquetDumper(tracer, tmp_path).dump()
+
+        table = pq.read_table(path)
+        assert table.column("stage").to_pylist() == [STAGE_CAPTURE, STAGE_DECISION]
+        assert table.column("count").to_pylist() == [1, 1]
+
+    def test_nothing_recorded(self, tracer, tmp_path):
+        pytest.importorskip("pyarrow")
+
+        assert LatencyParquetDumper(tracer, tmp_path).dump() is None
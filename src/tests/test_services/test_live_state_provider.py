@@ -466,9 +466,7 @@ class TestSessionStatsCapture:
         )
 
         # Wait for processing
-        assert wait_for_condition(
-            lambda: provider.average_multiplier == Decimal("15.5")
-        )
+        assert wait_for_condition(lambda: provider.average_multiplier == Decimal("15.5"))
         assert provider.count_2x == 100
         assert provider.count_10x == 45
         assert provider.count_50x == 12
@@ -759,3 +757,104 @@ class TestTimeInPositionTracking:
         """time_in_position should be 0 when no position."""
         assert provider.time_in_position == 0
         assert provider.entry_tick is None
+
+
+class TestFixedNumericMode:
+    """Per-tick fields stored as scaled integers, Decimal on read."""
+
+    @pytest.fixture
+    def fixed_provider(self, event_bus):
+        provider = LiveStateProvider(event_bus, numeric_mode="fixed")
+        yield provider
+        provider.stop()
+
+    def test_tick_fields_match_decimal_mode(self, event_bus, provider, fixed_provider):
+        event_bus.publish(
+            Events.WS_RAW_EVENT,
+            {
+                "event": "gameStateUpdate",
+                "data": {
+                    "gameId": "game-1",
+                    "tickCount": 7,
+                    "price": 1.23456789,
+                    "rugpool": {"rugpoolAmount": 0.123456789, "threshold": 2.0},
+                    "averageMultiplier": 2.5,
+                    "highestToday": 1234.5,
+                },
+            },
+        )
+
+        assert wait_for_condition(lambda: fixed_provider.current_tick == 7)
+        assert wait_for_condition(lambda: provider.current_tick == 7)
+        for name in (
+            "current_multiplier",
+            "rugpool_amount",
+            "rugpool_threshold",
+            "rugpool_ratio",
+            "average_multiplier",
+            "highest_today",
+        ):
+            assert getattr(fixed_provider, name) == getattr(provider, name), name
+        assert fixed_provider.current_multiplier_fp == 123456789
+        assert fixed_provider.rugpool_amount_lamports == 123456789
+        assert fixed_provider.rugpool_threshold_lamports == 2_000_000_000
+
+    def test_player_state_stays_decimal(self, event_bus, fixed_provider):
+        event_bus.publish(Events.PLAYER_UPDATE, {"cash": 1.5, "positionQty": 0.25, "avgCost": 1.2})
+        event_bus.publish(Events.GAME_TICK, {"tick": 3, "price": 1.6})
+
+        assert wait_for_condition(lambda: fixed_provider.current_tick == 3)
+        assert fixed_provider.cash == Decimal("1.5")
+        assert fixed_provider.unrealized_pnl == (Decimal("1.6") - Decimal("1.2")) * Decimal("0.25")
+        assert fixed_provider.get_snapshot()["current_multiplier"] == Decimal("1.6")
+
+    def test_decimal_mode_fixed_getters(self, event_bus, provider):
+        event_bus.publish(Events.GAME_TICK, {"tick": 1, "multiplier": "2.5"})
+
+        assert wait_for_condition(lambda: provider.current_tick == 1)
+        assert provider.current_multiplier_fp == 250_000_000
+
+    def test_invalid_mode_rejected(self, event_bus):
+        with pytest.raises(ValueError):
+            LiveStateProvider(event_bus, numeric_mode="float")
+
+
+class TestIncrementalAccounting:
+    """PnLLedger-backed accounting and the cached get_snapshot()."""
+
+    def test_realized_trades_from_cumulative_pnl(self, event_bus, provider):
+        event_bus.publish(Events.PLAYER_UPDATE, {"cumulativePnL": "0.5", "gameId": "g1"})
+        event_bus.publish(Events.PLAYER_UPDATE, {"cumulativePnL": "0.7"})
+        event_bus.publish(Events.PLAYER_UPDATE, {"cumulativePnL": "0.6"})
+
+        assert wait_for_condition(lambda: provider.pnl_snapshot.trades == 2)
+        pnl = provider.pnl_snapshot
+        assert pnl.realized_pnl == Decimal("0.1")
+        assert (pnl.wins, pnl.losses) == (1, 1)
+        assert pnl.current_game.game_id == "g1"
+
+    def test_snapshot_cached_until_next_event(self, event_bus, provider):
+        event_bus.publish(Events.PLAYER_UPDATE, {"cash": "1.0"})
+        assert wait_for_condition(lambda: provider.cash == Decimal("1.0"))
+
+        snapshot = provider.get_snapshot()
+        assert provider.get_snapshot() is snapshot
+
+        event_bus.publish(Events.GAME_TICK, {"tick": 5, "multiplier": "1.5"})
+        assert wait_for_condition(lambda: provider.current_tick == 5)
+        assert provider.get_snapshot() is not snapshot
+        assert provider.get_snapshot()["current_tick"] == 5
+
+    def test_new_game_closes_game_summary(self, event_bus, provider):
+        event_bus.publish(Events.PLAYER_UPDATE, {"cumulativePnL": "0", "gameId": "g1"})
+        event_bus.publish(Events.PLAYER_UPDATE, {"cumulativePnL": "0.2"})
+        event_bus.publish(
+            Events.WS_RAW_EVENT,
+            {"event": "gameStateUpdate", "data": {"gameId": "g2", "tickCount": 0, "price": 1.0}},
+        )
+
+        assert wait_for_condition(lambda: provider.game_id == "g2")
+        pnl = provider.pnl_snapshot
+        assert [g.game_id for g in pnl.games] == ["g1"]
+        assert pnl.games[0].realized_pnl == Decimal("0.2")
+        assert pnl.current_game is None
@@ -0,0 +1,177 @@
+"""
+Tests for PnLLedger - incremental P&L accounting with immutable snapshots
+"""
+
+import random
+from decimal import Decimal
+
+import pytest
+
+from services.pnl_ledger import GameSummary, PnLLedger, PnLSnapshot
+
+
+@pytest.fixture
+def ledger():
+    return PnLLedger(initial_balance=Decimal("1.0"))
+
+
+class TestPosition:
+    def test_initial_snapshot(self, ledger):
+        snap = ledger.snapshot
+
+        assert snap.balance == snap.equity == snap.peak_equity == Decimal("1.0")
+        assert snap.trades == 0
+        assert snap.win_rate == Decimal("0")
+        assert snap.current_game is None
+
+    def test_unrealized_and_exposure(self, ledger):
+        ledger.update_account(
+            balance=Decimal("0.5"),
+            position_qty=Decimal("10"),
+            avg_cost=Decimal("1.5"),
+            mark_price=Decimal("1.5"),
+        )
+        ledger.mark(Decimal("2.0"))
+
+        snap = ledger.snapshot
+        assert snap.unrealized_pnl == Decimal("5.0")
+        assert snap.exposure == Decimal("20.0")
+        assert snap.equity == Decimal("20.5")
+
+    def test_no_unrealized_without_cost_basis(self, ledger):
+        ledger.update_account(position_qty=Decimal("2"), mark_price=Decimal("3"))
+
+        assert ledger.snapshot.unrealized_pnl == Decimal("0")
+        assert ledger.snapshot.exposure == Decimal("6")
+
+    def test_mark_while_flat_publishes_nothing(self, ledger):
+        before = ledger.snapshot
+        ledger.mark(Decimal("4.0"))
+
+        assert ledger.snapshot is before
+
+    def test_mark_price_kept_for_next_open(self, ledger):
+        ledger.mark(Decimal("2.0"))
+        ledger.update_account(position_qty=Decimal("1"), avg_cost=Decimal("1.0"))
+
+        assert ledger.snapshot.unrealized_pnl == Decimal("1.0")
+
+    def test_max_drawdown(self, ledger):
+        ledger.update_account(balance=Decimal("2.0"))
+        ledger.update_account(balance=Decimal("1.5"))
+        ledger.update_account(balance=Decimal("1.8"))
+
+        snap = ledger.snapshot
+        assert snap.peak_equity == Decimal("2.0")
+        assert snap.max_drawdown == Decimal("0.25")
+
+
+class TestTrades:
+    def test_win_loss_aggregates(self, ledger):
+        ledger.record_trade(Decimal("0.3"), game_id="g1")
+        ledger.record_trade(Decimal("-0.1"), game_id="g1")
+        ledger.record_trade(Decimal("0.1"), game_id="g1")
+
+        snap = ledger.snapshot
+        assert snap.realized_pnl == Decimal("0.3")
+        assert (snap.trades, snap.wins, snap.losses) == (3, 2, 1)
+        assert snap.win_rate == Decimal(2) / Decimal(3)
+        assert snap.average_win == Decimal("0.2")
+        assert snap.average_loss == Decimal("0.1")
+
+    def test_total_pnl_includes_unrealized(self, ledger):
+        ledger.record_trade(Decimal("0.5"))
+        ledger.update_account(
+            position_qty=Decimal("1"), avg_cost=Decimal("1"), mark_price=Decimal("1.25")
+        )
+
+        assert ledger.snapshot.total_pnl == Decimal("0.75")
+
+    def test_sidebets(self, ledger):
+        ledger.record_sidebet(True, Decimal("0.004"), game_id="g1")
+        ledger.record_sidebet(False, Decimal("-0.001"), game_id="g1")
+
+        snap = ledger.snapshot
+        assert (snap.sidebets_won, snap.sidebets_lost) == (1, 1)
+        assert snap.realized_pnl == Decimal("0.003")
+        assert snap.trades == 0
+
+    def test_matches_full_recomputation(self):
+        """Running aggregates equal a walk over the full trade history"""
+        rng = random.Random(3)
+        ledger = PnLLedger()
+        history = []
+        for _ in range(2000):
+            pnl = Decimal(rng.randint(-500, 500)) / 1000
+            history.append(pnl)
+            ledger.record_trade(pnl, game_id=f"g{len(history) // 50}")
+
+        wins = [p for p in history if p > 0]
+        losses = [-p for p in history if p <= 0]
+        snap = ledger.snapshot
+        assert snap.realized_pnl == sum(history)
+        assert snap.trades == len(history)
+        assert snap.average_win == sum(wins) / len(wins)
+        assert snap.average_loss == sum(losses) / len(losses)
+        assert sum(g.realized_pnl for g in snap.games) + snap.current_game.realized_pnl == sum(
+            history
+        )
+
+
+class TestGames:
+    def test_trades_roll_games_over(self, ledger):
+        ledger.record_trade(Decimal("0.1"), game_id="g1")
+        ledger.record_trade(Decimal("-0.2"), game_id="g2")
+
+        snap = ledger.snapshot
+        assert snap.games == (
+            GameSummary(game_id="g1", trades=1, wins=1, realized_pnl=Decimal("0.1")),
+        )
+        assert snap.current_game.game_id == "g2"
+        assert snap.current_game.losses == 1
+
+    def test_start_game_closes_current(self, ledger):
+        ledger.record_trade(Decimal("0.1"), game_id="g1")
+        ledger.start_game("g1")
+        assert ledger.snapshot.games == ()
+
+        ledger.start_game("g2")
+        assert ledger.snapshot.current_game is None
+        assert [g.game_id for g in ledger.snapshot.games] == ["g1"]
+
+    def test_game_history_bounded(self):
+        ledger = PnLLedger(max_games=3)
+        for i in range(6):
+            ledger.record_trade(Decimal("0.1"), game_id=f"g{i}")
+
+        assert [g.game_id for g in ledger.snapshot.games] == ["g2", "g3", "g4"]
+
+    def test_reset(self, ledger):
+        ledger.record_trade(Decimal("0.1"), game_id="g1")
+        ledger.start_game("g2")
+        ledger.reset(Decimal("3.0"))
+
+        snap = ledger.snapshot
+        assert snap.trades == 0
+        assert snap.games == ()
+        assert snap.balance == snap.peak_equity == Decimal("3.0")
+
+
+class TestSnapshots:
+    def test_published_snapshots_are_immutable(self, ledger):
+        before = ledger.snapshot
+        ledger.record_trade(Decimal("0.1"))
+
+        assert before.trades == 0
+        assert ledger.snapshot.version == before.version + 1
+        with pytest.raises(AttributeError):
+            ledger.snapshot.trades = 5
+
+    def test_to_dict(self, ledger):
+        ledger.record_trade(Decimal("0.1"), game_id="g1")
+        data = ledger.snapshot.to_dict()
+
+        assert data["win_rate"] == Decimal("1")
+        assert data["current_game"]["game_id"] == "g1"
+        assert data["games"] == []
+        assert set(PnLSnapshot._fields) <= data.keys()
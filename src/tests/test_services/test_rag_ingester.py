@@ -4,6 +4,7 @@ import json
 from unittest.mock import patch
 
 from services.rag_ingester import RAGIngester
+from services.raw_ws_event import RawWsEvent
 
 
 class TestRAGIngester:
@@ -59,6 +60,50 @@ class TestRAGIngester:
         assert record["data"]["price"] == 1.5
         assert record["source"] == "cdp_intercept"
 
+    def test_catalog_splices_raw_data(self, tmp_path):
+        """Original data text is written as-is when provided."""
+        ingester = RAGIngester(capture_dir=tmp_path)
+        ingester.start_session()
+
+        ingester.catalog(
+            {
+                "event": "gameStateUpdate",
+                "data": {"price": 1.5},
+                "raw_data": '{"price":1.50}',
+                "timestamp": "2025-12-14T12:00:00",
+            }
+        )
+
+        with open(ingester.current_session) as f:
+            line = f.readline()
+
+        assert '"data": {"price":1.50}' in line
+        assert json.loads(line)["data"] == {"price": 1.5}
+
+    def test_catalog_keeps_nested_null_data(self, tmp_path):
+        """Raw data text containing '"data": null' is written intact."""
+        ingester = RAGIngester(capture_dir=tmp_path)
+        ingester.start_session()
+
+        raw = '{"inner": {"data": null}, "price": 2}'
+        ingester.catalog(RawWsEvent("gameStateUpdate", raw_data=raw, source="cdp"))
+
+        with open(ingester.current_session) as f:
+            record = json.loads(f.readline())
+
+        assert record["data"] == {"inner": {"data": None}, "price": 2}
+        assert record["event"] == "gameStateUpdate"
+
+    def test_catalog_trims_ack_arguments(self, tmp_path):
+        """Only the data element of the captured text is written."""
+        ingester = RAGIngester(capture_dir=tmp_path)
+        ingester.start_session()
+
+        ingester.catalog(RawWsEvent("playerUpdate", raw_data='{"cash": 1.0}, 7'))
+
+        with open(ingester.current_session) as f:
+            assert json.loads(f.readline())["data"] == {"cash": 1.0}
+
     def test_catalog_tracks_event_counts(self, tmp_path):
         """Cataloging tracks event type counts."""
         ingester = RAGIngester(capture_dir=tmp_path)
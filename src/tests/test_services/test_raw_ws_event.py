@@ -0,0 +1,177 @@
+"""Tests for the parse-once RawWsEvent shared by WS_RAW_EVENT subscribers."""
+
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from services.raw_ws_event import RawWsEvent
+from sources.socketio_parser import decode_data_text
+
+
+def game_state_event(**overrides) -> RawWsEvent:
+    data = {
+        "gameId": "20260101-abc",
+        "tickCount": 42,
+        "price": 1.5,
+        "rugged": False,
+        "phase": "ACTIVE",
+        "gameHistory": [
+            {"id": "g1", "timestamp": 1, "prices": [1.0, 1.2], "rugged": True, "rugPoint": 1.2},
+            {"id": "bad"},
+        ],
+        "leaderboard": [{"id": "did:privy:p1", "pnl": 0.5, "positionQty": 1.25}],
+    }
+    data.update(overrides)
+    return RawWsEvent(
+        event_name="gameStateUpdate",
+        data=data,
+        timestamp="2026-01-01T00:00:00+00:00",
+        direction="received",
+        raw_data='{"tickCount":42}',
+    )
+
+
+class TestFields:
+    def test_common_fields_extracted(self):
+        event = game_state_event()
+
+        assert event.event_name == "gameStateUpdate"
+        assert event.game_id == "20260101-abc"
+        assert event.tick == 42
+        assert event.price == 1.5
+        assert event.rugged is False
+        assert event.phase == "ACTIVE"
+
+    def test_multiplier_preferred_over_price(self):
+        event = game_state_event(multiplier=2.25)
+
+        assert event.price == 2.25
+        assert event.price_decimal == Decimal("2.25")
+
+    def test_explicit_game_id_wins(self):
+        event = RawWsEvent("newTrade", {"gameId": "from-data"}, game_id="explicit")
+
+        assert event.game_id == "explicit"
+
+    def test_non_dict_data(self):
+        event = RawWsEvent("ping", data=[1, 2])
+
+        assert event.game_id is None
+        assert event.tick is None
+        assert event.price_decimal is None
+        assert event.game_history == ()
+
+    def test_immutable(self):
+        event = game_state_event()
+
+        with pytest.raises(AttributeError):
+            event.tick = 1
+        with pytest.raises(AttributeError):
+            event.extra = 1
+
+
+class TestLazyDecodes:
+    def test_game_history_typed_and_cached(self):
+        event = game_state_event()
+
+        history = event.game_history
+
+        assert [entry.id for entry in history] == ["g1"]
+        assert history[0].rugPoint == Decimal("1.2")
+        assert event.game_history is history
+
+    def test_leaderboard_typed(self):
+        event = game_state_event()
+
+        assert event.leaderboard[0].positionQty == Decimal("1.25")
+
+    def test_price_decimal_converted_once(self):
+        event = game_state_event()
+
+        with patch("services.raw_ws_event.Decimal", wraps=Decimal) as decimal:
+            assert event.price_decimal == Decimal("1.5")
+            assert event.price_decimal == Decimal("1.5")
+
+        assert decimal.call_count == 1
+
+
+class TestRawData:
+    """CDP events carry only the frame text; data decodes on first access."""
+
+    TEXT = (
+        '{"leaderboard":[{"gameId":"nested","price":9}],"gameId":"g1",'
+        '"tickCount":12,"price":1.25,"rugged":true}'
+    )
+
+    def test_routing_fields_without_decoding_data(self):
+        with patch("services.raw_ws_event.decode_data_text") as decode:
+            event = RawWsEvent("gameStateUpdate", raw_data=self.TEXT)
+
+            assert (event.game_id, event.tick, event.price, event.rugged) == (
+                "g1",
+                12,
+                1.25,
+                True,
+            )
+            assert event.phase is None
+            decode.assert_not_called()
+
+    def test_data_decoded_once(self):
+        event = RawWsEvent("gameStateUpdate", raw_data=self.TEXT)
+
+        with patch("services.raw_ws_event.decode_data_text", wraps=decode_data_text) as decode:
+            assert event.data["tickCount"] == 12
+            assert event["data"] is event.data
+
+        assert decode.call_count == 1
+
+    def test_invalid_text_decodes_to_none(self):
+        event = RawWsEvent("gameStateUpdate", raw_data='{"tickCount":3,"price":}')
+
+        assert event.tick == 3
+        assert event.data is None
+
+    def test_no_data(self):
+        event = RawWsEvent("ping")
+
+        assert event.data is None
+        assert event.tick is None
+
+
+class TestMappingCompat:
+    def test_legacy_get_access(self):
+        event = game_state_event()
+
+        assert event.get("event") == "gameStateUpdate"
+        assert event["data"]["tickCount"] == 42
+        assert event.get("raw_data") == '{"tickCount":42}'
+        assert event.get("source", "public_ws") == "public_ws"
+        assert "source" not in event
+        assert set(event) >= {"event", "data", "timestamp", "direction"}
+
+
+class TestFromBus:
+    def test_shared_instance_returned(self):
+        event = game_state_event()
+
+        assert RawWsEvent.from_bus({"name": "ws.raw_event", "data": event}) is event
+        assert RawWsEvent.from_bus(event) is event
+
+    def test_legacy_wrappers(self):
+        inner = {"event": "newSideBet", "data": {"gameId": "g"}, "source": "cdp"}
+
+        for payload in (
+            inner,
+            {"name": "ws.raw_event", "data": inner},
+            {"name": "ws.raw_event", "data": {"data": inner}},
+        ):
+            event = RawWsEvent.from_bus(payload)
+            assert event.event_name == "newSideBet"
+            assert event.source == "cdp"
+            assert event.game_id == "g"
+
+    def test_invalid_payloads(self):
+        assert RawWsEvent.from_bus("nope") is None
+        assert RawWsEvent.from_bus({"name": "ws.raw_event", "data": None}) is None
+        assert RawWsEvent.from_bus({"name": "ws.raw_event", "data": {"data": 5}}) is None
@@ -9,12 +9,30 @@ import tempfile
 from pathlib import Path
 
 from services.schema_validator.validator import (
+    MIN_PARALLEL_FILES,
     SchemaValidationError,
     SchemaValidator,
     ValidationResult,
+    payload_shape,
 )
 
 
+def player_update_record(seq: int) -> dict:
+    return {
+        "seq": seq,
+        "ts": "2025-01-01T00:00:00",
+        "event": "gameStatePlayerUpdate",
+        "data": {"gameId": "test-game", "rugpool": {"rugpoolAmount": 1.0, "threshold": 10}},
+    }
+
+
+def write_jsonl(path: Path, records: list) -> Path:
+    with open(path, "w") as f:
+        for record in records:
+            f.write((record if isinstance(record, str) else json.dumps(record)) + "\n")
+    return path
+
+
 class TestValidationResult:
     """Test ValidationResult dataclass."""
 
@@ -331,3 +349,118 @@ class TestValidatorWithRealData:
 
         error = validator.validate_event("gameStatePlayerUpdate", data)
         assert error is None
+
+
+class TestFastPath:
+    """Bulk parsing, cached validators and throughput reporting."""
+
+    def test_reports_throughput(self, tmp_path):
+        """Should report elapsed time and events/sec."""
+        path = write_jsonl(tmp_path / "a.jsonl", [player_update_record(i) for i in range(50)])
+
+        result = SchemaValidator().validate_file(path)
+
+        assert result.events_validated == 50
+        assert result.elapsed_s > 0
+        assert result.events_per_sec > 0
+        assert "events_per_sec" in result.to_dict()
+
+    def test_non_standard_json_falls_back(self, tmp_path):
+        """Big ints (accepted by json, rejected by orjson) should still parse."""
+        line = json.dumps(player_update_record(2**70))
+        path = write_jsonl(tmp_path / "a.jsonl", [line, "not valid json"])
+
+        result = SchemaValidator().validate_file(path)
+
+        assert result.events_validated == 1
+        assert [e.error_type for e in result.errors] == ["json_parse"]
+        assert result.errors[0].line_number == 2
+
+    def test_validation_errors_reported_with_context(self, tmp_path):
+        """Invalid events keep file/line/seq context and raw line on request."""
+        bad = player_update_record(7)
+        del bad["data"]["rugpool"]
+        path = write_jsonl(tmp_path / "a.jsonl", [player_update_record(1), bad])
+
+        result = SchemaValidator(include_raw_line=True).validate_file(path)
+
+        assert result.error_count == 1
+        error = result.errors[0]
+        assert (error.line_number, error.seq, error.error_type) == (2, 7, "validation")
+        assert "rugpool" in error.error_message
+        assert error.raw_line == json.dumps(bad)
+
+
+class TestSampling:
+    """1-in-N sampling plus every new payload shape."""
+
+    def test_payload_shape(self):
+        """Same keys/types share a shape; tick-keyed maps don't create new shapes."""
+        assert payload_shape({"a": 1, "b": [1.5]}) == payload_shape({"a": 2, "b": [2.5]})
+        assert payload_shape({"a": 1}) != payload_shape({"a": "x"})
+        assert payload_shape({"p": {"10": 1.0}}) == payload_shape({"p": {"11": 2.0}})
+
+    def test_samples_one_in_n(self):
+        """Repeated shapes are validated every Nth event."""
+        validator = SchemaValidator(sample_every=10)
+        data = player_update_record(0)["data"]
+
+        sampled = sum(validator.should_sample("gameStatePlayerUpdate", data) for _ in range(100))
+
+        # First occurrence (new shape) + every 10th of the remaining
+        assert sampled == 1 + 9
+
+    def test_new_shapes_always_validated(self):
+        """A structurally new payload is validated even between samples."""
+        validator = SchemaValidator(sample_every=1000)
+        record = player_update_record(0)
+        validator.should_sample("gameStatePlayerUpdate", record["data"])
+
+        record["data"]["rugpool"]["instarugCount"] = 3
+
+        assert validator.should_sample("gameStatePlayerUpdate", record["data"])
+
+    def test_validate_sampled_catches_new_invalid_shape(self):
+        """Live sampling still reports a malformed event with a new shape."""
+        validator = SchemaValidator(sample_every=1000)
+        for i in range(5):
+            assert (
+                validator.validate_sampled("gameStatePlayerUpdate", player_update_record(i)["data"])
+                is None
+            )
+
+        error = validator.validate_sampled("gameStatePlayerUpdate", {"gameId": "test-game"})
+
+        assert error is not None
+        assert error.error_type == "validation"
+
+    def test_sampled_file_counts(self, tmp_path):
+        """Sampled-out events are counted separately from validated ones."""
+        path = write_jsonl(tmp_path / "a.jsonl", [player_update_record(i) for i in range(20)])
+
+        result = SchemaValidator(sample_every=5).validate_file(path)
+
+        assert result.events_validated + result.events_sampled_out == 20
+        assert result.events_validated == 1 + 3
+
+
+class TestDirectoryValidation:
+    """Process-pool directory validation."""
+
+    def test_parallel_matches_serial(self, tmp_path):
+        """Pool results merge to the same totals and errors as inline validation."""
+        for i in range(MIN_PARALLEL_FILES):
+            bad = player_update_record(100 + i)
+            del bad["data"]["rugpool"]
+            write_jsonl(
+                tmp_path / f"rec_{i}.jsonl",
+                [player_update_record(j) for j in range(10)] + [bad, {"event": "unknownEvent"}],
+            )
+
+        serial = SchemaValidator().validate_directory(tmp_path, max_workers=1)
+        parallel = SchemaValidator().validate_directory(tmp_path, max_workers=2)
+
+        assert parallel.files_processed == serial.files_processed == MIN_PARALLEL_FILES
+        assert parallel.events_validated == serial.events_validated
+        assert parallel.events_unknown == serial.events_unknown
+        assert [e.to_dict() for e in parallel.errors] == [e.to_dict() for e in serial.errors]
@@ -79,6 +79,7 @@ class TestCDPWebSocketInterceptor:
         assert event["data"]["price"] == 1.5
         assert event["direction"] == "received"
         assert "timestamp" in event
+        assert event["raw_data"] == '{"price":1.5}'
 
     def test_handle_frame_received_maps_monotonic_timestamp_to_wall_clock(self):
         """
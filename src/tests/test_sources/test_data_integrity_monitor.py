@@ -130,6 +130,23 @@ class TestDataIntegrityMonitorTickTracking:
         monitor.on_tick(tick=6)  # Sequential
         assert monitor.consecutive_tick_gaps == 0
 
+    def test_on_tick_coalesced_range_not_a_gap(self):
+        """Test ticks skipped by feed coalescing are not counted as loss"""
+        monitor = DataIntegrityMonitor(threshold_type=ThresholdType.TICKS, threshold_value=3)
+        monitor.on_tick(tick=0)
+        monitor.on_tick(tick=10, coalesced=[(1, 9)])
+        assert monitor.consecutive_tick_gaps == 0
+        assert monitor.coalesced_ticks == 9
+        assert not monitor.is_triggered
+
+    def test_on_tick_partial_coalesced_range(self):
+        """Test only ticks outside coalesced ranges count as a gap"""
+        monitor = DataIntegrityMonitor()
+        monitor.on_tick(tick=0)
+        monitor.on_tick(tick=10, coalesced=[(3, 6)])  # 1, 2, 7, 8, 9 lost
+        assert monitor.consecutive_tick_gaps == 5
+        assert monitor.coalesced_ticks == 4
+
     def test_on_tick_triggers_at_threshold(self):
         """Test monitor triggers when tick gap threshold reached"""
         monitor = DataIntegrityMonitor(threshold_type=ThresholdType.TICKS, threshold_value=5)
@@ -6,6 +6,7 @@ Phase 10.4A TDD: Tests written FIRST before extraction.
 Tests cover:
 - TokenBucketRateLimiter: token bucket algorithm, statistics
 - PriorityRateLimiter: critical signal bypass
+- CoalescingRateLimiter: latest-wins coalescing, skipped tick ranges
 """
 
 import time
@@ -14,7 +15,12 @@ from unittest.mock import MagicMock
 import pytest
 
 # These imports will FAIL until we create the module (TDD RED phase)
-from sources.feed_rate_limiter import PriorityRateLimiter, TokenBucketRateLimiter
+from sources.feed_rate_limiter import (
+    CoalescingRateLimiter,
+    PriorityRateLimiter,
+    TokenBucketRateLimiter,
+)
+from sources.game_state_machine import GameSignal
 
 
 class TestTokenBucketRateLimiter:
@@ -172,5 +178,144 @@ class TestPriorityRateLimiter:
         assert result is True
 
 
+def make_signal(tick, game_id="g1", phase="ACTIVE_GAMEPLAY", rugged=False):
+    return GameSignal(
+        gameId=game_id,
+        active=True,
+        rugged=rugged,
+        tickCount=tick,
+        price=1.0,
+        cooldownTimer=0,
+        allowPreRoundBuys=False,
+        tradeCount=0,
+        gameHistory=None,
+        phase=phase,
+    )
+
+
+class TestCoalescingRateLimiter:
+    """Tests for CoalescingRateLimiter"""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Controllable time.monotonic() (seconds)"""
+        now = [100.0]
+        monkeypatch.setattr(time, "monotonic", lambda: now[0])
+        return now
+
+    def ticks(self, signals):
+        return [s.tickCount for s in signals]
+
+    def test_one_signal_per_slot_passes(self, clock):
+        """Test signals in separate slots pass straight through"""
+        limiter = CoalescingRateLimiter(rate=4.0)
+
+        for tick in range(3):
+            assert self.ticks(limiter.offer(make_signal(tick))) == [tick]
+            clock[0] += 0.25
+
+        assert limiter.total_coalesced == 0
+
+    def test_burst_keeps_latest(self, clock):
+        """Test a burst is held as its latest state and flushed at the next slot"""
+        limiter = CoalescingRateLimiter(rate=4.0)
+
+        assert self.ticks(limiter.offer(make_signal(0))) == [0]
+        for tick in range(1, 5):
+            assert limiter.offer(make_signal(tick)) == []
+
+        clock[0] += 0.25
+        released = limiter.offer(make_signal(5))
+
+        # The next slot's signal supersedes the held one for its game
+        assert self.ticks(released) == [5]
+        assert released[0].coalescedTicks == ((1, 4),)
+        assert limiter.total_coalesced == 4
+
+    def test_held_signals_released_oldest_first(self, clock):
+        """Test held signals of other games go out before the new one"""
+        limiter = CoalescingRateLimiter(rate=4.0)
+        limiter.offer(make_signal(0, "a"))
+        limiter.offer(make_signal(1, "a"))
+        limiter.offer(make_signal(2, "a"))
+
+        clock[0] += 0.25
+        released = limiter.offer(make_signal(0, "b"))
+
+        assert [(s.gameId, s.tickCount) for s in released] == [("a", 2), ("b", 0)]
+        assert released[0].coalescedTicks == ((1, 1),)
+
+    def test_latest_per_game(self, clock):
+        """Test held signals are kept per game"""
+        limiter = CoalescingRateLimiter(rate=4.0)
+        limiter.offer(make_signal(0, "a"))
+        limiter.offer(make_signal(0, "b"))  # New game: emitted immediately
+        limiter.offer(make_signal(1, "b"))
+        limiter.offer(make_signal(2, "b"))
+
+        assert [(s.gameId, s.tickCount) for s in limiter.flush()] == [("b", 2)]
+
+    def test_critical_never_held(self, clock):
+        """Test rug signals bypass coalescing"""
+        limiter = CoalescingRateLimiter(rate=4.0)
+        limiter.offer(make_signal(0))
+        limiter.offer(make_signal(1))
+
+        released = limiter.offer(make_signal(2, phase="RUG_EVENT_1", rugged=True))
+
+        assert self.ticks(released) == [2]
+        assert released[0].coalescedTicks == ((1, 1),)
+
+    def test_phase_change_never_held(self, clock):
+        """Test the first signal of a new phase is emitted at once"""
+        limiter = CoalescingRateLimiter(rate=4.0)
+        limiter.offer(make_signal(0, phase="PRESALE"))
+
+        assert self.ticks(limiter.offer(make_signal(0, phase="ACTIVE_GAMEPLAY"))) == [0]
+
+    def test_flush(self, clock):
+        """Test flush emits held signals and is empty afterwards"""
+        limiter = CoalescingRateLimiter(rate=4.0)
+        limiter.offer(make_signal(0))
+        limiter.offer(make_signal(1))
+
+        assert self.ticks(limiter.flush()) == [1]
+        assert limiter.flush() == []
+
+    def test_flush_due_waits_for_next_slot(self, clock):
+        """Test the slot timer releases held signals only after their slot"""
+        limiter = CoalescingRateLimiter(rate=4.0)
+        limiter.offer(make_signal(0))
+        limiter.offer(make_signal(1))
+        limiter.offer(make_signal(2))
+
+        assert limiter.flush_due() == []
+
+        clock[0] += 0.25
+        released = limiter.flush_due()
+
+        assert self.ticks(released) == [2]
+        assert released[0].coalescedTicks == ((1, 1),)
+        # The timer used this slot: a signal arriving in it is held
+        assert limiter.offer(make_signal(3)) == []
+
+    def test_get_stats(self, clock):
+        """Test coalesce statistics"""
+        limiter = CoalescingRateLimiter(rate=4.0)
+        for tick in range(4):
+            limiter.offer(make_signal(tick))
+        limiter.flush()
+
+        stats = limiter.get_stats()
+
+        assert stats["total_requests"] == 4
+        assert stats["total_emitted"] == 2
+        assert stats["total_coalesced"] == 2
+        assert stats["coalesce_rate"] == 50.0
+        assert stats["drop_rate"] == 0.0
+        assert stats["pending"] == 0
+        assert stats["recent_skipped_ranges"] == [("g1", 1, 2)]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
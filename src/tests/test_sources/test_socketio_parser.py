@@ -1,6 +1,8 @@
 """Tests for Socket.IO frame parsing."""
 
-from sources.socketio_parser import parse_socketio_frame
+from unittest.mock import patch
+
+from sources.socketio_parser import _decoder, parse_socketio_frame
 
 
 class TestParseSocketIOFrame:
@@ -91,3 +93,58 @@ class TestParseSocketIOFrame:
         """Empty frame returns None."""
         frame = parse_socketio_frame("")
         assert frame is None
+
+    def test_event_keeps_raw_data_text(self):
+        """Event data text is kept exactly as received."""
+        raw = '42["gameStateUpdate", {"gameId":"123", "price":1.50}]'
+        frame = parse_socketio_frame(raw)
+
+        assert frame.data_raw == '{"gameId":"123", "price":1.50}'
+        assert frame.data == {"gameId": "123", "price": 1.5}
+
+    def test_traced_event_raw_data_is_actual_payload(self):
+        """Traced format keeps the text of the third element."""
+        raw = '42["playerUpdate",{"__trace":true},{"cash":1.23}]'
+        frame = parse_socketio_frame(raw)
+
+        assert frame.data == {"cash": 1.23}
+        assert frame.data_raw == '{"cash":1.23}'
+
+    def test_event_without_data_has_no_raw_data(self):
+        """Events without a payload have no raw data."""
+        frame = parse_socketio_frame('42["ping"]')
+
+        assert frame.event_name == "ping"
+        assert frame.data is None
+        assert frame.data_raw is None
+
+    def test_trailing_garbage_returns_none(self):
+        """Payloads json.loads would reject are rejected."""
+        assert parse_socketio_frame('42["gameStateUpdate",{"a":1}]x') is None
+        assert parse_socketio_frame('42["gameStateUpdate",{"a":1}') is None
+        assert parse_socketio_frame('42["gameStateUpdate" {"a":1}]') is None
+
+    def test_event_data_decoded_lazily(self):
+        """Only the event name is decoded until data is read."""
+        with patch("sources.socketio_parser._decoder", wraps=_decoder) as decoder:
+            frame = parse_socketio_frame('42["gameStateUpdate",{"leaderboard":[1,2,3]}]')
+            assert frame.event_name == "gameStateUpdate"
+            assert decoder.raw_decode.call_count == 1
+
+            assert frame.data == {"leaderboard": [1, 2, 3]}
+            assert frame.data == {"leaderboard": [1, 2, 3]}
+            assert decoder.raw_decode.call_count == 2
+
+    def test_malformed_data_decodes_to_none(self):
+        """Bad data JSON is reported on access, not at parse time."""
+        frame = parse_socketio_frame('42["gameStateUpdate",{"a":}]')
+
+        assert frame.event_name == "gameStateUpdate"
+        assert frame.data is None
+
+    def test_extra_elements_trimmed_from_raw_data(self):
+        """Elements after the data are not part of data_raw."""
+        frame = parse_socketio_frame('42["buyOrder",{"amount":1},{"ack":true}]')
+
+        assert frame.data == {"amount": 1}
+        assert frame.data_raw == '{"amount":1}'
@@ -11,6 +11,7 @@ Tests cover:
 - Signal to GameTick conversion
 """
 
+import time
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
@@ -412,6 +413,110 @@ class TestWebSocketFeed:
         assert "currentPhase" in metrics
         assert "avgLatency" in metrics
 
+    def test_coalescing_mode(self, mock_socketio):
+        """Test coalescing mode emits the latest state with skipped ticks"""
+        feed = WebSocketFeed(log_level="ERROR", rate_limit=0.001, coalesce=True)
+        received = []
+        feed.on("signal", received.append)
+
+        for tick in range(1, 6):
+            feed._handle_game_state_update(
+                {"gameId": "g1", "active": True, "tickCount": tick, "price": 1.0}
+            )
+        feed.disconnect()
+
+        assert [s.tickCount for s in received] == [1, 5]
+        assert received[1].coalescedTicks == ((2, 4),)
+        assert feed.get_metrics()["coalesced"] == 3
+        assert feed.last_signal.tickCount == 5
+
+    def test_coalesced_ticks_reach_integrity_monitor(self, mock_socketio):
+        """Test tick events carry coalesced ranges, which are not counted as gaps"""
+        feed = WebSocketFeed(log_level="ERROR", rate_limit=0.001, coalesce=True)
+        ticks = []
+        feed.on("tick", ticks.append)
+
+        for tick in range(1, 6):
+            feed._handle_game_state_update(
+                {"gameId": "g1", "active": True, "tickCount": tick, "price": 1.0}
+            )
+        feed.disconnect()
+
+        assert [t["coalescedTicks"] for t in ticks] == [(), ((2, 4),)]
+        assert feed.integrity_monitor.coalesced_ticks == 3
+        assert feed.integrity_monitor.consecutive_tick_gaps == 0
+
+    def test_rate_limited_drops_are_not_integrity_gaps(self, mock_socketio):
+        """Test the drop-mode limiter has no integrity monitor to report gaps to"""
+        feed = WebSocketFeed(log_level="ERROR", rate_limit=0.001)
+        issues = []
+        feed.on("integrity_issue", issues.append)
+
+        for tick in range(1, 50):
+            feed._handle_game_state_update(
+                {"gameId": "g1", "active": True, "tickCount": tick, "price": 1.0}
+            )
+
+        assert feed.metrics["rate_limited"] > 0
+        assert feed.integrity_monitor is None
+        assert issues == []
+
+    def test_flush_loop_releases_held_signals(self, mock_socketio):
+        """Test the slot timer delivers a held signal when the feed goes quiet"""
+        feed = WebSocketFeed(log_level="ERROR", rate_limit=5.0, coalesce=True)
+        received = []
+        feed.on("signal", received.append)
+
+        feed.connect()
+        try:
+            for tick in range(1, 4):
+                feed._handle_game_state_update(
+                    {"gameId": "g1", "active": True, "tickCount": tick, "price": 1.0}
+                )
+            deadline = time.monotonic() + 2.0
+            while received[-1].tickCount != 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            feed.disconnect()
+
+        assert received[-1].tickCount == 3
+
+    def test_sampled_schema_validation(self, mock_socketio):
+        """Test sampled live events failing their schema are counted and emitted"""
+        feed = WebSocketFeed(log_level="ERROR", schema_sample_every=100)
+        errors = []
+        feed.on("schema_error", errors.append)
+
+        feed._check_schema("gameStatePlayerUpdate", {"gameId": "g1"})
+        feed._check_schema("someUnknownEvent", {"gameId": "g1"})
+
+        assert [e.event_name for e in errors] == ["gameStatePlayerUpdate"]
+        assert feed.get_metrics()["schemaErrors"] == 1
+
+    def test_schema_validation_off_by_default(self, mock_socketio):
+        """Test the live feed skips schema validation unless sampling is enabled"""
+        assert WebSocketFeed(log_level="ERROR").schema_validator is None
+
+    def test_fixed_numeric_mode(self, mock_socketio):
+        """Test fixed mode carries priceFp and converts to Decimal in GameTick"""
+        feed = WebSocketFeed(log_level="ERROR", numeric_mode="fixed")
+        received = []
+        feed.on("signal", received.append)
+
+        feed._handle_game_state_update(
+            {"gameId": "g1", "active": True, "tickCount": 1, "price": 1.23456789}
+        )
+
+        signal = received[0]
+        assert signal.priceFp == 123456789
+        assert isinstance(signal.price, float)
+        assert feed.signal_to_game_tick(signal).price == Decimal("1.23456789")
+
+    def test_invalid_numeric_mode(self, mock_socketio):
+        """Test unknown numeric modes are rejected"""
+        with pytest.raises(ValueError):
+            WebSocketFeed(log_level="ERROR", numeric_mode="float")
+
     def test_get_last_signal(self, mock_socketio):
         """Test get_last_signal returns None initially"""
         feed = WebSocketFeed(log_level="ERROR")
@@ -0,0 +1,124 @@
+"""
+Tests for fixed-point utilities - rounding parity with decimal_utils
+"""
+
+import random
+from decimal import ROUND_HALF_UP, Decimal
+
+import pytest
+
+from utils.decimal_utils import calculate_pnl, round_percent, round_sol, safe_divide, to_decimal
+from utils.fixed_point import (
+    PRICE_DECIMALS,
+    calculate_pnl_fixed,
+    div_fixed,
+    fixed_price_to_decimal,
+    fixed_to_decimal,
+    fixed_to_float,
+    lamports_to_decimal,
+    mul_fixed,
+    price_to_fixed,
+    round_fixed,
+    sol_to_lamports,
+    to_fixed,
+)
+from utils.fixed_point_benchmark import run_benchmark
+
+
+def decimal_reference(value, decimals: int) -> int:
+    """The Decimal path: to_decimal() quantized ROUND_HALF_UP, scaled to an integer"""
+    quantized = to_decimal(value).quantize(Decimal(10) ** -decimals, rounding=ROUND_HALF_UP)
+    return int(quantized.scaleb(decimals))
+
+
+def random_floats(rng: random.Random, count: int):
+    """Uniform floats, short decimals, and exact/near .5 ties at 8 and 9 places"""
+    for _ in range(count):
+        kind = rng.randrange(4)
+        if kind == 0:
+            yield rng.uniform(-1000, 1000)
+        elif kind == 1:
+            yield round(rng.uniform(0, 100), rng.randint(0, 12))
+        elif kind == 2:
+            yield (rng.randint(-(10**12), 10**12) + 0.5) / 10 ** rng.choice([8, 9])
+        else:
+            yield rng.randint(0, 10**10) / 10**9 + rng.choice([-1, 1]) * 1e-15
+
+
+class TestConversionParity:
+    @pytest.mark.parametrize("decimals", [2, 4, 8, 9])
+    def test_floats_round_like_decimal(self, decimals):
+        rng = random.Random(decimals)
+        for value in random_floats(rng, 20_000):
+            assert to_fixed(value, decimals) == decimal_reference(value, decimals), value
+
+    @pytest.mark.parametrize(
+        "value", ["0.0000000005", "-2.5e-9", "1.23456789", Decimal("7.0000000015"), 3, 10**12 + 0.5]
+    )
+    def test_strings_decimals_ints_and_large(self, value):
+        assert sol_to_lamports(value) == decimal_reference(value, 9)
+
+    def test_round_trip(self):
+        assert lamports_to_decimal(sol_to_lamports(0.123456789)) == Decimal("0.123456789")
+        assert fixed_price_to_decimal(price_to_fixed("2.5")) == Decimal("2.5")
+        assert fixed_to_float(price_to_fixed(1.5), PRICE_DECIMALS) == 1.5
+
+    @pytest.mark.parametrize("value", [float("nan"), float("inf"), "abc", None])
+    def test_invalid(self, value):
+        with pytest.raises(ValueError):
+            to_fixed(value, 9)
+
+
+class TestArithmeticParity:
+    def test_round_fixed_matches_round_sol(self):
+        rng = random.Random(1)
+        for _ in range(20_000):
+            lamports = rng.randint(-(10**13), 10**13)
+            rounded = round_fixed(lamports, 9, 4)
+            assert lamports_to_decimal(rounded) == round_sol(lamports_to_decimal(lamports))
+
+    def test_calculate_pnl_matches(self):
+        rng = random.Random(2)
+        for _ in range(20_000):
+            entry = rng.randint(1, 10**10)
+            exit_price = rng.randint(0, 10**10)
+            amount = rng.randint(1, 10**11)
+
+            pnl_lamports, pnl_percent = calculate_pnl_fixed(entry, exit_price, amount)
+            pnl_sol, pnl_pct = calculate_pnl(
+                fixed_price_to_decimal(entry),
+                fixed_price_to_decimal(exit_price),
+                lamports_to_decimal(amount),
+            )
+
+            assert lamports_to_decimal(pnl_lamports) == pnl_sol
+            assert fixed_to_decimal(pnl_percent, 2) == pnl_pct
+
+    def test_calculate_pnl_validation(self):
+        with pytest.raises(ValueError):
+            calculate_pnl_fixed(0, 100, 1)
+        with pytest.raises(ValueError):
+            calculate_pnl_fixed(100, 100, 0)
+
+    def test_mul_and_div(self):
+        # 0.5 SOL at 2.5x
+        assert mul_fixed(sol_to_lamports("0.5"), price_to_fixed("2.5"), PRICE_DECIMALS) == (
+            sol_to_lamports("1.25")
+        )
+        ratio = div_fixed(price_to_fixed(3), price_to_fixed(7), 4)
+        expected = safe_divide(3, 7).quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
+        assert fixed_to_decimal(ratio, 4) == expected
+        assert div_fixed(1, 0, 4, default=-1) == -1
+
+    def test_percent_rounding(self):
+        assert fixed_to_decimal(round_fixed(12345, 3, 2), 3) == round_percent(Decimal("12.345"))
+
+
+class TestBenchmark:
+    def test_report(self):
+        report = run_benchmark(ticks=200)
+
+        assert report["ticks"] == 200
+        for mode in ("decimal", "fixed"):
+            assert set(report[mode]) == {"ingest_ns", "price_ns", "pnl_ns", "total_ns"}
+            assert report[mode]["total_ns"] > 0
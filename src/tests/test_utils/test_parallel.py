@@ -0,0 +1,59 @@
+"""
+Tests for map_in_pool - inline and process-pool paths give the same results
+"""
+
+import os
+
+from utils.parallel import map_in_pool, worker_count
+
+
+def scale(factor: int, value: int) -> int:
+    return factor * value
+
+
+def worker_pid(context: None, value: int) -> int:
+    return os.getpid()
+
+
+class TestWorkerCount:
+    def test_small_batches_run_inline(self):
+        assert worker_count(3, min_items=4, max_workers=8) == 1
+        assert worker_count(10, min_items=4, max_workers=1) == 1
+
+    def test_capped_by_items(self):
+        assert worker_count(3, min_items=2, max_workers=8) == 3
+        assert worker_count(0, max_workers=8) == 1
+
+
+class TestMapInPool:
+    def test_inline_builds_context_once(self):
+        calls = []
+
+        def init(factor):
+            calls.append(factor)
+            return factor
+
+        assert list(map_in_pool(scale, [1, 2, 3], init=init, initargs=(10,), workers=1)) == [
+            10,
+            20,
+            30,
+        ]
+        assert calls == [10]
+
+    def test_pool_matches_inline(self):
+        items = list(range(50))
+        inline = list(map_in_pool(scale, items, init=int, initargs=(3,), workers=1))
+        pooled = list(map_in_pool(scale, items, init=int, initargs=(3,), workers=2))
+
+        assert pooled == inline
+
+    def test_pool_runs_out_of_process(self):
+        pids = set(map_in_pool(worker_pid, range(8), workers=2))
+
+        assert os.getpid() not in pids
+
+    def test_early_close_stops(self):
+        results = map_in_pool(scale, range(100), init=int, initargs=(1,), workers=2)
+
+        assert next(results) == 0
+        results.close()
@@ -30,6 +30,7 @@ if TYPE_CHECKING:
     from ui.controllers.trading_controller import TradingController
 
 from services.event_bus import EventBus, Events
+from services.raw_ws_event import RawWsEvent
 from ui.controllers.recording_controller import RecordingController
 from ui.widgets.toggle_switch import RecordingToggle
 
@@ -588,13 +589,14 @@ class MinimalWindow:
         - playerUpdate: Updates balance (also handled by PLAYER_UPDATE)
         """
         try:
-            # EventBus wraps: {"name": event_type, "data": actual_data}
-            data = wrapped.get("data", wrapped)
-            if not isinstance(data, dict):
+            event = RawWsEvent.from_bus(wrapped)
+            if event is None:
                 return
 
-            event_name = data.get("event")
-            event_data = data.get("data", {})
+            event_name = event.event_name
+            if event_name not in ("gameStateUpdate", "usernameStatus", "playerUpdate"):
+                return  # Skip the payload decode for events we don't show
+            event_data = event.data
             if not isinstance(event_data, dict):
                 return
 
@@ -1015,6 +1017,8 @@ class MinimalWindow:
         # Wire to LiveBacktestService if provided
         if live_backtest_service:
             live_backtest_service.set_execution_bridge(execution_bridge)
+            if self.live_state_provider:
+                live_backtest_service.set_live_state_provider(self.live_state_provider)
 
         logger.info("Execution bridge wired to MinimalWindow")
 
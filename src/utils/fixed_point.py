@@ -0,0 +1,238 @@
+"""
+Fixed-Point Utilities - Integer representation for per-tick numeric paths
+
+decimal_utils keeps every value a Decimal, which costs a str() round trip
+per conversion and Decimal arithmetic per operation. Consumers that only
+chart or compute features on every tick can use scaled integers instead
+and convert to Decimal at the trading/accounting boundary:
+
+    SOL amounts   lamports (1 SOL = 10**9)
+    Prices        multiplier * 10**8 (GameTick keeps 8 places)
+
+Rounding matches decimal_utils exactly: to_fixed(x, n) equals
+to_decimal(x, round_places=n) scaled by 10**n (ROUND_HALF_UP on the
+shortest repr of x), and round_fixed/calculate_pnl_fixed round like
+round_sol/round_percent/calculate_pnl. Floats take an integer fast path
+unless they sit within rounding error of a tie, which falls back to the
+exact Decimal quantize.
+"""
+
+import math
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+
+from .decimal_utils import SOL_PRECISION, Numeric
+
+__all__ = [
+    "LAMPORTS_PER_SOL",
+    "NUMERIC_MODE_DECIMAL",
+    "NUMERIC_MODE_FIXED",
+    "NUMERIC_MODES",
+    "PERCENT_DECIMALS",
+    "PRICE_DECIMALS",
+    "PRICE_SCALE",
+    "calculate_pnl_fixed",
+    "div_fixed",
+    "fixed_price_to_decimal",
+    "fixed_to_decimal",
+    "fixed_to_float",
+    "lamports_to_decimal",
+    "mul_fixed",
+    "price_to_fixed",
+    "round_fixed",
+    "sol_to_lamports",
+    "to_fixed",
+]
+
+# Numeric modes for per-tick consumers (WebSocketFeed, LiveStateProvider)
+NUMERIC_MODE_DECIMAL = "decimal"
+NUMERIC_MODE_FIXED = "fixed"
+NUMERIC_MODES = (NUMERIC_MODE_DECIMAL, NUMERIC_MODE_FIXED)
+
+PRICE_DECIMALS = 8
+PRICE_SCALE = 10**PRICE_DECIMALS
+LAMPORTS_PER_SOL = 10**SOL_PRECISION
+PERCENT_DECIMALS = 2
+
+# Float fast path: below 2**40 the scaled product is within ~4e-4 of the
+# exact decimal value, so anything further than 1e-3 from a .5 tie rounds
+# the same way Decimal would
+_FAST_LIMIT = 2.0**40
+_TIE_GUARD = 1e-3
+
+_ONE = Decimal(1)
+
+
+def _div_half_up(numerator: int, denominator: int) -> int:
+    """Integer division rounding half away from zero (ROUND_HALF_UP)."""
+    negative = (numerator < 0) != (denominator < 0)
+    quotient, remainder = divmod(abs(numerator), abs(denominator))
+    if 2 * remainder >= abs(denominator):
+        quotient += 1
+    return -quotient if negative else quotient
+
+
+# ========================================================================
+# CONVERSION
+# ========================================================================
+
+
+def to_fixed(value: Numeric, decimals: int) -> int:
+    """
+    Convert to a scaled integer (value * 10**decimals, ROUND_HALF_UP)
+
+    Args:
+        value: Value to convert
+        decimals: Decimal places kept
+
+    Returns:
+        Scaled integer
+
+    Raises:
+        ValueError if the value is not a finite number
+    """
+    if type(value) is float:
+        scaled = value * 10**decimals
+        if -_FAST_LIMIT < scaled < _FAST_LIMIT:
+            floor = math.floor(scaled)
+            fraction = scaled - floor
+            if abs(fraction - 0.5) > _TIE_GUARD:
+                return floor + (fraction > 0.5)
+    elif type(value) is int:
+        return value * 10**decimals
+
+    try:
+        exact = value if isinstance(value, Decimal) else Decimal(str(value))
+        return int(exact.scaleb(decimals).quantize(_ONE, rounding=ROUND_HALF_UP))
+    except (InvalidOperation, ValueError, TypeError) as e:
+        raise ValueError(f"Cannot convert {value} to fixed point: {e}")
+
+
+def sol_to_lamports(value: Numeric) -> int:
+    """SOL amount to lamports"""
+    return to_fixed(value, SOL_PRECISION)
+
+
+def price_to_fixed(value: Numeric) -> int:
+    """Price multiplier to fixed point (10**8 scale)"""
+    return to_fixed(value, PRICE_DECIMALS)
+
+
+def fixed_to_decimal(value: int, decimals: int) -> Decimal:
+    """
+    Convert a scaled integer back to Decimal (exact)
+
+    Args:
+        value: Scaled integer
+        decimals: Decimal places of the scale
+
+    Returns:
+        Decimal value
+    """
+    return Decimal(value).scaleb(-decimals)
+
+
+def lamports_to_decimal(value: int) -> Decimal:
+    """Lamports to SOL as Decimal"""
+    return fixed_to_decimal(value, SOL_PRECISION)
+
+
+def fixed_price_to_decimal(value: int) -> Decimal:
+    """Fixed-point price to Decimal multiplier"""
+    return fixed_to_decimal(value, PRICE_DECIMALS)
+
+
+def fixed_to_float(value: int, decimals: int) -> float:
+    """Scaled integer to float for display/JSON"""
+    return value / 10**decimals
+
+
+# ========================================================================
+# ARITHMETIC
+# ========================================================================
+
+
+def mul_fixed(a: int, b: int, b_decimals: int) -> int:
+    """
+    Multiply two scaled integers, keeping a's scale
+
+    e.g. mul_fixed(lamports, price_fp, PRICE_DECIMALS) -> lamports
+
+    Args:
+        a: Scaled integer (result scale)
+        b: Scaled integer
+        b_decimals: Decimal places of b's scale
+
+    Returns:
+        a * b at a's scale (ROUND_HALF_UP)
+    """
+    return _div_half_up(a * b, 10**b_decimals)
+
+
+def div_fixed(a: int, b: int, decimals: int, default: int = 0) -> int:
+    """
+    Divide two integers at the same scale (safe_divide equivalent)
+
+    Args:
+        a: Numerator
+        b: Denominator
+        decimals: Decimal places of the result
+        default: Result when b is zero
+
+    Returns:
+        a / b scaled by 10**decimals (ROUND_HALF_UP)
+    """
+    if b == 0:
+        return default
+    return _div_half_up(a * 10**decimals, b)
+
+
+def round_fixed(value: int, decimals: int, precision: int) -> int:
+    """
+    Round a scaled integer to fewer places, keeping its scale
+
+    round_fixed(lamports, SOL_PRECISION, 4) matches round_sol().
+
+    Args:
+        value: Scaled integer
+        decimals: Decimal places of the scale
+        precision: Decimal places to keep
+
+    Returns:
+        Rounded value at the same scale
+    """
+    if precision < 0:
+        raise ValueError(f"Precision must be non-negative, got {precision}")
+    if precision >= decimals:
+        return value
+    step = 10 ** (decimals - precision)
+    return _div_half_up(value, step) * step
+
+
+def calculate_pnl_fixed(
+    entry_price: int, exit_price: int, amount_lamports: int, precision: int = 4
+) -> tuple[int, int]:
+    """
+    Calculate P&L for a trade in fixed point (calculate_pnl equivalent)
+
+    Args:
+        entry_price: Entry price (10**8 scale)
+        exit_price: Exit price (10**8 scale)
+        amount_lamports: Position size in lamports
+        precision: SOL decimal places of the P&L (round_sol default)
+
+    Returns:
+        Tuple of (pnl_lamports rounded to precision, pnl_percent in
+        hundredths of a percent)
+    """
+    if amount_lamports <= 0:
+        raise ValueError(f"Amount must be positive, got {amount_lamports}")
+    if entry_price <= 0:
+        raise ValueError(f"Entry price must be positive, got {entry_price}")
+    if exit_price < 0:
+        raise ValueError(f"Exit price cannot be negative, got {exit_price}")
+
+    change = exit_price - entry_price
+    step = 10 ** (SOL_PRECISION - precision)
+    pnl_lamports = _div_half_up(amount_lamports * change, entry_price * step) * step
+    pnl_percent = _div_half_up(change * 100 * 10**PERCENT_DECIMALS, entry_price)
+    return pnl_lamports, pnl_percent
@@ -0,0 +1,168 @@
+"""
+Fixed-Point Benchmark - Per-tick CPU of the Decimal vs fixed-point paths
+
+Drives the same synthetic gameStateUpdate stream through both numeric
+modes and reports CPU time per tick (time.process_time_ns):
+
+    ingest    LiveStateProvider WS_RAW_EVENT handler (price, rugpool,
+              session stats)
+    price     WebSocketFeed-style price extraction (Decimal(str(x)) vs
+              price_to_fixed)
+    pnl       unrealized P&L of an open position (calculate_pnl vs
+              calculate_pnl_fixed)
+
+Usage:
+    python -m utils.fixed_point_benchmark --ticks 100000 --out report.json
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from collections.abc import Callable
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+from services.event_bus import EventBus
+from services.live_state_provider import LiveStateProvider
+from services.raw_ws_event import RawWsEvent
+from utils.decimal_utils import calculate_pnl
+from utils.fixed_point import (
+    NUMERIC_MODE_DECIMAL,
+    NUMERIC_MODE_FIXED,
+    calculate_pnl_fixed,
+    price_to_fixed,
+    sol_to_lamports,
+)
+
+ENTRY_PRICE = 1.25
+POSITION_SOL = 0.05
+
+
+def synthetic_updates(ticks: int, seed: int = 0) -> list[dict[str, Any]]:
+    """gameStateUpdate payloads with a random-walk price and growing rugpool"""
+    rng = random.Random(seed)
+    price = 1.0
+    rugpool = 0.5
+    updates = []
+    for tick in range(ticks):
+        price = max(0.01, price * (1 + rng.gauss(0, 0.02)))
+        rugpool += rng.random() * 0.001
+        updates.append(
+            {
+                "gameId": f"game-{tick // 500}",
+                "tickCount": tick % 500,
+                "price": round(price, 12),
+                "active": True,
+                "rugpool": {"rugpoolAmount": round(rugpool, 9), "threshold": 10.0},
+                "averageMultiplier": 2.3456,
+                "highestToday": 1234.56789,
+            }
+        )
+    return updates
+
+
+def _cpu_per_tick_ns(run: Callable[[], None], ticks: int) -> float:
+    start = time.process_time_ns()
+    run()
+    return (time.process_time_ns() - start) / ticks
+
+
+def _measure(mode: str, updates: list[dict[str, Any]]) -> dict[str, float]:
+    provider = LiveStateProvider(EventBus(), numeric_mode=mode)
+    events = [{"data": RawWsEvent("gameStateUpdate", data=u)} for u in updates]
+    prices = [u["price"] for u in updates]
+    ticks = len(updates)
+
+    def ingest():
+        handler = provider._on_ws_raw_event
+        for event in events:
+            handler(event)
+
+    if mode == NUMERIC_MODE_FIXED:
+
+        def extract():
+            for raw in prices:
+                price_to_fixed(raw)
+
+        entry = price_to_fixed(ENTRY_PRICE)
+        amount = sol_to_lamports(POSITION_SOL)
+        fixed_prices = [price_to_fixed(p) for p in prices]
+
+        def pnl():
+            for price in fixed_prices:
+                calculate_pnl_fixed(entry, price, amount)
+
+    else:
+
+        def extract():
+            for raw in prices:
+                Decimal(str(raw))
+
+        entry = Decimal(str(ENTRY_PRICE))
+        amount = Decimal(str(POSITION_SOL))
+        decimal_prices = [Decimal(str(p)) for p in prices]
+
+        def pnl():
+            for price in decimal_prices:
+                calculate_pnl(entry, price, amount)
+
+    result = {
+        "ingest_ns": _cpu_per_tick_ns(ingest, ticks),
+        "price_ns": _cpu_per_tick_ns(extract, ticks),
+        "pnl_ns": _cpu_per_tick_ns(pnl, ticks),
+    }
+    result["total_ns"] = result["ingest_ns"] + result["price_ns"] + result["pnl_ns"]
+    provider.stop()
+    return result
+
+
+def run_benchmark(ticks: int = 50_000, seed: int = 0) -> dict[str, Any]:
+    """
+    Measure per-tick CPU for both numeric modes on the same stream
+
+    Args:
+        ticks: Number of synthetic ticks
+        seed: Random seed for the price walk
+
+    Returns:
+        Report dict: per-stage ns/tick per mode and the speedup
+    """
+    updates = synthetic_updates(ticks, seed)
+    decimal = _measure(NUMERIC_MODE_DECIMAL, updates)
+    fixed = _measure(NUMERIC_MODE_FIXED, updates)
+    return {
+        "ticks": ticks,
+        NUMERIC_MODE_DECIMAL: decimal,
+        NUMERIC_MODE_FIXED: fixed,
+        "speedup": {
+            stage: decimal[stage] / fixed[stage] if fixed[stage] else 0.0 for stage in decimal
+        },
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--ticks", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, help="Write the JSON report here")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.ticks, args.seed)
+    print(f"{'stage':<8} {'decimal ns':>12} {'fixed ns':>12} {'speedup':>8}")
+    for stage in report[NUMERIC_MODE_DECIMAL]:
+        print(
+            f"{stage.removesuffix('_ns'):<8} "
+            f"{report[NUMERIC_MODE_DECIMAL][stage]:>12.0f} "
+            f"{report[NUMERIC_MODE_FIXED][stage]:>12.0f} "
+            f"{report['speedup'][stage]:>7.2f}x"
+        )
+    if args.out:
+        args.out.write_text(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""
+Parallel Map - Fan a batch of independent tasks out across a process pool
+
+Batch backtests, headless replays and directory validation all share the
+same shape: build some per-worker context once (a game set, an engine
+stack, a validator), then map a cheap task over many items. map_in_pool()
+runs that shape inline for small batches and on a ProcessPoolExecutor
+otherwise, so each task only ships its item.
+
+fn, init and initargs must be picklable (module-level functions, classes
+or functools.partial of them).
+"""
+
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+__all__ = ["map_in_pool", "worker_count"]
+
+# Context built by init() in each worker process
+_worker_context: Any = None
+
+
+def _init_context(init: Callable[..., Any] | None, initargs: tuple) -> None:
+    global _worker_context
+    _worker_context = init(*initargs) if init is not None else None
+
+
+def _call_in_worker(fn: Callable[[Any, T], R], item: T) -> R:
+    return fn(_worker_context, item)
+
+
+def worker_count(n_items: int, min_items: int = 2, max_workers: int | None = None) -> int:
+    """
+    Processes map_in_pool() would use for n_items (1 means inline).
+
+    Args:
+        n_items: Number of items to map
+        min_items: Below this many items a pool costs more than it saves
+        max_workers: Process cap (defaults to CPU count)
+    """
+    workers = min(max_workers or os.cpu_count() or 1, n_items)
+    return workers if workers > 1 and n_items >= min_items else 1
+
+
+def map_in_pool(
+    fn: Callable[[Any, T], R],
+    items: Iterable[T],
+    init: Callable[..., Any] | None = None,
+    initargs: tuple = (),
+    min_items: int = 2,
+    workers: int | None = None,
+) -> Iterator[R]:
+    """
+    Yield fn(context, item) for every item, in input order.
+
+    context is init(*initargs), built once per worker process (or once
+    in-process when running inline); None without init. Results stream
+    as they complete in order, and closing the iterator early cancels
+    the remaining work.
+
+    Args:
+        fn: Task taking (context, item)
+        items: Items to map
+        init: Builds the per-worker context
+        initargs: Arguments for init
+        min_items: Below this many items run inline
+        workers: Process cap (defaults to CPU count; 1 runs inline)
+    """
+    items = list(items)
+    count = worker_count(len(items), min_items, workers)
+
+    if count <= 1:
+        context = init(*initargs) if init is not None else None
+        for item in items:
+            yield fn(context, item)
+        return
+
+    pool = ProcessPoolExecutor(
+        max_workers=count, initializer=_init_context, initargs=(init, initargs)
+    )
+    try:
+        yield from pool.map(
+            partial(_call_in_worker, fn), items, chunksize=max(1, len(items) // (count * 4))
+        )
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,504 @@
+"""
+Batch sidebet replay engine for v2-explorer.
+
+SidebetModule.replay_game() walks every tick through the 5-stage pipeline
+with Python objects, recomputing the survival function on every Model A call.
+This engine produces identical results per game in a single pass:
+
+  1. Features: all 16 features for every tick computed as NumPy arrays
+  2. Model A: base probability and feature multipliers evaluated vectorially
+     against one precomputed survival curve
+  3. Model B: the forecaster is not updated during replay, so its signal is
+     constant and computed once
+  4. Arbitration: vetoes, buckets, duration gate and the consensus lookup
+     table applied as array masks
+  5. Risk: RiskManager stays sequential but only runs on BET ticks
+
+Games are independent (fresh RiskManager each), so batches fan out across a
+process pool.
+
+Provides:
+  - BatchReplayer.replay()  -> ReplayResult / TracedReplayResult
+  - replay_games()          -> list of results for many games
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from functools import partial
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .base import ReplayResult, TracedReplayResult
+from .parallel import map_in_pool, worker_count
+from .sidebet import (
+    _CONSENSUS_MATRIX,
+    _SIZE_MODIFIERS,
+    ArbitrationEngine,
+    RiskManager,
+    SidebetModule,
+)
+
+logger = logging.getLogger(__name__)
+
+# Below this many games a process pool costs more than it saves
+MIN_PARALLEL_GAMES = 1000
+
+_BUCKETS = ("low", "medium", "high", "critical")
+
+# ============================================================================
+# Stage 1 — Feature arrays
+# ============================================================================
+
+
+def _rolling_std(diffs: np.ndarray, ticks: np.ndarray, window: int) -> np.ndarray:
+    """np.std of the `window` price changes ending at each tick (0.0 if too young)."""
+    out = np.zeros(len(ticks))
+    if len(diffs) < window:
+        return out
+    stds = np.std(sliding_window_view(diffs, window), axis=1)
+    mask = ticks >= window
+    out[mask] = stds[ticks[mask] - window]
+    return out
+
+
+def _momentum(arr: np.ndarray, ticks: np.ndarray, window: int) -> np.ndarray:
+    out = np.zeros(len(ticks))
+    mask = ticks >= window
+    t = ticks[mask]
+    out[mask] = (arr[t] - arr[t - window]) / window
+    return out
+
+
+def _monotone(ok: np.ndarray, ticks: np.ndarray) -> np.ndarray:
+    """True where every step in prices[max(0, t-3):t+1] satisfies `ok`."""
+    bad = np.concatenate(([0], np.cumsum(~ok)))
+    start = np.maximum(0, ticks - 3)
+    return (bad[ticks] - bad[start]) == 0
+
+
+def compute_features(prices: list[float]) -> dict[str, np.ndarray]:
+    """
+    Compute extract_features() for every tick 1..len(prices)-1 at once.
+
+    Float features use the same operations (and reductions) as the scalar
+    version, so values are bit-identical.
+
+    Returns:
+        Dict of feature name -> array aligned with the "tick" array
+    """
+    arr = np.asarray(prices, dtype=np.float64)
+    n = len(arr)
+    ticks = np.arange(1, n)
+
+    # Peak so far (first occurrence, like list.index)
+    running_max = np.maximum.accumulate(arr)
+    is_new_peak = np.ones(n, dtype=bool)
+    is_new_peak[1:] = arr[1:] > running_max[:-1]
+    peak_idx = np.maximum.accumulate(np.where(is_new_peak, np.arange(n), 0))
+
+    price = arr[ticks]
+    peak = running_max[ticks]
+    distance = np.divide(peak - price, peak, out=np.zeros(len(ticks)), where=peak > 0)
+
+    diffs = np.diff(arr)
+
+    acceleration = np.zeros(len(ticks))
+    mask = ticks >= 2
+    t = ticks[mask]
+    acceleration[mask] = (arr[t] - arr[t - 1]) - (arr[t - 1] - arr[t - 2])
+
+    change_3 = np.zeros(len(ticks))
+    mask = ticks >= 3
+    t = ticks[mask]
+    base = arr[t - 3]
+    change_3[mask] = np.divide(arr[t] - base, base, out=np.zeros(len(t)), where=base > 0)
+
+    mean_reversion = np.zeros(len(ticks))
+    if n >= 11:
+        means = np.mean(sliding_window_view(arr, 11), axis=1)
+        mask = ticks >= 10
+        t = ticks[mask]
+        recent_mean = means[t - 10]
+        mean_reversion[mask] = np.divide(
+            arr[t] - recent_mean, recent_mean, out=np.zeros(len(t)), where=recent_mean > 0
+        )
+
+    return {
+        "tick": ticks,
+        "price": price,
+        "distance_from_peak": distance,
+        "volatility_5": _rolling_std(diffs, ticks, 5),
+        "volatility_10": _rolling_std(diffs, ticks, 10),
+        "momentum_3": _momentum(arr, ticks, 3),
+        "momentum_5": _momentum(arr, ticks, 5),
+        "price_acceleration": acceleration,
+        "is_rising": _monotone(arr[:-1] <= arr[1:], ticks),
+        "is_falling": _monotone(arr[:-1] >= arr[1:], ticks),
+        "rapid_rise": change_3 > 0.20,
+        "rapid_fall": change_3 < -0.20,
+        "peak_so_far": peak,
+        "peak_tick": peak_idx[ticks],
+        "ticks_since_peak": ticks - peak_idx[ticks],
+        "mean_reversion": mean_reversion,
+    }
+
+
+# ============================================================================
+# Stage 2 — Model A arrays
+# ============================================================================
+
+
+def model_a_arrays(
+    survival: np.ndarray, features: dict[str, np.ndarray], window: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized BayesianSurvivalModel.predict_rug_probability().
+
+    Args:
+        survival: survival_function(len(hazard_rates)) of the fitted model
+        features: Output of compute_features()
+        window: Sidebet window in ticks
+
+    Returns:
+        (base_prob, feature_adjustment, p_rug) arrays aligned with ticks
+    """
+    ticks = features["tick"]
+    n_hazard = len(survival)
+    in_range = ticks < n_hazard
+    t = np.minimum(ticks, n_hazard - 1)
+
+    s_now = survival[t]
+    s_future = survival[np.minimum(t + window, n_hazard - 1)]
+    ratio = np.divide(s_future, s_now, out=np.zeros(len(t)), where=s_now > 0)
+    base_prob = np.where(s_now > 0, 1 - ratio, 0.5)
+
+    # Same multiplication order as _feature_adjustment()
+    adjustment = np.ones(len(t))
+    adjustment = np.where(features["rapid_fall"], adjustment * 2.0, adjustment)
+    adjustment = np.where(features["volatility_10"] > 0.1, adjustment * 1.5, adjustment)
+    adjustment = np.where(features["ticks_since_peak"] > 20, adjustment * 1.3, adjustment)
+    adjustment = np.where(features["rapid_rise"], adjustment * 0.7, adjustment)
+    adjustment = np.where(features["distance_from_peak"] > 0.3, adjustment * 1.2, adjustment)
+
+    p_rug = np.minimum(1.0, base_prob * adjustment)
+
+    base_prob = np.where(in_range, base_prob, 1.0)
+    p_rug = np.where(in_range, p_rug, 1.0)
+    feature_adj = np.divide(p_rug, base_prob, out=np.ones(len(t)), where=base_prob > 0)
+    return base_prob, feature_adj, p_rug
+
+
+# ============================================================================
+# Batch replayer
+# ============================================================================
+
+
+class BatchReplayer:
+    """Replays games through the sidebet pipeline using precomputed arrays.
+
+    Holds only the fitted survival curve and the (constant) Model B signal,
+    so it is cheap to ship to worker processes.
+    """
+
+    def __init__(self, survival: np.ndarray, model_b: dict, window: int = 40):
+        self.survival = survival
+        self.model_b = model_b
+        self.window = window
+
+        regime = model_b.get("regime", "normal")
+        self._regime = regime
+        self._size_keys = [_CONSENSUS_MATRIX.get((b, regime)) for b in _BUCKETS]
+        self._has_size = np.array([k is not None for k in self._size_keys])
+
+    @classmethod
+    def from_module(cls, module: SidebetModule) -> BatchReplayer:
+        model = module.survival_model
+        return cls(
+            survival=model.survival_function(len(model.hazard_rates)),
+            model_b=module._forecaster.predict(),
+            window=module.SIDEBET_WINDOW,
+        )
+
+    def _arbitrate(
+        self, features: dict[str, np.ndarray], p_rug: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Return (veto_code, bucket, bucket_upgraded, bet) arrays.
+
+        veto_code: 0 none, 1 game_too_young, 2 p_rug_below_breakeven,
+        3 rapid_rise_momentum (checked in that order).
+        """
+        ticks = features["tick"]
+        young = ticks < ArbitrationEngine.MIN_TICK
+        low_p = p_rug < ArbitrationEngine.MIN_P_RUG
+        veto = np.select(
+            [young, low_p, features["rapid_rise"]],
+            [1, 2, 3],
+            0,
+        )
+
+        bucket = np.select([p_rug >= 0.60, p_rug >= 0.35, p_rug >= 0.20], [3, 2, 1], 0)
+        remaining = self.model_b.get("predicted_duration", 999) - ticks
+        upgraded = np.where((remaining < 40) & (bucket <= 1), bucket + 1, bucket)
+
+        bet = (veto == 0) & self._has_size[upgraded]
+        return veto, bucket, upgraded, bet
+
+    def _veto_reason(self, code: int, tick: int, p_rug: float) -> str:
+        if code == 1:
+            return f"game_too_young (tick {tick} < {ArbitrationEngine.MIN_TICK})"
+        if code == 2:
+            return f"p_rug_below_breakeven ({p_rug:.3f} < {ArbitrationEngine.MIN_P_RUG})"
+        if code == 3:
+            return "rapid_rise_momentum"
+        return ""
+
+    def replay(
+        self, game: dict, initial_bankroll: float = 1.0, traced: bool = False
+    ) -> ReplayResult | TracedReplayResult:
+        """Replay one game; output matches SidebetModule.replay_game(_traced)."""
+        prices = game["prices"]
+        rug_tick = int(game["rug_tick"])
+        risk = RiskManager(initial_bankroll)
+        decisions: list[dict] = []
+        tick_traces: list[dict] = []
+
+        if len(prices) > 1:
+            features = compute_features(prices)
+            base_prob, feature_adj, p_rug = model_a_arrays(self.survival, features, self.window)
+            veto, bucket, upgraded, bet = self._arbitrate(features, p_rug)
+            ticks = features["tick"].tolist()
+        else:
+            ticks = []
+
+        if traced:
+            rows = range(len(ticks))
+        else:
+            rows = np.flatnonzero(bet).tolist() if ticks else []
+
+        for i in rows:
+            tick = ticks[i]
+            # min(1.0, p) in the scalar model yields a Python float when clipped
+            p = 1.0 if p_rug[i] == 1.0 else p_rug[i]
+            size_key = self._size_keys[upgraded[i]] if bet[i] else None
+            reason = ""
+            if bet[i]:
+                reason = f"consensus_{size_key} ({_BUCKETS[upgraded[i]]}/{self._regime})"
+
+            risk_snap = risk.snapshot(p) if traced else None
+
+            bet_amount = None
+            bet_outcome = None
+            if bet[i]:
+                bet_size = risk.calculate_position(p)
+                won = (rug_tick > tick) and (rug_tick <= tick + self.window)
+                risk.record_outcome(bet_size, won)
+                bet_amount = round(bet_size, 6)
+                bet_outcome = "WON" if won else "LOST"
+                decisions.append(
+                    {
+                        "tick": tick,
+                        "action": "BET",
+                        "p_rug": round(p, 4),
+                        "bet_size": bet_amount,
+                        "won": won,
+                        "reason": reason,
+                    }
+                )
+
+            if traced:
+                tick_traces.append(
+                    self._trace(
+                        prices,
+                        features,
+                        i,
+                        base_prob[i],
+                        feature_adj[i],
+                        p,
+                        int(veto[i]),
+                        int(bucket[i]),
+                        int(upgraded[i]),
+                        bool(bet[i]),
+                        reason,
+                        risk_snap,
+                        bet_amount,
+                        bet_outcome,
+                    )
+                )
+
+        bets_won = sum(1 for d in decisions if d["won"])
+        summary = dict(
+            game_id=game["game_id"],
+            ticks=len(prices),
+            rug_tick=rug_tick,
+            peak_price=round(float(game["peak_multiplier"]), 4),
+            bets_placed=len(decisions),
+            bets_won=bets_won,
+            bets_lost=len(decisions) - bets_won,
+            net_pnl=round(risk.bankroll - initial_bankroll, 6),
+            final_bankroll=round(risk.bankroll, 6),
+            decisions=decisions,
+        )
+        if traced:
+            return TracedReplayResult(**summary, tick_traces=tick_traces)
+        return ReplayResult(**summary)
+
+    def _trace(
+        self,
+        prices: list[float],
+        features: dict[str, np.ndarray],
+        i: int,
+        base_prob: float,
+        feature_adj: float,
+        p_rug: float,
+        veto: int,
+        bucket: int,
+        upgraded: int,
+        bet: bool,
+        reason: str,
+        risk_snap: dict,
+        bet_amount: float | None,
+        bet_outcome: str | None,
+    ) -> dict:
+        """Build one tick trace in the replay_game_traced() format."""
+        tick = int(features["tick"][i])
+        peak_tick = int(features["peak_tick"][i])
+        volatility_10 = features["volatility_10"][i]
+        ticks_since_peak = int(features["ticks_since_peak"][i])
+        distance = features["distance_from_peak"][i].item()
+        rapid_fall = bool(features["rapid_fall"][i])
+        rapid_rise = bool(features["rapid_rise"][i])
+
+        # Scalar extract_features() keeps np.std / np.mean results as NumPy
+        # scalars and the rest as Python floats; rounding follows suit
+        features_dict = {
+            "tick": tick,
+            "price": prices[tick],
+            "age": tick,
+            "distance_from_peak": round(distance, 6),
+            "volatility_5": round(features["volatility_5"][i], 6),
+            "volatility_10": round(volatility_10, 6),
+            "momentum_3": round(features["momentum_3"][i].item(), 6),
+            "momentum_5": round(features["momentum_5"][i].item(), 6),
+            "price_acceleration": round(features["price_acceleration"][i].item(), 6),
+            "is_rising": bool(features["is_rising"][i]),
+            "is_falling": bool(features["is_falling"][i]),
+            "rapid_rise": rapid_rise,
+            "rapid_fall": rapid_fall,
+            "peak_so_far": round(prices[peak_tick], 6),
+            "ticks_since_peak": ticks_since_peak,
+            "mean_reversion": round(features["mean_reversion"][i], 6),
+        }
+
+        multipliers_fired = {}
+        if rapid_fall:
+            multipliers_fired["rapid_fall"] = 2.0
+        if volatility_10 > 0.1:
+            multipliers_fired["high_volatility"] = 1.5
+        if ticks_since_peak > 20:
+            multipliers_fired["time_since_peak"] = 1.3
+        if rapid_rise:
+            multipliers_fired["rapid_rise"] = 0.7
+        if distance > 0.3:
+            multipliers_fired["distance_from_peak"] = 1.2
+
+        veto_reason = self._veto_reason(veto, tick, p_rug)
+        consensus_key = self._size_keys[upgraded]
+        if veto:
+            reason = veto_reason
+        elif not bet:
+            reason = f"no_consensus ({_BUCKETS[upgraded]}/{self._regime})"
+
+        return {
+            "tick": tick,
+            "price": round(float(prices[tick]), 6),
+            "features": features_dict,
+            "model_a": {
+                "base_prob": round(base_prob, 6),
+                "feature_adjustment": round(feature_adj, 4),
+                "p_rug": round(p_rug, 6),
+                "multipliers_fired": multipliers_fired,
+            },
+            "model_b": dict(self.model_b),
+            "arbitration": {
+                "action": "BET" if bet else "WAIT",
+                "bucket": _BUCKETS[bucket],
+                "bucket_upgraded": _BUCKETS[upgraded],
+                "consensus_lookup": consensus_key,
+                "size_modifier": _SIZE_MODIFIERS.get(consensus_key, 0.0) if not veto else 0.0,
+                "reason": reason,
+                "vetoed": bool(veto),
+                "veto_reason": veto_reason,
+            },
+            "risk": risk_snap,
+            "bet_placed": bet,
+            "bet_amount": bet_amount,
+            "bet_outcome": bet_outcome,
+        }
+
+
+# ============================================================================
+# Parallel batch replay
+# ============================================================================
+
+
+def replay_games(
+    module: SidebetModule,
+    game_ids: list[str] | None = None,
+    initial_bankroll: float = 1.0,
+    traced: bool = False,
+    max_workers: int | None = None,
+) -> list[ReplayResult]:
+    """Replay many games in parallel, each with a fresh bankroll.
+
+    Args:
+        module: SidebetModule providing games and the fitted models
+        game_ids: Games to replay in order (default: all loaded games)
+        initial_bankroll: Starting bankroll for every game
+        traced: Include per-tick traces
+        max_workers: Process count (defaults to CPU count; 1 runs inline)
+
+    Raises:
+        ValueError: If a game ID is not found
+    """
+    df = module.games_df.drop_duplicates(subset=["game_id"], keep="first")
+    if game_ids is None:
+        game_ids = df["game_id"].tolist()
+    by_id = df.set_index("game_id")
+
+    missing = [gid for gid in game_ids if gid not in by_id.index]
+    if missing:
+        raise ValueError(f"Game {missing[0]} not found")
+
+    rows = by_id.loc[game_ids, ["prices", "rug_tick", "peak_multiplier"]]
+    games = [
+        {"game_id": gid, "prices": prices, "rug_tick": rug_tick, "peak_multiplier": peak}
+        for gid, prices, rug_tick, peak in zip(
+            game_ids,
+            rows["prices"].tolist(),
+            rows["rug_tick"].tolist(),
+            rows["peak_multiplier"].tolist(),
+        )
+    ]
+
+    replayer = BatchReplayer.from_module(module)
+    workers = worker_count(len(games), MIN_PARALLEL_GAMES, max_workers)
+    start = time.perf_counter()
+
+    # Each worker rebuilds the replayer once so each task only ships its game
+    results = list(
+        map_in_pool(
+            partial(BatchReplayer.replay, initial_bankroll=initial_bankroll, traced=traced),
+            games,
+            init=BatchReplayer,
+            initargs=(replayer.survival, replayer.model_b, replayer.window),
+            min_items=MIN_PARALLEL_GAMES,
+            workers=max_workers,
+        )
+    )
+
+    elapsed = time.perf_counter() - start
+    logger.info(f"Batch replay: {len(games)} games in {elapsed:.2f}s ({workers} workers)")
+    return results
@@ -7,6 +7,7 @@ for the trace visualization UI.
 Endpoints:
   GET  /api/sidebet/games              — list available games
   POST /api/sidebet/replay             — replay game(s), summary only
+  POST /api/sidebet/replay-batch       — replay many games in parallel (batch engine)
   POST /api/sidebet/replay-traced      — replay single game with full trace
 
 Run:
@@ -17,6 +18,7 @@ Run:
 from __future__ import annotations
 
 import logging
+import time
 from dataclasses import asdict
 from pathlib import Path
 
@@ -24,6 +26,7 @@ from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from modules.sidebet import SidebetModule
+from modules.sidebet_batch import replay_games
 from pydantic import BaseModel, Field
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
@@ -67,6 +70,14 @@ class ReplayRequest(BaseModel):
     initial_bankroll: float = Field(1.0, ge=0.001)
 
 
+class BatchReplayRequest(BaseModel):
+    game_ids: list[str] | None = Field(None, description="Game IDs to replay (default: all)")
+    limit: int | None = Field(None, ge=1, description="Replay only the first N games")
+    initial_bankroll: float = Field(1.0, ge=0.001)
+    include_decisions: bool = Field(False, description="Include per-game BET decisions")
+    max_workers: int | None = Field(None, ge=1, description="Process count (default: CPUs)")
+
+
 class ReplayTracedRequest(BaseModel):
     game_id: str = Field(..., description="Single game ID for traced replay")
     initial_bankroll: float = Field(1.0, ge=0.001)
@@ -95,6 +106,53 @@ def replay(req: ReplayRequest):
     return asdict(result)
 
 
+@app.post("/api/sidebet/replay-batch")
+def replay_batch(req: BatchReplayRequest):
+    """Replay many games through the batch engine — per-game summaries plus totals.
+
+    Each game starts from `initial_bankroll`. Results match /api/sidebet/replay
+    for every game.
+    """
+    mod = _get_module()
+    game_ids = req.game_ids
+    if req.limit is not None:
+        game_ids = (game_ids or mod.games_df["game_id"].tolist())[: req.limit]
+
+    start = time.perf_counter()
+    try:
+        results = replay_games(
+            mod,
+            game_ids,
+            initial_bankroll=req.initial_bankroll,
+            max_workers=req.max_workers,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+    elapsed = time.perf_counter() - start
+
+    games = []
+    for result in results:
+        row = asdict(result)
+        if not req.include_decisions:
+            row.pop("decisions")
+        games.append(row)
+
+    bets_placed = sum(r.bets_placed for r in results)
+    bets_won = sum(r.bets_won for r in results)
+    return {
+        "games": games,
+        "totals": {
+            "games": len(results),
+            "bets_placed": bets_placed,
+            "bets_won": bets_won,
+            "bets_lost": bets_placed - bets_won,
+            "win_rate": round(bets_won / bets_placed, 4) if bets_placed else 0.0,
+            "net_pnl": round(sum(r.net_pnl for r in results), 6),
+        },
+        "elapsed_s": round(elapsed, 3),
+    }
+
+
 @app.post("/api/sidebet/replay-traced")
 def replay_traced(req: ReplayTracedRequest):
     """Replay a single game with full per-tick pipeline trace.
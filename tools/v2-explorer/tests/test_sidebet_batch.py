@@ -0,0 +1,81 @@
+"""Parity tests: the batch replay engine against SidebetModule's per-tick replay."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from modules.sidebet import SidebetModule
+from modules.sidebet_batch import BatchReplayer, replay_games
+
+
+def synthetic_games(count: int, seed: int) -> pd.DataFrame:
+    """Random-walk games, with some calm and some volatile, plus tied prices and peaks."""
+    rng = np.random.default_rng(seed)
+    games = []
+    for n in range(count):
+        ticks = int(rng.integers(2, 400))
+        sigma = 0.25 if n % 3 == 0 else 0.08
+        prices = [1.0]
+        for _ in range(ticks - 1):
+            prices.append(max(0.01, prices[-1] * (1 + rng.normal(0, sigma))))
+        if n % 5 == 0 and ticks > 10:
+            prices[5] = prices[4]
+            prices[8] = max(prices)
+        games.append(
+            {
+                "game_id": f"g{n}",
+                "prices": prices,
+                "rug_tick": ticks - 1,
+                "tick_count": ticks,
+                "peak_multiplier": max(prices),
+            }
+        )
+    return pd.DataFrame(games)
+
+
+@pytest.fixture(scope="module")
+def module() -> SidebetModule:
+    module = SidebetModule()
+    module._games_df = synthetic_games(60, seed=7)
+    return module
+
+
+@pytest.fixture(scope="module")
+def replayer(module) -> BatchReplayer:
+    return BatchReplayer.from_module(module)
+
+
+class TestParity:
+    def test_replay_matches(self, module, replayer):
+        for game in module.games_df.to_dict("records"):
+            assert replayer.replay(game) == module.replay_game(game["game_id"])
+
+    def test_traced_replay_matches(self, module, replayer):
+        for game in module.games_df.to_dict("records"):
+            expected = module.replay_game_traced(game["game_id"])
+            assert replayer.replay(game, traced=True) == expected
+
+    def test_bankroll_carried_through(self, module, replayer):
+        game = module.games_df.iloc[0].to_dict()
+        assert replayer.replay(game, initial_bankroll=2.5) == module.replay_game(
+            game["game_id"], initial_bankroll=2.5
+        )
+
+
+class TestReplayGames:
+    def test_inline_matches_per_game(self, module):
+        game_ids = module.games_df["game_id"].tolist()[:20]
+
+        results = replay_games(module, game_ids, max_workers=1)
+
+        assert results == [module.replay_game(gid) for gid in game_ids]
+
+    def test_pool_matches_inline(self, module, monkeypatch):
+        monkeypatch.setattr("modules.sidebet_batch.MIN_PARALLEL_GAMES", 1)
+
+        pooled = replay_games(module, traced=True, max_workers=2)
+
+        assert pooled == replay_games(module, traced=True, max_workers=1)
+
+    def test_unknown_game(self, module):
+        with pytest.raises(ValueError, match="not found"):
+            replay_games(module, ["missing"])